@@ -0,0 +1,105 @@
+"""Benchmark of the cleaning stage on a batch the size of the California housing dataset.
+
+Generates raw records shaped like the dataset, 20,640 by default, with some
+numbers given as strings, some total_bedrooms missing and some invalid rows, and
+reports how long the engine takes to clean the whole batch at once, from a
+DataFrame and from the dictionaries a run is configured with, and to build the
+HousingRecords of the valid rows. For comparison, cleaning the records one at a
+time, as `cleaned_data` does and as batches were, is timed in a Dagster test
+context, whose every log line is an event. Dagster's own checks of the step
+inputs and outputs, the same whichever way the batch is cleaned, are left out.
+
+Usage:
+    python -m benchmarks.cleaning [--rows N] [--runs N]
+"""
+import argparse
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+import dagster as dg
+import numpy as np
+import pandas as pd
+
+from src.adapter.driven.etl.assets import _clean_record
+from src.adapter.driven.etl.cleaning import clean_batch
+from src.core.domain.entities.housing_record import OCEAN_PROXIMITY_CATEGORIES
+from src.core.domain.exceptions import DataValidationError
+
+
+def _raw_records(rows: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Generate raw records in the ranges of the California housing dataset."""
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame(
+        {
+            "record_id": [f"record-{i}" for i in range(rows)],
+            "longitude": rng.uniform(-124.35, -114.31, rows),
+            "latitude": rng.uniform(32.54, 41.95, rows),
+            "housing_median_age": rng.integers(1, 53, rows).astype(float),
+            "total_rooms": rng.integers(2, 39321, rows).astype(float),
+            "total_bedrooms": rng.integers(1, 6446, rows).astype(float),
+            "population": rng.integers(3, 35683, rows).astype(float),
+            "households": rng.integers(1, 6083, rows).astype(float),
+            "median_income": rng.uniform(0.5, 15.0, rows),
+            "ocean_proximity": rng.choice(OCEAN_PROXIMITY_CATEGORIES, rows),
+        }
+    )
+    records = frame.to_dict("records")
+
+    # About 1% of missing total_bedrooms, as in the dataset, plus strings and errors
+    for index in rng.choice(rows, rows // 100, replace=False):
+        records[index]["total_bedrooms"] = None
+    for index in rng.choice(rows, rows // 20, replace=False):
+        records[index]["median_income"] = str(records[index]["median_income"])
+    for index in rng.choice(rows, rows // 200, replace=False):
+        records[index]["ocean_proximity"] = "INVALID"
+    return records
+
+
+def _clean_one_at_a_time(context: dg.OpExecutionContext, records: List[Dict[str, Any]]) -> None:
+    """Clean records one at a time, as `cleaned_data` does."""
+    for record in records:
+        try:
+            _clean_record(context, record)
+        except DataValidationError:
+            pass
+
+
+def _time(operation: Callable[[], Any], runs: int) -> float:
+    """Get the median duration of an operation, in milliseconds."""
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        operation()
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20640, help="Records in the batch")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per measurement")
+    args = parser.parse_args()
+
+    records = _raw_records(args.rows)
+    frame = pd.DataFrame(records)
+    result = clean_batch(frame)
+    print(f"{args.rows} records, {len(result.errors)} invalid\n")
+
+    with dg.build_op_context() as context:
+        timings = {
+            "whole batch, from a DataFrame": _time(lambda: clean_batch(frame), args.runs),
+            "whole batch, from dictionaries": _time(lambda: clean_batch(records), args.runs),
+            "HousingRecords of the batch": _time(result.to_housing_records, args.runs),
+            "one record at a time": _time(
+                lambda: _clean_one_at_a_time(context, records), args.runs
+            ),
+        }
+
+    for name, duration in timings.items():
+        print(f"{name:<40} {duration:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark of the per-request cost of building the dependency graph.
+
+Compares resolving the handler the way `get_handler` used to, with a new
+`Container()` per request, against reusing the handler built once at startup.
+A throwaway SQLite database stands in for PostgreSQL, so the numbers are a
+lower bound: against a real server each new engine also pays the network
+round trips of the `create_all` DDL and of opening fresh connections.
+
+Usage:
+    python -m benchmarks.handler_lifecycle [--requests N]
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from typing import Callable, List
+
+from dependency_injector import providers
+
+# The app module must be imported before the container it wires
+import src.adapter.driving.fastapi.app  # noqa: F401
+from src.config.container import Container
+from src.config.settings import Settings
+
+
+class BenchmarkSettings(Settings):
+    """Settings pointing the storage adapter at a local SQLite database."""
+
+    SQLITE_PATH: str
+
+    @property
+    def database_url(self) -> str:
+        """Get the database URL."""
+        return f"sqlite:///{self.SQLITE_PATH}"
+
+
+def _measure(resolve: Callable[[], object], requests: int) -> List[float]:
+    """Time `requests` calls of `resolve`, in milliseconds."""
+    timings = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        resolve()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def _report(name: str, timings: List[float]) -> None:
+    """Print a summary of the timings."""
+    print(
+        f"{name:<28} mean {statistics.mean(timings):8.3f} ms   "
+        f"p50 {statistics.median(timings):8.3f} ms   "
+        f"max {max(timings):8.3f} ms"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200, help="Requests per scenario")
+    args = parser.parse_args()
+
+    os.environ.setdefault("DAGSTER_WEBSERVER_URL", "http://localhost:3000")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        settings = BenchmarkSettings(SQLITE_PATH=os.path.join(tmp, "benchmark.db"))
+        config = providers.Object(settings)
+
+        def per_request() -> object:
+            # What every request did before: a new container, adapters, engine and DDL
+            dependencies = Container()
+            dependencies.config.override(config)
+            handler = dependencies.input_port()
+            dependencies.storage_adapter().close()
+            return handler
+
+        container = Container()
+        container.config.override(config)
+        startup = time.perf_counter()
+        handler = container.input_port()
+        print(f"One-off startup cost: {(time.perf_counter() - startup) * 1000:.3f} ms\n")
+
+        _report("Container per request", _measure(per_request, args.requests))
+        _report("Handler built at startup", _measure(lambda: handler, args.requests))
+
+        container.storage_adapter().close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Load test of the submission path while one dependency is slow.
+
+Drives `PredictionService.submit_prediction_request` with a fixed number of
+concurrent clients, against a storage port and a Dagster client that block
+their thread for a set latency each call, as SQLAlchemy and `requests` do. It
+reports the submission throughput and latency for each size of the blocking
+I/O executor, along with the worst event loop lag seen meanwhile: how late a
+task scheduled every 10 ms ran, which is what every other request of the worker
+waits on. With the blocking calls made on the event loop, throughput would be
+capped at one submission per sum of latencies, whatever the concurrency.
+
+Usage:
+    python -m benchmarks.slow_dependency [--threads 8 32 64] [--storage-latency S]
+"""
+import argparse
+import asyncio
+import itertools
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import uuid4
+
+from src.core.domain.entities.housing_record import HousingRecord
+from src.core.service.prediction_service import PredictionService
+
+RECORD = HousingRecord(
+    longitude=-122.64,
+    latitude=38.01,
+    housing_median_age=36.0,
+    total_rooms=1336.0,
+    total_bedrooms=258.0,
+    population=678.0,
+    households=249.0,
+    median_income=5.5789,
+    ocean_proximity="NEAR OCEAN",
+)
+
+
+class SlowStorage:
+    """Storage whose calls block their thread, like a synchronous database driver."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def save_housing_record(self, record: HousingRecord) -> None:
+        time.sleep(self.latency)
+
+    def save_run_status(self, run_id: str, status: str) -> None:
+        time.sleep(self.latency)
+
+    def get_idempotency_key(self, key: str, created_after: datetime) -> Optional[str]:
+        time.sleep(self.latency)
+        return None
+
+    def save_idempotency_key(self, key: str, run_id: str, created_after: datetime) -> str:
+        time.sleep(self.latency)
+        return run_id
+
+
+class SlowETL:
+    """Pipeline whose client blocks a thread of the executor, like the Dagster adapter."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def start_prediction_pipeline(
+        self, record: HousingRecord, callback_url: Optional[str] = None
+    ) -> str:
+        await asyncio.to_thread(time.sleep, self.latency)
+        return str(uuid4())
+
+
+async def _drive(
+    service: PredictionService, concurrency: int, duration: float
+) -> Tuple[List[float], float]:
+    """Submit unique records from `concurrency` clients for `duration` seconds.
+
+    Returns:
+        Tuple[List[float], float]: Latencies of the submissions and worst event loop
+            lag, in milliseconds
+    """
+    counter = itertools.count()
+    latencies: List[float] = []
+    worst_lag = 0.0
+    deadline = time.monotonic() + duration
+
+    async def client() -> None:
+        while time.monotonic() < deadline:
+            # Vary the record so no submission is deduplicated
+            record = RECORD.model_copy(
+                update={"id": str(uuid4()), "median_income": 5.0 + next(counter) * 1e-6}
+            )
+            start = time.perf_counter()
+            await service.submit_prediction_request(record)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    async def probe() -> None:
+        nonlocal worst_lag
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            await asyncio.sleep(0.01)
+            worst_lag = max(worst_lag, (time.perf_counter() - start - 0.01) * 1000)
+
+    await asyncio.gather(probe(), *(client() for _ in range(concurrency)))
+    return latencies, worst_lag
+
+
+async def _run(threads: int, args: argparse.Namespace) -> None:
+    """Load test the service with a blocking I/O executor of the given size."""
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=threads, thread_name_prefix="blocking-io")
+    )
+    service = PredictionService(
+        etl=SlowETL(args.etl_latency),
+        storage=SlowStorage(args.storage_latency),
+        idempotency_ttl=3600.0,
+    )
+
+    latencies, worst_lag = await _drive(service, args.concurrency, args.duration)
+    latencies.sort()
+    print(
+        f"{threads:>3} threads   {len(latencies) / args.duration:8.1f} submissions/s   "
+        f"p50 {statistics.median(latencies):8.2f} ms   "
+        f"p99 {latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]:8.2f} ms   "
+        f"loop lag {worst_lag:6.2f} ms"
+    )
+
+
+def main() -> None:
+    """Run the load test."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, nargs="+", default=[8, 32, 64])
+    parser.add_argument("--concurrency", type=int, default=64, help="Concurrent clients")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per executor size")
+    parser.add_argument(
+        "--storage-latency", type=float, default=0.05, help="Seconds each storage call blocks"
+    )
+    parser.add_argument(
+        "--etl-latency", type=float, default=0.005, help="Seconds each Dagster call blocks"
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{args.concurrency} concurrent clients, storage {args.storage_latency * 1000:.0f} ms, "
+        f"Dagster {args.etl_latency * 1000:.0f} ms per call\n"
+    )
+    for threads in args.threads:
+        asyncio.run(_run(threads, args))
+
+
+if __name__ == "__main__":
+    main()
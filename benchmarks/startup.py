@@ -0,0 +1,95 @@
+"""Benchmark of the import time and memory of the API and the Dagster code location.
+
+Imports each entry point in a fresh interpreter with `-X importtime`, so nothing
+is cached between runs, and reports the median wall time of the import, the peak
+RSS of the interpreter, and the packages that took the longest to import. The
+API is imported the way a server worker does before its first request, without
+resolving any provider, which is what new instances pay before they can start.
+
+Usage:
+    python -m benchmarks.startup [--runs N] [--top N]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+ENTRY_POINTS = {
+    "api": "src.adapter.driving.fastapi.app",
+    "dagster": "src.adapter.driven.etl.assets",
+}
+
+# Prints the import wall time and the peak RSS of the child, in kilobytes on Linux
+PROBE = """
+import resource, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def _import(module: str) -> Tuple[float, float, Dict[str, int]]:
+    """Import a module in a fresh interpreter.
+
+    Returns:
+        Tuple[float, float, Dict[str, int]]: Import time in milliseconds, peak RSS
+            in megabytes, and import time in microseconds by top-level package
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-W", "ignore", "-c", PROBE.format(module=module)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed, maxrss = result.stdout.split()
+
+    # Lines read "import time: self [us] | cumulative | imported package". The self
+    # times of all the modules of a package add up to what importing it costs
+    packages: Dict[str, int] = defaultdict(int)
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        own, _, name = line[len("import time:") :].split("|")
+        packages[name.strip().split(".")[0]] += int(own)
+
+    return float(elapsed) * 1000, int(maxrss) / 1024, packages
+
+
+def _run(name: str, module: str, runs: int, top: int) -> None:
+    """Benchmark the import of an entry point."""
+    times: List[float] = []
+    rss: List[float] = []
+    packages: Dict[str, int] = {}
+    for _ in range(runs):
+        elapsed, maxrss, packages = _import(module)
+        times.append(elapsed)
+        rss.append(maxrss)
+
+    print(
+        f"{name:<8} {statistics.median(times):8.1f} ms   "
+        f"min {min(times):8.1f} ms   RSS {statistics.median(rss):6.1f} MB"
+    )
+    heaviest = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+    for package, own in heaviest:
+        print(f"    {package:<28} {own / 1000:8.1f} ms")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Imports per entry point")
+    parser.add_argument("--top", type=int, default=10, help="Heaviest packages to list")
+    parser.add_argument(
+        "--entry-points", nargs="+", choices=list(ENTRY_POINTS), default=list(ENTRY_POINTS)
+    )
+    args = parser.parse_args()
+
+    for name in args.entry_points:
+        _run(name, ENTRY_POINTS[name], args.runs, args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Benchmark of the API throughput across numbers of gunicorn workers.
+
+Starts the production server with `gunicorn.conf.py` once per worker count and
+drives it with a fixed number of concurrent clients scoring records in-process
+(`POST /predictions?mode=sync`). Every record is different, so no request is
+answered from the prediction cache. The server uses the `.env` settings, so
+PostgreSQL and the model file must be reachable, as with `docker compose up`.
+
+Usage:
+    python -m benchmarks.worker_throughput [--workers 1 2 4 8] [--duration S]
+"""
+import argparse
+import asyncio
+import itertools
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import httpx
+
+from main import APP
+
+GUNICORN_CONFIG = Path(__file__).resolve().parent.parent / "gunicorn.conf.py"
+
+RECORD: Dict[str, object] = {
+    "longitude": -122.64,
+    "latitude": 38.01,
+    "housing_median_age": 36.0,
+    "total_rooms": 1336.0,
+    "total_bedrooms": 258.0,
+    "population": 678.0,
+    "households": 249.0,
+    "median_income": 5.5789,
+    "ocean_proximity": "NEAR OCEAN",
+}
+
+
+def _start_server(workers: int, port: int) -> subprocess.Popen:
+    """Start gunicorn with the given number of workers."""
+    env = dict(os.environ, WEB_CONCURRENCY=str(workers), API_HOST="127.0.0.1", API_PORT=str(port))
+    return subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "--config", str(GUNICORN_CONFIG), APP],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+async def _wait_until_healthy(client: httpx.AsyncClient, timeout: float = 60.0) -> None:
+    """Wait for the server to answer its health check."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if (await client.get("/health")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise TimeoutError("Server did not become healthy")
+
+
+async def _drive(client: httpx.AsyncClient, concurrency: int, duration: float) -> List[float]:
+    """Send requests from `concurrency` clients for `duration` seconds.
+
+    Returns:
+        List[float]: Latencies of the successful requests, in milliseconds
+    """
+    counter = itertools.count()
+    latencies: List[float] = []
+    errors = 0
+    deadline = time.monotonic() + duration
+
+    async def worker() -> None:
+        nonlocal errors
+        while time.monotonic() < deadline:
+            # Vary the record so the prediction cache never answers
+            record = dict(RECORD, median_income=RECORD["median_income"] + next(counter) * 1e-6)
+            start = time.perf_counter()
+            response = await client.post("/predictions", params={"mode": "sync"}, json=record)
+            if response.status_code == 200:
+                latencies.append((time.perf_counter() - start) * 1000)
+            else:
+                errors += 1
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    if errors:
+        print(f"  {errors} requests failed")
+    return latencies
+
+
+async def _run(workers: int, port: int, concurrency: int, duration: float) -> None:
+    """Benchmark a server with the given number of workers."""
+    server = _start_server(workers, port)
+    limits = httpx.Limits(max_connections=concurrency)
+    try:
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=30.0
+        ) as client:
+            await _wait_until_healthy(client)
+            await _drive(client, concurrency, min(duration, 2.0))  # Warm up
+            latencies = await _drive(client, concurrency, duration)
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait()
+
+    if not latencies:
+        print(f"{workers:>2} workers   no successful requests")
+        return
+
+    latencies.sort()
+    print(
+        f"{workers:>2} workers   {len(latencies) / duration:9.1f} req/s   "
+        f"p50 {statistics.median(latencies):8.2f} ms   "
+        f"p99 {latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]:8.2f} ms"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--concurrency", type=int, default=64, help="Concurrent clients")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per worker count")
+    parser.add_argument("--port", type=int, default=8100, help="Port the server listens on")
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPUs, {args.concurrency} concurrent clients\n")
+    for workers in args.workers:
+        asyncio.run(_run(workers, args.port, args.concurrency, args.duration))
+
+
+if __name__ == "__main__":
+    main()
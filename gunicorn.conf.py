@@ -0,0 +1,83 @@
+"""Gunicorn configuration for the production server.
+
+Runs the FastAPI app in several uvicorn worker processes. The app is imported
+and the model loaded once in the master process before the workers are forked,
+so the workers share the model's memory pages instead of each loading a copy.
+
+Usage:
+    gunicorn --config gunicorn.conf.py src.adapter.driving.fastapi.app:app
+"""
+import asyncio
+import gc
+import glob
+import multiprocessing
+import os
+import tempfile
+
+# Metrics are only shared between workers if this is set before prometheus_client
+# is first imported, so before the app is
+multiproc_dir = os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR", os.path.join(tempfile.gettempdir(), "prometheus_multiproc")
+)
+
+# Samples left by a previous server would otherwise be added to the new totals
+os.makedirs(multiproc_dir, exist_ok=True)
+for stale in glob.glob(os.path.join(multiproc_dir, "*.db")):
+    os.remove(stale)
+
+bind = f"{os.getenv('API_HOST', '0.0.0.0')}:{os.getenv('API_PORT', '8000')}"
+
+# Scoring is CPU bound, so one worker per CPU unless told otherwise
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Import the app in the master so the workers inherit it, model included
+preload_app = True
+
+# Let in-flight requests and micro-batches drain on shutdown
+graceful_timeout = 30
+keepalive = 5
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "info")
+
+
+def when_ready(server) -> None:
+    """Load the model in the master process, once the app is imported.
+
+    The adapters are imported when first resolved. Those the workers need before
+    they are ready are imported here, for the workers to share them, while the
+    Dagster client is left to each worker to import in the background of its
+    warm-up, so that it does not hold back the workers of a new instance.
+
+    Args:
+        server: The gunicorn arbiter
+    """
+    # The app module is imported first, since it is the one wiring the container
+    from src.adapter.driving.fastapi.app import container
+
+    try:
+        asyncio.run(container.model().load_model())
+        server.log.info("Model preloaded before forking workers")
+    except Exception as e:
+        # Workers still load the model on their first prediction
+        server.log.warning(f"Error preloading model: {str(e)}")
+
+    # The engine itself is created in the workers, as connections do not survive a fork
+    import src.adapter.driven.storage.postgres_adapter  # noqa: F401
+
+    # Keep the garbage collector from touching, and so copying, the shared pages
+    gc.freeze()
+
+
+def child_exit(server, worker) -> None:
+    """Drop the live metrics of a worker that exited.
+
+    Args:
+        server: The gunicorn arbiter
+        worker: The worker that exited
+    """
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
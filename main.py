@@ -1,9 +1,32 @@
 """Main entry point for the FastAPI application."""
+import argparse
+import os
+from pathlib import Path
+
 import uvicorn
 
+APP = "src.adapter.driving.fastapi.app:app"
+GUNICORN_CONFIG = Path(__file__).with_name("gunicorn.conf.py")
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the housing price prediction API.")
+    parser.add_argument(
+        "--prod",
+        action="store_true",
+        help="Run several gunicorn workers instead of a single reloading development server",
+    )
+    parser.add_argument(
+        "--workers", type=int, help="Number of worker processes with --prod (default: CPU count)"
+    )
+    args = parser.parse_args()
+
+    if args.prod:
+        if args.workers:
+            os.environ["WEB_CONCURRENCY"] = str(args.workers)
+        os.execvp("gunicorn", ["gunicorn", "--config", str(GUNICORN_CONFIG), APP])
+
     uvicorn.run(
-        "src.adapter.driving.fastapi.app:app",
+        APP,
         host="0.0.0.0",
         port=8000,
         reload=True,
@@ -1,14 +1,23 @@
 """Dagster assets for the housing prediction pipeline."""
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
 import dagster as dg
+import pandas as pd
 
+from src.adapter.driven.etl.cleaning import clean_batch
+from src.adapter.driven.etl.dagster_adapter import CALLBACK_URL_TAG
+from src.adapter.driven.etl.housing_source import HousingFileResource
 from src.adapter.driven.model.model_resource import ModelResource
 from src.adapter.driven.storage.postgres_resource import PostgresResource
 from src.config.settings import get_settings
-from src.core.domain.entities.housing_record import HousingRecord
-from src.core.domain.entities.prediction import Prediction
+from src.core.domain.entities.housing_record import (
+    NUMERIC_FEATURES,
+    OCEAN_PROXIMITY_CATEGORIES,
+    HousingRecord,
+)
+from src.core.domain.entities.prediction import Prediction, PredictionStatus
+from src.core.domain.entities.webhook import WebhookDelivery
 from src.core.domain.exceptions import (
     DataCleaningError,
     DataValidationError,
@@ -42,7 +51,8 @@ def cleaned_data(
 ) -> HousingRecord:
     """Asset that cleans the raw data.
 
-    This asset takes the raw data and performs cleaning operations:
+    The record goes through the rules of `cleaned_batch_data`, as a batch of one,
+    so both pipelines accept and reject the same records:
     - Validates data types and ranges
     - Handles missing values
     - Validates ocean proximity values
@@ -58,129 +68,25 @@ def cleaned_data(
         DataValidationError: If the data validation fails
         DataCleaningError: If the data cleaning fails
     """
+    context.log.info(
+        f"Starting data cleaning for record ID: {raw_input.get('record_id', 'unknown')}"
+    )
     try:
-        context.log.info(
-            f"Starting data cleaning for record ID: {raw_input.get('record_id', 'unknown')}"
-        )
-
-        # Clean the data
-        context.log.debug("Cleaning data")
-        cleaned_data = raw_input.copy()
-
-        # Convert string values to floats
-        numeric_fields = [
-            "longitude",
-            "latitude",
-            "housing_median_age",
-            "total_rooms",
-            "total_bedrooms",
-            "population",
-            "households",
-            "median_income",
-        ]
-
-        for field in numeric_fields:
-            if field in cleaned_data and isinstance(cleaned_data[field], str):
-                try:
-                    cleaned_data[field] = float(cleaned_data[field])
-                except ValueError as e:
-                    context.log.error(f"Invalid numeric value for {field}: {cleaned_data[field]}")
-                    raise DataValidationError(f"{field} must be a valid number") from e
-
-        # Validate data types and ranges
-        context.log.debug("Validating data types and ranges")
-        if not isinstance(cleaned_data.get("longitude"), (int, float)) or not isinstance(
-            cleaned_data.get("latitude"), (int, float)
-        ):
-            context.log.error("Invalid longitude or latitude data type")
-            raise DataValidationError("Longitude and latitude must be numeric")
-
-        if (
-            not isinstance(cleaned_data.get("housing_median_age"), (int, float))
-            or cleaned_data.get("housing_median_age") < 0
-        ):
-            context.log.error("Invalid housing median age")
-            raise DataValidationError("Housing median age must be a non-negative number")
-
-        if (
-            not isinstance(cleaned_data.get("total_rooms"), (int, float))
-            or cleaned_data.get("total_rooms") < 0
-        ):
-            context.log.error("Invalid total rooms")
-            raise DataValidationError("Total rooms must be a non-negative number")
-
-        if (
-            not isinstance(cleaned_data.get("total_bedrooms"), (int, float))
-            or cleaned_data.get("total_bedrooms") < 0
-        ):
-            context.log.error("Invalid total bedrooms")
-            raise DataValidationError("Total bedrooms must be a non-negative number")
-
-        if (
-            not isinstance(cleaned_data.get("population"), (int, float))
-            or cleaned_data.get("population") < 0
-        ):
-            context.log.error("Invalid population")
-            raise DataValidationError("Population must be a non-negative number")
-
-        if (
-            not isinstance(cleaned_data.get("households"), (int, float))
-            or cleaned_data.get("households") < 0
-        ):
-            context.log.error("Invalid households")
-            raise DataValidationError("Households must be a non-negative number")
-
-        if (
-            not isinstance(cleaned_data.get("median_income"), (int, float))
-            or cleaned_data.get("median_income") < 0
-        ):
-            context.log.error("Invalid median income")
-            raise DataValidationError("Median income must be a non-negative number")
-
-        # Validate ocean proximity
-        context.log.debug("Validating ocean proximity")
-        ocean_proximity = cleaned_data.get("ocean_proximity")
-        if not ocean_proximity:
-            context.log.error("Missing ocean proximity")
-            raise DataValidationError("Ocean proximity is required")
-
-        # Use OceanProximity value object for validation
-        valid_categories = ["<1H OCEAN", "INLAND", "ISLAND", "NEAR BAY", "NEAR OCEAN"]
-        if ocean_proximity not in valid_categories:
-            context.log.error(f"Invalid ocean proximity: {ocean_proximity}")
-            raise DataValidationError(f"Invalid ocean proximity: {ocean_proximity}")
-
-        # Handle missing values
-        if cleaned_data.get("total_bedrooms") is None:
-            context.log.info("Filling missing total_bedrooms with median")
-            cleaned_data["total_bedrooms"] = 0
-
-        # Create and return a HousingRecord object
-        housing_record = HousingRecord(
-            # Only set id if record_id is provided, otherwise let the default factory generate one
-            **({"id": cleaned_data.get("record_id")} if cleaned_data.get("record_id") else {}),
-            longitude=cleaned_data.get("longitude"),
-            latitude=cleaned_data.get("latitude"),
-            housing_median_age=cleaned_data.get("housing_median_age"),
-            total_rooms=cleaned_data.get("total_rooms"),
-            total_bedrooms=cleaned_data.get("total_bedrooms"),
-            population=cleaned_data.get("population"),
-            households=cleaned_data.get("households"),
-            median_income=cleaned_data.get("median_income"),
-            ocean_proximity=cleaned_data.get("ocean_proximity"),
-        )
-
-        context.log.info(f"Data cleaning completed successfully for record ID: {housing_record.id}")
-        return housing_record
-
-    except DataValidationError as e:
-        context.log.error(f"Data validation error: {str(e)}")
-        raise
+        result = clean_batch([raw_input])
 
     except Exception as e:
         context.log.error(f"Unexpected error during data cleaning: {str(e)}")
         raise DataCleaningError(f"Error cleaning data: {str(e)}") from e
 
+    if not result.errors.empty:
+        error = result.errors.iloc[0]
+        context.log.error(f"Data validation error: {error}")
+        raise DataValidationError(error)
+
+    (housing_record,) = result.to_housing_records()
+    context.log.info(f"Data cleaning completed successfully for record ID: {housing_record.id}")
+    return housing_record
+
 
 @dg.asset
 def stored_cleaned_data(
@@ -217,6 +123,61 @@ def stored_cleaned_data(
         raise StorageError(f"Error storing cleaned data: {str(e)}") from e
 
 
+def _prepare_features(context, record: HousingRecord) -> Dict[str, Any]:
+    """Build the model feature dictionary for a single cleaned record.
+
+    Args:
+        context: The Dagster context
+        record: The cleaned data as a HousingRecord
+
+    Returns:
+        A dictionary containing the prepared features
+    """
+    # Extract features
+    context.log.debug("Extracting features")
+    features = {
+        "longitude": record.longitude,
+        "latitude": record.latitude,
+        "housing_median_age": record.housing_median_age,
+        "total_rooms": record.total_rooms,
+        "total_bedrooms": record.total_bedrooms,
+        "population": record.population,
+        "households": record.households,
+        "median_income": record.median_income,
+        "ocean_proximity": record.ocean_proximity,
+    }
+
+    # One-hot encode ocean_proximity
+    context.log.debug("One-hot encoding ocean_proximity")
+    ocean_proximity = features.pop("ocean_proximity")
+
+    for category in OCEAN_PROXIMITY_CATEGORIES:
+        features[f"ocean_proximity_{category}"] = 1 if ocean_proximity == category else 0
+
+    # Scale numerical features (in a real scenario, we'd use a scaler from the model)
+    context.log.debug("Scaling numerical features")
+    # For simplicity, we'll just use the raw values
+    # In a real scenario, we'd use a scaler from the model
+    return features
+
+
+def _prepare_batch_features(cleaned: pd.DataFrame) -> pd.DataFrame:
+    """Build the model features of a batch of cleaned records, a column at a time.
+
+    Args:
+        cleaned: The cleaned records, with the `CLEANED_COLUMNS` columns
+
+    Returns:
+        The features of each record, as `_prepare_features` builds them, in batch order
+    """
+    features = cleaned.loc[:, list(NUMERIC_FEATURES)]
+    for category in OCEAN_PROXIMITY_CATEGORIES:
+        features[f"ocean_proximity_{category}"] = (cleaned["ocean_proximity"] == category).astype(
+            int
+        )
+    return features
+
+
 @dg.asset
 def prepared_data(
     context,
@@ -242,32 +203,7 @@ def prepared_data(
     try:
         context.log.info(f"Preparing data for prediction for record ID: {cleaned_data.id}")
 
-        # Extract features
-        context.log.debug("Extracting features")
-        features = {
-            "longitude": cleaned_data.longitude,
-            "latitude": cleaned_data.latitude,
-            "housing_median_age": cleaned_data.housing_median_age,
-            "total_rooms": cleaned_data.total_rooms,
-            "total_bedrooms": cleaned_data.total_bedrooms,
-            "population": cleaned_data.population,
-            "households": cleaned_data.households,
-            "median_income": cleaned_data.median_income,
-            "ocean_proximity": cleaned_data.ocean_proximity,
-        }
-
-        # One-hot encode ocean_proximity
-        context.log.debug("One-hot encoding ocean_proximity")
-        ocean_proximity = features.pop("ocean_proximity")
-        valid_categories = ["<1H OCEAN", "INLAND", "ISLAND", "NEAR BAY", "NEAR OCEAN"]
-
-        for category in valid_categories:
-            features[f"ocean_proximity_{category}"] = 1 if ocean_proximity == category else 0
-
-        # Scale numerical features (in a real scenario, we'd use a scaler from the model)
-        context.log.debug("Scaling numerical features")
-        # For simplicity, we'll just use the raw values
-        # In a real scenario, we'd use a scaler from the model
+        features = _prepare_features(context, cleaned_data)
 
         context.log.info(
             f"Data preparation completed successfully for record ID: {cleaned_data.id}"
@@ -321,16 +257,20 @@ def stored_prediction_result(
     prediction_result: List[float],
     stored_cleaned_data: Dict[str, Any],
     postgres: PostgresResource,
+    model: ModelResource,
 ) -> Dict[str, Any]:
     """Asset that stores the predictions in PostgreSQL.
 
     This asset takes the predictions and stores them in the PostgreSQL database.
+    If the run was submitted with a callback URL, its completion notice is queued
+    in the webhook outbox in the same transaction, and sent by the API.
 
     Args:
         context: The Dagster context
         prediction_result: The predictions as a list of floats
         stored_cleaned_data: The stored cleaned data containing the record ID
         postgres: The PostgreSQL resource
+        model: The ML model resource the prediction was made with
 
     Returns:
         A dictionary containing the predictions
@@ -349,11 +289,18 @@ def stored_prediction_result(
             value=prediction_result[0],
             created_at=datetime.utcnow(),
             run_id=context.run_id,  # Get run_id from Dagster context
+            model_version=model.get_version(),
+        )
+
+        # The notice is stored with the prediction, so neither exists without the other
+        callback_url = context.run.tags.get(CALLBACK_URL_TAG)
+        delivery = (
+            WebhookDelivery.for_prediction(prediction, callback_url) if callback_url else None
         )
 
         # Store the prediction using the PostgresResource
         # The save_prediction method returns the record_id as a string
-        record_id = postgres.save_prediction(prediction)
+        record_id = postgres.save_prediction(prediction, delivery=delivery)
 
         context.log.info(f"Successfully stored prediction with record ID: {record_id}")
         return {
@@ -367,7 +314,451 @@ def stored_prediction_result(
         raise PredictionError(f"Error storing prediction: {str(e)}") from e
 
 
-@dg.job
+@dg.asset
+def raw_batch_input(context: dg.OpExecutionContext) -> List[Dict[str, Any]]:
+    """Asset that loads a batch of raw input records.
+
+    This asset is the entry point for the batch pipeline. It loads the list of raw
+    records from the context so a whole batch is scored in a single run.
+
+    Args:
+        context: The Dagster context
+
+    Returns:
+        A list of dictionaries containing the raw input data
+    """
+    data = context.op_config["data"]
+    return list(data)
+
+
+@dg.asset
+def cleaned_batch_data(
+    context,
+    raw_batch_input: List[Dict[str, Any]],
+) -> pd.DataFrame:
+    """Asset that cleans a batch of raw records.
+
+    Every record goes through the same cleaning rules as `cleaned_data`, applied
+    to the whole batch at once. The batch fails as a whole if any record is
+    invalid, reporting the first offending index.
+
+    Args:
+        context: The Dagster context
+        raw_batch_input: The raw data as a list of dictionaries
+
+    Returns:
+        The cleaned records, with the `CLEANED_COLUMNS` columns, in batch order
+
+    Raises:
+        DataValidationError: If the data validation fails
+        DataCleaningError: If the data cleaning fails
+    """
+    context.log.info(f"Starting batch data cleaning for {len(raw_batch_input)} records")
+    try:
+        result = clean_batch(raw_batch_input)
+
+    except Exception as e:
+        context.log.error(f"Unexpected error during batch data cleaning: {str(e)}")
+        raise DataCleaningError(f"Error cleaning batch: {str(e)}") from e
+
+    if not result.errors.empty:
+        index, error = next(iter(result.errors.items()))
+        context.log.error(f"Data validation error in {len(result.errors)} records: {error}")
+        raise DataValidationError(f"Record {index}: {error}")
+
+    context.log.info(
+        f"Batch data cleaning completed successfully for {len(result.records)} records"
+    )
+    return result.records
+
+
+@dg.asset
+def stored_cleaned_batch_data(
+    context,
+    cleaned_batch_data: pd.DataFrame,
+    postgres: PostgresResource,
+) -> Dict[str, Any]:
+    """Asset that stores a batch of cleaned records in PostgreSQL in one transaction.
+
+    Args:
+        context: The Dagster context
+        cleaned_batch_data: The cleaned records, in batch order
+        postgres: The PostgreSQL resource
+
+    Returns:
+        A dictionary containing the stored record IDs, in batch order
+
+    Raises:
+        StorageError: If the data storage fails
+    """
+    try:
+        context.log.info(f"Storing {len(cleaned_batch_data)} cleaned records")
+
+        # Only the storage needs the records as entities
+        records = [HousingRecord(**row) for row in cleaned_batch_data.to_dict("records")]
+        record_ids = postgres.save_housing_records(records)
+
+        context.log.info(f"Successfully stored {len(record_ids)} cleaned records")
+        return {"record_ids": record_ids}
+
+    except Exception as e:
+        context.log.error(f"Error storing cleaned batch data: {str(e)}")
+        raise StorageError(f"Error storing cleaned batch data: {str(e)}") from e
+
+
+@dg.asset
+def prepared_batch_data(
+    context,
+    cleaned_batch_data: pd.DataFrame,
+) -> pd.DataFrame:
+    """Asset that prepares a batch of cleaned records for prediction.
+
+    Args:
+        context: The Dagster context
+        cleaned_batch_data: The cleaned records, in batch order
+
+    Returns:
+        The features of each record, in batch order
+
+    Raises:
+        DataValidationError: If the data preparation fails
+    """
+    try:
+        context.log.info(f"Preparing {len(cleaned_batch_data)} records for prediction")
+        return _prepare_batch_features(cleaned_batch_data)
+
+    except Exception as e:
+        context.log.error(f"Error preparing batch data: {str(e)}")
+        raise DataValidationError(f"Error preparing batch data: {str(e)}") from e
+
+
+@dg.asset
+def batch_prediction_result(
+    context,
+    model: ModelResource,
+    prepared_batch_data: pd.DataFrame,
+) -> List[float]:
+    """Asset that scores a whole batch with a single model call.
+
+    Args:
+        context: The Dagster context
+        model: The model resource
+        prepared_batch_data: The features of each record, in batch order
+
+    Returns:
+        A list containing one prediction per record, in batch order
+
+    Raises:
+        PredictionError: If the prediction fails
+    """
+    try:
+        context.log.info(f"Generating predictions for {len(prepared_batch_data)} records")
+
+        predictions = model.predict_batch(prepared_batch_data)
+
+        context.log.info(f"Generated {len(predictions)} predictions successfully")
+        return predictions
+
+    except Exception as e:
+        context.log.error(f"Error generating batch predictions: {str(e)}")
+        raise PredictionError(f"Error generating batch predictions: {str(e)}") from e
+
+
+@dg.asset
+def stored_batch_prediction_result(
+    context,
+    batch_prediction_result: List[float],
+    stored_cleaned_batch_data: Dict[str, Any],
+    postgres: PostgresResource,
+    model: ModelResource,
+) -> Dict[str, Any]:
+    """Asset that stores the batch predictions in PostgreSQL in one transaction.
+
+    Args:
+        context: The Dagster context
+        batch_prediction_result: The predictions as a list of floats
+        stored_cleaned_batch_data: The stored cleaned data containing the record IDs
+        postgres: The PostgreSQL resource
+        model: The ML model resource the predictions were made with
+
+    Returns:
+        A dictionary containing the stored record IDs and predictions
+
+    Raises:
+        PredictionError: If storing the predictions fails
+    """
+    try:
+        record_ids = stored_cleaned_batch_data["record_ids"]
+        context.log.info(f"Storing {len(record_ids)} batch predictions")
+
+        created_at = datetime.utcnow()
+        model_version = model.get_version()
+        predictions = [
+            Prediction(
+                record_id=record_id,
+                value=value,
+                created_at=created_at,
+                run_id=context.run_id,
+                batch_index=index,
+                model_version=model_version,
+            )
+            for index, (record_id, value) in enumerate(zip(record_ids, batch_prediction_result))
+        ]
+
+        postgres.save_predictions(predictions)
+
+        context.log.info(f"Successfully stored {len(predictions)} batch predictions")
+        return {
+            "record_ids": record_ids,
+            "predictions": batch_prediction_result,
+            "run_id": context.run_id,
+        }
+
+    except Exception as e:
+        context.log.error(f"Error storing batch predictions: {str(e)}")
+        raise PredictionError(f"Error storing batch predictions: {str(e)}") from e
+
+
+# Slices of the backfilled housing file, one partition each. Changing their
+# number moves records to other slices, partitions materialized before then no
+# longer match their records
+BACKFILL_SLICES = get_settings().BACKFILL_PARTITION_COUNT
+BACKFILL_PARTITIONS = dg.StaticPartitionsDefinition(
+    [str(index) for index in range(BACKFILL_SLICES)]
+)
+
+# A failed step is retried within its partition, without failing the others
+BACKFILL_RETRY_POLICY = dg.RetryPolicy(
+    max_retries=get_settings().BACKFILL_MAX_RETRIES,
+    delay=5,
+    backoff=dg.Backoff.EXPONENTIAL,
+)
+
+
+class BackfillConfig(dg.Config):
+    """Configuration of a backfill run."""
+
+    skip_materialized: bool = True  # Skip the partitions whose predictions are already stored
+
+
+@dg.asset(
+    partitions_def=BACKFILL_PARTITIONS,
+    retry_policy=BACKFILL_RETRY_POLICY,
+    output_required=False,
+)
+def backfill_raw_data(
+    context: dg.AssetExecutionContext,
+    config: BackfillConfig,
+    housing_file: HousingFileResource,
+) -> Iterator[dg.Output[pd.DataFrame]]:
+    """Asset that loads the raw records of a slice of the backfilled file.
+
+    This asset is the entry point for the backfill pipeline, one partition per
+    slice. A partition whose predictions are already stored is skipped along
+    with the rest of its run, unless `skip_materialized` is turned off.
+
+    Args:
+        context: The Dagster context
+        config: The backfill configuration
+        housing_file: The housing file resource
+
+    Yields:
+        The raw records of the partition, unless it is skipped
+
+    Raises:
+        DataCleaningError: If the file cannot be read
+    """
+    partition = context.partition_key
+    if config.skip_materialized and partition in context.instance.get_materialized_partitions(
+        stored_backfill_predictions.key
+    ):
+        context.log.info(f"Skipping partition {partition}, its predictions are already stored")
+        return
+
+    try:
+        context.log.info(f"Reading partition {partition} of {housing_file.path}")
+        raw_data = housing_file.read_slice(int(partition), BACKFILL_SLICES)
+
+    except Exception as e:
+        context.log.error(f"Error reading housing file: {str(e)}")
+        raise DataCleaningError(f"Error reading housing file: {str(e)}") from e
+
+    context.log.info(f"Read {len(raw_data)} records of partition {partition}")
+    yield dg.Output(raw_data, metadata={"records": len(raw_data)})
+
+
+@dg.asset(partitions_def=BACKFILL_PARTITIONS, retry_policy=BACKFILL_RETRY_POLICY)
+def backfill_cleaned_data(
+    context: dg.AssetExecutionContext,
+    backfill_raw_data: pd.DataFrame,
+) -> pd.DataFrame:
+    """Asset that cleans the raw records of a backfill partition.
+
+    The records go through the rules of `cleaned_batch_data`. Unlike a batch
+    submitted through the API, invalid records are logged and left out rather
+    than failing the partition.
+
+    Args:
+        context: The Dagster context
+        backfill_raw_data: The raw records of the partition
+
+    Returns:
+        The cleaned records, with the `CLEANED_COLUMNS` columns
+
+    Raises:
+        DataCleaningError: If the data cleaning fails
+    """
+    try:
+        result = clean_batch(backfill_raw_data)
+
+    except Exception as e:
+        context.log.error(f"Unexpected error during backfill data cleaning: {str(e)}")
+        raise DataCleaningError(f"Error cleaning backfill partition: {str(e)}") from e
+
+    if not result.errors.empty:
+        index, error = next(iter(result.errors.items()))
+        context.log.warning(
+            f"Left out {len(result.errors)} invalid records, first of them {index}: {error}"
+        )
+
+    context.add_output_metadata({"records": len(result.records), "invalid": len(result.errors)})
+    return result.records
+
+
+@dg.asset(partitions_def=BACKFILL_PARTITIONS, retry_policy=BACKFILL_RETRY_POLICY)
+def backfill_prediction_result(
+    context: dg.AssetExecutionContext,
+    model: ModelResource,
+    backfill_cleaned_data: pd.DataFrame,
+) -> List[float]:
+    """Asset that scores the cleaned records of a backfill partition with one model call.
+
+    Args:
+        context: The Dagster context
+        model: The model resource
+        backfill_cleaned_data: The cleaned records of the partition
+
+    Returns:
+        A list containing one prediction per record, in partition order
+
+    Raises:
+        PredictionError: If the prediction fails
+    """
+    if backfill_cleaned_data.empty:
+        return []
+
+    try:
+        context.log.info(f"Generating predictions for {len(backfill_cleaned_data)} records")
+
+        predictions = model.predict_batch(_prepare_batch_features(backfill_cleaned_data))
+
+        context.log.info(f"Generated {len(predictions)} predictions successfully")
+        return predictions
+
+    except Exception as e:
+        context.log.error(f"Error generating backfill predictions: {str(e)}")
+        raise PredictionError(f"Error generating backfill predictions: {str(e)}") from e
+
+
+@dg.asset(partitions_def=BACKFILL_PARTITIONS, retry_policy=BACKFILL_RETRY_POLICY)
+def stored_backfill_predictions(
+    context: dg.AssetExecutionContext,
+    backfill_cleaned_data: pd.DataFrame,
+    backfill_prediction_result: List[float],
+    postgres: PostgresResource,
+    model: ModelResource,
+) -> Dict[str, Any]:
+    """Asset that stores the records and predictions of a backfill partition.
+
+    They are stored in one transaction, leaving out the records that already have
+    a prediction, so a partition run again, or retried, never stores one twice.
+
+    Args:
+        context: The Dagster context
+        backfill_cleaned_data: The cleaned records of the partition
+        backfill_prediction_result: The predictions, in partition order
+        postgres: The PostgreSQL resource
+        model: The ML model resource the predictions were made with
+
+    Returns:
+        A dictionary containing the number of stored and skipped predictions
+
+    Raises:
+        StorageError: If the storage fails
+    """
+    try:
+        records = [HousingRecord(**row) for row in backfill_cleaned_data.to_dict("records")]
+        context.log.info(f"Storing {len(records)} backfilled records and predictions")
+
+        created_at = datetime.utcnow()
+        model_version = model.get_version()
+        predictions = [
+            Prediction(
+                record_id=record.id,
+                value=value,
+                created_at=created_at,
+                run_id=context.run_id,
+                model_version=model_version,
+            )
+            for record, value in zip(records, backfill_prediction_result)
+        ]
+
+        stored = postgres.save_backfilled_predictions(records, predictions)
+
+    except Exception as e:
+        context.log.error(f"Error storing backfill predictions: {str(e)}")
+        raise StorageError(f"Error storing backfill predictions: {str(e)}") from e
+
+    skipped = len(predictions) - len(stored)
+    context.log.info(f"Stored {len(stored)} predictions, {skipped} were already stored")
+    context.add_output_metadata({"stored": len(stored), "skipped": skipped})
+    return {"stored": len(stored), "skipped": skipped, "run_id": context.run_id}
+
+
+# Status a run reaches once each of these steps succeeds. Storing its predictions
+# records it as completed, in the same transaction
+STEP_RUN_STATUSES = {
+    "cleaned_data": PredictionStatus.RUNNING.value,
+    "cleaned_batch_data": PredictionStatus.RUNNING.value,
+}
+
+
+def _save_run_status(context: dg.HookContext, status: str) -> None:
+    """Record the status a run reached, without failing it if that fails.
+
+    Args:
+        context: The hook context
+        status: The status the run reached
+    """
+    try:
+        context.resources.postgres.save_run_status(context.run_id, status)
+    except Exception as e:
+        context.log.warning(f"Error recording run status {status}: {str(e)}")
+
+
+@dg.success_hook(required_resource_keys={"postgres"})
+def record_run_progress(context: dg.HookContext) -> None:
+    """Hook recording that a run is in progress once its records are cleaned.
+
+    Args:
+        context: The hook context
+    """
+    status = STEP_RUN_STATUSES.get(context.op.name)
+    if status is not None:
+        _save_run_status(context, status)
+
+
+@dg.failure_hook(required_resource_keys={"postgres"})
+def record_run_failure(context: dg.HookContext) -> None:
+    """Hook recording that a run failed as soon as any of its steps does.
+
+    Args:
+        context: The hook context
+    """
+    _save_run_status(context, PredictionStatus.FAILED.value)
+
+
+@dg.job(hooks={record_run_progress, record_run_failure})
 def housing_prediction_job():
     """Define the housing prediction job."""
     # Define the assets in dependency order
@@ -379,6 +770,93 @@ def housing_prediction_job():
     stored_prediction_result(prediction, stored_cleaned)
 
 
+@dg.job(hooks={record_run_progress, record_run_failure})
+def housing_batch_prediction_job():
+    """Define the batch housing prediction job."""
+    raw_batch = raw_batch_input()
+    cleaned_batch = cleaned_batch_data(raw_batch)
+    stored_cleaned_batch = stored_cleaned_batch_data(cleaned_batch)
+    prepared_batch = prepared_batch_data(cleaned_batch)
+    predictions = batch_prediction_result(prepared_batch)
+    stored_batch_prediction_result(predictions, stored_cleaned_batch)
+
+
+# One run per partition, launched together by a backfill of the whole file and
+# run in parallel by as many run workers as the run coordinator allows
+housing_backfill_job = dg.define_asset_job(
+    "housing_backfill_job",
+    selection=[
+        backfill_raw_data,
+        backfill_cleaned_data,
+        backfill_prediction_result,
+        stored_backfill_predictions,
+    ],
+    partitions_def=BACKFILL_PARTITIONS,
+)
+
+
+def _record_failed_run(
+    context: dg.RunStatusSensorContext, postgres: PostgresResource, error: str
+) -> None:
+    """Record a prediction run as failed, and queue its failure notice.
+
+    The notice is queued for runs submitted with a callback URL.
+
+    Args:
+        context: The run status sensor context
+        postgres: The PostgreSQL resource
+        error: Why the run failed
+    """
+    run_id = context.dagster_run.run_id
+    callback_url = context.dagster_run.tags.get(CALLBACK_URL_TAG)
+    if callback_url:
+        postgres.save_webhook_delivery(WebhookDelivery.for_failed_run(run_id, callback_url, error))
+        context.log.info(f"Queued failure notice for run_id: {run_id}")
+
+    postgres.save_run_status(run_id, PredictionStatus.FAILED.value)
+
+
+@dg.run_failure_sensor(
+    monitored_jobs=[housing_prediction_job, housing_batch_prediction_job],
+    # Failures are only recorded here, so the sensor must not wait to be turned on
+    default_status=dg.DefaultSensorStatus.RUNNING,
+)
+def prediction_failure_webhook(
+    context: dg.RunFailureSensorContext,
+    postgres: PostgresResource,
+) -> None:
+    """Sensor recording failed prediction runs, and queuing their failure notice.
+
+    Runs that failed outside of a step, such as a crashed run worker, are only
+    recorded as failed here.
+
+    Args:
+        context: The run failure sensor context
+        postgres: The PostgreSQL resource
+    """
+    _record_failed_run(context, postgres, context.failure_event.message or "Prediction run failed")
+
+
+@dg.run_status_sensor(
+    run_status=dg.DagsterRunStatus.CANCELED,
+    monitored_jobs=[housing_prediction_job, housing_batch_prediction_job],
+    default_status=dg.DefaultSensorStatus.RUNNING,
+)
+def prediction_cancellation_webhook(
+    context: dg.RunStatusSensorContext,
+    postgres: PostgresResource,
+) -> None:
+    """Sensor recording canceled prediction runs as failed, and queuing their failure notice.
+
+    Canceled runs run no failure hook, and are otherwise left pending or running.
+
+    Args:
+        context: The run status sensor context
+        postgres: The PostgreSQL resource
+    """
+    _record_failed_run(context, postgres, "Prediction run was canceled")
+
+
 # Define the Dagster definitions
 defs = dg.Definitions(
     assets=[
@@ -388,10 +866,22 @@ defs = dg.Definitions(
         prepared_data,
         prediction_result,
         stored_prediction_result,
+        raw_batch_input,
+        cleaned_batch_data,
+        stored_cleaned_batch_data,
+        prepared_batch_data,
+        batch_prediction_result,
+        stored_batch_prediction_result,
+        backfill_raw_data,
+        backfill_cleaned_data,
+        backfill_prediction_result,
+        stored_backfill_predictions,
     ],
     resources={
         "postgres": PostgresResource(connection_url=get_settings().database_url),
         "model": ModelResource(model_path=get_settings().MODEL_PATH),
+        "housing_file": HousingFileResource(path=get_settings().BACKFILL_SOURCE_PATH),
     },
-    jobs=[housing_prediction_job],
+    jobs=[housing_prediction_job, housing_batch_prediction_job, housing_backfill_job],
+    sensors=[prediction_failure_webhook, prediction_cancellation_webhook],
 )
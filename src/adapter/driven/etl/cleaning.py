@@ -0,0 +1,112 @@
+"""Vectorized cleaning and validation of batches of raw housing records."""
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Sequence, Tuple, Union
+from uuid import uuid4
+
+import numpy as np
+import pandas as pd
+
+from src.core.domain.entities.housing_record import (
+    NUMERIC_FEATURES,
+    OCEAN_PROXIMITY_CATEGORIES,
+    HousingRecord,
+)
+
+# A batch of raw records: a DataFrame, arrays by column, or one dictionary per record
+RawBatch = Union[pd.DataFrame, Mapping[str, Union[Sequence[Any], np.ndarray]], Sequence[Mapping]]
+
+# Value given to a missing total_bedrooms
+MISSING_TOTAL_BEDROOMS = 0.0
+
+# Inclusive range of each numeric field, and the error of the values outside of it
+NUMERIC_RANGES: Dict[str, Tuple[float, float, str]] = {
+    "longitude": (-180.0, 180.0, "Longitude must be a number between -180 and 180"),
+    "latitude": (-90.0, 90.0, "Latitude must be a number between -90 and 90"),
+    "housing_median_age": (0.0, np.inf, "Housing median age must be a non-negative number"),
+    "total_rooms": (0.0, np.inf, "Total rooms must be a non-negative number"),
+    "total_bedrooms": (0.0, np.inf, "Total bedrooms must be a non-negative number"),
+    "population": (0.0, np.inf, "Population must be a non-negative number"),
+    "households": (0.0, np.inf, "Households must be a non-negative number"),
+    "median_income": (0.0, np.inf, "Median income must be a non-negative number"),
+}
+
+# Columns of the cleaned records, in order
+CLEANED_COLUMNS: Tuple[str, ...] = ("id",) + NUMERIC_FEATURES + ("ocean_proximity",)
+
+
+@dataclass
+class CleaningResult:
+    """Valid rows of a cleaned batch, and the reasons the other rows were rejected.
+
+    Both are indexed by the position of their row in the raw batch.
+
+    Attributes:
+        records: The cleaned rows, with the `CLEANED_COLUMNS` columns
+        errors: The errors of each rejected row, separated by "; "
+    """
+
+    records: pd.DataFrame
+    errors: "pd.Series[str]"
+
+    def to_housing_records(self) -> List[HousingRecord]:
+        """Build the HousingRecord of each valid row, in batch order."""
+        return [HousingRecord(**row) for row in self.records.to_dict("records")]
+
+
+def clean_batch(batch: RawBatch) -> CleaningResult:
+    """Clean and validate a batch of raw records, a column at a time.
+
+    Applies the rules of the single-record pipeline to every row at once:
+    - Numeric strings are converted to floats
+    - Numeric fields must be numbers within their range, see `NUMERIC_RANGES`
+    - A missing total_bedrooms is set to `MISSING_TOTAL_BEDROOMS`
+    - ocean_proximity must be one of `OCEAN_PROXIMITY_CATEGORIES`
+    A `record_id` is kept as the ID of its record, rows without one get a new ID.
+    Invalid rows are reported rather than raised, so one bad row never rejects
+    the others.
+
+    Args:
+        batch: The raw records, as a DataFrame, arrays by column, or dictionaries
+
+    Returns:
+        CleaningResult: The cleaned rows and the errors of the rejected ones
+    """
+    raw = batch if isinstance(batch, pd.DataFrame) else pd.DataFrame(batch)
+    raw = raw.reset_index(drop=True)
+    missing = pd.Series(np.nan, index=raw.index, dtype=object)
+
+    cleaned = pd.DataFrame(index=raw.index)
+    problems: List["pd.Series[str]"] = []
+
+    for field in NUMERIC_FEATURES:
+        column = raw[field] if field in raw else missing
+        values = pd.to_numeric(column, errors="coerce").astype(float)
+        unparsable = values.isna() & column.notna()
+        if field == "total_bedrooms":
+            values = values.mask(column.isna(), MISSING_TOTAL_BEDROOMS)
+
+        lower, upper, message = NUMERIC_RANGES[field]
+        out_of_range = ~values.between(lower, upper) & ~unparsable
+        problems.append(pd.Series(f"{field} must be a valid number", index=raw.index[unparsable]))
+        problems.append(pd.Series(message, index=raw.index[out_of_range]))
+        cleaned[field] = values
+
+    ocean_proximity = raw["ocean_proximity"] if "ocean_proximity" in raw else missing
+    absent = ocean_proximity.isna() | (ocean_proximity == "")
+    unknown = ~ocean_proximity.isin(OCEAN_PROXIMITY_CATEGORIES) & ~absent
+    problems.append(pd.Series("Ocean proximity is required", index=raw.index[absent]))
+    problems.append("Invalid ocean proximity: " + ocean_proximity[unknown].astype(str))
+    cleaned["ocean_proximity"] = ocean_proximity
+
+    record_ids = raw["record_id"] if "record_id" in raw else missing
+    record_ids = record_ids.where(record_ids.notna() & (record_ids != ""), None)
+    unset = record_ids.isna()
+    record_ids[unset] = [str(uuid4()) for _ in range(int(unset.sum()))]
+    cleaned["id"] = record_ids.astype(str)
+
+    errors = pd.concat(problems).groupby(level=0).agg("; ".join).astype(str)
+    valid = ~raw.index.isin(errors.index)
+    return CleaningResult(
+        records=cleaned.loc[valid, list(CLEANED_COLUMNS)],
+        errors=errors.sort_index(),
+    )
@@ -1,21 +1,141 @@
 """Dagster adapter implementation."""
+import asyncio
 import logging
 import os
+import threading
 from datetime import datetime
-from typing import Literal, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+)
 from urllib.parse import urlparse
 
-from dagster import DagsterRunStatus
-from dagster_graphql import DagsterGraphQLClient, DagsterGraphQLClientError
+import httpx
 
 from src.config.settings import get_settings
 from src.core.domain.entities.housing_record import HousingRecord
-from src.core.domain.exceptions import PipelineError
+from src.core.domain.exceptions import PipelineError, PipelineUnavailableError
 from src.core.port.etl_port import ETLPort, PipelineRunProtocol
+from src.core.service.circuit_breaker import CircuitBreaker
+
+if TYPE_CHECKING:
+    from dagster_graphql import DagsterGraphQLClient
+
+T = TypeVar("T")
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# Run tag carrying the URL notified when a prediction run completes or fails
+CALLBACK_URL_TAG = "housing/callback_url"
+
+# Jobs started by the API
+PREDICTION_JOBS = ("housing_prediction_job", "housing_batch_prediction_job")
+
+# Dagster run statuses mapped to pipeline statuses, all others being "pending"
+RUN_STATUSES = {
+    "SUCCESS": "completed",
+    "FAILURE": "failed",
+    "CANCELED": "failed",
+    "STARTED": "running",
+}
+
+# Run statuses of runs waiting in the run queue or holding a run worker
+ACTIVE_RUN_STATUSES = ["QUEUED", "NOT_STARTED", "STARTING", "STARTED"]
+
+# Seconds to wait for the webserver to answer a GraphQL query
+GRAPHQL_TIMEOUT = 30.0
+
+# Finds the repository location of every job in a single round trip
+JOB_LOCATIONS_QUERY = """
+query PredictionJobLocations {
+  repositoriesOrError {
+    __typename
+    ... on RepositoryConnection {
+      nodes { name location { name } pipelines { name } }
+    }
+    ... on PythonError { message }
+  }
+}
+"""
+
+# Counts the active runs of both prediction jobs in a single round trip
+ACTIVE_RUN_COUNT_QUERY = """
+query ActivePredictionRuns($single: RunsFilter, $batch: RunsFilter) {
+  single: runsOrError(filter: $single) {
+    __typename
+    ... on Runs { count }
+    ... on PythonError { message }
+  }
+  batch: runsOrError(filter: $batch) {
+    __typename
+    ... on Runs { count }
+    ... on PythonError { message }
+  }
+}
+"""
+
+# Gets the statuses of any number of runs in a single round trip
+RUN_STATUSES_QUERY = """
+query PredictionRunStatuses($filter: RunsFilter, $limit: Int) {
+  runsOrError(filter: $filter, limit: $limit) {
+    __typename
+    ... on Runs { results { runId status } }
+    ... on PythonError { message }
+  }
+}
+"""
+
+
+def _client_error() -> Type[Exception]:
+    """Get the error raised by the Dagster client.
+
+    Only called to match an exception, once the client has been imported.
+
+    Returns:
+        Type[Exception]: The DagsterGraphQLClientError class
+    """
+    from dagster_graphql import DagsterGraphQLClientError
+
+    return DagsterGraphQLClientError
+
+
+def _is_unavailable(error: BaseException) -> bool:
+    """Tell whether an error shows that Dagster is unavailable.
+
+    Transport errors, timeouts and 5xx responses do, wherever they are in the
+    causes of the error. Errors Dagster answers a query with, such as an unknown
+    run ID or an invalid query, do not.
+
+    Args:
+        error: The error a query raised
+
+    Returns:
+        bool: Whether the error shows that Dagster is unavailable
+    """
+    # gql is only imported, with the client, to match the errors it raised
+    from gql.transport.exceptions import TransportServerError
+
+    cause: Optional[BaseException] = error
+    while cause is not None:
+        if isinstance(cause, httpx.HTTPStatusError):
+            return cause.response.status_code >= 500
+        if isinstance(cause, TransportServerError):
+            return cause.code is None or cause.code >= 500
+        # The errors of requests, used by the client, are OSErrors, as timeouts are
+        if isinstance(cause, (httpx.TransportError, OSError)):
+            return True
+        cause = cause.__cause__
+    return False
+
 
 class DagsterPipelineRun(PipelineRunProtocol):
     """Implementation of PipelineRunProtocol for Dagster."""
@@ -36,32 +156,205 @@ class DagsterPipelineRun(PipelineRunProtocol):
 
 
 class DagsterETLAdapter(ETLPort):
-    """Implementation of ETLPort using Dagster's GraphQL Python client."""
+    """Implementation of ETLPort using Dagster's GraphQL Python client.
+
+    The client is synchronous, so its queries run in the default executor of the
+    event loop, each thread with a client of its own. Queries the client has no
+    public method for are POSTed to the GraphQL endpoint of the webserver by the
+    adapter itself. With a circuit breaker, all queries go through it, and fail
+    fast while Dagster is degraded. Only the queries failing because Dagster is
+    unavailable count against it, and raise PipelineUnavailableError.
+    """
 
-    def __init__(self) -> None:
-        """Initialize the adapter with Dagster client."""
+    def __init__(self, breaker: Optional[CircuitBreaker] = None) -> None:
+        """Initialize the adapter, without connecting to Dagster yet.
+
+        Args:
+            breaker: Circuit breaker the queries go through, if any
+        """
 
         # Use the provided URL or get it from environment variables
         self.dagster_url = os.getenv("DAGSTER_WEBSERVER_URL", "http://dagster-webserver:3000")
         logger.info(f"Initializing DagsterETLAdapter with URL: {self.dagster_url}")
+        self.settings = get_settings()
+        # Clients by thread, created on first use, as importing the client imports
+        # all of Dagster
+        self._local = threading.local()
+        # Repository location and name of each job, once resolved
+        self._job_locations: Dict[str, Dict[str, str]] = {}
+        self.breaker = breaker
+        # Shared by the executor threads, as it is thread-safe and pools connections
+        self._http = httpx.Client(timeout=GRAPHQL_TIMEOUT)
+
+    @property
+    def client(self) -> "DagsterGraphQLClient":
+        """The Dagster GraphQL client of the calling thread, created on first use.
+
+        The client connects and closes its transport around every query, so two
+        queries sent at once from different threads cannot share one.
+        """
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = self._create_client()
+        return client
+
+    async def _query(self, call: Callable[["DagsterGraphQLClient"], T]) -> T:
+        """Run a query off the event loop, with the client of the thread running it.
+
+        Args:
+            call: Sends the query with the client it is given
+
+        Returns:
+            T: What the query returned
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open, without sending the query
+            PipelineUnavailableError: If the query failed because Dagster is unavailable
+        """
+        return await self._off_loop(lambda: call(self.client))
+
+    async def _graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Any:
+        """Send a GraphQL query to the webserver off the event loop.
+
+        Args:
+            query: The GraphQL query
+            variables: Values of the variables of the query, if any
+
+        Returns:
+            Any: The data the query returned
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open, without sending the query
+            PipelineUnavailableError: If the query failed because Dagster is unavailable
+            PipelineError: If the query fails otherwise
+        """
+        return await self._off_loop(lambda: self._execute(query, variables))
+
+    async def _off_loop(self, call: Callable[[], T]) -> T:
+        """Run a blocking call in the default executor, through the breaker if any.
+
+        Raises:
+            PipelineUnavailableError: If the call failed because Dagster is unavailable
+        """
+
+        def run() -> T:
+            try:
+                return call()
+            except Exception as e:
+                if _is_unavailable(e):
+                    raise PipelineUnavailableError(f"Dagster is unavailable: {str(e)}") from e
+                raise
+
+        if self.breaker is None:
+            return await asyncio.to_thread(run)
+        return await self.breaker.call(
+            lambda: asyncio.to_thread(run),
+            is_failure=lambda error: isinstance(error, PipelineUnavailableError),
+        )
+
+    def _execute(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Any:
+        """POST a GraphQL query to the webserver.
+
+        Args:
+            query: The GraphQL query
+            variables: Values of the variables of the query, if any
+
+        Returns:
+            Any: The data the query returned
+
+        Raises:
+            PipelineError: If the webserver cannot be reached or reports errors
+        """
+        try:
+            response = self._http.post(
+                f"{self.dagster_url.rstrip('/')}/graphql",
+                json={"query": query, "variables": variables or {}},
+            )
+            response.raise_for_status()
+            body = response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            raise PipelineError(f"Dagster GraphQL error: {str(e)}") from e
+
+        if body.get("errors"):
+            messages = "; ".join(error.get("message", str(error)) for error in body["errors"])
+            raise PipelineError(f"Dagster GraphQL error: {messages}")
+        return body["data"]
+
+    def _create_client(self) -> "DagsterGraphQLClient":
+        """Import and create the Dagster GraphQL client.
+
+        Returns:
+            DagsterGraphQLClient: The client of the Dagster webserver
+        """
+        from dagster_graphql import DagsterGraphQLClient
+
         try:
             # Extract hostname from URL
             parsed_url = urlparse(self.dagster_url)
             hostname = parsed_url.netloc
 
             logger.info(f"Connecting to Dagster at hostname: {hostname}")
-            self.client = DagsterGraphQLClient(hostname=hostname)
+            client = DagsterGraphQLClient(hostname=hostname)
             logger.info("DagsterGraphQLClient initialized successfully")
-        except DagsterGraphQLClientError as e:
+            return client
+        except _client_error() as e:
             logger.error(f"Failed to initialize DagsterGraphQLClient: {str(e)}")
             raise
-        self.settings = get_settings()
 
-    async def start_prediction_pipeline(self, record: HousingRecord) -> str:
+    async def warm_up(self) -> None:
+        """Resolve the repository location of the prediction jobs.
+
+        Submissions of a job whose location is unknown make the client look it up
+        first, in an extra round trip to the webserver. The client is created here
+        too, off the event loop, so that the first submission does not import it.
+
+        Raises:
+            PipelineError: If a job cannot be found in the deployment
+        """
+        result = await self._graphql(JOB_LOCATIONS_QUERY)
+        self._resolve_job_locations(result["repositoriesOrError"])
+        await asyncio.to_thread(lambda: self.client)
+
+    def _resolve_job_locations(self, repositories: Dict[str, Any]) -> None:
+        """Record the repository location of the prediction jobs.
+
+        Args:
+            repositories: The repositories of the deployment, with their jobs
+
+        Raises:
+            PipelineError: If a job is not deployed exactly once
+        """
+        if repositories["__typename"] != "RepositoryConnection":
+            raise PipelineError(
+                f"Error listing repositories: {repositories.get('message', repositories)}"
+            )
+
+        for job_name in PREDICTION_JOBS:
+            jobs = [
+                repository
+                for repository in repositories["nodes"]
+                if any(job["name"] == job_name for job in repository["pipelines"])
+            ]
+            if len(jobs) != 1:
+                raise PipelineError(f"Expected one {job_name} in the deployment, found {len(jobs)}")
+
+            self._job_locations[job_name] = {
+                "repository_location_name": jobs[0]["location"]["name"],
+                "repository_name": jobs[0]["name"],
+            }
+            logger.info(f"Resolved {job_name} in location {jobs[0]['location']['name']}")
+
+    async def start_prediction_pipeline(
+        self, record: HousingRecord, callback_url: Optional[str] = None
+    ) -> str:
         """Start a prediction pipeline for a housing record.
 
+        The callback URL is passed along as the `CALLBACK_URL_TAG` run tag, where
+        the run picks it up when queuing its completion notice.
+
         Args:
             record: The housing record to process
+            callback_url: URL notified when the run completes or fails, if any
 
         Returns:
             str: Dagster run ID
@@ -80,21 +373,19 @@ class DagsterETLAdapter(ETLPort):
 
             logger.info("Submitting job execution to Dagster: housing_prediction_job")
             # Submit job run with record data
-            run_id = self.client.submit_job_execution(
-                "housing_prediction_job",
-                run_config={
-                    "ops": {"raw_input": {"config": {"data": raw_data}}},
-                    "resources": {
-                        "postgres": {"config": {"connection_url": self.settings.database_url}},
-                        "model": {"config": {"model_path": self.settings.MODEL_PATH}},
-                    },
-                },
+            run_id = await self._query(
+                lambda client: client.submit_job_execution(
+                    "housing_prediction_job",
+                    **self._job_locations.get("housing_prediction_job", {}),
+                    run_config=self._run_config("raw_input", raw_data),
+                    tags={CALLBACK_URL_TAG: callback_url} if callback_url else None,
+                )
             )
 
             logger.info(f"Job execution submitted successfully with run_id: {run_id}")
             return str(run_id)
 
-        except DagsterGraphQLClientError as e:
+        except _client_error() as e:
             logger.error(f"DagsterGraphQLClientError when submitting job: {str(e)}")
             raise
 
@@ -102,6 +393,67 @@ class DagsterETLAdapter(ETLPort):
             logger.error(f"Unexpected error when submitting job: {str(e)}")
             raise
 
+    async def start_batch_prediction_pipeline(self, records: List[HousingRecord]) -> str:
+        """Start a single prediction pipeline run for a batch of housing records.
+
+        Record IDs are passed along as `record_id` so the stored rows keep the IDs
+        that were handed back to the caller.
+
+        Args:
+            records: The housing records to process, in submission order
+
+        Returns:
+            str: Dagster run ID for the whole batch
+
+        Raises:
+            Exception: If there's an error starting the pipeline
+        """
+        try:
+            logger.info(f"Starting batch prediction pipeline for {len(records)} records")
+            raw_data = []
+            for record in records:
+                record_data = record.model_dump()
+                record_data["record_id"] = record_data.pop("id")
+                raw_data.append(record_data)
+
+            logger.info("Submitting job execution to Dagster: housing_batch_prediction_job")
+            run_id = await self._query(
+                lambda client: client.submit_job_execution(
+                    "housing_batch_prediction_job",
+                    **self._job_locations.get("housing_batch_prediction_job", {}),
+                    run_config=self._run_config("raw_batch_input", raw_data),
+                )
+            )
+
+            logger.info(f"Batch job execution submitted successfully with run_id: {run_id}")
+            return str(run_id)
+
+        except _client_error() as e:
+            logger.error(f"DagsterGraphQLClientError when submitting batch job: {str(e)}")
+            raise
+
+        except Exception as e:
+            logger.error(f"Unexpected error when submitting batch job: {str(e)}")
+            raise
+
+    def _run_config(self, entry_op: str, data: Any) -> Dict[str, Any]:
+        """Build the run config shared by the single and batch prediction jobs.
+
+        Args:
+            entry_op: Name of the op that receives the raw data
+            data: The raw data passed to the entry op
+
+        Returns:
+            The Dagster run config
+        """
+        return {
+            "ops": {entry_op: {"config": {"data": data}}},
+            "resources": {
+                "postgres": {"config": {"connection_url": self.settings.database_url}},
+                "model": {"config": {"model_path": self.settings.MODEL_PATH}},
+            },
+        }
+
     async def get_pipeline_status(self, run_id: str) -> str:
         """Get the status of a pipeline run.
 
@@ -117,24 +469,99 @@ class DagsterETLAdapter(ETLPort):
         try:
             logger.info(f"Getting status for run_id: {run_id}")
             # Get run status from Dagster
-            status: DagsterRunStatus = self.client.get_run_status(run_id)
-
-            # Map Dagster status to our status
-            if status == DagsterRunStatus.SUCCESS:
-                mapped_status = "completed"
-            elif status == DagsterRunStatus.FAILURE or status == DagsterRunStatus.CANCELED:
-                mapped_status = "failed"
-            elif status == DagsterRunStatus.STARTED:
-                mapped_status = "running"
-            else:  # All other states (STARTING, MANAGED, QUEUED, NOT_STARTED, CANCELING)
-                mapped_status = "pending"
+            status = await self._query(lambda client: client.get_run_status(run_id))
+
+            mapped_status = self._map_run_status(status.value)
 
             logger.info(f"Run status: {mapped_status}")
             return mapped_status
 
-        except DagsterGraphQLClientError as e:
+        except PipelineError:
+            raise
+        except _client_error() as e:
             logger.error(f"DagsterGraphQLClientError when getting run status: {str(e)}")
             raise PipelineError(f"Dagster client error: {str(e)}") from e
         except Exception as e:
             logger.error(f"Unexpected error when getting run status: {str(e)}")
             raise PipelineError(f"Error checking pipeline status: {str(e)}") from e
+
+    async def get_pipeline_statuses(self, run_ids: Sequence[str]) -> Dict[str, str]:
+        """Get the statuses of several pipeline runs in a single query.
+
+        Args:
+            run_ids: The IDs of the pipeline runs to check
+
+        Returns:
+            Dict[str, str]: "pending", "running", "completed", or "failed" by run ID.
+                Run IDs unknown to Dagster are left out
+
+        Raises:
+            PipelineError: If there's an error querying the pipeline runs
+        """
+        if not run_ids:
+            return {}
+
+        try:
+            variables = {"filter": {"runIds": list(run_ids)}, "limit": len(run_ids)}
+            result = await self._graphql(RUN_STATUSES_QUERY, variables)
+
+            runs = result["runsOrError"]
+            if runs["__typename"] != "Runs":
+                raise PipelineError(f"Error getting run statuses: {runs.get('message', runs)}")
+
+            return {run["runId"]: self._map_run_status(run["status"]) for run in runs["results"]}
+
+        except PipelineError:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error when getting run statuses: {str(e)}")
+            raise PipelineError(f"Error checking pipeline statuses: {str(e)}") from e
+
+    @staticmethod
+    def _map_run_status(status: str) -> str:
+        """Map a Dagster run status to a pipeline status.
+
+        Args:
+            status: The Dagster run status, e.g. "SUCCESS"
+
+        Returns:
+            str: "pending", "running", "completed", or "failed"
+        """
+        # All other states (STARTING, MANAGED, QUEUED, NOT_STARTED, CANCELING)
+        return RUN_STATUSES.get(status, "pending")
+
+    async def get_active_run_count(self) -> int:
+        """Get the number of prediction pipeline runs queued or in progress.
+
+        Returns:
+            int: The number of runs of the prediction jobs not yet finished
+
+        Raises:
+            PipelineError: If there's an error querying the pipeline runs
+        """
+        try:
+            variables = {
+                "single": {
+                    "pipelineName": "housing_prediction_job",
+                    "statuses": ACTIVE_RUN_STATUSES,
+                },
+                "batch": {
+                    "pipelineName": "housing_batch_prediction_job",
+                    "statuses": ACTIVE_RUN_STATUSES,
+                },
+            }
+            result = await self._graphql(ACTIVE_RUN_COUNT_QUERY, variables)
+
+            count = 0
+            for runs in (result["single"], result["batch"]):
+                if runs["__typename"] != "Runs":
+                    raise PipelineError(f"Error counting runs: {runs.get('message', runs)}")
+                count += runs["count"]
+
+            return count
+
+        except PipelineError:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error when counting active runs: {str(e)}")
+            raise PipelineError(f"Error counting active runs: {str(e)}") from e
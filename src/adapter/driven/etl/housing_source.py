@@ -0,0 +1,155 @@
+"""Dagster resource for historical housing files."""
+import io
+from itertools import islice
+from pathlib import Path
+from typing import BinaryIO, Iterator, Tuple
+
+import dagster as dg
+import numpy as np
+import pandas as pd
+
+from src.core.domain.entities.housing_record import NUMERIC_FEATURES
+
+# Columns read from a housing file, any other one is ignored
+SOURCE_COLUMNS = ("record_id",) + NUMERIC_FEATURES + ("ocean_proximity",)
+
+# Rows of a file read at once, so that no slice has to fit in memory
+CHUNK_SIZE = 100_000
+
+
+def _line_start(file: BinaryIO, offset: int, body: int) -> int:
+    """Get the offset of the first line of a file starting at or after an offset.
+
+    Args:
+        file: The file, opened in binary mode
+        offset: The offset to look from
+        body: The offset of the first line after the header
+
+    Returns:
+        int: The offset of the line, the size of the file if there is none
+    """
+    if offset <= body:
+        return body
+    file.seek(offset - 1)
+    file.readline()
+    return file.tell()
+
+
+def _lines(file: BinaryIO, start: int, stop: int) -> Iterator[Tuple[int, bytes]]:
+    """Iterate over the non-empty lines of a file starting between two offsets.
+
+    Args:
+        file: The file, opened in binary mode
+        start: The offset of the first line
+        stop: The offset after which no line starts
+
+    Yields:
+        The offset of each line, and the line
+    """
+    file.seek(start)
+    position = start
+    while position < stop:
+        line = file.readline()
+        if line.rstrip(b"\r\n"):
+            yield position, line
+        position += len(line)
+
+
+class HousingFileResource(dg.ConfigurableResource):
+    """Resource reading the records of a CSV or Parquet housing file, a slice at a time.
+
+    The file is split into contiguous slices, each read without reading the others:
+    a Parquet file by row groups, so it needs at least as many row groups as
+    slices, and a CSV file by byte ranges starting on a line, so a record may not
+    span lines. Rows without a `record_id` get `<file name>:<position>`, their row
+    number in a Parquet file and the offset of their line in a CSV file, so every
+    read of the file gives a row the same ID and slice, and storing a slice twice
+    stores it once. Reading Parquet files requires pyarrow.
+    """
+
+    path: str
+
+    def read_slice(self, index: int, slices: int) -> pd.DataFrame:
+        """Read the raw records of a slice of the file.
+
+        Args:
+            index: The slice to read, from 0 to `slices` - 1
+            slices: The number of slices the file is split into
+
+        Returns:
+            pd.DataFrame: The raw records of the slice, with their `record_id`
+
+        Raises:
+            ValueError: If the file is neither a CSV nor a Parquet file
+        """
+        suffix = Path(self.path).suffix.lower()
+        if suffix == ".csv":
+            chunks = self._read_csv_slice(index, slices)
+        elif suffix == ".parquet":
+            chunks = self._read_parquet_slice(index, slices)
+        else:
+            raise ValueError(f"Unsupported housing file format: {suffix or self.path}")
+
+        name = Path(self.path).name
+        selected = []
+        for positions, chunk in chunks:
+            chunk = chunk.reset_index(drop=True)
+            record_ids = (
+                chunk["record_id"]
+                if "record_id" in chunk
+                else pd.Series(None, chunk.index, dtype=object)
+            )
+            chunk["record_id"] = record_ids.where(
+                record_ids.notna() & (record_ids != ""),
+                name + ":" + pd.Series(positions).astype(str),
+            ).astype(str)
+            selected.append(chunk)
+
+        if not selected:
+            return pd.DataFrame(columns=list(SOURCE_COLUMNS))
+        return pd.concat(selected, ignore_index=True)
+
+    def _read_csv_slice(self, index: int, slices: int) -> Iterator[Tuple[np.ndarray, pd.DataFrame]]:
+        """Read the useful columns of the lines of a slice of a CSV file, in chunks of rows."""
+        with open(self.path, "rb") as file:
+            header = file.readline()
+            body = file.tell()
+            size = file.seek(0, io.SEEK_END)
+
+            # Each slice takes the lines starting in its share of the bytes after the header
+            start = _line_start(file, body + (size - body) * index // slices, body)
+            stop = _line_start(file, body + (size - body) * (index + 1) // slices, body)
+
+            lines = _lines(file, start, stop)
+            while True:
+                chunk = list(islice(lines, CHUNK_SIZE))
+                if not chunk:
+                    return
+                positions, rows = zip(*chunk)
+                frame = pd.read_csv(
+                    io.BytesIO(header + b"".join(rows)),
+                    usecols=lambda column: column in SOURCE_COLUMNS,
+                    dtype={"record_id": str},
+                )
+                yield np.array(positions), frame
+
+    def _read_parquet_slice(
+        self, index: int, slices: int
+    ) -> Iterator[Tuple[np.ndarray, pd.DataFrame]]:
+        """Read the useful columns of the row groups of a slice of a Parquet file, in chunks."""
+        # pyarrow is only needed, and imported, to read Parquet files
+        import pyarrow.parquet as pq
+
+        parquet = pq.ParquetFile(self.path)
+        groups = parquet.metadata.num_row_groups
+        first, last = groups * index // slices, groups * (index + 1) // slices
+        if first == last:
+            return
+
+        position = sum(parquet.metadata.row_group(group).num_rows for group in range(first))
+        columns = [column for column in SOURCE_COLUMNS if column in parquet.schema_arrow.names]
+        for batch in parquet.iter_batches(
+            batch_size=CHUNK_SIZE, row_groups=list(range(first, last)), columns=columns
+        ):
+            yield np.arange(position, position + batch.num_rows), batch.to_pandas()
+            position += batch.num_rows
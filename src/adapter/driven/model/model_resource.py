@@ -1,26 +1,53 @@
 """Dagster resource for ML model."""
+import os
 from typing import Any, Dict, List, Optional
 
 import dagster as dg
 import joblib
 import numpy as np
+import pandas as pd
 
+from src.core.domain.entities.housing_record import FEATURE_NAMES
 from src.core.domain.exceptions import PredictionError
 
+# The model expects exactly 13 features: 8 numeric features followed by
+# 5 one-hot encoded features for ocean_proximity
+EXPECTED_FEATURES = list(FEATURE_NAMES)
+
 
 class ModelResource(dg.ConfigurableResource):
     """Resource for loading and using the ML model."""
 
     model_path: str
     _model: Optional[Any] = None
+    _version: Optional[str] = None
 
     def setup_for_execution(self, context) -> None:
         """Setup the resource for execution."""
-        self._model = joblib.load(self.model_path)
+        self._load()
 
     def teardown_after_execution(self, context) -> None:
         """Teardown the resource after execution."""
         self._model = None
+        self._version = None
+
+    def get_version(self) -> str:
+        """Get the version of the model the predictions are made with.
+
+        Matches the version the API's model adapter reports for the same file.
+
+        Returns:
+            str: The version of the loaded model file
+        """
+        if self._model is None:
+            self._load()
+        return self._version
+
+    def _load(self) -> None:
+        """Load the model, with the version of its file read before loading it."""
+        stat = os.stat(self.model_path)
+        self._version = f"{stat.st_mtime_ns}-{stat.st_size}"
+        self._model = joblib.load(self.model_path)
 
     def predict(self, data: Dict[str, Any]) -> List[float]:
         """Make predictions using the loaded model.
@@ -35,31 +62,11 @@ class ModelResource(dg.ConfigurableResource):
             PredictionError: If there's an error during prediction
         """
         if self._model is None:
-            self._model = joblib.load(self.model_path)
+            self._load()
 
         try:
-            # The model expects exactly 13 features:
-            # - 8 numeric features: longitude, latitude, housing_median_age, total_rooms,
-            #   total_bedrooms, population, households, median_income
-            # - 5 one-hot encoded features for ocean_proximity
-            expected_features = [
-                "longitude",
-                "latitude",
-                "housing_median_age",
-                "total_rooms",
-                "total_bedrooms",
-                "population",
-                "households",
-                "median_income",
-                "ocean_proximity_<1H OCEAN",
-                "ocean_proximity_INLAND",
-                "ocean_proximity_ISLAND",
-                "ocean_proximity_NEAR BAY",
-                "ocean_proximity_NEAR OCEAN",
-            ]
-
             # Create a list of values in the correct order
-            feature_values = [data[feature] for feature in expected_features]
+            feature_values = [data[feature] for feature in EXPECTED_FEATURES]
 
             # Convert to numpy array for prediction
             features = np.array(feature_values).reshape(1, -1)
@@ -69,3 +76,27 @@ class ModelResource(dg.ConfigurableResource):
             return [float(prediction)]
         except Exception as e:
             raise PredictionError(f"Error making prediction: {str(e)}") from e
+
+    def predict_batch(self, features: pd.DataFrame) -> List[float]:
+        """Make predictions for several prepared records with a single model call.
+
+        Args:
+            features: The prepared data, one row per record
+
+        Returns:
+            A list containing one prediction per row, in the same order
+
+        Raises:
+            PredictionError: If there's an error during prediction
+        """
+        if self._model is None:
+            self._load()
+
+        try:
+            # Take the feature columns as one matrix so the model is invoked once per batch
+            matrix = features.loc[:, EXPECTED_FEATURES].to_numpy(dtype=float)
+
+            predictions = self._model.predict(matrix)
+            return [float(prediction) for prediction in predictions]
+        except Exception as e:
+            raise PredictionError(f"Error making batch prediction: {str(e)}") from e
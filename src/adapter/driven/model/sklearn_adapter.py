@@ -1,8 +1,9 @@
 """Scikit-learn implementation of the ModelPort."""
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
-from typing import Any
+from typing import Any, List
 
 import joblib
 import numpy as np
@@ -24,7 +25,13 @@ class SklearnModel(ModelProtocol):
 
 
 class SklearnModelAdapter(ModelPort[SklearnModel]):
-    """Adapter for scikit-learn models."""
+    """Adapter for scikit-learn models.
+
+    The model is loaded again as soon as its file is replaced, so predictions are
+    always made by the model whose version `get_version` reports. Loading the
+    model and making predictions both run in the default executor, keeping the
+    event loop free to serve other requests meanwhile.
+    """
 
     def __init__(self, model_path: str):
         """Initialize the adapter with path to saved model.
@@ -34,6 +41,9 @@ class SklearnModelAdapter(ModelPort[SklearnModel]):
         """
         self.model_path = Path(model_path)
         self._model: SklearnModel | None = None
+        self._version: str | None = None
+        # Concurrent predictions wait for a single reload of a replaced model file
+        self._load_lock = asyncio.Lock()
 
     async def load_model(self) -> SklearnModel:
         """Load the scikit-learn model from disk.
@@ -49,8 +59,11 @@ class SklearnModelAdapter(ModelPort[SklearnModel]):
             raise FileNotFoundError(f"Model file not found at {self.model_path}")
 
         try:
-            model = joblib.load(self.model_path)
+            # Read before loading, so that a file replaced meanwhile is loaded again
+            version = self.get_version()
+            model = await asyncio.to_thread(joblib.load, self.model_path)
             self._model = SklearnModel(model)
+            self._version = version
             return self._model
         except Exception as e:
             raise PredictionError(f"Error loading model: {str(e)}") from e
@@ -68,21 +81,80 @@ class SklearnModelAdapter(ModelPort[SklearnModel]):
             ValueError: If model isn't loaded or record can't be processed
             PredictionError: If there's an error during prediction
         """
-        if self._model is None:
-            self._model = await self.load_model()
+        model = await self._get_model()
 
         try:
             # Convert record to feature array
             features = self._record_to_features(record)
 
             # Make prediction
-            prediction = self._model.predict(features.reshape(1, -1))[0]
+            prediction = (await asyncio.to_thread(model.predict, features.reshape(1, -1)))[0]
 
             return float(prediction)
 
         except Exception as e:
             raise PredictionError(f"Error making prediction: {str(e)}") from e
 
+    async def predict_batch(self, records: List[HousingRecord]) -> List[float]:
+        """Make predictions for several housing records with a single model call.
+
+        Args:
+            records: The housing records to make predictions for
+
+        Returns:
+            List[float]: The predicted house values, in the same order
+
+        Raises:
+            PredictionError: If there's an error during prediction
+        """
+        model = await self._get_model()
+
+        try:
+            # Stack the feature rows so the model runs once for the whole batch
+            features = np.vstack([self._record_to_features(record) for record in records])
+
+            predictions = await asyncio.to_thread(model.predict, features)
+
+            return [float(prediction) for prediction in predictions]
+
+        except Exception as e:
+            raise PredictionError(f"Error making batch prediction: {str(e)}") from e
+
+    def get_version(self) -> str:
+        """Get an identifier of the model file currently deployed.
+
+        The version is derived from the file's modification time and size, so it
+        changes as soon as the file is replaced, without reading the file.
+
+        Returns:
+            str: The version of the model file
+
+        Raises:
+            FileNotFoundError: If model file doesn't exist
+        """
+        stat = self.model_path.stat()
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+    async def _get_model(self) -> SklearnModel:
+        """Get the loaded model, loading it again if its file was replaced since."""
+        if self._model is None or self._is_outdated():
+            async with self._load_lock:
+                # Another prediction may have loaded it while this one was waiting
+                if self._model is None or self._is_outdated():
+                    self._model = await self.load_model()
+        return self._model
+
+    def _is_outdated(self) -> bool:
+        """Check whether the model file changed since the model was loaded from it."""
+        if self._version is None:
+            return False
+
+        try:
+            return self.get_version() != self._version
+        except OSError:
+            # Keep serving the loaded model while its file is being replaced
+            return False
+
     @staticmethod
     def _record_to_features(record: HousingRecord) -> np.ndarray:
         """Convert a housing record to feature array for prediction.
@@ -93,35 +165,7 @@ class SklearnModelAdapter(ModelPort[SklearnModel]):
         Returns:
             numpy array of features in correct order for model
         """
-        # Convert ocean_proximity to one-hot encoding
-        ocean_proximity_map = {
-            "<1H OCEAN": [1, 0, 0, 0, 0],
-            "INLAND": [0, 1, 0, 0, 0],
-            "ISLAND": [0, 0, 1, 0, 0],
-            "NEAR BAY": [0, 0, 0, 1, 0],
-            "NEAR OCEAN": [0, 0, 0, 0, 1],
-            "OUT OF REACH": [0, 0, 0, 0, 0],  # Default case
-        }
-
-        ocean_prox_encoded = (
-            ocean_proximity_map[record.ocean_proximity]
-            if record.ocean_proximity
-            else ocean_proximity_map["OUT OF REACH"]
-        )
-
-        # Create feature array in correct order
-        features = np.array(
-            [
-                record.longitude,
-                record.latitude,
-                record.housing_median_age,
-                record.total_rooms,
-                record.total_bedrooms,
-                record.population,
-                record.households,
-                record.median_income,
-                *ocean_prox_encoded,  # Unpack one-hot encoded ocean proximity
-            ]
-        )
+        # Same order as the feature vector used to key cached predictions
+        features = np.array(record.to_feature_vector())
 
         return features
@@ -1,25 +1,74 @@
 """PostgreSQL adapter for storing housing data and predictions."""
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 from sqlalchemy import (
+    JSON,
     Column,
     DateTime,
     Float,
     ForeignKey,
+    Index,
+    Integer,
     String,
+    any_,
+    bindparam,
     create_engine,
+    or_,
+    select,
+    text,
+    tuple_,
+    update,
 )
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import declarative_base, relationship, sessionmaker
+from sqlalchemy.orm import (
+    contains_eager,
+    declarative_base,
+    joinedload,
+    relationship,
+    sessionmaker,
+)
 
 from src.core.domain.entities.housing_record import HousingRecord
-from src.core.domain.entities.prediction import Prediction, PredictionStatus
+from src.core.domain.entities.prediction import (
+    Prediction,
+    PredictionCursor,
+    PredictionFilter,
+    PredictionStatus,
+)
+from src.core.domain.entities.submission import SubmissionKey
+from src.core.domain.entities.webhook import WebhookDelivery, WebhookDeliveryStatus
 from src.core.domain.exceptions import StorageError
 from src.core.port.storage_port import StoragePort
 
 Base = declarative_base()
 
+# Rows fetched per round trip while a listing is streamed
+LIST_FETCH_SIZE = 500
+
+# Columns added to tables after their creation, which create_all does not add to
+# tables that already exist: table, column and SQL type
+ADDED_COLUMNS = (
+    ("predictions", "batch_index", "INTEGER"),
+    ("predictions", "model_version", "VARCHAR"),
+    ("idempotency_keys", "fingerprint", "VARCHAR"),
+)
+
+# Indexes of earlier versions that listings no longer use, dropped from existing tables
+DROPPED_INDEXES = (
+    "ix_predictions_prediction_value_created_at",
+    "ix_cleaned_housing_records_ocean_proximity_id",
+)
+
+# Order in which the status of a run moves, a run never goes back to an earlier one
+RUN_STATUS_ORDER = {
+    PredictionStatus.PENDING.value: 0,
+    PredictionStatus.RUNNING.value: 1,
+    PredictionStatus.COMPLETED.value: 2,
+    PredictionStatus.FAILED.value: 2,
+}
+
 
 class CleanedHousingRecord(Base):
     """Cleaned housing record model."""
@@ -51,29 +100,121 @@ class PredictionRecord(Base):
     cleaned_record_id = Column(String, ForeignKey("cleaned_housing_records.id"), nullable=False)
     prediction_value = Column(Float, nullable=False)
     run_id = Column(String, nullable=True)  # Keep run_id for predictions
+    batch_index = Column(Integer, nullable=True)  # Position in the batch submission, if any
+    model_version = Column(String, nullable=True)  # Version of the model that scored the record
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
 
     # Relationship to cleaned record
     cleaned_record = relationship("CleanedHousingRecord", back_populates="prediction")
 
+    __table_args__ = (
+        # Lookups of the predictions of one or many runs
+        Index("ix_predictions_run_id", "run_id"),
+        # Keyset pagination of listings, newest first, scanned in index order. Filtered
+        # listings scan it too, filtering rows until the page is full, as an index led
+        # by a filtered column would have its matches sorted in full for each page
+        Index("ix_predictions_created_at_id", "created_at", "id"),
+    )
+
+
+class IdempotencyKeyRecord(Base):
+    """Run started for a prediction submission, keyed by its idempotency key."""
+
+    __tablename__ = "idempotency_keys"
+
+    key = Column(String, primary_key=True)
+    run_id = Column(String, nullable=False)
+    fingerprint = Column(String, nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class PredictionRunRecord(Base):
+    """Status of a pipeline run, kept up to date by the run itself."""
+
+    __tablename__ = "prediction_runs"
+
+    run_id = Column(String, primary_key=True)
+    status = Column(String, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class WebhookDeliveryRecord(Base):
+    """Webhook outbox entry, queued with the prediction or failure it notifies."""
+
+    __tablename__ = "webhook_deliveries"
+
+    id = Column(String, primary_key=True)
+    run_id = Column(String, nullable=False)
+    callback_url = Column(String, nullable=False)
+    payload = Column(JSON, nullable=False)
+    status = Column(String, nullable=False, default=WebhookDeliveryStatus.PENDING.value)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=True)
+    last_error = Column(String, nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    delivered_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # Claims of the pending deliveries that are due
+        Index("ix_webhook_deliveries_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
 
 class PostgresAdapter(StoragePort):
     """PostgreSQL adapter for storing housing data and predictions."""
 
-    def __init__(self, connection_url: str):
+    def __init__(self, connection_url: str, pool_size: int = 5):
         """Initialize the PostgreSQL adapter.
 
         Args:
             connection_url: The PostgreSQL connection URL
+            pool_size: Number of connections kept open in the pool
         """
-        self.engine = create_engine(connection_url)
+        self.pool_size = pool_size
+        self.engine = create_engine(connection_url, pool_size=pool_size)
         self.Session = sessionmaker(bind=self.engine)
         self.setup()  # Call setup() during initialization
 
     def setup(self) -> None:
-        """Ensure tables exist."""
+        """Ensure tables and their indexes exist."""
         Base.metadata.create_all(self.engine)
 
+        # create_all skips the columns and indexes of tables that already exist
+        with self.engine.begin() as connection:
+            for table, column, type_ in ADDED_COLUMNS:
+                connection.execute(
+                    text(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {column} {type_}")
+                )
+            for index_name in DROPPED_INDEXES:
+                connection.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
+
+    def warm_up(self) -> None:
+        """Open every pooled connection, so that requests never wait for a connect.
+
+        Raises:
+            StorageError: If there is an error connecting to the database
+        """
+        connections = []
+        try:
+            # Connections are checked out together, or the pool would reuse the first one
+            for _ in range(self.pool_size):
+                connection = self.engine.connect()
+                connections.append(connection)
+                connection.execute(text("SELECT 1"))
+        except SQLAlchemyError as e:
+            raise StorageError(f"Error warming up connection pool: {str(e)}") from e
+        finally:
+            for connection in connections:
+                connection.close()
+
+    def close(self) -> None:
+        """Close every pooled connection of the engine."""
+        self.engine.dispose()
+
     def _get_session(self):
         """Get a new database session."""
         return self.Session()
@@ -113,6 +254,43 @@ class PostgresAdapter(StoragePort):
         except SQLAlchemyError as e:
             raise StorageError(f"Error saving housing record: {str(e)}") from e
 
+    def save_housing_records(self, records: List[HousingRecord]) -> List[str]:
+        """Save several housing records to the database in a single transaction.
+
+        Args:
+            records: The housing records to save
+
+        Returns:
+            The IDs of the saved records, in the same order
+
+        Raises:
+            StorageError: If there is an error saving the records
+        """
+        try:
+            with self._get_session() as session:
+                session.add_all(
+                    [
+                        CleanedHousingRecord(
+                            id=record.id,
+                            longitude=record.longitude,
+                            latitude=record.latitude,
+                            housing_median_age=record.housing_median_age,
+                            total_rooms=record.total_rooms,
+                            total_bedrooms=record.total_bedrooms,
+                            population=record.population,
+                            households=record.households,
+                            median_income=record.median_income,
+                            ocean_proximity=record.ocean_proximity,
+                        )
+                        for record in records
+                    ]
+                )
+                session.commit()
+
+                return [str(record.id) for record in records]
+        except SQLAlchemyError as e:
+            raise StorageError(f"Error saving housing records: {str(e)}") from e
+
     def get_housing_record(self, record_id: str) -> Optional[HousingRecord]:
         """Get a housing record from the database.
 
@@ -129,30 +307,20 @@ class PostgresAdapter(StoragePort):
             with self._get_session() as session:
                 cleaned_record = session.query(CleanedHousingRecord).filter_by(id=record_id).first()
                 if cleaned_record:
-                    # Create a HousingRecord from the cleaned record
-                    # First get the values from the SQLAlchemy model
-                    record_dict = {
-                        "id": cleaned_record.id,
-                        "longitude": cleaned_record.longitude,
-                        "latitude": cleaned_record.latitude,
-                        "housing_median_age": cleaned_record.housing_median_age,
-                        "total_rooms": cleaned_record.total_rooms,
-                        "total_bedrooms": cleaned_record.total_bedrooms,
-                        "population": cleaned_record.population,
-                        "households": cleaned_record.households,
-                        "median_income": cleaned_record.median_income,
-                        "ocean_proximity": cleaned_record.ocean_proximity,
-                    }
-                    return HousingRecord(**record_dict)
+                    return self._to_housing_record(cleaned_record)
                 return None
         except SQLAlchemyError as e:
             raise StorageError(f"Error getting housing record: {str(e)}") from e
 
-    def save_prediction(self, prediction: Prediction) -> str:
+    def save_prediction(
+        self, prediction: Prediction, delivery: Optional[WebhookDelivery] = None
+    ) -> str:
         """Save a prediction to the database.
 
         Args:
             prediction: The prediction to save
+            delivery: Completion notice of the run, queued in the webhook outbox in the
+                same transaction as the prediction, if any
 
         Returns:
             The ID of the saved prediction
@@ -168,9 +336,17 @@ class PostgresAdapter(StoragePort):
                     cleaned_record_id=prediction.record_id,
                     prediction_value=prediction.value,
                     run_id=prediction.run_id,  # Save run_id from prediction
+                    model_version=prediction.model_version,
                     created_at=prediction.created_at,
                 )
                 session.add(prediction_record)
+                if delivery is not None:
+                    session.add(self._to_webhook_delivery_record(delivery))
+                # The run is completed as soon as its prediction can be read
+                if prediction.run_id is not None:
+                    session.execute(
+                        self._run_status_upsert(prediction.run_id, PredictionStatus.COMPLETED.value)
+                    )
                 session.commit()
 
                 # Return the ID of the saved prediction
@@ -178,6 +354,108 @@ class PostgresAdapter(StoragePort):
         except SQLAlchemyError as e:
             raise StorageError(f"Error saving prediction: {str(e)}") from e
 
+    def save_predictions(self, predictions: List[Prediction]) -> List[str]:
+        """Save several predictions to the database in a single transaction.
+
+        Args:
+            predictions: The predictions to save
+
+        Returns:
+            The IDs of the saved predictions, in the same order
+
+        Raises:
+            StorageError: If there is an error saving the predictions
+        """
+        try:
+            with self._get_session() as session:
+                session.add_all(
+                    [
+                        PredictionRecord(
+                            id=prediction.id,
+                            cleaned_record_id=prediction.record_id,
+                            prediction_value=prediction.value,
+                            run_id=prediction.run_id,
+                            batch_index=prediction.batch_index,
+                            model_version=prediction.model_version,
+                            created_at=prediction.created_at,
+                        )
+                        for prediction in predictions
+                    ]
+                )
+                # The runs are completed as soon as their predictions can be read
+                for run_id in dict.fromkeys(p.run_id for p in predictions if p.run_id):
+                    session.execute(
+                        self._run_status_upsert(run_id, PredictionStatus.COMPLETED.value)
+                    )
+                session.commit()
+
+                return [prediction.id for prediction in predictions]
+        except SQLAlchemyError as e:
+            raise StorageError(f"Error saving predictions: {str(e)}") from e
+
+    def save_backfilled_predictions(
+        self, records: List[HousingRecord], predictions: List[Prediction]
+    ) -> List[str]:
+        """Save backfilled records and their predictions in a single transaction.
+
+        Records already stored are kept as they are, and the predictions of records
+        that already have one are dropped, so a backfill can be run again.
+
+        Args:
+            records: The housing records to save
+            predictions: The predictions of the records
+
+        Returns:
+            The IDs of the records whose prediction was saved
+
+        Raises:
+            StorageError: If there is an error saving the records or predictions
+        """
+        if not records:
+            return []
+
+        try:
+            with self._get_session() as session:
+                session.execute(
+                    insert(CleanedHousingRecord).on_conflict_do_nothing(
+                        index_elements=[CleanedHousingRecord.id]
+                    ),
+                    [record.model_dump() for record in records],
+                )
+                scored = set(
+                    session.execute(
+                        select(PredictionRecord.cleaned_record_id).where(
+                            PredictionRecord.cleaned_record_id
+                            == any_(
+                                bindparam(
+                                    "record_ids",
+                                    [record.id for record in records],
+                                    type_=ARRAY(String),
+                                )
+                            )
+                        )
+                    ).scalars()
+                )
+                new_predictions = [p for p in predictions if p.record_id not in scored]
+                session.add_all(
+                    [
+                        PredictionRecord(
+                            id=prediction.id,
+                            cleaned_record_id=prediction.record_id,
+                            prediction_value=prediction.value,
+                            run_id=prediction.run_id,
+                            model_version=prediction.model_version,
+                            created_at=prediction.created_at,
+                        )
+                        for prediction in new_predictions
+                    ]
+                )
+                session.commit()
+
+                return [prediction.record_id for prediction in new_predictions]
+        except SQLAlchemyError as e:
+            raise StorageError(f"Error saving backfilled predictions: {str(e)}") from e
+
     def get_prediction(self, run_id: str) -> Optional[Prediction]:
         """Get a prediction from the database by Dagster run ID.
 
@@ -194,33 +472,534 @@ class PostgresAdapter(StoragePort):
             with self._get_session() as session:
                 prediction_record = session.query(PredictionRecord).filter_by(run_id=run_id).first()
                 if prediction_record:
-                    # Create a HousingRecord from the cleaned record
-                    cleaned_record = prediction_record.cleaned_record
-                    record_dict = {
-                        "id": cleaned_record.id,
-                        "longitude": cleaned_record.longitude,
-                        "latitude": cleaned_record.latitude,
-                        "housing_median_age": cleaned_record.housing_median_age,
-                        "total_rooms": cleaned_record.total_rooms,
-                        "total_bedrooms": cleaned_record.total_bedrooms,
-                        "population": cleaned_record.population,
-                        "households": cleaned_record.households,
-                        "median_income": cleaned_record.median_income,
-                        "ocean_proximity": cleaned_record.ocean_proximity,
-                    }
-                    housing_record = HousingRecord(**record_dict)
-
-                    # Create the prediction with the proper HousingRecord
-                    prediction_dict = {
-                        "id": prediction_record.id,
-                        "record_id": prediction_record.cleaned_record_id,
-                        "value": prediction_record.prediction_value,
-                        "created_at": prediction_record.created_at,
-                        "run_id": prediction_record.run_id,
-                        "record": housing_record,
-                        "status": PredictionStatus.COMPLETED,
-                    }
-                    return Prediction(**prediction_dict)
+                    return self._to_prediction(prediction_record)
                 return None
         except SQLAlchemyError as e:
             raise StorageError(f"Error getting prediction by run_id: {str(e)}") from e
+
+    def get_predictions(self, run_id: str) -> List[Prediction]:
+        """Get every prediction produced by a Dagster run.
+
+        Args:
+            run_id: The Dagster run ID to get the predictions for
+
+        Returns:
+            The predictions stored by the run, in batch order for batch runs, empty if
+            none were found
+
+        Raises:
+            StorageError: If there is an error getting the predictions
+        """
+        try:
+            with self._get_session() as session:
+                prediction_records = (
+                    session.query(PredictionRecord)
+                    .options(joinedload(PredictionRecord.cleaned_record))
+                    .filter_by(run_id=run_id)
+                    .order_by(
+                        PredictionRecord.batch_index,
+                        PredictionRecord.created_at,
+                        PredictionRecord.id,
+                    )
+                    .all()
+                )
+                return [self._to_prediction(record) for record in prediction_records]
+        except SQLAlchemyError as e:
+            raise StorageError(f"Error getting predictions by run_id: {str(e)}") from e
+
+    def get_predictions_by_run_ids(self, run_ids: Sequence[str]) -> Dict[str, Prediction]:
+        """Get the predictions of several Dagster runs in a single query.
+
+        The run IDs are bound as one array parameter, `run_id = ANY(:run_ids)`, so
+        the statement is the same however many runs are looked up.
+
+        Args:
+            run_ids: The Dagster run IDs to get the predictions for
+
+        Returns:
+            The first prediction stored by each run, by run ID. Runs without a
+            stored prediction are left out
+
+        Raises:
+            StorageError: If there is an error getting the predictions
+        """
+        if not run_ids:
+            return {}
+
+        try:
+            with self._get_session() as session:
+                prediction_records = (
+                    session.query(PredictionRecord)
+                    .options(joinedload(PredictionRecord.cleaned_record))
+                    .filter(
+                        PredictionRecord.run_id
+                        == any_(bindparam("run_ids", list(run_ids), type_=ARRAY(String)))
+                    )
+                    .order_by(PredictionRecord.created_at, PredictionRecord.id)
+                    .all()
+                )
+
+                predictions: Dict[str, Prediction] = {}
+                for record in prediction_records:
+                    if record.run_id not in predictions:
+                        predictions[record.run_id] = self._to_prediction(record)
+                return predictions
+        except SQLAlchemyError as e:
+            raise StorageError(f"Error getting predictions by run_ids: {str(e)}") from e
+
+    def get_predictions_by_records(
+        self, keys: Sequence[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Prediction]:
+        """Get the predictions of given records of batch runs in a single query.
+
+        Rows are narrowed by run ID through its index, and by record ID, each bound
+        as one array parameter; pairs that were not asked for are dropped.
+
+        Args:
+            keys: Dagster run ID and housing record ID of each prediction to get
+
+        Returns:
+            The predictions found, by run ID and record ID. Keys without a stored
+            prediction are left out
+
+        Raises:
+            StorageError: If there is an error getting the predictions
+        """
+        wanted = set(keys)
+        if not wanted:
+            return {}
+
+        run_ids = list({run_id for run_id, _ in wanted})
+        record_ids = list({record_id for _, record_id in wanted})
+        try:
+            with self._get_session() as session:
+                prediction_records = (
+                    session.query(PredictionRecord)
+                    .options(joinedload(PredictionRecord.cleaned_record))
+                    .filter(
+                        PredictionRecord.run_id
+                        == any_(bindparam("run_ids", run_ids, type_=ARRAY(String))),
+                        PredictionRecord.cleaned_record_id
+                        == any_(bindparam("record_ids", record_ids, type_=ARRAY(String))),
+                    )
+                    .all()
+                )
+
+                return {
+                    (record.run_id, record.cleaned_record_id): self._to_prediction(record)
+                    for record in prediction_records
+                    if (record.run_id, record.cleaned_record_id) in wanted
+                }
+        except SQLAlchemyError as e:
+            raise StorageError(f"Error getting predictions by records: {str(e)}") from e
+
+    def list_predictions(
+        self, filters: PredictionFilter, limit: int, after: Optional[PredictionCursor] = None
+    ) -> Iterator[Prediction]:
+        """List stored predictions, newest first, with their housing records.
+
+        Pages are delimited by the position of their last prediction rather than
+        an offset, so every page is an index range scan, however deep it is. Rows
+        are streamed from a server-side cursor, `LIST_FETCH_SIZE` at a time.
+
+        Args:
+            filters: Criteria the predictions must match
+            limit: Maximum number of predictions to list
+            after: Position of the last prediction of the previous page, if any
+
+        Returns:
+            Iterator over the matching predictions, newest first
+
+        Raises:
+            StorageError: If there is an error listing the predictions
+        """
+        statement = (
+            select(PredictionRecord)
+            .join(PredictionRecord.cleaned_record)
+            .options(contains_eager(PredictionRecord.cleaned_record))
+            .order_by(PredictionRecord.created_at.desc(), PredictionRecord.id.desc())
+            .limit(limit)
+            .execution_options(yield_per=LIST_FETCH_SIZE)
+        )
+
+        if filters.created_from is not None:
+            statement = statement.where(PredictionRecord.created_at >= filters.created_from)
+        if filters.created_to is not None:
+            statement = statement.where(PredictionRecord.created_at < filters.created_to)
+        if filters.ocean_proximity is not None:
+            statement = statement.where(
+                CleanedHousingRecord.ocean_proximity == filters.ocean_proximity
+            )
+        if filters.min_value is not None:
+            statement = statement.where(PredictionRecord.prediction_value >= filters.min_value)
+        if filters.max_value is not None:
+            statement = statement.where(PredictionRecord.prediction_value <= filters.max_value)
+        if after is not None:
+            statement = statement.where(
+                tuple_(PredictionRecord.created_at, PredictionRecord.id)
+                < tuple_(after.created_at, after.id)
+            )
+
+        session = self._get_session()
+        try:
+            for prediction_record in session.execute(statement).scalars():
+                yield self._to_prediction(prediction_record)
+        except SQLAlchemyError as e:
+            raise StorageError(f"Error listing predictions: {str(e)}") from e
+        finally:
+            # Runs as soon as the listing is closed, not once it is garbage collected
+            session.close()
+
+    def get_idempotency_key(self, key: str, created_after: datetime) -> Optional[SubmissionKey]:
+        """Get the submission recorded for an idempotency key.
+
+        Args:
+            key: The idempotency key of the submission
+            created_after: Keys recorded at or before this time are expired and ignored
+
+        Returns:
+            The submission recorded for the key, or None if there is no live one
+
+        Raises:
+            StorageError: If there is an error getting the key
+        """
+        try:
+            with self._get_session() as session:
+                key_record = (
+                    session.query(IdempotencyKeyRecord)
+                    .filter(
+                        IdempotencyKeyRecord.key == key,
+                        IdempotencyKeyRecord.created_at > created_after,
+                    )
+                    .one_or_none()
+                )
+                return self._to_submission_key(key_record) if key_record else None
+        except SQLAlchemyError as e:
+            raise StorageError(f"Error getting idempotency key: {str(e)}") from e
+
+    def save_idempotency_key(
+        self,
+        submission: SubmissionKey,
+        created_after: datetime,
+        replaced_run_id: Optional[str] = None,
+    ) -> SubmissionKey:
+        """Record the run started for a submission key, unless a live one exists.
+
+        Args:
+            submission: The submission to record under its key
+            created_after: Keys recorded at or before this time are expired and replaced
+            replaced_run_id: Run of a live key that is replaced all the same, such as
+                a run that failed, if any
+
+        Returns:
+            The submission recorded for the key, which is an earlier one if another
+            submission with the same key was recorded first
+
+        Raises:
+            StorageError: If there is an error saving the key
+        """
+        replaceable = IdempotencyKeyRecord.created_at <= created_after
+        if replaced_run_id is not None:
+            replaceable = or_(replaceable, IdempotencyKeyRecord.run_id == replaced_run_id)
+
+        try:
+            with self._get_session() as session:
+                values = {
+                    "run_id": submission.run_id,
+                    "fingerprint": submission.fingerprint,
+                    "created_at": submission.created_at,
+                }
+                statement = (
+                    insert(IdempotencyKeyRecord)
+                    .values(key=submission.key, **values)
+                    .on_conflict_do_update(
+                        index_elements=[IdempotencyKeyRecord.key],
+                        set_=values,
+                        where=replaceable,
+                    )
+                    .returning(IdempotencyKeyRecord.run_id)
+                )
+                stored_run_id = session.execute(statement).scalar()
+                session.commit()
+
+                if stored_run_id is not None:
+                    return submission
+
+                # A live key was recorded first, keep the run it points to
+                key_record = session.query(IdempotencyKeyRecord).filter_by(key=submission.key).one()
+                return self._to_submission_key(key_record)
+        except SQLAlchemyError as e:
+            raise StorageError(f"Error saving idempotency key: {str(e)}") from e
+
+    def save_run_status(self, run_id: str, status: str) -> None:
+        """Record the status of a pipeline run, unless it has already moved past it.
+
+        Args:
+            run_id: The Dagster run ID
+            status: The status the run reached
+
+        Raises:
+            StorageError: If there is an error saving the status
+        """
+        try:
+            with self._get_session() as session:
+                session.execute(self._run_status_upsert(run_id, status))
+                session.commit()
+        except SQLAlchemyError as e:
+            raise StorageError(f"Error saving run status: {str(e)}") from e
+
+    def get_run_statuses(
+        self, run_ids: Sequence[str], stale_before: Optional[datetime] = None
+    ) -> Dict[str, str]:
+        """Get the recorded statuses of several pipeline runs in a single query.
+
+        Args:
+            run_ids: The Dagster run IDs to get the statuses of
+            stale_before: "pending" and "running" statuses last updated before this
+                time are stale and left out, if given
+
+        Returns:
+            The status of each run, by run ID. Runs without a recorded status, or
+            with a stale one, are left out
+
+        Raises:
+            StorageError: If there is an error getting the statuses
+        """
+        if not run_ids:
+            return {}
+
+        query = select(PredictionRunRecord.run_id, PredictionRunRecord.status).where(
+            PredictionRunRecord.run_id
+            == any_(bindparam("run_ids", list(run_ids), type_=ARRAY(String)))
+        )
+        if stale_before is not None:
+            query = query.where(
+                or_(
+                    PredictionRunRecord.status.in_(
+                        [PredictionStatus.COMPLETED.value, PredictionStatus.FAILED.value]
+                    ),
+                    PredictionRunRecord.updated_at >= stale_before,
+                )
+            )
+
+        try:
+            with self._get_session() as session:
+                rows = session.execute(query).all()
+                return {run_id: status for run_id, status in rows}
+        except SQLAlchemyError as e:
+            raise StorageError(f"Error getting run statuses: {str(e)}") from e
+
+    @staticmethod
+    def _run_status_upsert(run_id: str, status: str):
+        """Build the upsert of the status of a run, which only ever moves it forward."""
+        now = datetime.utcnow()
+        earlier = [
+            candidate
+            for candidate, order in RUN_STATUS_ORDER.items()
+            if order < RUN_STATUS_ORDER[status]
+        ]
+        return (
+            insert(PredictionRunRecord)
+            .values(run_id=run_id, status=status, created_at=now, updated_at=now)
+            .on_conflict_do_update(
+                index_elements=[PredictionRunRecord.run_id],
+                set_={"status": status, "updated_at": now},
+                where=PredictionRunRecord.status.in_(earlier),
+            )
+        )
+
+    def save_webhook_delivery(self, delivery: WebhookDelivery) -> str:
+        """Queue a webhook delivery in the outbox.
+
+        Args:
+            delivery: The delivery to queue
+
+        Returns:
+            The ID of the queued delivery
+
+        Raises:
+            StorageError: If there is an error queuing the delivery
+        """
+        try:
+            with self._get_session() as session:
+                session.add(self._to_webhook_delivery_record(delivery))
+                session.commit()
+                return delivery.id
+        except SQLAlchemyError as e:
+            raise StorageError(f"Error saving webhook delivery: {str(e)}") from e
+
+    def claim_webhook_deliveries(self, limit: int, lease: float) -> List[WebhookDelivery]:
+        """Claim pending webhook deliveries that are due, oldest first.
+
+        Rows locked by another dispatcher are skipped rather than waited for, and
+        the claimed ones are pushed back by the lease before the lock is released.
+
+        Args:
+            limit: Maximum number of deliveries to claim
+            lease: Seconds the claimed deliveries are reserved for
+
+        Returns:
+            The claimed deliveries
+
+        Raises:
+            StorageError: If there is an error claiming the deliveries
+        """
+        now = datetime.utcnow()
+        statement = (
+            select(WebhookDeliveryRecord)
+            .where(
+                WebhookDeliveryRecord.status == WebhookDeliveryStatus.PENDING.value,
+                WebhookDeliveryRecord.next_attempt_at <= now,
+            )
+            .order_by(WebhookDeliveryRecord.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+
+        try:
+            with self._get_session() as session:
+                delivery_records = session.execute(statement).scalars().all()
+                deliveries = [self._to_webhook_delivery(record) for record in delivery_records]
+
+                leased_until = now + timedelta(seconds=lease)
+                for record in delivery_records:
+                    record.next_attempt_at = leased_until
+                session.commit()
+
+                return deliveries
+        except SQLAlchemyError as e:
+            raise StorageError(f"Error claiming webhook deliveries: {str(e)}") from e
+
+    def complete_webhook_deliveries(self, delivery_ids: Sequence[str]) -> None:
+        """Mark webhook deliveries as delivered.
+
+        Args:
+            delivery_ids: The IDs of the delivered deliveries
+
+        Raises:
+            StorageError: If there is an error updating the deliveries
+        """
+        if not delivery_ids:
+            return
+
+        try:
+            with self._get_session() as session:
+                session.execute(
+                    update(WebhookDeliveryRecord)
+                    .where(WebhookDeliveryRecord.id.in_(list(delivery_ids)))
+                    .values(
+                        status=WebhookDeliveryStatus.DELIVERED.value,
+                        next_attempt_at=None,
+                        delivered_at=datetime.utcnow(),
+                    )
+                )
+                session.commit()
+        except SQLAlchemyError as e:
+            raise StorageError(f"Error completing webhook deliveries: {str(e)}") from e
+
+    def fail_webhook_deliveries(self, deliveries: Sequence[WebhookDelivery]) -> None:
+        """Record failed attempts of webhook deliveries.
+
+        Args:
+            deliveries: The deliveries with their attempt count, error and next attempt
+                time updated. A delivery without a next attempt time is given up
+
+        Raises:
+            StorageError: If there is an error updating the deliveries
+        """
+        if not deliveries:
+            return
+
+        try:
+            with self._get_session() as session:
+                session.execute(
+                    update(WebhookDeliveryRecord),
+                    [
+                        {
+                            "id": delivery.id,
+                            "status": (
+                                WebhookDeliveryStatus.PENDING.value
+                                if delivery.next_attempt_at is not None
+                                else WebhookDeliveryStatus.FAILED.value
+                            ),
+                            "attempts": delivery.attempts,
+                            "next_attempt_at": delivery.next_attempt_at,
+                            "last_error": delivery.last_error,
+                        }
+                        for delivery in deliveries
+                    ],
+                )
+                session.commit()
+        except SQLAlchemyError as e:
+            raise StorageError(f"Error failing webhook deliveries: {str(e)}") from e
+
+    @staticmethod
+    def _to_submission_key(key_record: IdempotencyKeyRecord) -> SubmissionKey:
+        """Convert an idempotency key row into a SubmissionKey entity."""
+        return SubmissionKey(
+            key=key_record.key,
+            run_id=key_record.run_id,
+            fingerprint=key_record.fingerprint,
+            created_at=key_record.created_at,
+        )
+
+    @staticmethod
+    def _to_webhook_delivery_record(delivery: WebhookDelivery) -> WebhookDeliveryRecord:
+        """Convert a WebhookDelivery entity into an outbox row."""
+        return WebhookDeliveryRecord(
+            id=delivery.id,
+            run_id=delivery.run_id,
+            callback_url=delivery.callback_url,
+            payload=delivery.payload,
+            status=delivery.status.value,
+            attempts=delivery.attempts,
+            next_attempt_at=delivery.next_attempt_at,
+            last_error=delivery.last_error,
+            created_at=delivery.created_at,
+        )
+
+    @staticmethod
+    def _to_webhook_delivery(delivery_record: WebhookDeliveryRecord) -> WebhookDelivery:
+        """Convert an outbox row into a WebhookDelivery entity."""
+        return WebhookDelivery(
+            id=delivery_record.id,
+            run_id=delivery_record.run_id,
+            callback_url=delivery_record.callback_url,
+            payload=delivery_record.payload,
+            status=WebhookDeliveryStatus(delivery_record.status),
+            attempts=delivery_record.attempts,
+            next_attempt_at=delivery_record.next_attempt_at,
+            last_error=delivery_record.last_error,
+            created_at=delivery_record.created_at,
+        )
+
+    @staticmethod
+    def _to_housing_record(cleaned_record: CleanedHousingRecord) -> HousingRecord:
+        """Convert a cleaned housing record row into a HousingRecord entity."""
+        return HousingRecord(
+            id=cleaned_record.id,
+            longitude=cleaned_record.longitude,
+            latitude=cleaned_record.latitude,
+            housing_median_age=cleaned_record.housing_median_age,
+            total_rooms=cleaned_record.total_rooms,
+            total_bedrooms=cleaned_record.total_bedrooms,
+            population=cleaned_record.population,
+            households=cleaned_record.households,
+            median_income=cleaned_record.median_income,
+            ocean_proximity=cleaned_record.ocean_proximity,
+        )
+
+    @classmethod
+    def _to_prediction(cls, prediction_record: PredictionRecord) -> Prediction:
+        """Convert a prediction row, with its cleaned record, into a Prediction entity."""
+        return Prediction(
+            id=prediction_record.id,
+            record_id=prediction_record.cleaned_record_id,
+            value=prediction_record.prediction_value,
+            created_at=prediction_record.created_at,
+            run_id=prediction_record.run_id,
+            batch_index=prediction_record.batch_index,
+            model_version=prediction_record.model_version,
+            record=cls._to_housing_record(prediction_record.cleaned_record),
+            status=PredictionStatus.COMPLETED,
+        )
@@ -1,11 +1,12 @@
 """Dagster resource for PostgreSQL storage."""
 
-from typing import Optional
+from typing import List, Optional
 
 from dagster import ConfigurableResource
 
 from src.adapter.driven.storage.postgres_adapter import PostgresAdapter
 from src.core.domain.entities.prediction import Prediction
+from src.core.domain.entities.webhook import WebhookDelivery
 from src.core.port.storage_port import (
     HousingRecord,
 )
@@ -38,14 +39,42 @@ class PostgresResource(ConfigurableResource):
         """Save a housing record to storage."""
         return self.get_adapter().save_housing_record(record)
 
+    def save_housing_records(self, records: List[HousingRecord]) -> List[str]:
+        """Save several housing records to storage."""
+        return self.get_adapter().save_housing_records(records)
+
     def get_housing_record(self, record_id: str) -> Optional[HousingRecord]:
         """Get a housing record from storage."""
         return self.get_adapter().get_housing_record(record_id)
 
-    def save_prediction(self, prediction: Prediction) -> str:
-        """Save a prediction to storage."""
-        return self.get_adapter().save_prediction(prediction)
+    def save_prediction(
+        self, prediction: Prediction, delivery: Optional[WebhookDelivery] = None
+    ) -> str:
+        """Save a prediction to storage, with the completion notice of its run."""
+        return self.get_adapter().save_prediction(prediction, delivery)
+
+    def save_predictions(self, predictions: List[Prediction]) -> List[str]:
+        """Save several predictions to storage."""
+        return self.get_adapter().save_predictions(predictions)
+
+    def save_backfilled_predictions(
+        self, records: List[HousingRecord], predictions: List[Prediction]
+    ) -> List[str]:
+        """Save backfilled records and their predictions, skipping those already stored."""
+        return self.get_adapter().save_backfilled_predictions(records, predictions)
 
     def get_prediction(self, prediction_id: str) -> Optional[Prediction]:
         """Get a prediction from storage."""
         return self.get_adapter().get_prediction(prediction_id)
+
+    def get_predictions(self, run_id: str) -> List[Prediction]:
+        """Get every prediction produced by a run from storage."""
+        return self.get_adapter().get_predictions(run_id)
+
+    def save_run_status(self, run_id: str, status: str) -> None:
+        """Record the status a run reached in storage."""
+        self.get_adapter().save_run_status(run_id, status)
+
+    def save_webhook_delivery(self, delivery: WebhookDelivery) -> str:
+        """Queue a webhook delivery in the outbox."""
+        return self.get_adapter().save_webhook_delivery(delivery)
@@ -0,0 +1 @@
+"""Webhook adapters for notifying clients of finished runs."""
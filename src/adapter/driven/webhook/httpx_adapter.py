@@ -0,0 +1,185 @@
+"""HTTPX implementation of the WebhookPort."""
+import asyncio
+import hashlib
+import hmac
+import ipaddress
+import json
+import logging
+import socket
+import time
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import httpx
+
+from src.core.domain.exceptions import CallbackUrlNotAllowedError, WebhookDeliveryError
+from src.core.port.webhook_port import WebhookPort
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+SIGNATURE_HEADER = "X-Webhook-Signature"
+TIMESTAMP_HEADER = "X-Webhook-Timestamp"
+
+
+def sign(secret: str, timestamp: str, body: bytes) -> str:
+    """Sign a webhook body.
+
+    The timestamp is signed along with the body, so a receiver rejecting old
+    timestamps is not open to replays of captured requests.
+
+    Args:
+        secret: Secret shared with the receivers
+        timestamp: Unix time the request is sent at, as sent in `X-Webhook-Timestamp`
+        body: The request body
+
+    Returns:
+        str: The `X-Webhook-Signature` header value, `sha256=<hex HMAC>`
+    """
+    digest = hmac.new(secret.encode(), timestamp.encode() + b"." + body, hashlib.sha256)
+    return f"sha256={digest.hexdigest()}"
+
+
+class HttpxWebhookAdapter(WebhookPort):
+    """Sends webhooks over a pool of keep-alive connections.
+
+    Callback URLs come from clients, so the API must not be turned into a proxy
+    to the network it runs in. With allowed hosts, webhooks only go to those.
+    Otherwise they only go over https to hosts resolving to public addresses.
+    URLs are checked on submission and again before every request, as the
+    addresses of a host can change in between.
+    """
+
+    def __init__(
+        self,
+        secret: Optional[str] = None,
+        timeout: float = 10.0,
+        max_connections: int = 50,
+        allowed_hosts: Sequence[str] = (),
+    ):
+        """Initialize the adapter.
+
+        Args:
+            secret: Secret the requests are signed with, or None to send them unsigned
+            timeout: Seconds to wait for a receiver to connect and respond
+            max_connections: Maximum number of connections open at once, across receivers
+            allowed_hosts: Only hosts webhooks may be sent to, or empty to allow any
+                https host resolving to public addresses
+        """
+        if secret is None:
+            logger.warning("WEBHOOK_SECRET is not set, webhooks are sent unsigned")
+        self._secret = secret
+        self._timeout = timeout
+        self._max_connections = max_connections
+        self._allowed_hosts = frozenset(host.lower() for host in allowed_hosts)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared client, created on first use inside the running event loop."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self._timeout,
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_connections,
+                ),
+                follow_redirects=False,
+            )
+        return self._client
+
+    async def check_callback_url(self, callback_url: str) -> None:
+        """Check that webhooks may be sent to a callback URL.
+
+        Args:
+            callback_url: The URL to check
+
+        Raises:
+            CallbackUrlNotAllowedError: If the URL is not allowed to receive webhooks
+        """
+        try:
+            url = httpx.URL(callback_url)
+        except httpx.InvalidURL as e:
+            raise CallbackUrlNotAllowedError(f"Invalid callback URL: {str(e)}") from e
+
+        if self._allowed_hosts:
+            if url.host not in self._allowed_hosts:
+                raise CallbackUrlNotAllowedError(f"Callback host {url.host} is not allowed")
+            return
+
+        if url.scheme != "https":
+            raise CallbackUrlNotAllowedError("Callback URLs must use https")
+        for address in await self._resolve(url.host, url.port or 443):
+            if not address.is_global:
+                raise CallbackUrlNotAllowedError(
+                    f"Callback host {url.host} resolves to the non-public address {address}"
+                )
+
+    @staticmethod
+    async def _resolve(
+        host: str, port: int
+    ) -> List[Union[ipaddress.IPv4Address, ipaddress.IPv6Address]]:
+        """Resolve a host to its addresses, without blocking the event loop.
+
+        Args:
+            host: The host name or IP address
+            port: The port connected to
+
+        Returns:
+            The addresses of the host, IPv4-mapped IPv6 addresses given as IPv4
+
+        Raises:
+            CallbackUrlNotAllowedError: If the host cannot be resolved
+        """
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(
+                host, port, type=socket.SOCK_STREAM
+            )
+        except (socket.gaierror, UnicodeError) as e:
+            raise CallbackUrlNotAllowedError(f"Cannot resolve callback host {host}: {e}") from e
+
+        addresses = []
+        for info in infos:
+            # Link-local IPv6 addresses carry their interface after a %
+            address = ipaddress.ip_address(str(info[4][0]).split("%")[0])
+            if isinstance(address, ipaddress.IPv6Address) and address.ipv4_mapped:
+                address = address.ipv4_mapped
+            addresses.append(address)
+        return addresses
+
+    async def send(self, callback_url: str, events: List[Dict[str, Any]]) -> None:
+        """POST a batch of events to a callback URL in a single request.
+
+        The body is `{"events": [...]}`. Any 2xx response acknowledges every event.
+
+        Args:
+            callback_url: The URL to POST to
+            events: The events to send, in order
+
+        Raises:
+            CallbackUrlNotAllowedError: If the URL is no longer allowed to receive webhooks
+            WebhookDeliveryError: If the receiver cannot be reached or does not
+                answer with a 2xx status
+        """
+        await self.check_callback_url(callback_url)
+
+        body = json.dumps({"events": events}, separators=(",", ":")).encode()
+        headers = {"Content-Type": "application/json"}
+        if self._secret is not None:
+            timestamp = str(int(time.time()))
+            headers[TIMESTAMP_HEADER] = timestamp
+            headers[SIGNATURE_HEADER] = sign(self._secret, timestamp, body)
+
+        try:
+            response = await self._get_client().post(callback_url, content=body, headers=headers)
+        except httpx.HTTPError as e:
+            raise WebhookDeliveryError(f"Error sending webhook to {callback_url}: {str(e)}") from e
+
+        if not response.is_success:
+            raise WebhookDeliveryError(
+                f"Webhook rejected by {callback_url} with status {response.status_code}"
+            )
+
+    async def close(self) -> None:
+        """Close the pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
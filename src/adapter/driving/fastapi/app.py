@@ -1,26 +1,56 @@
 """FastAPI application for the housing ML pipeline."""
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from typing import Union
+from datetime import datetime
+from typing import Annotated, List, Optional, Union
 
 from dependency_injector.wiring import inject
-from fastapi import Depends, FastAPI
-from fastapi.encoders import jsonable_encoder
+from fastapi import Depends, FastAPI, Header, Query, Response, WebSocket, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import StreamingResponse
+from starlette.requests import HTTPConnection
 
-from src.adapter.driving.fastapi.handler import FastAPIHandler
-from src.adapter.driving.fastapi.metrics import metrics
+from src.adapter.driving.fastapi.metrics import (
+    ADMISSION_METRICS,
+    BREAKER_METRICS,
+    CACHE_METRICS,
+    WORKER_METRICS,
+    is_multiprocess,
+    metrics,
+)
 from src.adapter.driving.fastapi.middleware import PrometheusMiddleware
 from src.adapter.driving.fastapi.models import (
+    BatchPredictionResultResponse,
+    BatchPredictionSubmissionResponse,
     ErrorResponse,
     PredictionCompletedResponse,
     PredictionFailedResponse,
+    PredictionListResponse,
     PredictionPendingResponse,
     PredictionRequest,
+    PredictionStatusListResponse,
+    PredictionStatusRequest,
     PredictionSubmissionResponse,
+    SubmissionMode,
+    UnnotifiedPredictionRequest,
+)
+from src.adapter.driving.fastapi.pagination import page_stream
+from src.adapter.driving.fastapi.responses import (
+    IMMUTABLE_CACHE_CONTROL,
+    UNCACHEABLE_CACHE_CONTROL,
+    ClosingStreamingResponse,
+    ModelJSONResponse,
+    completed_etag,
+    completed_headers,
+    etag_matches,
 )
-from src.config.container import Container, container
+from src.adapter.driving.fastapi.sse import event_stream
+from src.adapter.driving.fastapi.websocket import serve_prediction_stream
+from src.config.container import container
+from src.core.domain.entities.housing_record import OceanProximity
+from src.core.domain.entities.prediction import PredictionFilter
 from src.core.port.input_port import InputPort
 
 # Configure logging
@@ -34,13 +64,40 @@ container.wire(modules=[__name__])
 
 @asynccontextmanager
 async def lifespan(api: FastAPI):
-    """Lifecycle manager for FastAPI application."""
-    # Startup
-    handler = FastAPIHandler(container.resolve(InputPort))
-    api.state.handler = handler
+    """Lifecycle manager for FastAPI application.
+
+    The dependency graph is built once at startup, so every request shares the
+    same handler, database pool and Dagster client. The model and connections are
+    then warmed up in the background, and `/ready` answers 503 until they are.
+    """
+    # Startup. Blocking storage and Dagster calls run in the default executor of the
+    # loop, bounded so that a slow dependency queues calls instead of piling up threads
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(
+            max_workers=container.config().BLOCKING_IO_THREADS, thread_name_prefix="blocking-io"
+        )
+    )
+    api.state.handler = container.input_port()
+    api.state.warm_up = container.warm_up()
+    api.state.warm_up.start()
+    CACHE_METRICS.register("submission", container.submission_cache())
+    CACHE_METRICS.register("prediction_result", container.result_cache())
+    CACHE_METRICS.register("run_result", container.run_cache())
+    ADMISSION_METRICS.register(container.admission_controller())
+    BREAKER_METRICS.register(container.etl_breaker(), container.prediction_service())
+    if is_multiprocess():
+        WORKER_METRICS.start(container.config().METRICS_PUBLISH_INTERVAL)
+    if container.config().WEBHOOK_DELIVERY_ENABLED:
+        container.webhook_dispatcher().start()
     yield
     # Shutdown
-    await container.dispose()
+    await api.state.warm_up.stop()
+    await WORKER_METRICS.stop()
+    await container.webhook_dispatcher().stop()
+    await container.webhook_adapter().close()
+    await container.prediction_service().drain()
+    await container.scoring_batcher().drain()
+    container.storage_adapter().close()
 
 
 app = FastAPI(
@@ -49,6 +106,8 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ModelJSONResponse,
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -63,14 +122,10 @@ app.add_middleware(
 # Add Prometheus middleware
 app.add_middleware(PrometheusMiddleware)
 
-# Set lifespan context
-app.lifespan = lifespan
 
-
-def get_handler() -> InputPort:
-    """Get the handler from the dependencies container."""
-    dependencies = Container()
-    return dependencies.input_port()
+def get_handler(connection: HTTPConnection) -> InputPort:
+    """Get the handler built for the application at startup."""
+    return connection.app.state.handler
 
 
 # Create a dependency for the handler
@@ -79,19 +134,169 @@ handler_dependency = Depends(get_handler)
 
 @app.post(
     "/predictions",
-    response_model=PredictionSubmissionResponse,
-    responses={400: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},
+    response_model=Union[PredictionSubmissionResponse, PredictionCompletedResponse],
+    responses={
+        400: {"model": ErrorResponse},
+        422: {
+            "model": ErrorResponse,
+            "description": "Idempotency-Key reused, or callback_url not allowed",
+        },
+        429: {"model": ErrorResponse, "description": "Pipeline backlog is full, see Retry-After"},
+        500: {"model": ErrorResponse},
+    },
     summary="Submit a prediction request",
-    description="Submit a new housing price prediction request",
+    description=(
+        "Submit a new housing price prediction request. With `mode=sync` the record is "
+        "scored in-process and the completed prediction is returned in the same response. "
+        "Records already scored by the current model get the cached completed prediction. "
+        "With a `callback_url`, the result of the run is also POSTed to it once it completes "
+        "or fails."
+    ),
     tags=["predictions"],
 )
 @inject
 async def submit_prediction(
-    request: PredictionRequest, handler: InputPort = handler_dependency
-) -> JSONResponse:
+    request: PredictionRequest,
+    mode: Annotated[SubmissionMode, Query(description="Processing mode")] = SubmissionMode.ASYNC,
+    idempotency_key: Optional[str] = Header(
+        None,
+        alias="Idempotency-Key",
+        max_length=255,
+        description=(
+            "Key identifying the submission. Resubmissions with the same key return the "
+            "original run ID, unless its run failed, and the key cannot be reused for another "
+            "request. Without it, identical records are deduplicated by content."
+        ),
+    ),
+    handler: InputPort = handler_dependency,
+) -> ModelJSONResponse:
     """Submit a prediction request."""
-    result = await handler.submit_prediction_request(request)
-    return JSONResponse(content=jsonable_encoder(result, exclude_none=True))
+    if mode == SubmissionMode.SYNC:
+        result = await handler.predict_sync(request)
+    else:
+        result = await handler.submit_prediction_request(request, idempotency_key=idempotency_key)
+    return ModelJSONResponse(result)
+
+
+@app.get(
+    "/predictions",
+    response_class=StreamingResponse,
+    responses={
+        200: {"model": PredictionListResponse},
+        400: {"model": ErrorResponse},
+        500: {"model": ErrorResponse},
+    },
+    summary="List predictions",
+    description=(
+        "List stored predictions, newest first, with the records they were made for. "
+        "Pages are chained by cursor: pass the `next_cursor` of a page to get the next one. "
+        "The last page has no `next_cursor`."
+    ),
+    tags=["predictions"],
+)
+@inject
+async def list_predictions(
+    created_from: Annotated[
+        Optional[datetime], Query(description="Only predictions created at or after this time")
+    ] = None,
+    created_to: Annotated[
+        Optional[datetime], Query(description="Only predictions created before this time")
+    ] = None,
+    ocean_proximity: Annotated[
+        Optional[OceanProximity],
+        Query(description="Only predictions for records with this ocean proximity"),
+    ] = None,
+    min_prediction: Annotated[
+        Optional[float], Query(description="Only predictions with a value at or above this one")
+    ] = None,
+    max_prediction: Annotated[
+        Optional[float], Query(description="Only predictions with a value at or below this one")
+    ] = None,
+    limit: Annotated[
+        int,
+        Query(ge=1, description="Predictions per page, capped by the server's LIST_PAGE_MAX_SIZE"),
+    ] = 100,
+    cursor: Annotated[
+        Optional[str], Query(description="`next_cursor` of the previous page")
+    ] = None,
+    handler: InputPort = handler_dependency,
+) -> StreamingResponse:
+    """List stored predictions, streaming the page as it is read."""
+    filters = PredictionFilter(
+        created_from=created_from,
+        created_to=created_to,
+        ocean_proximity=ocean_proximity,
+        min_value=min_prediction,
+        max_value=max_prediction,
+    )
+    items = await handler.list_predictions(filters, limit, cursor=cursor)
+    return ClosingStreamingResponse(
+        page_stream(items, limit),
+        media_type="application/json",
+        headers={"Cache-Control": UNCACHEABLE_CACHE_CONTROL},
+    )
+
+
+@app.post(
+    "/predictions/batch",
+    response_model=BatchPredictionSubmissionResponse,
+    responses={
+        400: {"model": ErrorResponse},
+        429: {"model": ErrorResponse, "description": "Pipeline backlog is full, see Retry-After"},
+        500: {"model": ErrorResponse},
+    },
+    summary="Submit a batch prediction request",
+    description="Submit many housing price prediction requests as a single pipeline run",
+    tags=["predictions"],
+)
+@inject
+async def submit_batch_prediction(
+    requests: List[UnnotifiedPredictionRequest], handler: InputPort = handler_dependency
+) -> ModelJSONResponse:
+    """Submit a batch prediction request."""
+    result = await handler.submit_batch_prediction_request(requests)
+    return ModelJSONResponse(result)
+
+
+@app.post(
+    "/predictions/status",
+    response_model=PredictionStatusListResponse,
+    responses={
+        400: {"model": ErrorResponse},
+        500: {"model": ErrorResponse},
+    },
+    summary="Get the status of many predictions",
+    description=(
+        "Get the status and result of up to `STATUS_LOOKUP_MAX_SIZE` prediction runs in one "
+        "call, resolved with a single Dagster query and a single database query. Run IDs "
+        "unknown to the pipeline get the `not_found` status."
+    ),
+    tags=["predictions"],
+)
+@inject
+async def get_prediction_statuses(
+    request: PredictionStatusRequest, handler: InputPort = handler_dependency
+) -> ModelJSONResponse:
+    """Get the status of many predictions."""
+    result = await handler.get_prediction_results(request.run_ids)
+    return ModelJSONResponse(result, headers={"Cache-Control": UNCACHEABLE_CACHE_CONTROL})
+
+
+@app.get(
+    "/predictions/batch/{run_id}",
+    response_model=BatchPredictionResultResponse,
+    responses={500: {"model": ErrorResponse}},
+    summary="Get batch prediction results",
+    description="Get the results of a batch prediction request by its Dagster run ID",
+    tags=["predictions"],
+)
+@inject
+async def get_batch_prediction(
+    run_id: str, handler: InputPort = handler_dependency
+) -> ModelJSONResponse:
+    """Get the batch prediction results."""
+    result = await handler.get_batch_prediction_result(run_id)
+    return ModelJSONResponse(result)
 
 
 @app.get(
@@ -99,16 +304,81 @@ async def submit_prediction(
     response_model=Union[
         PredictionPendingResponse, PredictionCompletedResponse, PredictionFailedResponse
     ],
-    responses={404: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},
+    responses={
+        304: {"description": "The completed prediction tagged by If-None-Match is unchanged"},
+        404: {"model": ErrorResponse},
+        500: {"model": ErrorResponse},
+    },
     summary="Get prediction result",
-    description="Get the result of a prediction request by its Dagster run ID",
+    description=(
+        "Get the result of a prediction request by its Dagster run ID. Completed predictions "
+        "never change and are returned with an ETag and immutable caching headers."
+    ),
     tags=["predictions"],
 )
 @inject
-async def get_prediction(run_id: str, handler: InputPort = handler_dependency) -> JSONResponse:
+async def get_prediction(
+    run_id: str,
+    wait: float = Query(
+        0.0,
+        ge=0,
+        description=(
+            "Seconds to hold the request open until the run completes or fails. "
+            "Capped by the server's LONG_POLL_MAX_WAIT."
+        ),
+    ),
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
+    handler: InputPort = handler_dependency,
+) -> Response:
     """Get the prediction result."""
-    result = await handler.get_prediction_result(run_id)
-    return JSONResponse(content=jsonable_encoder(result, exclude_none=True))
+    # Only completed predictions are tagged, and they never change
+    etag = completed_etag(run_id)
+    if if_none_match is not None and etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL},
+        )
+
+    result = await handler.get_prediction_result(run_id, wait=wait)
+    if isinstance(result, PredictionCompletedResponse):
+        return ModelJSONResponse(
+            result, headers=completed_headers(result.run_id, result.completed_at)
+        )
+    return ModelJSONResponse(result, headers={"Cache-Control": UNCACHEABLE_CACHE_CONTROL})
+
+
+@app.get(
+    "/predictions/{run_id}/events",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {"text/event-stream": {}},
+            "description": "Stream of `status` events, one per status transition",
+        }
+    },
+    summary="Stream prediction status events",
+    description=(
+        "Server-Sent Events stream pushing each pending, running, completed or failed "
+        "transition of a prediction run, ending with the final prediction"
+    ),
+    tags=["predictions"],
+)
+@inject
+async def stream_prediction_events(
+    run_id: str, handler: InputPort = handler_dependency
+) -> StreamingResponse:
+    """Stream the prediction status transitions."""
+    return StreamingResponse(
+        event_stream(handler.stream_prediction_events(run_id)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.websocket("/predictions/ws")
+async def prediction_stream(websocket: WebSocket, handler: InputPort = handler_dependency) -> None:
+    """Score a continuous stream of prediction requests over a WebSocket."""
+    await serve_prediction_stream(websocket, handler)
 
 
 @app.get("/health")
@@ -117,6 +387,24 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get(
+    "/ready",
+    responses={503: {"description": "The model and connections are still being warmed up"}},
+    summary="Readiness check",
+    description=(
+        "Answers 200 once the model is loaded and exercised and the database connections are "
+        "open, 503 until then. Route traffic to the instance only once it is ready."
+    ),
+)
+async def readiness_check(connection: HTTPConnection) -> ModelJSONResponse:
+    """Readiness check endpoint."""
+    if not connection.app.state.warm_up.ready:
+        return ModelJSONResponse(
+            {"status": "warming_up"}, status_code=status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+    return ModelJSONResponse({"status": "ready"})
+
+
 @app.get("/metrics")
 async def metrics_endpoint():
     """Prometheus metrics endpoint."""
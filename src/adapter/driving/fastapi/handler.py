@@ -1,46 +1,104 @@
 """FastAPI handler implementation."""
 from __future__ import annotations
 
+import math
 from datetime import datetime
+from typing import AsyncIterator, Iterator, Optional, Sequence, Union
 
 from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 
 from src.adapter.driving.fastapi.models import (
+    BatchPredictionItem,
+    BatchPredictionResultResponse,
+    BatchPredictionSubmissionResponse,
     PredictionCompletedResponse,
     PredictionFailedResponse,
+    PredictionListItem,
     PredictionPendingResponse,
+    PredictionRequest,
+    PredictionStatusItem,
+    PredictionStatusListResponse,
     PredictionSubmissionResponse,
 )
-from src.core.domain.entities.prediction import PredictionStatus
+from src.adapter.driving.fastapi.pagination import close_iterator, decode_cursor
+from src.core.domain.entities.housing_record import HousingRecord
+from src.core.domain.entities.prediction import Prediction, PredictionFilter, PredictionStatus
+from src.core.domain.exceptions import (
+    CallbackUrlNotAllowedError,
+    IdempotencyKeyReusedError,
+    PipelineOverloadedError,
+)
 from src.core.port.input_port import (
     InputPort,
     PredictionRequestProtocol,
     PredictionResponseProtocol,
 )
+from src.core.service.micro_batcher import MicroBatcher
 from src.core.service.prediction_service import PredictionService
+from src.core.service.status_watcher import PredictionStatusWatcher
 
 
 class FastAPIHandler(InputPort):
     """FastAPI handler implementation."""
 
-    def __init__(self, prediction_service: PredictionService):
+    def __init__(
+        self,
+        prediction_service: PredictionService,
+        max_batch_size: int = 10000,
+        status_watcher: Optional[PredictionStatusWatcher] = None,
+        max_wait: float = 30.0,
+        scoring_batcher: Optional[MicroBatcher[HousingRecord, Prediction]] = None,
+        max_page_size: int = 1000,
+        max_status_lookup_size: int = 5000,
+    ):
         """Initialize the handler with the prediction service.
 
         Args:
             prediction_service: The prediction service to use
+            max_batch_size: Maximum number of records accepted in a batch request
+            status_watcher: Shared watcher used to long-poll runs, if available
+            max_wait: Maximum number of seconds a long-poll request is held open
+            scoring_batcher: Batcher grouping streamed in-process scoring into model calls
+            max_page_size: Maximum number of predictions listed per page
+            max_status_lookup_size: Maximum number of run IDs accepted in a status lookup
         """
         self._prediction_service = prediction_service
+        self._max_batch_size = max_batch_size
+        self._status_watcher = status_watcher
+        self._max_wait = max_wait
+        self._scoring_batcher = scoring_batcher
+        self._max_page_size = max_page_size
+        self._max_status_lookup_size = max_status_lookup_size
 
     async def submit_prediction_request(
-        self, request: PredictionRequestProtocol
-    ) -> PredictionSubmissionResponse:
-        """Submit a prediction request."""
+        self, request: PredictionRequestProtocol, idempotency_key: Optional[str] = None
+    ) -> Union[PredictionSubmissionResponse, PredictionCompletedResponse]:
+        """Submit a prediction request.
+
+        A record whose model input was already scored by the current model gets
+        the cached prediction back, completed, without starting a pipeline run, and
+        its callback URL is not notified.
+        """
         try:
             # Convert request to housing record
             record = request.to_housing_record()
 
+            cached = self._prediction_service.get_cached_prediction(record)
+            if cached is not None:
+                return PredictionCompletedResponse(
+                    run_id=cached.run_id,
+                    status=PredictionStatus.COMPLETED,
+                    prediction=cached.value,
+                    completed_at=cached.created_at,
+                )
+
             # Submit to prediction service
-            run_id = await self._prediction_service.submit_prediction_request(record)
+            run_id = await self._prediction_service.submit_prediction_request(
+                record,
+                idempotency_key=idempotency_key,
+                callback_url=str(request.callback_url) if request.callback_url else None,
+            )
 
             # Create response with PENDING status
             response = PredictionSubmissionResponse(
@@ -49,6 +107,12 @@ class FastAPIHandler(InputPort):
 
             return response
 
+        except PipelineOverloadedError as e:
+            raise self._too_many_requests(e) from e
+        except (IdempotencyKeyReusedError, CallbackUrlNotAllowedError) as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
+            ) from e
         except ValueError as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
         except Exception as e:
@@ -57,52 +121,313 @@ class FastAPIHandler(InputPort):
                 detail=f"Error processing prediction request: {str(e)}",
             ) from e
 
-    async def get_prediction_result(self, run_id: str) -> PredictionResponseProtocol:
-        """Get the prediction result."""
+    async def predict_sync(self, request: PredictionRequestProtocol) -> PredictionCompletedResponse:
+        """Score a prediction request in-process and return the completed result."""
+        try:
+            record = request.to_housing_record()
+
+            prediction = await self._prediction_service.predict(record)
+
+            return PredictionCompletedResponse(
+                run_id=prediction.run_id,
+                status=PredictionStatus.COMPLETED,
+                prediction=prediction.value,
+                completed_at=prediction.created_at,
+            )
+
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error scoring prediction request: {str(e)}",
+            ) from e
+
+    async def predict_sync_batched(
+        self, request: PredictionRequestProtocol
+    ) -> PredictionCompletedResponse:
+        """Score a prediction request in-process as part of a micro-batch.
+
+        Concurrent requests are grouped by the scoring batcher into a single
+        vectorized model call, trading a few milliseconds of latency for throughput.
+        """
+        if self._scoring_batcher is None:
+            return await self.predict_sync(request)
+
+        try:
+            record = request.to_housing_record()
+
+            prediction = await self._scoring_batcher.submit(record)
+
+            return PredictionCompletedResponse(
+                run_id=prediction.run_id,
+                status=PredictionStatus.COMPLETED,
+                prediction=prediction.value,
+                completed_at=prediction.created_at,
+            )
+
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error scoring prediction request: {str(e)}",
+            ) from e
+
+    async def get_prediction_result(
+        self, run_id: str, wait: float = 0.0
+    ) -> PredictionResponseProtocol:
+        """Get the prediction result.
+
+        With a positive `wait`, the request is held open until the run reaches a
+        terminal state or the wait expires, whichever comes first.
+        """
         try:
+            wait = min(wait, self._max_wait)
+            if wait > 0 and self._status_watcher is not None:
+                result = await self._status_watcher.wait_for_result(run_id, timeout=wait)
+            else:
+                result = await self._prediction_service.get_prediction_result(run_id)
+
+            return self._to_response(run_id, result)
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Error retrieving prediction result: {str(e)}"
+            ) from e
+
+    async def get_prediction_results(self, run_ids: Sequence[str]) -> PredictionStatusListResponse:
+        """Get the results of several prediction requests with one lookup per backend."""
+        if len(run_ids) > self._max_status_lookup_size:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=(
+                    f"Status lookup of {len(run_ids)} runs exceeds the maximum of "
+                    f"{self._max_status_lookup_size}"
+                ),
+            )
+
+        try:
+            results = await self._prediction_service.get_prediction_results(run_ids)
+
+            return PredictionStatusListResponse(
+                items=[self._to_status_item(run_id, results[run_id]) for run_id in run_ids]
+            )
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error retrieving prediction results: {str(e)}",
+            ) from e
+
+    async def stream_prediction_events(
+        self, run_id: str
+    ) -> AsyncIterator[PredictionResponseProtocol]:
+        """Stream every status transition of a run until it completes or fails."""
+        if self._status_watcher is None:
             result = await self._prediction_service.get_prediction_result(run_id)
+            yield self._to_response(run_id, result)
+            return
+
+        # Closed right away when the client leaves, so the run stops being polled for it
+        results = self._status_watcher.watch(run_id)
+        try:
+            async for result in results:
+                yield self._to_response(run_id, result)
+        finally:
+            await results.aclose()
+
+    @staticmethod
+    def _too_many_requests(error: PipelineOverloadedError) -> HTTPException:
+        """Map a full pipeline backlog to a 429 telling the client when to retry."""
+        return HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(error),
+            headers={"Retry-After": str(math.ceil(error.retry_after))},
+        )
+
+    @classmethod
+    def _to_status_item(cls, run_id: str, result: Union[Prediction, str]) -> PredictionStatusItem:
+        """Convert a prediction service result into an entry of a bulk status lookup."""
+        if result == "not_found":
+            return PredictionStatusItem(run_id=run_id, status=PredictionStatus.NOT_FOUND)
+
+        return PredictionStatusItem.model_validate(
+            cls._to_response(run_id, result), from_attributes=True
+        )
+
+    @staticmethod
+    def _to_response(run_id: str, result: Union[Prediction, str]) -> PredictionResponseProtocol:
+        """Convert a prediction service result into the matching response model."""
+        # If result is a string, it's a status from the ETL pipeline
+        if isinstance(result, str):
+            # Map ETL status to PredictionStatus
+            status_map = {
+                "pending": PredictionStatus.PENDING,
+                "running": PredictionStatus.RUNNING,
+                "completed": PredictionStatus.COMPLETED,
+                "failed": PredictionStatus.FAILED,
+            }
+
+            # If failed, return failed response with error
+            if result == "failed":
+                return PredictionFailedResponse(
+                    run_id=run_id, status=PredictionStatus.FAILED, completed_at=datetime.now()
+                )
+
+            # For pending/running, return pending response
+            return PredictionPendingResponse(
+                run_id=run_id,
+                status=status_map.get(result, PredictionStatus.PENDING),
+            )
+
+        # If result is a Prediction, convert to appropriate response type
+        if result.status == PredictionStatus.COMPLETED:
+            return PredictionCompletedResponse(
+                run_id=result.run_id,
+                status=result.status,
+                prediction=result.value,
+                completed_at=result.created_at,
+            )
+        elif result.status == PredictionStatus.FAILED:
+            return PredictionFailedResponse(
+                run_id=result.run_id, status=result.status, completed_at=result.created_at
+            )
+        else:
+            return PredictionPendingResponse(
+                run_id=result.run_id,
+                status=result.status,
+            )
+
+    async def submit_batch_prediction_request(
+        self, requests: Sequence[PredictionRequestProtocol]
+    ) -> BatchPredictionSubmissionResponse:
+        """Submit a batch of prediction requests as a single pipeline run."""
+        if not requests:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Batch must contain at least one record",
+            )
+        if len(requests) > self._max_batch_size:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Batch size {len(requests)} exceeds the maximum of {self._max_batch_size}",
+            )
+
+        try:
+            records = [request.to_housing_record() for request in requests]
+
+            run_id = await self._prediction_service.submit_batch_prediction_request(records)
+
+            return BatchPredictionSubmissionResponse(
+                run_id=run_id,
+                status=PredictionStatus.PENDING,
+                items=[
+                    BatchPredictionItem(index=index, record_id=record.id)
+                    for index, record in enumerate(records)
+                ],
+            )
+
+        except PipelineOverloadedError as e:
+            raise self._too_many_requests(e) from e
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error processing batch prediction request: {str(e)}",
+            ) from e
+
+    async def get_batch_prediction_result(self, run_id: str) -> BatchPredictionResultResponse:
+        """Get the results of a batch prediction request."""
+        try:
+            result = await self._prediction_service.get_batch_prediction_result(run_id)
 
-            # If result is a string, it's a status from the ETL pipeline
             if isinstance(result, str):
-                # Map ETL status to PredictionStatus
-                status_map = {
-                    "pending": PredictionStatus.PENDING,
-                    "running": PredictionStatus.RUNNING,
-                    "completed": PredictionStatus.COMPLETED,
-                    "failed": PredictionStatus.FAILED,
-                }
-
-                # If failed, return failed response with error
                 if result == "failed":
-                    return PredictionFailedResponse(
+                    return BatchPredictionResultResponse(
                         run_id=run_id, status=PredictionStatus.FAILED, completed_at=datetime.now()
                     )
 
-                # For pending/running, return pending response
-                return PredictionPendingResponse(
+                return BatchPredictionResultResponse(
                     run_id=run_id,
-                    status=status_map.get(result, PredictionStatus.PENDING),
+                    status=(
+                        PredictionStatus.RUNNING
+                        if result == "running"
+                        else PredictionStatus.PENDING
+                    ),
                 )
 
-            # If result is a Prediction, convert to appropriate response type
-            if result.status == PredictionStatus.COMPLETED:
-                return PredictionCompletedResponse(
-                    run_id=result.run_id,
-                    status=result.status,
-                    prediction=result.value,
-                    completed_at=result.created_at,
-                )
-            elif result.status == PredictionStatus.FAILED:
-                return PredictionFailedResponse(
-                    run_id=result.run_id, status=result.status, completed_at=result.created_at
-                )
-            else:
-                return PredictionPendingResponse(
-                    run_id=result.run_id,
-                    status=result.status,
-                )
+            return BatchPredictionResultResponse(
+                run_id=run_id,
+                status=PredictionStatus.COMPLETED,
+                items=[
+                    BatchPredictionItem(
+                        index=prediction.batch_index,
+                        record_id=prediction.record_id,
+                        prediction=prediction.value,
+                    )
+                    for prediction in result
+                ],
+                completed_at=max(prediction.created_at for prediction in result),
+            )
 
         except Exception as e:
             raise HTTPException(
-                status_code=500, detail=f"Error retrieving prediction result: {str(e)}"
+                status_code=500, detail=f"Error retrieving batch prediction result: {str(e)}"
             ) from e
+
+    async def list_predictions(
+        self, filters: PredictionFilter, limit: int, cursor: Optional[str] = None
+    ) -> Iterator[PredictionListItem]:
+        """List stored predictions, newest first, one page at a time.
+
+        One prediction more than the page holds is fetched, telling whether the
+        listing continues. The first one is fetched before returning, so a failing
+        query is still answered with an error status rather than a broken stream.
+        """
+        if limit > self._max_page_size:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Page size {limit} exceeds the maximum of {self._max_page_size}",
+            )
+
+        try:
+            after = decode_cursor(cursor) if cursor is not None else None
+            predictions = self._prediction_service.list_predictions(filters, limit + 1, after)
+
+            first = await run_in_threadpool(next, predictions, None)
+            if first is None:
+                return iter(())
+
+            return self._list_items(first, predictions)
+
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error listing predictions: {str(e)}",
+            ) from e
+
+    def _list_items(
+        self, first: Prediction, predictions: Iterator[Prediction]
+    ) -> Iterator[PredictionListItem]:
+        """Convert listed predictions into listing entries, closing the listing once done."""
+        try:
+            yield self._to_list_item(first)
+            for prediction in predictions:
+                yield self._to_list_item(prediction)
+        finally:
+            close_iterator(predictions)
+
+    @staticmethod
+    def _to_list_item(prediction: Prediction) -> PredictionListItem:
+        """Convert a stored prediction into a listing entry."""
+        return PredictionListItem(
+            id=prediction.id,
+            run_id=prediction.run_id,
+            prediction=prediction.value,
+            created_at=prediction.created_at,
+            record=PredictionRequest.model_validate(prediction.record, from_attributes=True),
+        )
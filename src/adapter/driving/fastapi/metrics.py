@@ -1,7 +1,31 @@
 """Prometheus metrics for the FastAPI application."""
-from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+import asyncio
+import logging
+import os
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+from prometheus_client.registry import Collector
 from starlette.responses import Response
 
+from src.core.service.admission import AdmissionController
+from src.core.service.cache import TTLLRUCache
+from src.core.service.circuit_breaker import BreakerState, CircuitBreaker
+from src.core.service.prediction_service import PredictionService
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
 # Define metrics
 REQUEST_COUNT = Counter(
     "http_requests_total", "Total number of HTTP requests", ["method", "endpoint", "status"]
@@ -15,6 +39,309 @@ REQUEST_LATENCY = Histogram(
 )
 
 
+class CacheCollector(Collector):
+    """Collector exposing the statistics kept by the in-process caches.
+
+    Caches count their own hits and misses, so the core stays free of Prometheus;
+    the counts are read when metrics are scraped.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the collector with no caches."""
+        self._caches: Dict[str, TTLLRUCache] = {}
+
+    def register(self, name: str, cache: TTLLRUCache) -> None:
+        """Expose the statistics of a cache, replacing any cache of the same name.
+
+        Args:
+            name: Value of the `cache` label
+            cache: The cache to expose
+        """
+        self._caches[name] = cache
+
+    def collect(self) -> Iterator[Metric]:
+        """Collect the current statistics of every registered cache."""
+        hits = CounterMetricFamily("cache_hits", "Cache lookups answered", labels=["cache"])
+        misses = CounterMetricFamily("cache_misses", "Cache lookups not answered", labels=["cache"])
+        evictions = CounterMetricFamily(
+            "cache_evictions", "Entries evicted to respect the cache size", labels=["cache"]
+        )
+        expirations = CounterMetricFamily(
+            "cache_expirations", "Entries dropped after their time to live", labels=["cache"]
+        )
+        entries = GaugeMetricFamily("cache_entries", "Entries held in the cache", labels=["cache"])
+        hit_ratio = GaugeMetricFamily(
+            "cache_hit_ratio", "Share of the lookups answered since startup", labels=["cache"]
+        )
+
+        for name, cache in self._caches.items():
+            hits.add_metric([name], cache.stats.hits)
+            misses.add_metric([name], cache.stats.misses)
+            evictions.add_metric([name], cache.stats.evictions)
+            expirations.add_metric([name], cache.stats.expirations)
+            entries.add_metric([name], len(cache))
+            hit_ratio.add_metric([name], cache.stats.hit_ratio)
+
+        yield from (hits, misses, evictions, expirations, entries, hit_ratio)
+
+
+class AdmissionCollector(Collector):
+    """Collector exposing the pipeline backlog seen by the admission controller."""
+
+    def __init__(self) -> None:
+        """Initialize the collector with no controller."""
+        self._controller: Optional[AdmissionController] = None
+
+    def register(self, controller: AdmissionController) -> None:
+        """Expose the statistics of an admission controller, replacing any previous one.
+
+        Args:
+            controller: The admission controller to expose
+        """
+        self._controller = controller
+
+    def collect(self) -> Iterator[Metric]:
+        """Collect the current statistics of the admission controller."""
+        if self._controller is None:
+            return
+
+        stats = self._controller.stats
+        yield GaugeMetricFamily(
+            "prediction_pipeline_backlog",
+            "Prediction runs queued or in progress, as last seen on admission",
+            value=stats.backlog,
+        )
+        yield GaugeMetricFamily(
+            "prediction_pipeline_backlog_limit",
+            "Backlog at which new prediction runs are rejected",
+            value=self._controller.max_backlog,
+        )
+        yield CounterMetricFamily(
+            "prediction_admission_admitted",
+            "Prediction runs admitted into the pipeline",
+            value=stats.admitted,
+        )
+        yield CounterMetricFamily(
+            "prediction_admission_rejected",
+            "Prediction submissions rejected because the backlog was full",
+            value=stats.rejected,
+        )
+
+
+class BreakerCollector(Collector):
+    """Collector exposing the circuit breaker of the pipeline and the fallbacks it causes."""
+
+    def __init__(self) -> None:
+        """Initialize the collector with no breaker nor service."""
+        self._breaker: Optional[CircuitBreaker] = None
+        self._service: Optional[PredictionService] = None
+
+    def register(self, breaker: CircuitBreaker, service: PredictionService) -> None:
+        """Expose a circuit breaker and the fallbacks of a service, replacing any previous ones.
+
+        Args:
+            breaker: The circuit breaker of the pipeline calls
+            service: The prediction service falling back to in-process scoring
+        """
+        self._breaker = breaker
+        self._service = service
+
+    def collect(self) -> Iterator[Metric]:
+        """Collect the current state of the breaker and the fallback count."""
+        if self._breaker is None or self._service is None:
+            return
+
+        state = GaugeMetricFamily(
+            "pipeline_breaker_state",
+            "Whether the circuit breaker of the pipeline is in each state",
+            labels=["state"],
+        )
+        current = self._breaker.state
+        for candidate in BreakerState:
+            state.add_metric([candidate.value], int(candidate == current))
+        yield state
+
+        stats = self._breaker.stats
+        yield CounterMetricFamily(
+            "pipeline_breaker_trips",
+            "Times the circuit breaker of the pipeline opened",
+            value=stats.trips,
+        )
+        yield CounterMetricFamily(
+            "pipeline_breaker_rejected",
+            "Pipeline calls failed fast because the circuit breaker was open",
+            value=stats.rejected,
+        )
+        yield CounterMetricFamily(
+            "prediction_fallbacks",
+            "Submissions scored in-process because the pipeline could not be reached",
+            value=self._service.fallbacks,
+        )
+
+
+# How the workers' values of a gauge are combined on a scrape. The other gauges
+# describe the state of each worker, and are exposed by worker with a `pid` label
+WORKER_GAUGE_MODES = {
+    "cache_entries": "livesum",
+    "prediction_pipeline_backlog": "livemax",
+    "prediction_pipeline_backlog_limit": "livemax",
+}
+
+
+class WorkerMetricsPublisher:
+    """Writes the metrics of the per-worker collectors to the files shared by the workers.
+
+    Caches, admission control and the circuit breaker keep their statistics in
+    each worker, where a scrape only reads those of the worker answering it. With
+    several workers, each one publishes them regularly to the multiprocess files:
+    counters as their increase since the last publication, so a scrape sums them
+    over every worker, live or dead, and gauges as their current value, combined
+    over the live workers as set in `WORKER_GAUGE_MODES`.
+    """
+
+    def __init__(self, collectors: Sequence[Collector]) -> None:
+        """Initialize the publisher.
+
+        Args:
+            collectors: The collectors of per-worker statistics to publish
+        """
+        self._collectors = collectors
+        # Multiprocess metrics by name, created on first publication
+        self._metrics: Dict[str, Union[Counter, Gauge]] = {}
+        # Last value published of each counter sample, by metric name and labels
+        self._published: Dict[Tuple[str, Tuple[str, ...]], float] = {}
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def publish(self) -> None:
+        """Write the current statistics of every collector to the multiprocess files."""
+        for collector in self._collectors:
+            for family in collector.collect():
+                if family.samples:
+                    self._publish_family(family)
+
+    def _publish_family(self, family: Metric) -> None:
+        """Write the samples of a metric family to its multiprocess metric.
+
+        Args:
+            family: The metric family collected from the worker
+        """
+        metric = self._metrics.get(family.name)
+        if metric is None:
+            metric = self._metrics[family.name] = self._create_metric(
+                family, list(family.samples[0].labels)
+            )
+
+        for sample in family.samples:
+            labels = tuple(sample.labels.values())
+            child = metric.labels(*labels) if labels else metric
+            if isinstance(child, Gauge):
+                child.set(sample.value)
+                continue
+            if not sample.name.endswith("_total"):
+                continue
+            last = self._published.get((family.name, labels), 0.0)
+            # A counter lower than last published has been reset and counts from zero
+            child.inc(sample.value - last if sample.value >= last else sample.value)
+            self._published[(family.name, labels)] = sample.value
+
+    @staticmethod
+    def _create_metric(family: Metric, labelnames: List[str]) -> Union[Counter, Gauge]:
+        """Create the multiprocess metric a metric family is published to.
+
+        The metric is left out of the default registry, where the collector of the
+        family already exposes it; the multiprocess collector reads it from its file.
+
+        Args:
+            family: The metric family collected from the worker
+            labelnames: Names of the labels of the family
+
+        Returns:
+            Union[Counter, Gauge]: The counter or gauge of the same name
+        """
+        if family.type == "counter":
+            return Counter(family.name, family.documentation, labelnames, registry=None)
+        return Gauge(
+            family.name,
+            family.documentation,
+            labelnames,
+            registry=None,
+            multiprocess_mode=WORKER_GAUGE_MODES.get(family.name, "liveall"),
+        )
+
+    def start(self, interval: float) -> None:
+        """Start publishing regularly in the background of the running event loop.
+
+        Args:
+            interval: Seconds between two publications
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(interval))
+
+    async def stop(self) -> None:
+        """Stop publishing, after a last publication if it was started."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self.publish()
+
+    async def _run(self, interval: float) -> None:
+        """Publish every interval until stopped."""
+        while True:
+            try:
+                self.publish()
+            except Exception as e:
+                logger.warning(f"Publishing the worker metrics failed: {str(e)}")
+            await asyncio.sleep(interval)
+
+
+CACHE_METRICS = CacheCollector()
+REGISTRY.register(CACHE_METRICS)
+
+ADMISSION_METRICS = AdmissionCollector()
+REGISTRY.register(ADMISSION_METRICS)
+
+BREAKER_METRICS = BreakerCollector()
+REGISTRY.register(BREAKER_METRICS)
+
+WORKER_METRICS = WorkerMetricsPublisher((CACHE_METRICS, ADMISSION_METRICS, BREAKER_METRICS))
+
+
+def is_multiprocess() -> bool:
+    """Check whether metrics are shared between worker processes.
+
+    prometheus_client switches to multiprocess mode when `PROMETHEUS_MULTIPROC_DIR`
+    is set before it is imported: every worker then writes its samples to files
+    in that directory instead of keeping them in memory.
+    """
+    return "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+
+def build_registry() -> CollectorRegistry:
+    """Build the registry to expose on a scrape.
+
+    With a single process this is the default registry. With several workers,
+    every metric is aggregated over the files written by the workers, so a scrape
+    sees the same totals whichever worker answers it. The worker answering
+    publishes its own statistics first, the others having published theirs at
+    most `METRICS_PUBLISH_INTERVAL` ago.
+
+    Returns:
+        CollectorRegistry: The registry to expose
+    """
+    if not is_multiprocess():
+        return REGISTRY
+
+    WORKER_METRICS.publish()
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
 def metrics():
     """Return Prometheus metrics."""
-    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+    return Response(generate_latest(build_registry()), media_type=CONTENT_TYPE_LATEST)
@@ -1,34 +1,71 @@
 """Middleware for the FastAPI application."""
 import time
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.adapter.driving.fastapi.metrics import REQUEST_COUNT, REQUEST_LATENCY
 
+# Endpoint label for requests that matched no route, so unknown paths share one series
+UNMATCHED_ENDPOINT = "<unmatched>"
 
-class PrometheusMiddleware(BaseHTTPMiddleware):
-    """Middleware to track Prometheus metrics."""
 
-    async def dispatch(self, request: Request, call_next):
+class PrometheusMiddleware:
+    """Pure ASGI middleware to track Prometheus metrics.
+
+    Requests are labelled with the template of the route they matched, such as
+    `/predictions/{run_id}`, never with the raw path, so the number of series
+    stays bounded whatever the number of distinct run IDs.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: The ASGI application to wrap
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process the request and track metrics."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Start timer
-        start_time = time.time()
+        start_time = time.perf_counter()
+        status_code = 500
 
-        # Get the path (endpoint)
-        path = request.url.path
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
-        # Process the request
-        response = await call_next(request)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # Calculate duration
+            duration = time.perf_counter() - start_time
 
-        # Calculate duration
-        duration = time.time() - start_time
+            # Record metrics
+            method = scope["method"]
+            endpoint = self._endpoint(scope)
+            REQUEST_COUNT.labels(method=method, endpoint=endpoint, status=status_code).inc()
+            REQUEST_LATENCY.labels(method=method, endpoint=endpoint).observe(duration)
 
-        # Record metrics
-        REQUEST_COUNT.labels(
-            method=request.method, endpoint=path, status=response.status_code
-        ).inc()
+    @staticmethod
+    def _endpoint(scope: Scope) -> str:
+        """Get the template of the route that handled the request."""
+        # FastAPI records the matched route in the scope while routing
+        route = scope.get("route")
 
-        REQUEST_LATENCY.labels(method=request.method, endpoint=path).observe(duration)
+        if route is None:
+            # Plain Starlette routes, such as the docs, do not record themselves
+            for candidate in getattr(scope.get("app"), "routes", ()):
+                match, _ = candidate.matches(scope)
+                if match == Match.FULL:
+                    route = candidate
+                    break
 
-        return response
+        return getattr(route, "path", UNMATCHED_ENDPOINT)
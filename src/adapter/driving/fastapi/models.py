@@ -2,14 +2,22 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional, Union
+from enum import Enum
+from typing import List, Optional, Union
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import AnyHttpUrl, BaseModel, ConfigDict, Field, field_validator
 
 from src.core.domain.entities.housing_record import HousingRecord, OceanProximity
 from src.core.domain.entities.prediction import PredictionStatus
 
 
+class SubmissionMode(str, Enum):
+    """How a prediction request is processed."""
+
+    ASYNC = "async"  # Launch a Dagster run and poll for the result
+    SYNC = "sync"  # Score in-process and return the result in the same response
+
+
 class PredictionRequest(BaseModel):
     """Request model for house price prediction."""
 
@@ -22,6 +30,14 @@ class PredictionRequest(BaseModel):
     households: float = Field(description="Total number of households in the block")
     median_income: float = Field(description="Median income of households in the block")
     ocean_proximity: OceanProximity = Field(description="Proximity to the ocean")
+    callback_url: Optional[AnyHttpUrl] = Field(
+        None,
+        description=(
+            "URL the result is POSTed to when the run completes or fails, so the client "
+            "does not have to poll. Only used for asynchronous submissions. Must be an "
+            "https URL of a public host, or of one of the hosts set in WEBHOOK_ALLOWED_HOSTS"
+        ),
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -58,6 +74,22 @@ class PredictionRequest(BaseModel):
         )
 
 
+class UnnotifiedPredictionRequest(PredictionRequest):
+    """Request model for a house price prediction whose result is not POSTed anywhere.
+
+    Batch submissions and WebSocket messages are never notified, so their records
+    are rejected with a `callback_url` rather than silently dropping it.
+    """
+
+    @field_validator("callback_url")
+    @classmethod
+    def reject_callback_url(cls, value: Optional[AnyHttpUrl]) -> Optional[AnyHttpUrl]:
+        """Reject a callback URL, only single submissions are notified."""
+        if value is not None:
+            raise ValueError("callback_url is only supported by single submissions")
+        return value
+
+
 # Base response model with common fields
 class BasePredictionResponse(BaseModel):
     """Base response model for prediction requests."""
@@ -155,6 +187,71 @@ class PredictionNotFoundResponse(BaseModel):
     )
 
 
+# Per-item entry of a batch prediction response
+class BatchPredictionItem(BaseModel):
+    """Item of a batch prediction response."""
+
+    index: Optional[int] = Field(
+        default=None, description="Position of the record in the submitted batch"
+    )
+    record_id: str = Field(description="ID assigned to the housing record")
+    prediction: Optional[float] = Field(
+        default=None, description="The prediction value if available"
+    )
+
+
+# Response model for batch submission
+class BatchPredictionSubmissionResponse(BaseModel):
+    """Response model for batch prediction request submission."""
+
+    run_id: str = Field(description="Dagster run ID shared by the whole batch")
+    status: PredictionStatus = Field(description="Status of the batch")
+    items: List[BatchPredictionItem] = Field(description="Submitted records, in batch order")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "run_id": "123e4567-e89b-12d3-a456-426614174000",
+                "status": "pending",
+                "items": [
+                    {"index": 0, "record_id": "0f8fad5b-d9cb-469f-a165-70867728950e"},
+                    {"index": 1, "record_id": "7c9e6679-7425-40de-944b-e07fc1f90ae7"},
+                ],
+            }
+        }
+    )
+
+
+# Response model for batch results
+class BatchPredictionResultResponse(BaseModel):
+    """Response model for batch prediction results."""
+
+    run_id: str = Field(description="Dagster run ID shared by the whole batch")
+    status: PredictionStatus = Field(description="Status of the batch")
+    items: List[BatchPredictionItem] = Field(
+        default_factory=list, description="Predictions of the batch once completed"
+    )
+    completed_at: Optional[datetime] = Field(
+        default=None, description="When the batch completed or failed"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "run_id": "123e4567-e89b-12d3-a456-426614174000",
+                "status": "completed",
+                "items": [
+                    {
+                        "record_id": "0f8fad5b-d9cb-469f-a165-70867728950e",
+                        "prediction": 320201.58,
+                    }
+                ],
+                "completed_at": "2024-04-10T12:00:05Z",
+            }
+        }
+    )
+
+
 # Union type for all possible response types
 PredictionResponse = Union[
     PredictionSubmissionResponse,
@@ -165,6 +262,82 @@ PredictionResponse = Union[
 ]
 
 
+# Message received on the prediction WebSocket
+class StreamPredictionRequest(BaseModel):
+    """Prediction request sent over the prediction WebSocket."""
+
+    correlation_id: str = Field(description="Client-chosen ID echoed back with the result")
+    record: UnnotifiedPredictionRequest = Field(description="The housing record to score")
+
+
+# Message sent on the prediction WebSocket
+class StreamPredictionResponse(BaseModel):
+    """Prediction result sent over the prediction WebSocket."""
+
+    correlation_id: Optional[str] = Field(
+        default=None, description="ID of the request this result answers"
+    )
+    run_id: Optional[str] = Field(default=None, description="Run ID of the stored prediction")
+    status: PredictionStatus = Field(description="Status of the prediction")
+    prediction: Optional[float] = Field(default=None, description="The prediction value")
+    error: Optional[str] = Field(default=None, description="Error message if scoring failed")
+
+
+# Request model for bulk status lookups
+class PredictionStatusRequest(BaseModel):
+    """Request model for looking up the status of several prediction runs."""
+
+    run_ids: List[str] = Field(min_length=1, description="Run IDs of the predictions to check")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "run_ids": [
+                    "123e4567-e89b-12d3-a456-426614174000",
+                    "sync-7c9e6679-7425-40de-944b-e07fc1f90ae7",
+                ]
+            }
+        }
+    )
+
+
+# Per-run entry of a bulk status lookup
+class PredictionStatusItem(BasePredictionResponse):
+    """Status of one prediction run of a bulk status lookup."""
+
+    completed_at: Optional[datetime] = Field(
+        default=None, description="When the prediction completed or failed"
+    )
+
+
+# Response model for bulk status lookups
+class PredictionStatusListResponse(BaseModel):
+    """Response model for bulk status lookups."""
+
+    items: List[PredictionStatusItem] = Field(description="One status per run ID, in request order")
+
+
+# Entry of a prediction listing
+class PredictionListItem(BaseModel):
+    """Stored prediction, with the housing record it was made for."""
+
+    id: str = Field(description="ID of the prediction")
+    run_id: Optional[str] = Field(default=None, description="Run ID that produced the prediction")
+    prediction: float = Field(description="The prediction value")
+    created_at: datetime = Field(description="When the prediction was created")
+    record: PredictionRequest = Field(description="The housing record the prediction is for")
+
+
+# Page of a prediction listing
+class PredictionListResponse(BaseModel):
+    """Page of stored predictions, newest first."""
+
+    items: List[PredictionListItem] = Field(description="Predictions of the page, newest first")
+    next_cursor: Optional[str] = Field(
+        default=None, description="Cursor of the next page, absent on the last page"
+    )
+
+
 # Error response model
 class ErrorResponse(BaseModel):
     """Error response model."""
@@ -0,0 +1,100 @@
+"""Cursor pagination encoding for the FastAPI application."""
+import base64
+import json
+from typing import Any, Iterator, List, Optional
+
+from src.adapter.driving.fastapi.models import PredictionListItem
+from src.core.domain.entities.prediction import PredictionCursor
+
+# Items encoded into each chunk of a streamed page
+STREAM_CHUNK_SIZE = 100
+
+
+def encode_cursor(cursor: PredictionCursor) -> str:
+    """Encode a listing position as an opaque, URL-safe cursor.
+
+    Args:
+        cursor: Position of the last prediction of a page
+
+    Returns:
+        str: The cursor to send back to get the next page
+    """
+    payload = cursor.__pydantic_serializer__.to_json(cursor)
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> PredictionCursor:
+    """Decode a cursor produced by `encode_cursor`.
+
+    Args:
+        token: The cursor sent by the client
+
+    Returns:
+        PredictionCursor: The position the next page starts after
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        payload = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        return PredictionCursor.model_validate_json(payload)
+    except ValueError as e:
+        raise ValueError(f"Invalid cursor: {token}") from e
+
+
+def close_iterator(iterator: Iterator[Any]) -> None:
+    """Close an iterator holding resources, such as a generator, if it can be closed.
+
+    Args:
+        iterator: The iterator to close
+    """
+    close = getattr(iterator, "close", None)
+    if close is not None:
+        close()
+
+
+def page_stream(items: Iterator[PredictionListItem], limit: int) -> Iterator[bytes]:
+    """Encode a page of predictions as JSON while they are fetched.
+
+    The items are expected to hold one prediction more than the page when the
+    listing continues: it is not sent, and tells the page to end with the cursor
+    of its last item.
+
+    Args:
+        items: The predictions of the page, followed by the first one of the next page
+        limit: Number of predictions in a full page
+
+    Yields:
+        bytes: Chunks of a `PredictionListResponse` document
+
+    The items are closed once the page is sent, or as soon as the stream is closed.
+    """
+    chunk: List[bytes] = [b'{"items":[']
+    last: Optional[PredictionListItem] = None
+    next_cursor: Optional[str] = None
+
+    try:
+        for position, item in enumerate(items):
+            if position == limit:
+                next_cursor = encode_cursor(
+                    PredictionCursor(created_at=last.created_at, id=last.id)
+                )
+                break
+
+            if position:
+                chunk.append(b",")
+            chunk.append(item.__pydantic_serializer__.to_json(item, exclude_none=True))
+            last = item
+
+            if len(chunk) >= 2 * STREAM_CHUNK_SIZE:
+                yield b"".join(chunk)
+                chunk = []
+    finally:
+        close_iterator(items)
+
+    # Like every response model, the cursor is left out rather than sent as null
+    if next_cursor is None:
+        chunk.append(b"]}")
+    else:
+        chunk.append(b'],"next_cursor":' + json.dumps(next_cursor).encode() + b"}")
+    yield b"".join(chunk)
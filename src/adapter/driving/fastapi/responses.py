@@ -0,0 +1,110 @@
+"""Response classes for the FastAPI application."""
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Any, Dict, Iterator
+
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+from starlette.types import Receive, Scope, Send
+
+from src.adapter.driving.fastapi.pagination import close_iterator
+
+# Completed predictions never change, so shared caches may keep them for good
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Predictions still in progress must always be revalidated
+UNCACHEABLE_CACHE_CONTROL = "no-store"
+
+
+class ModelJSONResponse(JSONResponse):
+    """JSON response serializing pydantic models in a single pass.
+
+    Response models are rendered straight to bytes by pydantic-core, skipping the
+    intermediate `jsonable_encoder` walk over Python objects. `None` fields are
+    left out, matching `exclude_none=True`. Any other content is rendered the
+    same way as by `JSONResponse`.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Serialize the content to JSON bytes.
+
+        Args:
+            content: A pydantic model, or any JSON-compatible content
+
+        Returns:
+            bytes: The encoded response body
+        """
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content, exclude_none=True)
+        return super().render(content)
+
+
+class ClosingStreamingResponse(StreamingResponse):
+    """Streaming response closing its content once sent, or when the client disconnects.
+
+    `StreamingResponse` leaves an unfinished iterator to the garbage collector, so
+    the resources it holds, such as a database session, would stay open until it
+    is collected. The content is closed in the threadpool, like it is iterated.
+    """
+
+    def __init__(self, content: Iterator[Any], **kwargs: Any) -> None:
+        super().__init__(content, **kwargs)
+        self._content = content
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await run_in_threadpool(close_iterator, self._content)
+
+
+def completed_etag(run_id: str) -> str:
+    """Get the entity tag of the completed prediction of a run.
+
+    The tag depends on the run ID alone, since a completed prediction never
+    changes, so a matching `If-None-Match` can be answered without a lookup.
+
+    Args:
+        run_id: ID of the prediction run
+
+    Returns:
+        str: The quoted entity tag
+    """
+    return f'"completed-{run_id}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check whether an `If-None-Match` header matches an entity tag.
+
+    Args:
+        if_none_match: Value of the request's `If-None-Match` header
+        etag: The quoted entity tag of the resource
+
+    Returns:
+        bool: True if the client already holds the tagged representation
+    """
+    # Weak comparison, as required for If-None-Match. A `*` is not honoured, since
+    # it would need a lookup to know whether the prediction is completed
+    candidates = (candidate.strip() for candidate in if_none_match.split(","))
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def completed_headers(run_id: str, completed_at: datetime) -> Dict[str, str]:
+    """Get the caching headers of a completed prediction.
+
+    Args:
+        run_id: ID of the prediction run
+        completed_at: When the prediction was completed, naive datetimes being UTC
+
+    Returns:
+        Dict[str, str]: The `ETag`, `Last-Modified` and `Cache-Control` headers
+    """
+    if completed_at.tzinfo is None:
+        completed_at = completed_at.replace(tzinfo=timezone.utc)
+
+    return {
+        "ETag": completed_etag(run_id),
+        "Last-Modified": format_datetime(completed_at.astimezone(timezone.utc), usegmt=True),
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+    }
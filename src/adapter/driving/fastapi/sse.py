@@ -0,0 +1,78 @@
+"""Server-Sent Events encoding for the FastAPI application."""
+import asyncio
+import contextlib
+from typing import AsyncIterator, Optional
+
+from pydantic import BaseModel
+
+# Seconds of silence after which a comment line is sent to keep proxies from closing the stream
+HEARTBEAT_INTERVAL = 15.0
+
+
+def format_event(model: BaseModel, event: str, event_id: Optional[int] = None) -> str:
+    """Encode a response model as a single SSE message.
+
+    Args:
+        model: The response model sent as the event data
+        event: The SSE event name
+        event_id: Optional sequence number sent as the event ID
+
+    Returns:
+        str: The encoded message, terminated by a blank line
+    """
+    lines = [f"event: {event}"]
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"data: {model.model_dump_json(exclude_none=True)}")
+    return "\n".join(lines) + "\n\n"
+
+
+async def event_stream(
+    events: AsyncIterator[BaseModel],
+    event: str = "status",
+    heartbeat_interval: float = HEARTBEAT_INTERVAL,
+) -> AsyncIterator[str]:
+    """Encode an async stream of response models as SSE messages.
+
+    A heartbeat comment is emitted whenever no event was produced for
+    `heartbeat_interval` seconds.
+
+    Args:
+        events: The response models to send, in order
+        event: The SSE event name used for every message
+        heartbeat_interval: Seconds of silence before a heartbeat is sent
+
+    Yields:
+        str: Encoded SSE messages
+    """
+    iterator = events.__aiter__()
+    event_id = 0
+    pending: Optional["asyncio.Task[BaseModel]"] = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(iterator.__anext__())
+
+            done, _ = await asyncio.wait({pending}, timeout=heartbeat_interval)
+            if not done:
+                yield ": keep-alive\n\n"
+                continue
+
+            try:
+                model = pending.result()
+            except StopAsyncIteration:
+                return
+            finally:
+                pending = None
+
+            yield format_event(model, event, event_id)
+            event_id += 1
+    finally:
+        # A client that disconnected stops the stream, and whatever it was following
+        if pending is not None:
+            pending.cancel()
+            with contextlib.suppress(asyncio.CancelledError, StopAsyncIteration):
+                await pending
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
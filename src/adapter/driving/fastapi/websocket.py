@@ -0,0 +1,137 @@
+"""WebSocket scoring channel for the FastAPI application."""
+import asyncio
+import json
+import logging
+from typing import Optional, Set
+
+from fastapi import HTTPException, WebSocket, WebSocketDisconnect, status
+from pydantic import ValidationError
+
+from src.adapter.driving.fastapi.models import StreamPredictionRequest, StreamPredictionResponse
+from src.core.domain.entities.prediction import PredictionStatus
+from src.core.port.input_port import InputPort
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+# Maximum number of messages of a single connection being scored at the same time
+MAX_IN_FLIGHT = 1024
+
+
+async def serve_prediction_stream(
+    websocket: WebSocket, handler: InputPort, max_in_flight: int = MAX_IN_FLIGHT
+) -> None:
+    """Score a continuous stream of prediction requests received on a WebSocket.
+
+    Each text message is a `StreamPredictionRequest`. Messages are scored
+    concurrently through the handler's micro-batched path, and every result is
+    sent back as a `StreamPredictionResponse` tagged with the request's
+    correlation ID. Results may arrive out of order. A message counts as in flight
+    until its result is sent, so a client that does not read its results stops
+    its messages being read. A binary frame closes the connection with 1003
+    (unsupported data).
+
+    Args:
+        websocket: The accepted client connection
+        handler: The input port used to score records
+        max_in_flight: Maximum number of messages scored at the same time
+    """
+    await websocket.accept()
+
+    outbox: "asyncio.Queue[str]" = asyncio.Queue(maxsize=max_in_flight)
+    in_flight = asyncio.Semaphore(max_in_flight)
+    tasks: Set["asyncio.Task[None]"] = set()
+    writer = asyncio.create_task(_write(websocket, outbox, in_flight))
+
+    try:
+        while True:
+            message = await _receive_text(websocket)
+            if message is None:
+                # Requests are JSON text, a binary frame is a protocol error of the client
+                logger.warning("Prediction stream client sent a binary frame")
+                await websocket.close(code=status.WS_1003_UNSUPPORTED_DATA)
+                return
+
+            # Stop reading once too many messages are in flight, pushing back on the client
+            await in_flight.acquire()
+            task = asyncio.create_task(_score(message, handler, outbox, in_flight))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+    except WebSocketDisconnect:
+        logger.info("Prediction stream client disconnected")
+    finally:
+        for task in tasks:
+            task.cancel()
+        writer.cancel()
+
+
+async def _receive_text(websocket: WebSocket) -> Optional[str]:
+    """Receive the next message, or None if the client sent a binary frame.
+
+    Raises:
+        WebSocketDisconnect: If the client disconnected
+    """
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", status.WS_1000_NORMAL_CLOSURE))
+    return message.get("text")
+
+
+async def _score(
+    message: str, handler: InputPort, outbox: "asyncio.Queue[str]", in_flight: asyncio.Semaphore
+) -> None:
+    """Score a single message and queue its result for sending.
+
+    The writer releases the permit of the message once its result is sent.
+    """
+    correlation_id: Optional[str] = None
+    try:
+        request = StreamPredictionRequest.model_validate_json(message)
+        correlation_id = request.correlation_id
+
+        result = await handler.predict_sync_batched(request.record)
+        response = StreamPredictionResponse(
+            correlation_id=correlation_id,
+            run_id=result.run_id,
+            status=result.status,
+            prediction=result.prediction,
+        )
+
+    except ValidationError as e:
+        response = StreamPredictionResponse(
+            correlation_id=_extract_correlation_id(message),
+            status=PredictionStatus.FAILED,
+            error=f"Invalid message: {str(e)}",
+        )
+    except HTTPException as e:
+        response = StreamPredictionResponse(
+            correlation_id=correlation_id, status=PredictionStatus.FAILED, error=str(e.detail)
+        )
+    except BaseException:
+        in_flight.release()
+        raise
+
+    # Never waits, as each queued result still holds the permit of its message
+    await outbox.put(response.model_dump_json(exclude_none=True))
+
+
+async def _write(
+    websocket: WebSocket, outbox: "asyncio.Queue[str]", in_flight: asyncio.Semaphore
+) -> None:
+    """Send queued results one at a time, so frames are never interleaved."""
+    while True:
+        message = await outbox.get()
+        try:
+            await websocket.send_text(message)
+        finally:
+            in_flight.release()
+
+
+def _extract_correlation_id(message: str) -> Optional[str]:
+    """Best-effort recovery of the correlation ID of a message that failed validation."""
+    try:
+        correlation_id = json.loads(message).get("correlation_id")
+    except (ValueError, AttributeError):
+        return None
+    return str(correlation_id) if correlation_id is not None else None
@@ -1,16 +1,43 @@
 """Dependency injection container configuration."""
+from importlib import import_module
+from typing import Any, Callable
+
 from dependency_injector import containers, providers
 
-from src.adapter.driven.etl.dagster_adapter import DagsterETLAdapter
-from src.adapter.driven.model.sklearn_adapter import SklearnModelAdapter
-from src.adapter.driven.storage.postgres_adapter import PostgresAdapter
-from src.adapter.driven.storage.postgres_resource import PostgresResource
 from src.adapter.driving.fastapi.handler import FastAPIHandler
+from src.core.service.admission import AdmissionController
+from src.core.service.cache import TTLLRUCache
+from src.core.service.circuit_breaker import CircuitBreaker
+from src.core.service.micro_batcher import MicroBatcher
 from src.core.service.prediction_service import PredictionService
+from src.core.service.status_watcher import PredictionStatusWatcher
+from src.core.service.warm_up import WarmUp
+from src.core.service.webhook_dispatcher import WebhookDispatcher
 
 from .settings import get_settings
 
 
+def lazy(path: str) -> Callable[..., Any]:
+    """Get a factory of a class that is only imported when first called.
+
+    Driven adapters pull in heavy dependencies (Dagster, SQLAlchemy, scikit-learn),
+    so they are imported when their provider is first resolved, not with the container.
+
+    Args:
+        path: Dotted import path of the class
+
+    Returns:
+        Callable[..., Any]: A factory calling the class with its arguments
+    """
+    module_name, _, class_name = path.rpartition(".")
+
+    def factory(*args: Any, **kwargs: Any) -> Any:
+        return getattr(import_module(module_name), class_name)(*args, **kwargs)
+
+    factory.__qualname__ = factory.__name__ = class_name
+    return factory
+
+
 class Container(containers.DeclarativeContainer):
     """Application container."""
 
@@ -19,44 +46,136 @@ class Container(containers.DeclarativeContainer):
 
     # Storage
     postgres_resource = providers.Singleton(
-        PostgresResource, connection_url=config.provided.database_url
+        lazy("src.adapter.driven.storage.postgres_resource.PostgresResource"),
+        connection_url=config.provided.database_url,
     )
 
     # Storage Adapter (implements StoragePort)
     storage_adapter = providers.Singleton(
-        PostgresAdapter,
+        lazy("src.adapter.driven.storage.postgres_adapter.PostgresAdapter"),
         connection_url=config.provided.database_url,
+        pool_size=config.provided.DB_POOL_SIZE,
     )
 
     # Model
     model = providers.Singleton(
-        SklearnModelAdapter,
+        lazy("src.adapter.driven.model.sklearn_adapter.SklearnModelAdapter"),
         model_path=config.provided.MODEL_PATH,
     )
 
     # ETL
+    etl_breaker = providers.Singleton(
+        CircuitBreaker,
+        failure_rate=config.provided.BREAKER_FAILURE_RATE,
+        slow_call_duration=config.provided.BREAKER_SLOW_CALL_DURATION,
+        min_calls=config.provided.BREAKER_MIN_CALLS,
+        window=config.provided.BREAKER_WINDOW,
+        open_duration=config.provided.BREAKER_OPEN_DURATION,
+    )
+
     etl_adapter = providers.Singleton(
-        DagsterETLAdapter,
+        lazy("src.adapter.driven.etl.dagster_adapter.DagsterETLAdapter"),
+        breaker=etl_breaker,
+    )
+
+    # Webhooks
+    webhook_adapter = providers.Singleton(
+        lazy("src.adapter.driven.webhook.httpx_adapter.HttpxWebhookAdapter"),
+        secret=config.provided.WEBHOOK_SECRET,
+        timeout=config.provided.WEBHOOK_TIMEOUT,
+        max_connections=config.provided.WEBHOOK_MAX_CONNECTIONS,
+        allowed_hosts=config.provided.webhook_allowed_hosts,
+    )
+
+    # Caches
+    submission_cache = providers.Singleton(
+        TTLLRUCache,
+        maxsize=config.provided.IDEMPOTENCY_CACHE_SIZE,
+        ttl=config.provided.IDEMPOTENCY_TTL,
+    )
+
+    result_cache = providers.Singleton(
+        TTLLRUCache,
+        maxsize=config.provided.RESULT_CACHE_SIZE,
+        ttl=config.provided.RESULT_CACHE_TTL,
+    )
+
+    run_cache = providers.Singleton(
+        TTLLRUCache,
+        maxsize=config.provided.RUN_CACHE_SIZE,
+        ttl=config.provided.RUN_CACHE_TTL,
     )
 
     # Services
+    admission_controller = providers.Singleton(
+        AdmissionController,
+        etl=etl_adapter,
+        max_backlog=config.provided.ADMISSION_MAX_BACKLOG,
+        refresh_interval=config.provided.ADMISSION_REFRESH_INTERVAL,
+        retry_after=config.provided.ADMISSION_RETRY_AFTER,
+        breaker=etl_breaker,
+    )
+
+    warm_up = providers.Singleton(
+        WarmUp,
+        model=model,
+        storage=storage_adapter,
+        etl=etl_adapter,
+        retry_interval=config.provided.WARM_UP_RETRY_INTERVAL,
+    )
+
     prediction_service = providers.Singleton(
         PredictionService,
         etl=etl_adapter,
         storage=storage_adapter,
+        model=model,
+        webhook=webhook_adapter,
+        idempotency_ttl=config.provided.IDEMPOTENCY_TTL,
+        submission_cache=submission_cache,
+        result_cache=result_cache,
+        admission=admission_controller,
+        run_cache=run_cache,
+        submission_batch_max_size=config.provided.SUBMISSION_BATCH_MAX_SIZE,
+        submission_batch_max_wait=config.provided.SUBMISSION_BATCH_MAX_WAIT,
+        run_status_stale_after=config.provided.RUN_STATUS_STALE_AFTER,
+    )
+
+    status_watcher = providers.Singleton(
+        PredictionStatusWatcher,
+        prediction_service=prediction_service,
+        poll_interval=config.provided.STATUS_POLL_INTERVAL,
+    )
+
+    scoring_batcher = providers.Singleton(
+        MicroBatcher,
+        flush=prediction_service.provided.predict_batch,
+        max_batch_size=config.provided.SCORING_BATCH_MAX_SIZE,
+        max_wait=config.provided.SCORING_BATCH_MAX_WAIT,
+    )
+
+    webhook_dispatcher = providers.Singleton(
+        WebhookDispatcher,
+        storage=storage_adapter,
+        webhook=webhook_adapter,
+        batch_size=config.provided.WEBHOOK_BATCH_SIZE,
+        max_events_per_request=config.provided.WEBHOOK_MAX_EVENTS_PER_REQUEST,
+        max_attempts=config.provided.WEBHOOK_MAX_ATTEMPTS,
+        poll_interval=config.provided.WEBHOOK_POLL_INTERVAL,
     )
 
     # Input Port Implementation
     input_port = providers.Singleton(
         FastAPIHandler,
         prediction_service=prediction_service,
-    )
-
-    # Wire modules for dependency injection
-    wiring_config = containers.WiringConfiguration(
-        modules=["src.adapter.driving.fastapi.app", "src.adapter.driven.etl.assets"]
+        max_batch_size=config.provided.BATCH_MAX_SIZE,
+        status_watcher=status_watcher,
+        max_wait=config.provided.LONG_POLL_MAX_WAIT,
+        scoring_batcher=scoring_batcher,
+        max_page_size=config.provided.LIST_PAGE_MAX_SIZE,
+        max_status_lookup_size=config.provided.STATUS_LOOKUP_MAX_SIZE,
     )
 
 
-# Create and configure the container
+# Create and configure the container. Modules wire themselves when imported, as
+# wiring them here would import them, and the Dagster code location with them
 container = Container()
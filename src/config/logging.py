@@ -46,7 +46,9 @@ def setup_logging() -> None:
         "src.adapter.driven.etl.dagster_adapter",
         "src.adapter.driven.storage.postgres_adapter",
         "src.core.service.prediction_service",
+        "src.core.service.status_watcher",
         "src.adapter.driving.fastapi.handler",
+        "src.adapter.driving.fastapi.websocket",
     ]
 
     for logger_name in loggers:
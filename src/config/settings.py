@@ -2,6 +2,7 @@
 import os
 from functools import lru_cache
 from pathlib import Path
+from typing import List, Optional
 
 from dotenv import load_dotenv
 from pydantic.v1 import BaseSettings
@@ -19,6 +20,7 @@ class Settings(BaseSettings):
     POSTGRES_HOST: str
     POSTGRES_PORT: int
     POSTGRES_DB: str
+    DB_POOL_SIZE: int = 5  # Connections each API worker keeps open, opened during warm-up
 
     # Model
     MODEL_PATH: str
@@ -26,16 +28,62 @@ class Settings(BaseSettings):
     # API
     API_HOST: str
     API_PORT: int
+    BATCH_MAX_SIZE: int = 10000  # Maximum number of records per batch prediction request
+    LONG_POLL_MAX_WAIT: float = 30.0  # Maximum seconds a GET /predictions/{run_id} is held open
+    LIST_PAGE_MAX_SIZE: int = 1000  # Maximum predictions per page of GET /predictions
+    STATUS_LOOKUP_MAX_SIZE: int = 5000  # Maximum run IDs per POST /predictions/status
+    STATUS_POLL_INTERVAL: float = 0.5  # Seconds between two status checks of a watched run
+    SCORING_BATCH_MAX_SIZE: int = 256  # Maximum records per micro-batched model call
+    SCORING_BATCH_MAX_WAIT: float = 0.005  # Maximum seconds a record waits for its micro-batch
+    SUBMISSION_BATCH_MAX_SIZE: int = 1  # Maximum submissions per batch run, 1 to disable
+    SUBMISSION_BATCH_MAX_WAIT: float = 0.05  # Maximum seconds a submission waits for its batch
+    IDEMPOTENCY_TTL: float = 86400.0  # Seconds a submission is deduplicated for
+    IDEMPOTENCY_CACHE_SIZE: int = 100000  # Submission keys kept in the in-process cache
+    RESULT_CACHE_SIZE: int = 100000  # Completed predictions kept in the in-process cache
+    RESULT_CACHE_TTL: float = 3600.0  # Seconds a completed prediction is served from the cache
+    RUN_CACHE_SIZE: int = 10000  # Results of finished runs kept in the in-process cache
+    RUN_CACHE_TTL: float = 3600.0  # Seconds the result of a finished run is served from the cache
+    RUN_STATUS_STALE_AFTER: float = 300.0  # Seconds after which unfinished statuses are re-read
+    ADMISSION_MAX_BACKLOG: int = 500  # Runs queued or in progress at which submissions get 429
+    ADMISSION_REFRESH_INTERVAL: float = 1.0  # Minimum seconds between two backlog counts
+    ADMISSION_RETRY_AFTER: float = 5.0  # Seconds rejected clients are asked to wait (Retry-After)
+    BREAKER_FAILURE_RATE: float = 0.5  # Share of bad Dagster calls that opens the breaker
+    BREAKER_SLOW_CALL_DURATION: float = 5.0  # Seconds after which a Dagster call counts as slow
+    BREAKER_MIN_CALLS: int = 10  # Dagster calls in the window before the breaker can open
+    BREAKER_WINDOW: float = 30.0  # Seconds the outcome of a Dagster call is kept for
+    BREAKER_OPEN_DURATION: float = 15.0  # Seconds the breaker stays open before probing Dagster
+    WARM_UP_RETRY_INTERVAL: float = 5.0  # Seconds between two attempts of failed warm-up steps
+    BLOCKING_IO_THREADS: int = 32  # Threads running storage and Dagster calls off the event loop
+    METRICS_PUBLISH_INTERVAL: float = 5.0  # Seconds between two metric writes of each worker
+
+    # Webhooks
+    WEBHOOK_DELIVERY_ENABLED: bool = True  # Send the queued webhooks from the API workers
+    WEBHOOK_SECRET: Optional[str] = None  # HMAC-SHA256 key signing webhooks, unsigned if unset
+    WEBHOOK_BATCH_SIZE: int = 100  # Maximum queued webhooks claimed at once
+    WEBHOOK_MAX_EVENTS_PER_REQUEST: int = 50  # Maximum events POSTed to a URL in one request
+    WEBHOOK_MAX_ATTEMPTS: int = 10  # Failed attempts after which a webhook is given up
+    WEBHOOK_POLL_INTERVAL: float = 1.0  # Seconds between two checks of an empty outbox
+    WEBHOOK_TIMEOUT: float = 10.0  # Seconds to wait for a receiver to respond
+    WEBHOOK_MAX_CONNECTIONS: int = 50  # Maximum connections open to receivers at once
+    WEBHOOK_ALLOWED_HOSTS: str = ""  # Comma-separated callback hosts, else any public https one
 
     # Dagster
     DAGSTER_HOME: str
     DAGSTER_WORKSPACE_PATH: str = "workspace.yaml"  # Default to workspace.yaml in project root
+    BACKFILL_SOURCE_PATH: str = "data/housing.csv"  # CSV or Parquet file the backfill job reads
+    BACKFILL_PARTITION_COUNT: int = 16  # Slices a backfilled file is split into
+    BACKFILL_MAX_RETRIES: int = 3  # Retries of a failed step of a backfill partition
 
     @property
     def database_url(self) -> str:
         """Get the database URL."""
         return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
 
+    @property
+    def webhook_allowed_hosts(self) -> List[str]:
+        """Get the hosts webhooks may be sent to, empty if any public host may be."""
+        return [host.strip() for host in self.WEBHOOK_ALLOWED_HOSTS.split(",") if host.strip()]
+
     @property
     def workspace_path(self) -> Path:
         """Get the absolute path to the Dagster workspace file."""
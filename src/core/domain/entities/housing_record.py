@@ -1,13 +1,33 @@
 """Domain entity for housing records."""
 from __future__ import annotations
 
-from typing import Literal
+import hashlib
+import json
+from typing import Literal, Tuple, get_args
 from uuid import uuid4
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 # Valid categories for ocean_proximity
 OceanProximity = Literal["<1H OCEAN", "INLAND", "ISLAND", "NEAR BAY", "NEAR OCEAN"]
+OCEAN_PROXIMITY_CATEGORIES: Tuple[str, ...] = get_args(OceanProximity)
+
+# The model expects exactly 13 features:
+# - 8 numeric features, in the order below
+# - 5 one-hot encoded features for ocean_proximity, in category order
+NUMERIC_FEATURES: Tuple[str, ...] = (
+    "longitude",
+    "latitude",
+    "housing_median_age",
+    "total_rooms",
+    "total_bedrooms",
+    "population",
+    "households",
+    "median_income",
+)
+FEATURE_NAMES: Tuple[str, ...] = NUMERIC_FEATURES + tuple(
+    f"ocean_proximity_{category}" for category in OCEAN_PROXIMITY_CATEGORIES
+)
 
 
 class HousingRecord(BaseModel):
@@ -28,6 +48,32 @@ class HousingRecord(BaseModel):
 
     model_config = ConfigDict(validate_assignment=True, extra="forbid")
 
+    def to_feature_vector(self) -> Tuple[float, ...]:
+        """Get the model input for the record.
+
+        Returns:
+            Tuple[float, ...]: The values of `FEATURE_NAMES`, in the same order
+        """
+        numeric = tuple(float(getattr(self, name)) for name in NUMERIC_FEATURES)
+        one_hot = tuple(
+            1.0 if self.ocean_proximity == category else 0.0
+            for category in OCEAN_PROXIMITY_CATEGORIES
+        )
+        return numeric + one_hot
+
+    def fingerprint(self) -> str:
+        """Get a hash identifying the listing described by the record.
+
+        The ID is left out, so two submissions of the same listing share a
+        fingerprint. Numbers are hashed as floats, so `3` and `3.0` match.
+
+        Returns:
+            str: Hex SHA-256 digest of the record's fields
+        """
+        fields = self.model_dump(exclude={"id"})
+        payload = json.dumps(fields, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(payload.encode()).hexdigest()
+
     @field_validator("longitude")
     @classmethod
     def validate_longitude(cls, v):
@@ -36,6 +36,12 @@ class Prediction(BaseModel):
     )
     error: Optional[str] = Field(None, description="Error message if prediction failed")
     run_id: Optional[str] = Field(None, description="Dagster run ID that generated this prediction")
+    model_version: Optional[str] = Field(
+        None, description="Version of the model that made the prediction, if known"
+    )
+    batch_index: Optional[int] = Field(
+        None, description="Position of the record in its batch submission, for batch runs"
+    )
 
     @field_validator("value")
     @classmethod
@@ -52,3 +58,30 @@ class Prediction(BaseModel):
         if not v:
             raise ValueError("Record ID cannot be empty")
         return v
+
+
+class PredictionFilter(BaseModel):
+    """Criteria selecting stored predictions, every one of them optional."""
+
+    created_from: Optional[datetime] = Field(
+        None, description="Only predictions created at or after this time"
+    )
+    created_to: Optional[datetime] = Field(
+        None, description="Only predictions created before this time"
+    )
+    ocean_proximity: Optional[str] = Field(
+        None, description="Only predictions for records with this ocean proximity"
+    )
+    min_value: Optional[float] = Field(
+        None, description="Only predictions with a value at or above this one"
+    )
+    max_value: Optional[float] = Field(
+        None, description="Only predictions with a value at or below this one"
+    )
+
+
+class PredictionCursor(BaseModel):
+    """Position of a prediction in the listing order, newest first."""
+
+    created_at: datetime = Field(description="When the prediction was created")
+    id: str = Field(description="ID of the prediction, breaking ties between equal times")
@@ -0,0 +1,35 @@
+"""Domain entities for deduplicated prediction submissions."""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class SubmissionKey(BaseModel):
+    """Run handed out for a prediction submission, recorded under its idempotency key."""
+
+    key: str = Field(description="Idempotency key of the submission")
+    run_id: str = Field(description="Run ID handed out for the submission")
+    fingerprint: Optional[str] = Field(
+        None, description="Hash of the request sent with a client-provided key, if any"
+    )
+    created_at: datetime = Field(
+        default_factory=datetime.utcnow, description="When the key was recorded"
+    )
+
+    def conflicts_with(self, fingerprint: Optional[str]) -> bool:
+        """Check whether the key was recorded for another request.
+
+        Args:
+            fingerprint: Hash of the request now sent with the key, if any
+
+        Returns:
+            bool: True if both requests have a fingerprint and they differ
+        """
+        return (
+            fingerprint is not None
+            and self.fingerprint is not None
+            and self.fingerprint != fingerprint
+        )
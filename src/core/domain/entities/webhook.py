@@ -0,0 +1,88 @@
+"""Domain entities for completion webhooks."""
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Optional
+from uuid import uuid4
+
+from pydantic import BaseModel, Field
+
+from src.core.domain.entities.prediction import Prediction, PredictionStatus
+
+
+class WebhookDeliveryStatus(str, Enum):
+    """Status of a webhook delivery."""
+
+    PENDING = "pending"
+    DELIVERED = "delivered"
+    FAILED = "failed"
+
+
+class WebhookDelivery(BaseModel):
+    """Notice of a finished run, waiting in the outbox to be sent to its callback URL."""
+
+    id: str = Field(default_factory=lambda: str(uuid4()), description="ID of the delivery")
+    run_id: str = Field(description="Dagster run ID the notice is about")
+    callback_url: str = Field(description="URL the notice is POSTed to")
+    payload: Dict[str, Any] = Field(description="Body of the notice")
+    status: WebhookDeliveryStatus = Field(
+        default=WebhookDeliveryStatus.PENDING, description="Current status of the delivery"
+    )
+    attempts: int = Field(default=0, description="Number of failed delivery attempts")
+    next_attempt_at: Optional[datetime] = Field(
+        default_factory=datetime.utcnow,
+        description="When the delivery is next attempted, None once it is given up",
+    )
+    last_error: Optional[str] = Field(None, description="Error of the last failed attempt")
+    created_at: datetime = Field(
+        default_factory=datetime.utcnow, description="When the delivery was queued"
+    )
+
+    @classmethod
+    def for_prediction(cls, prediction: Prediction, callback_url: str) -> WebhookDelivery:
+        """Build the notice of a run that completed with a prediction.
+
+        Args:
+            prediction: The prediction stored by the run
+            callback_url: URL the notice is POSTed to
+
+        Returns:
+            WebhookDelivery: The pending delivery
+        """
+        return cls(
+            run_id=prediction.run_id,
+            callback_url=callback_url,
+            payload={
+                "run_id": prediction.run_id,
+                "status": PredictionStatus.COMPLETED.value,
+                "prediction": prediction.value,
+                "completed_at": prediction.created_at.isoformat(),
+            },
+        )
+
+    @classmethod
+    def for_failed_run(cls, run_id: str, callback_url: str, error: str) -> WebhookDelivery:
+        """Build the notice of a run that failed.
+
+        Args:
+            run_id: The Dagster run ID
+            callback_url: URL the notice is POSTed to
+            error: Why the run failed
+
+        Returns:
+            WebhookDelivery: The pending delivery
+        """
+        return cls(
+            run_id=run_id,
+            callback_url=callback_url,
+            payload={"run_id": run_id, "status": PredictionStatus.FAILED.value, "error": error},
+        )
+
+    def to_event(self) -> Dict[str, Any]:
+        """Get the notice as sent, with the delivery ID receivers deduplicate on.
+
+        Returns:
+            Dict[str, Any]: The payload, with the delivery ID
+        """
+        return {"id": self.id, **self.payload}
@@ -38,3 +38,41 @@ class StorageError(PipelineError):
     """Raised when storage operations fail."""
 
     pass
+
+
+class PipelineOverloadedError(PipelineError):
+    """Raised when the pipeline backlog is too large to accept new runs."""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message, details={"retry_after": retry_after})
+        self.retry_after = retry_after
+
+
+class IdempotencyKeyReusedError(PipelineError):
+    """Raised when an idempotency key is sent again with another request."""
+
+    pass
+
+
+class WebhookDeliveryError(PipelineError):
+    """Raised when a webhook cannot be delivered to its callback URL."""
+
+    pass
+
+
+class CallbackUrlNotAllowedError(WebhookDeliveryError):
+    """Raised when webhooks may not be sent to a callback URL."""
+
+    pass
+
+
+class PipelineUnavailableError(PipelineError):
+    """Raised when the pipeline cannot be reached, times out or fails on its side."""
+
+    pass
+
+
+class CircuitOpenError(PipelineUnavailableError):
+    """Raised when a call is not made because its circuit breaker is open."""
+
+    pass
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Literal, Optional, Protocol
+from typing import Dict, List, Literal, Optional, Protocol, Sequence
 
 from src.core.domain.entities.housing_record import HousingRecord
 
@@ -17,11 +17,22 @@ class PipelineRunProtocol(Protocol):
 class ETLPort(Protocol):
     """Protocol defining the interface for ETL pipeline operations."""
 
-    async def start_prediction_pipeline(self, record: HousingRecord) -> str:
+    async def warm_up(self) -> None:
+        """Prepare the pipeline client so that the first submissions are not slower.
+
+        Raises:
+            PipelineError: If the pipeline deployment cannot be reached
+        """
+        ...
+
+    async def start_prediction_pipeline(
+        self, record: HousingRecord, callback_url: Optional[str] = None
+    ) -> str:
         """Start a prediction pipeline for a housing record.
 
         Args:
             record: The housing record to process
+            callback_url: URL notified when the run completes or fails, if any
 
         Returns:
             str: The run ID for tracking the pipeline
@@ -31,6 +42,20 @@ class ETLPort(Protocol):
         """
         ...
 
+    async def start_batch_prediction_pipeline(self, records: List[HousingRecord]) -> str:
+        """Start a single prediction pipeline run for a batch of housing records.
+
+        Args:
+            records: The housing records to process, in submission order
+
+        Returns:
+            str: The run ID for tracking the whole batch
+
+        Raises:
+            Exception: If there's an error starting the pipeline
+        """
+        ...
+
     async def get_pipeline_status(self, run_id: str) -> str:
         """Get the status of a pipeline run.
 
@@ -45,3 +70,29 @@ class ETLPort(Protocol):
             Exception: If there's an error checking the pipeline status
         """
         ...
+
+    async def get_pipeline_statuses(self, run_ids: Sequence[str]) -> Dict[str, str]:
+        """Get the statuses of several pipeline runs in a single query.
+
+        Args:
+            run_ids: The IDs of the pipeline runs to check
+
+        Returns:
+            Dict[str, str]: "pending", "running", "completed", or "failed" by run ID.
+                Run IDs unknown to the pipeline are left out
+
+        Raises:
+            Exception: If there's an error checking the pipeline statuses
+        """
+        ...
+
+    async def get_active_run_count(self) -> int:
+        """Get the number of prediction pipeline runs queued or in progress.
+
+        Returns:
+            int: The number of runs not yet finished
+
+        Raises:
+            Exception: If there's an error querying the pipeline runs
+        """
+        ...
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import Optional, Protocol
+from datetime import datetime
+from typing import Any, AsyncIterator, Iterator, List, Optional, Protocol, Sequence
 
 from src.core.domain.entities.housing_record import HousingRecord
-from src.core.domain.entities.prediction import PredictionStatus
+from src.core.domain.entities.prediction import PredictionFilter, PredictionStatus
 
 
 class PredictionRequestProtocol(Protocol):
@@ -18,6 +19,7 @@ class PredictionRequestProtocol(Protocol):
     households: float
     median_income: float
     ocean_proximity: str
+    callback_url: Optional[Any]
 
     def to_housing_record(self) -> HousingRecord:
         """Convert to housing record."""
@@ -32,6 +34,29 @@ class PredictionResponseProtocol(Protocol):
     prediction: Optional[float]
 
 
+class BatchPredictionResponseProtocol(Protocol):
+    """Protocol defining what we expect from a batch prediction response."""
+
+    run_id: str
+    status: PredictionStatus
+    items: List
+
+
+class PredictionStatusListProtocol(Protocol):
+    """Protocol defining what we expect from a bulk status lookup response."""
+
+    items: List
+
+
+class PredictionListItemProtocol(Protocol):
+    """Protocol defining what we expect from an entry of a prediction listing."""
+
+    id: str
+    run_id: Optional[str]
+    prediction: float
+    created_at: datetime
+
+
 class PredictionStatusProtocol(Protocol):
     """Protocol defining what we expect from a prediction status."""
 
@@ -44,12 +69,16 @@ class InputPort(Protocol):
     """Protocol defining the interface for external input operations."""
 
     async def submit_prediction_request(
-        self, request: PredictionRequestProtocol
+        self, request: PredictionRequestProtocol, idempotency_key: Optional[str] = None
     ) -> PredictionResponseProtocol:
         """Submit a request for house price prediction.
 
+        Resubmitting the same request returns the tracking information of the
+        first submission instead of starting another pipeline run.
+
         Args:
             request: Validated prediction request data
+            idempotency_key: Client-provided key identifying the submission, if any
 
         Returns:
             Response containing request tracking information
@@ -60,11 +89,46 @@ class InputPort(Protocol):
         """
         ...
 
-    async def get_prediction_result(self, run_id: str) -> PredictionResponseProtocol:
+    async def predict_sync(self, request: PredictionRequestProtocol) -> PredictionResponseProtocol:
+        """Score a house price prediction request in-process and return the result.
+
+        Args:
+            request: Validated prediction request data
+
+        Returns:
+            Response containing the completed prediction
+
+        Raises:
+            ValueError: If the request data is invalid
+            Exception: If there's an error scoring the request
+        """
+        ...
+
+    async def predict_sync_batched(
+        self, request: PredictionRequestProtocol
+    ) -> PredictionResponseProtocol:
+        """Score a house price prediction request in-process as part of a micro-batch.
+
+        Args:
+            request: Validated prediction request data
+
+        Returns:
+            Response containing the completed prediction
+
+        Raises:
+            ValueError: If the request data is invalid
+            Exception: If there's an error scoring the request
+        """
+        ...
+
+    async def get_prediction_result(
+        self, run_id: str, wait: float = 0.0
+    ) -> PredictionResponseProtocol:
         """Get the result of a prediction request.
 
         Args:
             run_id: The Dagster run ID of the prediction request to check
+            wait: Seconds to wait for the run to reach a terminal state before answering
 
         Returns:
             Current status and result of the prediction request
@@ -74,3 +138,84 @@ class InputPort(Protocol):
             Exception: If there's an error retrieving the result
         """
         ...
+
+    async def get_prediction_results(self, run_ids: Sequence[str]) -> PredictionStatusListProtocol:
+        """Get the results of several prediction requests at once.
+
+        Args:
+            run_ids: The Dagster run IDs of the prediction requests to check
+
+        Returns:
+            Current status and result of each prediction request, in request order
+
+        Raises:
+            ValueError: If too many run IDs are looked up
+            Exception: If there's an error retrieving the results
+        """
+        ...
+
+    def stream_prediction_events(self, run_id: str) -> AsyncIterator[PredictionResponseProtocol]:
+        """Stream the status transitions of a prediction request.
+
+        Args:
+            run_id: The Dagster run ID of the prediction request to follow
+
+        Returns:
+            Async iterator yielding the current state, then each transition until the
+            run completes or fails
+
+        Raises:
+            Exception: If there's an error retrieving the result
+        """
+        ...
+
+    async def submit_batch_prediction_request(
+        self, requests: Sequence[PredictionRequestProtocol]
+    ) -> BatchPredictionResponseProtocol:
+        """Submit a batch of house price prediction requests as one pipeline run.
+
+        Args:
+            requests: Validated prediction request data, in submission order
+
+        Returns:
+            Response containing the batch run ID and the per-item indexes
+
+        Raises:
+            ValueError: If the batch is empty or too large
+            Exception: If there's an error processing the batch
+        """
+        ...
+
+    async def get_batch_prediction_result(self, run_id: str) -> BatchPredictionResponseProtocol:
+        """Get the results of a batch prediction request.
+
+        Args:
+            run_id: The Dagster run ID of the batch to check
+
+        Returns:
+            Current status of the batch and the predictions once completed
+
+        Raises:
+            Exception: If there's an error retrieving the result
+        """
+        ...
+
+    async def list_predictions(
+        self, filters: PredictionFilter, limit: int, cursor: Optional[str] = None
+    ) -> Iterator[PredictionListItemProtocol]:
+        """List stored predictions, newest first, one page at a time.
+
+        Args:
+            filters: Criteria the predictions must match
+            limit: Number of predictions in a full page
+            cursor: Cursor ending the previous page, None for the first page
+
+        Returns:
+            Iterator over the predictions of the page, fetched while it is consumed,
+            followed by the first prediction of the next page if the listing continues
+
+        Raises:
+            ValueError: If the cursor or the filters are invalid
+            Exception: If there's an error listing the predictions
+        """
+        ...
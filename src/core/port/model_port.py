@@ -1,4 +1,4 @@
-from typing import Any, Protocol, TypeVar
+from typing import Any, List, Protocol, TypeVar
 
 from src.core.domain.entities.housing_record import HousingRecord
 
@@ -44,3 +44,29 @@ class ModelPort(Protocol[ModelT]):
             Exception: If there's an error during prediction
         """
         ...
+
+    async def predict_batch(self, records: List[HousingRecord]) -> List[float]:
+        """Make predictions for several records with a single model call.
+
+        Args:
+            records: The housing records to make predictions for
+
+        Returns:
+            List[float]: The predicted house values, in the same order
+
+        Raises:
+            ValueError: If a record cannot be processed by the model
+            Exception: If there's an error during prediction
+        """
+        ...
+
+    def get_version(self) -> str:
+        """Get an identifier of the model currently deployed.
+
+        Returns:
+            str: A version that changes whenever the deployed model changes
+
+        Raises:
+            FileNotFoundError: If the model file is not found
+        """
+        ...
@@ -1,21 +1,67 @@
 """Service port definitions."""
-from typing import Protocol, Union
+from typing import Dict, Iterator, List, Optional, Protocol, Sequence, Union
 
 from src.core.domain.entities.housing_record import HousingRecord
-from src.core.domain.entities.prediction import Prediction
+from src.core.domain.entities.prediction import Prediction, PredictionCursor, PredictionFilter
 
 
 class PredictionServicePort(Protocol):
     """Interface for the prediction service."""
 
-    async def submit_prediction_request(self, record: HousingRecord) -> str:
+    async def submit_prediction_request(
+        self,
+        record: HousingRecord,
+        idempotency_key: Optional[str] = None,
+        callback_url: Optional[str] = None,
+    ) -> str:
         """Submit a prediction request and trigger ETL pipeline.
 
+        Resubmissions of the same request may return the run ID of the first one.
+
         Args:
             record: Housing record to process
+            idempotency_key: Client-provided key identifying the submission, if any
+            callback_url: URL notified when the run completes or fails, if any
 
         Returns:
             str: Dagster run ID for tracking
+
+        Raises:
+            IdempotencyKeyReusedError: If the idempotency key was sent with another request
+            CallbackUrlNotAllowedError: If webhooks may not be sent to the callback URL
+        """
+        ...
+
+    def get_cached_prediction(self, record: HousingRecord) -> Optional[Prediction]:
+        """Get a prediction already completed for the same model input.
+
+        Args:
+            record: Housing record to look up
+
+        Returns:
+            Optional[Prediction]: The completed prediction, or None if none is cached
+        """
+        ...
+
+    async def predict(self, record: HousingRecord) -> Prediction:
+        """Score a record in-process and persist it, bypassing the ETL pipeline.
+
+        Args:
+            record: Housing record to score
+
+        Returns:
+            Prediction: The completed prediction
+        """
+        ...
+
+    async def predict_batch(self, records: List[HousingRecord]) -> List[Prediction]:
+        """Score several records in-process with one model call and persist them.
+
+        Args:
+            records: Housing records to score
+
+        Returns:
+            List[Prediction]: The completed predictions, in the same order
         """
         ...
 
@@ -29,3 +75,54 @@ class PredictionServicePort(Protocol):
             Union[Prediction, str]: Either the prediction result or the pipeline status
         """
         ...
+
+    async def get_prediction_results(
+        self, run_ids: Sequence[str]
+    ) -> Dict[str, Union[Prediction, str]]:
+        """Get the results of several prediction requests at once.
+
+        Args:
+            run_ids: Dagster run IDs of the requests to check
+
+        Returns:
+            Dict[str, Union[Prediction, str]]: The prediction, or the status string if
+                not completed, by run ID
+        """
+        ...
+
+    async def submit_batch_prediction_request(self, records: List[HousingRecord]) -> str:
+        """Submit a batch of prediction requests as a single ETL pipeline run.
+
+        Args:
+            records: Housing records to process
+
+        Returns:
+            str: Dagster run ID for tracking the whole batch
+        """
+        ...
+
+    async def get_batch_prediction_result(self, run_id: str) -> Union[List[Prediction], str]:
+        """Get the results of a batch prediction request.
+
+        Args:
+            run_id: Pipeline run ID of the batch to check
+
+        Returns:
+            Union[List[Prediction], str]: Either the batch predictions or the pipeline status
+        """
+        ...
+
+    def list_predictions(
+        self, filters: PredictionFilter, limit: int, after: Optional[PredictionCursor] = None
+    ) -> Iterator[Prediction]:
+        """List stored predictions, newest first, fetching them lazily.
+
+        Args:
+            filters: Criteria the predictions must match
+            limit: Maximum number of predictions to list
+            after: Position of the last prediction of the previous page, if any
+
+        Returns:
+            Iterator[Prediction]: The matching predictions, newest first
+        """
+        ...
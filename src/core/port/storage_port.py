@@ -1,12 +1,23 @@
-from typing import Optional, Protocol
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Protocol, Sequence, Tuple
 
 from src.core.domain.entities.housing_record import HousingRecord
-from src.core.domain.entities.prediction import Prediction
+from src.core.domain.entities.prediction import Prediction, PredictionCursor, PredictionFilter
+from src.core.domain.entities.submission import SubmissionKey
+from src.core.domain.entities.webhook import WebhookDelivery
 
 
 class StoragePort(Protocol):
     """Protocol for storage operations."""
 
+    def warm_up(self) -> None:
+        """Open the connections kept ready for requests.
+
+        Raises:
+            StorageError: If the storage cannot be reached
+        """
+        ...
+
     def save_housing_record(self, record: HousingRecord) -> str:
         """Save a housing record to storage.
 
@@ -21,6 +32,20 @@ class StoragePort(Protocol):
         """
         ...
 
+    def save_housing_records(self, records: List[HousingRecord]) -> List[str]:
+        """Save several housing records to storage in a single transaction.
+
+        Args:
+            records: The housing records to save
+
+        Returns:
+            The IDs of the saved records, in the same order
+
+        Raises:
+            StorageError: If the records cannot be saved
+        """
+        ...
+
     def get_housing_record(self, record_id: str) -> Optional[HousingRecord]:
         """Get a housing record from storage.
 
@@ -35,11 +60,15 @@ class StoragePort(Protocol):
         """
         ...
 
-    def save_prediction(self, prediction: Prediction) -> str:
+    def save_prediction(
+        self, prediction: Prediction, delivery: Optional[WebhookDelivery] = None
+    ) -> str:
         """Save a prediction to storage.
 
         Args:
             prediction: The prediction to save
+            delivery: Completion notice of the run, queued in the webhook outbox in the
+                same transaction as the prediction, if any
 
         Returns:
             The ID of the saved prediction
@@ -49,6 +78,20 @@ class StoragePort(Protocol):
         """
         ...
 
+    def save_predictions(self, predictions: List[Prediction]) -> List[str]:
+        """Save several predictions to storage in a single transaction.
+
+        Args:
+            predictions: The predictions to save
+
+        Returns:
+            The IDs of the saved predictions, in the same order
+
+        Raises:
+            StorageError: If the predictions cannot be saved
+        """
+        ...
+
     def get_prediction(self, run_id: str) -> Optional[Prediction]:
         """Get a prediction from storage by pipeline run execution id.
 
@@ -62,3 +105,220 @@ class StoragePort(Protocol):
             StorageError: If the prediction cannot be retrieved
         """
         ...
+
+    def get_predictions(self, run_id: str) -> List[Prediction]:
+        """Get every prediction produced by a pipeline run.
+
+        Args:
+            run_id: ID of the prediction pipeline run to retrieve
+
+        Returns:
+            The predictions stored by the run, in batch order for batch runs, empty if
+            none were found
+
+        Raises:
+            StorageError: If the predictions cannot be retrieved
+        """
+        ...
+
+    def get_predictions_by_run_ids(self, run_ids: Sequence[str]) -> Dict[str, Prediction]:
+        """Get the predictions of several pipeline runs in a single query.
+
+        Args:
+            run_ids: IDs of the prediction pipeline runs to retrieve
+
+        Returns:
+            The first prediction stored by each run, by run ID. Runs without a
+            stored prediction are left out
+
+        Raises:
+            StorageError: If the predictions cannot be retrieved
+        """
+        ...
+
+    def get_predictions_by_records(
+        self, keys: Sequence[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Prediction]:
+        """Get the predictions of given records of batch runs in a single query.
+
+        Args:
+            keys: Pipeline run ID and housing record ID of each prediction to retrieve
+
+        Returns:
+            The predictions found, by run ID and record ID. Keys without a stored
+            prediction are left out
+
+        Raises:
+            StorageError: If the predictions cannot be retrieved
+        """
+        ...
+
+    def list_predictions(
+        self, filters: PredictionFilter, limit: int, after: Optional[PredictionCursor] = None
+    ) -> Iterator[Prediction]:
+        """List stored predictions, newest first, with their housing records.
+
+        Predictions are fetched lazily while the iterator is consumed, so a page
+        is never held in memory as a whole.
+
+        Args:
+            filters: Criteria the predictions must match
+            limit: Maximum number of predictions to list
+            after: Position of the last prediction of the previous page, if any
+
+        Returns:
+            Iterator over the matching predictions, newest first
+
+        Raises:
+            StorageError: If the predictions cannot be retrieved
+        """
+        ...
+
+    def get_idempotency_key(self, key: str, created_after: datetime) -> Optional[SubmissionKey]:
+        """Get the submission recorded for an idempotency key.
+
+        Args:
+            key: The idempotency key of the submission
+            created_after: Keys recorded at or before this time are expired and ignored
+
+        Returns:
+            The submission recorded for the key, or None if there is no live one
+
+        Raises:
+            StorageError: If the key cannot be retrieved
+        """
+        ...
+
+    def save_idempotency_key(
+        self,
+        submission: SubmissionKey,
+        created_after: datetime,
+        replaced_run_id: Optional[str] = None,
+    ) -> SubmissionKey:
+        """Record the run started for a submission key, unless a live one exists.
+
+        Args:
+            submission: The submission to record under its key
+            created_after: Keys recorded at or before this time are expired and replaced
+            replaced_run_id: Run of a live key that is replaced all the same, such as
+                a run that failed, if any
+
+        Returns:
+            The submission recorded for the key, which is an earlier one if another
+            submission with the same key was recorded first
+
+        Raises:
+            StorageError: If the key cannot be saved
+        """
+        ...
+
+    def save_backfilled_predictions(
+        self, records: List[HousingRecord], predictions: List[Prediction]
+    ) -> List[str]:
+        """Save backfilled records and their predictions in a single transaction.
+
+        Records already stored are kept as they are, and the predictions of records
+        that already have one are dropped, so a backfill can be run again.
+
+        Args:
+            records: The housing records to save
+            predictions: The predictions of the records
+
+        Returns:
+            The IDs of the records whose prediction was saved
+
+        Raises:
+            StorageError: If the records or predictions cannot be saved
+        """
+        ...
+
+    def save_run_status(self, run_id: str, status: str) -> None:
+        """Record the status of a pipeline run, unless it has already moved past it.
+
+        Statuses only move forward, from "pending" to "running" to "completed" or
+        "failed", so updates arriving out of order never undo a later one. Storing
+        the predictions of a run records it as completed, in the same transaction.
+
+        Args:
+            run_id: ID of the prediction pipeline run
+            status: The status the run reached
+
+        Raises:
+            StorageError: If the status cannot be saved
+        """
+        ...
+
+    def get_run_statuses(
+        self, run_ids: Sequence[str], stale_before: Optional[datetime] = None
+    ) -> Dict[str, str]:
+        """Get the recorded statuses of several pipeline runs in a single query.
+
+        Args:
+            run_ids: IDs of the prediction pipeline runs to look up
+            stale_before: "pending" and "running" statuses last updated before this
+                time are stale and left out, if given
+
+        Returns:
+            The status of each run, by run ID. Runs without a recorded status, or
+            with a stale one, are left out
+
+        Raises:
+            StorageError: If the statuses cannot be retrieved
+        """
+        ...
+
+    def save_webhook_delivery(self, delivery: WebhookDelivery) -> str:
+        """Queue a webhook delivery in the outbox.
+
+        Args:
+            delivery: The delivery to queue
+
+        Returns:
+            The ID of the queued delivery
+
+        Raises:
+            StorageError: If the delivery cannot be queued
+        """
+        ...
+
+    def claim_webhook_deliveries(self, limit: int, lease: float) -> List[WebhookDelivery]:
+        """Claim pending webhook deliveries that are due, oldest first.
+
+        Claimed deliveries are not due again before the lease expires, so concurrent
+        dispatchers never claim the same one, and a dispatcher that dies while
+        sending leaves them to be retried.
+
+        Args:
+            limit: Maximum number of deliveries to claim
+            lease: Seconds the claimed deliveries are reserved for
+
+        Returns:
+            The claimed deliveries
+
+        Raises:
+            StorageError: If the deliveries cannot be claimed
+        """
+        ...
+
+    def complete_webhook_deliveries(self, delivery_ids: Sequence[str]) -> None:
+        """Mark webhook deliveries as delivered.
+
+        Args:
+            delivery_ids: The IDs of the delivered deliveries
+
+        Raises:
+            StorageError: If the deliveries cannot be updated
+        """
+        ...
+
+    def fail_webhook_deliveries(self, deliveries: Sequence[WebhookDelivery]) -> None:
+        """Record failed attempts of webhook deliveries.
+
+        Args:
+            deliveries: The deliveries with their attempt count, error and next attempt
+                time updated. A delivery without a next attempt time is given up
+
+        Raises:
+            StorageError: If the deliveries cannot be updated
+        """
+        ...
@@ -0,0 +1,34 @@
+from typing import Any, Dict, List, Protocol
+
+
+class WebhookPort(Protocol):
+    """Protocol defining the interface for sending webhooks."""
+
+    async def check_callback_url(self, callback_url: str) -> None:
+        """Check that webhooks may be sent to a callback URL.
+
+        Args:
+            callback_url: The URL to check
+
+        Raises:
+            CallbackUrlNotAllowedError: If the URL is not allowed to receive webhooks
+        """
+        ...
+
+    async def send(self, callback_url: str, events: List[Dict[str, Any]]) -> None:
+        """POST a batch of events to a callback URL in a single request.
+
+        Args:
+            callback_url: The URL to POST to
+            events: The events to send, in order
+
+        Raises:
+            CallbackUrlNotAllowedError: If the URL is no longer allowed to receive webhooks
+            WebhookDeliveryError: If the receiver cannot be reached or does not
+                acknowledge the events
+        """
+        ...
+
+    async def close(self) -> None:
+        """Close the pooled connections."""
+        ...
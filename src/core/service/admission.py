@@ -0,0 +1,119 @@
+"""Admission control of new pipeline runs."""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from src.core.domain.exceptions import PipelineOverloadedError
+from src.core.port.etl_port import ETLPort
+from src.core.service.circuit_breaker import BreakerState, CircuitBreaker
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AdmissionStats:
+    """Counters describing the decisions of an admission controller."""
+
+    backlog: int = 0
+    admitted: int = 0
+    rejected: int = 0
+
+
+class AdmissionController:
+    """Rejects new pipeline runs while the pipeline backlog is over a limit.
+
+    The backlog is the number of prediction runs queued or in progress. Counting
+    them costs a round trip to the pipeline, so the count is refreshed at most
+    once per `refresh_interval`. Runs admitted in between are added to the last
+    count, so a burst cannot overshoot the limit while the count is stale, unless
+    they are released because they could not be started.
+
+    While the circuit breaker of the pipeline is open, no run can be started, and
+    submissions are let through without a reservation to be scored in-process.
+    """
+
+    def __init__(
+        self,
+        etl: ETLPort,
+        max_backlog: int = 500,
+        refresh_interval: float = 1.0,
+        retry_after: float = 5.0,
+        breaker: Optional[CircuitBreaker] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the controller.
+
+        Args:
+            etl: The ETL port used to count the runs queued or in progress
+            max_backlog: Number of runs queued or in progress at which new runs are rejected
+            refresh_interval: Minimum seconds between two counts of the backlog
+            retry_after: Seconds rejected clients are asked to wait before retrying
+            breaker: Circuit breaker of the pipeline calls, if any
+            clock: Monotonic time source, in seconds
+        """
+        self.etl = etl
+        self.max_backlog = max_backlog
+        self.refresh_interval = refresh_interval
+        self.retry_after = retry_after
+        self.stats = AdmissionStats()
+        self._breaker = breaker
+        self._clock = clock
+        self._refresh_lock = asyncio.Lock()
+        self._counted_backlog = 0
+        self._admitted_since_count = 0
+        self._counted_at = float("-inf")
+
+    async def admit(self) -> bool:
+        """Reserve room in the backlog for a new pipeline run.
+
+        Returns:
+            bool: Whether room was reserved, False if the circuit breaker is open and
+                the run cannot be started anyway
+
+        Raises:
+            PipelineOverloadedError: If the backlog is at or over its limit
+        """
+        if self._breaker is not None and self._breaker.state == BreakerState.OPEN:
+            return False
+
+        await self._refresh()
+
+        backlog = self._counted_backlog + self._admitted_since_count
+        self.stats.backlog = backlog
+
+        if backlog >= self.max_backlog:
+            self.stats.rejected += 1
+            raise PipelineOverloadedError(
+                f"Prediction pipeline is overloaded: {backlog} runs queued or in progress",
+                retry_after=self.retry_after,
+            )
+
+        self._admitted_since_count += 1
+        self.stats.admitted += 1
+        return True
+
+    def release(self) -> None:
+        """Give back the room reserved for a run that could not be started."""
+        self._admitted_since_count = max(self._admitted_since_count - 1, 0)
+
+    async def _refresh(self) -> None:
+        """Count the backlog again if the last count is stale."""
+        if self._clock() - self._counted_at < self.refresh_interval:
+            return
+
+        async with self._refresh_lock:
+            # Another caller may have refreshed the count while this one waited
+            if self._clock() - self._counted_at < self.refresh_interval:
+                return
+
+            try:
+                self._counted_backlog = await self.etl.get_active_run_count()
+                self._admitted_since_count = 0
+            except Exception as e:
+                # Keep admitting on the last count rather than failing every submission
+                logger.warning(f"Error counting pipeline backlog: {str(e)}")
+            finally:
+                self._counted_at = self._clock()
@@ -0,0 +1,116 @@
+"""In-process caching primitives."""
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
+
+@dataclass
+class CacheStats:
+    """Counters describing how a cache has been used."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of the lookups answered, 0 before the first lookup."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TTLLRUCache(Generic[KeyT, ValueT]):
+    """Bounded least-recently-used cache whose entries expire after a time to live.
+
+    Once `maxsize` entries are held, adding one evicts the least recently used.
+    Expired entries are dropped lazily when they are looked up. The cache is meant
+    to be shared within a single event loop and is not thread-safe.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10000,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries held
+            ttl: Seconds an entry stays valid after being set, or None to never expire
+            clock: Monotonic time source, in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: "OrderedDict[KeyT, Tuple[ValueT, Optional[float]]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Get the number of entries held, including expired ones not yet dropped."""
+        return len(self._entries)
+
+    def get(self, key: KeyT) -> Optional[ValueT]:
+        """Get the value cached for a key.
+
+        Args:
+            key: The key to look up
+
+        Returns:
+            Optional[ValueT]: The cached value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= self._clock():
+            del self._entries[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def set(self, key: KeyT, value: ValueT, ttl: Optional[float] = None) -> None:
+        """Cache a value, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key: The key to cache the value under
+            value: The value to cache
+            ttl: Seconds the entry stays valid, if shorter than the time to live of
+                the cache
+        """
+        if ttl is None or (self.ttl is not None and self.ttl < ttl):
+            ttl = self.ttl
+        expires_at = self._clock() + ttl if ttl is not None else None
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def pop(self, key: KeyT) -> Optional[ValueT]:
+        """Remove a key from the cache.
+
+        Args:
+            key: The key to remove
+
+        Returns:
+            Optional[ValueT]: The value that was cached, if any
+        """
+        entry = self._entries.pop(key, None)
+        return entry[0] if entry is not None else None
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        self._entries.clear()
@@ -0,0 +1,174 @@
+"""Circuit breaking of calls to a degraded dependency."""
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Awaitable, Callable, Deque, Optional, Tuple, TypeVar
+
+from src.core.domain.exceptions import CircuitOpenError
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class BreakerState(str, Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class CircuitBreakerStats:
+    """Counters describing the decisions of a circuit breaker."""
+
+    trips: int = 0
+    rejected: int = 0
+
+
+class CircuitBreaker:
+    """Stops calling a dependency that fails or slows down, and probes it again later.
+
+    The outcomes of the calls of the last `window` seconds are kept. Once at least
+    `min_calls` were made, the breaker opens if the share of calls that failed or
+    took longer than `slow_call_duration` reaches `failure_rate`. While open, calls
+    are rejected without being made. After `open_duration` seconds a single probe
+    call is let through: the breaker closes if it succeeds in time, and opens again
+    otherwise. Slow calls still return their result, they only count against the
+    dependency.
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        slow_call_duration: float = 5.0,
+        min_calls: int = 10,
+        window: float = 30.0,
+        open_duration: float = 15.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the breaker, closed.
+
+        Args:
+            failure_rate: Share of failed or slow calls in the window that opens the breaker
+            slow_call_duration: Seconds after which a call counts as slow
+            min_calls: Minimum number of calls in the window before the breaker can open
+            window: Seconds the outcome of a call is kept for
+            open_duration: Seconds the breaker stays open before a probe call
+            clock: Monotonic time source, in seconds
+        """
+        self.failure_rate = failure_rate
+        self.slow_call_duration = slow_call_duration
+        self.min_calls = min_calls
+        self.window = window
+        self.open_duration = open_duration
+        self.stats = CircuitBreakerStats()
+        self._clock = clock
+        self._state = BreakerState.CLOSED
+        self._opened_at = float("-inf")
+        self._probing = False
+        # Time and whether it failed or was slow, of each call of the window
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._bad_calls = 0
+
+    @property
+    def state(self) -> BreakerState:
+        """Current state, half open once the open duration has elapsed."""
+        if (
+            self._state == BreakerState.OPEN
+            and self._clock() - self._opened_at >= self.open_duration
+        ):
+            return BreakerState.HALF_OPEN
+        return self._state
+
+    async def call(
+        self,
+        operation: Callable[[], Awaitable[T]],
+        is_failure: Optional[Callable[[Exception], bool]] = None,
+    ) -> T:
+        """Make a call through the breaker.
+
+        Args:
+            operation: Makes the call when called
+            is_failure: Tells whether an exception the call raised counts against the
+                dependency, all of them do if not given
+
+        Returns:
+            T: What the call returned
+
+        Raises:
+            CircuitOpenError: If the breaker is open, without making the call
+            Exception: Whatever the call raised. Only exceptions can count as failures,
+                cancellations are not recorded
+        """
+        probe = self._admit()
+        start = self._clock()
+        try:
+            result = await operation()
+        except Exception as e:
+            # Other exceptions are answers of a working dependency, only their duration counts
+            failed = is_failure is None or is_failure(e)
+            self._record(probe, bad=failed or self._clock() - start >= self.slow_call_duration)
+            raise
+        except BaseException:
+            # A cancelled call tells nothing about the dependency, but frees the probe
+            if probe:
+                self._probing = False
+            raise
+
+        self._record(probe, bad=self._clock() - start >= self.slow_call_duration)
+        return result
+
+    def _admit(self) -> bool:
+        """Let a call through, telling whether it is the probe of a half-open breaker."""
+        state = self.state
+        if state == BreakerState.CLOSED:
+            return False
+        if state == BreakerState.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+
+        self.stats.rejected += 1
+        raise CircuitOpenError(
+            f"Circuit breaker is open, retrying in {self.open_duration:.0f}s at most"
+        )
+
+    def _record(self, probe: bool, bad: bool) -> None:
+        """Record the outcome of a call, opening or closing the breaker accordingly."""
+        now = self._clock()
+        if probe:
+            self._probing = False
+            if bad:
+                self._open(now)
+            else:
+                logger.info("Circuit breaker closed after a successful probe")
+                self._state = BreakerState.CLOSED
+                self._outcomes.clear()
+                self._bad_calls = 0
+            return
+
+        if self._state != BreakerState.CLOSED:
+            # Calls made before the breaker opened do not change its course
+            return
+
+        self._outcomes.append((now, bad))
+        self._bad_calls += bad
+        while self._outcomes and self._outcomes[0][0] <= now - self.window:
+            self._bad_calls -= self._outcomes.popleft()[1]
+
+        calls = len(self._outcomes)
+        if calls >= self.min_calls and self._bad_calls / calls >= self.failure_rate:
+            self._open(now)
+
+    def _open(self, now: float) -> None:
+        """Open the breaker."""
+        logger.warning(f"Circuit breaker opened for {self.open_duration:.0f}s")
+        self._state = BreakerState.OPEN
+        self._opened_at = now
+        self._outcomes.clear()
+        self._bad_calls = 0
+        self.stats.trips += 1
@@ -0,0 +1,99 @@
+"""Micro-batching of individual calls into batched calls."""
+import asyncio
+import logging
+from typing import Awaitable, Callable, Generic, List, Optional, Set, Tuple, TypeVar
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+
+class MicroBatcher(Generic[ItemT, ResultT]):
+    """Collects items submitted one at a time and processes them in batches.
+
+    A batch is flushed as soon as it reaches `max_batch_size` items, or `max_wait`
+    seconds after its first item arrived, whichever comes first. Each caller gets
+    back the result matching its own item.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[List[ItemT]], Awaitable[List[ResultT]]],
+        max_batch_size: int = 256,
+        max_wait: float = 0.005,
+    ):
+        """Initialize the batcher.
+
+        Args:
+            flush: Coroutine processing a batch, returning one result per item in order
+            max_batch_size: Maximum number of items per batch
+            max_wait: Maximum seconds the first item of a batch waits before a flush
+        """
+        self._flush = flush
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._pending: List[Tuple[ItemT, "asyncio.Future[ResultT]"]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushes: Set["asyncio.Task[None]"] = set()
+
+    async def submit(self, item: ItemT) -> ResultT:
+        """Add an item to the current batch and wait for its result.
+
+        Args:
+            item: The item to process
+
+        Returns:
+            The result produced for this item
+
+        Raises:
+            Exception: Whatever the flush raised for the batch holding this item
+        """
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[ResultT]" = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush_pending()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_wait, self._flush_pending)
+
+        return await future
+
+    async def drain(self) -> None:
+        """Flush the current batch and wait for every in-flight batch to finish."""
+        self._flush_pending()
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    def _flush_pending(self) -> None:
+        """Hand the current batch over to a background flush."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._run(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _run(self, batch: List[Tuple[ItemT, "asyncio.Future[ResultT]"]]) -> None:
+        """Process a batch and resolve the future of each of its items."""
+        try:
+            results = await self._flush([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(f"Batch of {len(batch)} items produced {len(results)} results")
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+        except Exception as e:
+            logger.error(f"Error processing batch of {len(batch)} items: {str(e)}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
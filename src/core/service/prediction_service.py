@@ -1,47 +1,351 @@
 """Prediction service implementation."""
+import asyncio
+import hashlib
 import logging
-from typing import Union
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from uuid import uuid4
 
 from src.core.domain.entities.housing_record import HousingRecord
-from src.core.domain.entities.prediction import Prediction
+from src.core.domain.entities.prediction import (
+    Prediction,
+    PredictionCursor,
+    PredictionFilter,
+    PredictionStatus,
+)
+from src.core.domain.entities.submission import SubmissionKey
+from src.core.domain.entities.webhook import WebhookDelivery
+from src.core.domain.exceptions import (
+    IdempotencyKeyReusedError,
+    PipelineUnavailableError,
+    PredictionError,
+)
 from src.core.port.etl_port import ETLPort
+from src.core.port.model_port import ModelPort
 from src.core.port.service_port import PredictionServicePort
 from src.core.port.storage_port import StoragePort
+from src.core.port.webhook_port import WebhookPort
+from src.core.service.admission import AdmissionController
+from src.core.service.cache import TTLLRUCache
+from src.core.service.micro_batcher import MicroBatcher
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# Run IDs of predictions scored in-process start with this prefix so reads skip Dagster
+SYNC_RUN_PREFIX = "sync-"
+
+# Joins the batch run ID and the record ID in the run ID of a micro-batched submission
+BATCH_HANDLE_SEPARATOR = ":"
+
+
+def split_handle(run_id: str) -> Tuple[str, Optional[str]]:
+    """Split the run ID handed out for a submission into its pipeline run and record.
+
+    Args:
+        run_id: Run ID of a submission, possibly micro-batched
+
+    Returns:
+        Tuple[str, Optional[str]]: The pipeline run ID, and the record ID if the
+            submission was micro-batched into a batch run
+    """
+    pipeline_run_id, separator, record_id = run_id.partition(BATCH_HANDLE_SEPARATOR)
+    return pipeline_run_id, record_id if separator else None
+
 
 class PredictionService(PredictionServicePort):
-    """Service for handling prediction requests."""
+    """Service for handling prediction requests.
 
-    def __init__(self, etl: ETLPort, storage: StoragePort):
+    The storage port is synchronous, so its calls run in the default executor of
+    the event loop, and independent calls of a request run concurrently.
+    """
+
+    def __init__(
+        self,
+        etl: ETLPort,
+        storage: StoragePort,
+        model: Optional[ModelPort] = None,
+        webhook: Optional[WebhookPort] = None,
+        idempotency_ttl: Optional[float] = None,
+        submission_cache: Optional[TTLLRUCache[str, SubmissionKey]] = None,
+        result_cache: Optional[TTLLRUCache[Tuple, Prediction]] = None,
+        admission: Optional[AdmissionController] = None,
+        run_cache: Optional[TTLLRUCache[str, Union[Prediction, str]]] = None,
+        submission_batch_max_size: int = 1,
+        submission_batch_max_wait: float = 0.05,
+        run_status_stale_after: Optional[float] = None,
+    ):
         """Initialize the prediction service.
 
         Args:
             etl: The ETL port for running the prediction pipeline
             storage: The storage port for saving and retrieving records
+            model: The model port used to score records in-process, if available
+            webhook: The webhook port checking the callback URLs of submissions, if
+                available
+            idempotency_ttl: Seconds a submission is deduplicated for, or None to disable
+            submission_cache: In-process cache of the submissions recorded by key, if
+                available
+            result_cache: In-process cache of completed predictions by model input, if
+                available. Requires the model port, which provides the model version
+            admission: Controller rejecting new pipeline runs while the backlog is full,
+                if available
+            run_cache: In-process cache of the results of finished runs by run ID, the
+                completed prediction or "failed", if available
+            submission_batch_max_size: Maximum submissions started as one batch run, 1 to
+                start a run per submission
+            submission_batch_max_wait: Maximum seconds a submission waits for its batch
+            run_status_stale_after: Seconds after which a recorded "pending" or "running"
+                status is read from the pipeline instead, or None to always trust it
         """
         self.etl = etl
         self.storage = storage
+        self.model = model
+        self.webhook = webhook
+        self.idempotency_ttl = idempotency_ttl
+        self.submission_cache = submission_cache
+        self._in_flight_submissions: Dict[str, "asyncio.Task[SubmissionKey]"] = {}
+        self.result_cache = result_cache
+        self._result_cache_version: Optional[str] = None
+        self.admission = admission
+        self.run_cache = run_cache
+        self.run_status_stale_after = run_status_stale_after
+        # Submissions scored in-process because the pipeline could not be reached
+        self.fallbacks = 0
+        self.submission_batcher: Optional[MicroBatcher[HousingRecord, str]] = None
+        if submission_batch_max_size > 1:
+            self.submission_batcher = MicroBatcher(
+                self._start_batched_pipeline,
+                max_batch_size=submission_batch_max_size,
+                max_wait=submission_batch_max_wait,
+            )
         logger.info("PredictionService initialized")
 
-    async def submit_prediction_request(self, record: HousingRecord) -> str:
+    async def submit_prediction_request(
+        self,
+        record: HousingRecord,
+        idempotency_key: Optional[str] = None,
+        callback_url: Optional[str] = None,
+    ) -> str:
         """Submit a prediction request and trigger ETL pipeline.
 
+        When deduplication is enabled, a submission whose idempotency key, or whose
+        record fingerprint if no key is given, was already seen within the TTL gets
+        the run ID of the earlier submission, and no new pipeline run is started,
+        unless that run failed. Fingerprints are told apart by callback URL, so every
+        URL is notified.
+
         Args:
             record: Housing record to process
+            idempotency_key: Client-provided key identifying the submission, if any
+            callback_url: URL notified when the run completes or fails, if any
 
         Returns:
             str: Dagster run ID for tracking
+
+        Raises:
+            PipelineOverloadedError: If a new run is needed while the pipeline backlog is full
+            IdempotencyKeyReusedError: If the idempotency key was sent with another request
+            CallbackUrlNotAllowedError: If webhooks may not be sent to the callback URL
+        """
+        if callback_url is not None and self.webhook is not None:
+            await self.webhook.check_callback_url(callback_url)
+
+        if self.idempotency_ttl is None:
+            return await self._start_prediction_pipeline(record, callback_url)
+
+        fingerprint = None
+        if idempotency_key:
+            key = f"key:{idempotency_key}"
+            fingerprint = hashlib.sha256(
+                f"{record.fingerprint()}:{callback_url or ''}".encode()
+            ).hexdigest()
+        elif callback_url:
+            key = f"record:{record.fingerprint()}:{callback_url}"
+        else:
+            key = f"record:{record.fingerprint()}"
+
+        # Identical submissions arriving together share a single lookup and run
+        task = self._in_flight_submissions.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._submit_deduplicated(key, record, callback_url, fingerprint)
+            )
+            self._in_flight_submissions[key] = task
+            task.add_done_callback(lambda _: self._in_flight_submissions.pop(key, None))
+
+        submission = await asyncio.shield(task)
+        if submission.conflicts_with(fingerprint):
+            raise IdempotencyKeyReusedError(
+                f"Idempotency key {idempotency_key} was already used for another request"
+            )
+        return submission.run_id
+
+    async def _submit_deduplicated(
+        self,
+        key: str,
+        record: HousingRecord,
+        callback_url: Optional[str] = None,
+        fingerprint: Optional[str] = None,
+    ) -> SubmissionKey:
+        """Get the live submission recorded for a key, or start a new run and record it.
+
+        A live key whose run failed is replaced by a new run, so that the submission
+        can be retried. A key recorded for another request is returned as it is.
+        """
+        now = datetime.utcnow()
+        created_after = now - timedelta(seconds=self.idempotency_ttl)
+
+        submission = self.submission_cache.get(key) if self.submission_cache else None
+        if submission is None:
+            try:
+                submission = await asyncio.to_thread(
+                    self.storage.get_idempotency_key, key, created_after
+                )
+            except Exception as e:
+                logger.warning(f"Error looking up idempotency key, not deduplicating: {str(e)}")
+
+        failed_run_id = None
+        if submission is not None:
+            if submission.conflicts_with(fingerprint) or not await self._run_failed(
+                submission.run_id
+            ):
+                logger.info(f"Deduplicated prediction request onto run_id: {submission.run_id}")
+                self._cache_submission(submission)
+                return submission
+
+            logger.info(f"Run {submission.run_id} failed, starting a new one for its key")
+            failed_run_id = submission.run_id
+
+        run_id = await self._start_prediction_pipeline(record, callback_url)
+        submission = SubmissionKey(key=key, run_id=run_id, fingerprint=fingerprint, created_at=now)
+        try:
+            # Another process may have recorded the same key first, its run wins
+            submission = await asyncio.to_thread(
+                self.storage.save_idempotency_key, submission, created_after, failed_run_id
+            )
+        except Exception as e:
+            logger.warning(f"Error saving idempotency key for run_id {run_id}: {str(e)}")
+
+        self._cache_submission(submission)
+        return submission
+
+    def _cache_submission(self, submission: SubmissionKey) -> None:
+        """Cache a submission for the rest of the lifetime of its key."""
+        if self.submission_cache is None:
+            return
+
+        age = (datetime.utcnow() - submission.created_at).total_seconds()
+        remaining = self.idempotency_ttl - age
+        if remaining > 0:
+            self.submission_cache.set(submission.key, submission, ttl=remaining)
+
+    async def _run_failed(self, run_id: str) -> bool:
+        """Check whether the run handed out for a submission is known to have failed."""
+        cached = self.run_cache.get(run_id) if self.run_cache is not None else None
+        if cached is not None:
+            return cached == "failed"
+        if run_id.startswith(SYNC_RUN_PREFIX):
+            return False
+
+        pipeline_run_id, _ = split_handle(run_id)
+        statuses = await self._get_recorded_statuses([pipeline_run_id])
+        return statuses.get(pipeline_run_id) == "failed"
+
+    def get_cached_prediction(self, record: HousingRecord) -> Optional[Prediction]:
+        """Get a prediction already completed for the same model input.
+
+        Args:
+            record: Housing record to look up
+
+        Returns:
+            Optional[Prediction]: The completed prediction, or None if none is cached
+        """
+        key = self._result_cache_key(record)
+        if key is None:
+            return None
+        return self.result_cache.get(key)
+
+    def _cache_prediction(self, prediction: Prediction) -> None:
+        """Cache a completed prediction under the model input of its record.
+
+        Only predictions made by the model currently deployed are cached, so those
+        of an earlier model, or of an unknown one, are never served for it.
+        """
+        if prediction.record is None or prediction.model_version is None:
+            return
+        key = self._result_cache_key(prediction.record)
+        if key is not None and key[0] == prediction.model_version:
+            self.result_cache.set(key, prediction)
+
+    def _cache_run_result(self, run_id: str, result: Union[Prediction, str]) -> None:
+        """Cache the result of a finished run, which never changes again."""
+        if self.run_cache is not None:
+            self.run_cache.set(run_id, result)
+
+    def _result_cache_key(self, record: HousingRecord) -> Optional[Tuple]:
+        """Get the result cache key of a record, or None if results are not cached."""
+        if self.result_cache is None or self.model is None:
+            return None
+
+        version = self._get_model_version()
+        if version is None:
+            return None
+
+        if version != self._result_cache_version:
+            # Predictions of a previous model must never be served again
+            self.result_cache.clear()
+            self._result_cache_version = version
+
+        return (version, record.to_feature_vector())
+
+    def _get_model_version(self) -> Optional[str]:
+        """Get the version of the model deployed, or None if it cannot be read."""
+        try:
+            return self.model.get_version()
+        except Exception as e:
+            logger.warning(f"Error getting model version: {str(e)}")
+            return None
+
+    async def _start_prediction_pipeline(
+        self, record: HousingRecord, callback_url: Optional[str] = None
+    ) -> str:
+        """Start the ETL pipeline for a record and store the record.
+
+        Without a callback URL, which only single runs notify, the record joins the
+        current micro-batch if batching is enabled, and gets a run ID made of the
+        batch run ID and its record ID. A micro-batch is admitted as the single run
+        it starts, the other submissions each as a run of their own. If the pipeline
+        is unavailable and an in-process model is available, the record is scored
+        in-process instead. Other errors starting the run, such as a misconfigured
+        job, are raised.
         """
         try:
-            # Start the ETL pipeline
-            run_id = await self.etl.start_prediction_pipeline(record)
+            if self.submission_batcher is not None and callback_url is None:
+                try:
+                    return await self.submission_batcher.submit(record)
+                except PipelineUnavailableError as e:
+                    return await self._fall_back(record, callback_url, e, record_stored=False)
+
+            reserved = await self._admit()
 
-            # Store the record (without run_id)
-            self.storage.save_housing_record(record)
+            # Start the ETL pipeline and store the record (without run_id) concurrently,
+            # as neither needs the other
+            run_id, stored = await asyncio.gather(
+                self.etl.start_prediction_pipeline(record, callback_url=callback_url),
+                asyncio.to_thread(self.storage.save_housing_record, record),
+                return_exceptions=True,
+            )
+            if isinstance(run_id, Exception):
+                self._release(reserved)
+            if isinstance(stored, Exception):
+                raise stored
+            if isinstance(run_id, PipelineUnavailableError):
+                return await self._fall_back(record, callback_url, run_id, record_stored=True)
+            if isinstance(run_id, Exception):
+                raise run_id
 
+            await self._record_pending_run(run_id)
             logger.info(f"Submitted prediction request with run_id: {run_id}")
             return run_id
 
@@ -49,30 +353,244 @@ class PredictionService(PredictionServicePort):
             logger.error(f"Error submitting prediction request: {str(e)}")
             raise
 
+    async def _admit(self) -> bool:
+        """Reserve room in the pipeline backlog for a new run, if admission is enabled.
+
+        Returns:
+            bool: Whether room was reserved, to be released if the run is not started
+
+        Raises:
+            PipelineOverloadedError: If the pipeline backlog is full
+        """
+        return self.admission is not None and await self.admission.admit()
+
+    def _release(self, reserved: bool) -> None:
+        """Give back the room reserved in the pipeline backlog for a run not started."""
+        if reserved and self.admission is not None:
+            self.admission.release()
+
+    async def _fall_back(
+        self,
+        record: HousingRecord,
+        callback_url: Optional[str],
+        error: Exception,
+        record_stored: bool,
+    ) -> str:
+        """Score a record in-process because its pipeline run could not be started.
+
+        Raises:
+            Exception: The pipeline error, if no in-process model is configured
+        """
+        if self.model is None:
+            raise error
+
+        logger.warning(f"Pipeline unavailable, scoring in-process instead: {str(error)}")
+        prediction = await self._score(record, callback_url, store_record=not record_stored)
+        self.fallbacks += 1
+        return prediction.run_id
+
+    async def _record_pending_run(self, run_id: str) -> None:
+        """Record a run just started as pending, so that its status is read from storage.
+
+        The run may already have recorded a later status, which is kept. Without
+        this row, the status of the run is read from the pipeline until it progresses.
+        """
+        try:
+            await asyncio.to_thread(
+                self.storage.save_run_status, run_id, PredictionStatus.PENDING.value
+            )
+        except Exception as e:
+            logger.warning(f"Error recording pending run {run_id}: {str(e)}")
+
+    async def _start_batched_pipeline(self, records: List[HousingRecord]) -> List[str]:
+        """Start one batch run for micro-batched submissions, which stores the records.
+
+        Returns:
+            List[str]: The run ID handed out for each record, in order
+
+        Raises:
+            PipelineOverloadedError: If the pipeline backlog is full
+        """
+        reserved = await self._admit()
+        try:
+            run_id = await self.etl.start_batch_prediction_pipeline(records)
+        except Exception:
+            self._release(reserved)
+            raise
+
+        await self._record_pending_run(run_id)
+        logger.info(f"Submitted {len(records)} micro-batched prediction requests as {run_id}")
+        return [f"{run_id}{BATCH_HANDLE_SEPARATOR}{record.id}" for record in records]
+
+    async def drain(self) -> None:
+        """Start the batch run of the submissions waiting for their micro-batch."""
+        if self.submission_batcher is not None:
+            await self.submission_batcher.drain()
+
+    async def predict(self, record: HousingRecord) -> Prediction:
+        """Score a record in-process and persist it, bypassing the ETL pipeline.
+
+        Args:
+            record: Housing record to score
+
+        Returns:
+            Prediction: The completed prediction, with a run ID that resolves from storage
+
+        Raises:
+            PredictionError: If no in-process model is configured or scoring fails
+        """
+        if self.model is None:
+            raise PredictionError("In-process model is not configured")
+
+        try:
+            prediction = await self._score(record)
+
+            logger.info(f"Scored prediction in-process with run_id: {prediction.run_id}")
+            return prediction
+
+        except Exception as e:
+            logger.error(f"Error scoring prediction in-process: {str(e)}")
+            raise
+
+    async def _score(
+        self, record: HousingRecord, callback_url: Optional[str] = None, store_record: bool = True
+    ) -> Prediction:
+        """Score a record in-process and persist its prediction.
+
+        Args:
+            record: Housing record to score
+            callback_url: URL notified of the prediction, in the same transaction, if any
+            store_record: Whether the record is stored too, unless it already is
+
+        Returns:
+            Prediction: The completed prediction
+        """
+        # Read first, as the model is loaded again if its file is replaced meanwhile
+        model_version = self._get_model_version()
+        value = await self.model.predict(record)
+
+        prediction = Prediction(
+            record_id=record.id,
+            value=value,
+            created_at=datetime.utcnow(),
+            status=PredictionStatus.COMPLETED,
+            record=record,
+            run_id=f"{SYNC_RUN_PREFIX}{uuid4()}",
+            model_version=model_version,
+        )
+
+        # Persist the record before the prediction that references it
+        if store_record:
+            await asyncio.to_thread(self.storage.save_housing_record, record)
+        if callback_url is None:
+            await asyncio.to_thread(self.storage.save_prediction, prediction)
+        else:
+            # Queue the notice the pipeline run would have sent, with the prediction
+            delivery = WebhookDelivery.for_prediction(prediction, callback_url)
+            await asyncio.to_thread(self.storage.save_prediction, prediction, delivery=delivery)
+        self._cache_prediction(prediction)
+        return prediction
+
+    async def predict_batch(self, records: List[HousingRecord]) -> List[Prediction]:
+        """Score several records in-process with one model call and persist them.
+
+        Every prediction gets its own run ID, so each one can be read back on its own.
+
+        Args:
+            records: Housing records to score
+
+        Returns:
+            List[Prediction]: The completed predictions, in the same order
+
+        Raises:
+            PredictionError: If no in-process model is configured or scoring fails
+        """
+        if self.model is None:
+            raise PredictionError("In-process model is not configured")
+
+        try:
+            model_version = self._get_model_version()
+            values = await self.model.predict_batch(records)
+
+            created_at = datetime.utcnow()
+            predictions = [
+                Prediction(
+                    record_id=record.id,
+                    value=value,
+                    created_at=created_at,
+                    status=PredictionStatus.COMPLETED,
+                    record=record,
+                    run_id=f"{SYNC_RUN_PREFIX}{uuid4()}",
+                    model_version=model_version,
+                )
+                for record, value in zip(records, values)
+            ]
+
+            await asyncio.to_thread(self.storage.save_housing_records, records)
+            await asyncio.to_thread(self.storage.save_predictions, predictions)
+            for prediction in predictions:
+                self._cache_prediction(prediction)
+
+            logger.info(f"Scored {len(predictions)} predictions in-process")
+            return predictions
+
+        except Exception as e:
+            logger.error(f"Error scoring batch in-process: {str(e)}")
+            raise
+
     async def get_prediction_result(self, run_id: str) -> Union[Prediction, str]:
         """Get the result of a prediction request.
 
+        The status of the run is read from the one its pipeline run recorded in
+        storage, and from the pipeline only if none was recorded. Results of finished
+        runs are cached by run ID, so reading them again queries neither the pipeline
+        nor storage. A run only reported as failed because its result could not be
+        read is not cached.
+
         Args:
-            run_id: Dagster run ID of the request to check
+            run_id: Dagster run ID of the request to check, or the run ID handed out
+                for a micro-batched submission
 
         Returns:
             Union[Prediction, str]: The prediction result or status string if not completed
         """
+        cached = self.run_cache.get(run_id) if self.run_cache is not None else None
+        if cached is not None:
+            return cached
+
         try:
-            # Get pipeline status
-            status = await self.etl.get_pipeline_status(run_id)
+            # In-process predictions never went through the pipeline
+            if run_id.startswith(SYNC_RUN_PREFIX):
+                stored_prediction = await asyncio.to_thread(self.storage.get_prediction, run_id)
+                if not stored_prediction:
+                    return "failed"
+
+                self._cache_run_result(run_id, stored_prediction)
+                return stored_prediction
+
+            # Get pipeline status, of the batch run for micro-batched submissions
+            pipeline_run_id, record_id = split_handle(run_id)
+            status = (await self._get_recorded_statuses([pipeline_run_id])).get(pipeline_run_id)
+            if status is None:
+                status = await self.etl.get_pipeline_status(pipeline_run_id)
 
             if status == "failed":
                 logger.error("Pipeline failed")
+                self._cache_run_result(run_id, "failed")
                 return "failed"
 
             # Pipeline completed, get prediction from storage
             if status == "completed":
-                stored_prediction = self.storage.get_prediction(run_id)
+                if record_id is None:
+                    stored_prediction = await asyncio.to_thread(self.storage.get_prediction, run_id)
+                else:
+                    stored_prediction = (await self._get_batched_predictions([run_id])).get(run_id)
                 if not stored_prediction:
                     logger.error("Prediction not found in storage")
                     return "failed"
 
+                self._cache_prediction(stored_prediction)
+                self._cache_run_result(run_id, stored_prediction)
                 return stored_prediction
 
             # For pending/running states, just return the status
@@ -81,3 +599,218 @@ class PredictionService(PredictionServicePort):
         except Exception as e:
             logger.error(f"Error getting prediction result: {str(e)}")
             return "failed"
+
+    async def get_prediction_results(
+        self, run_ids: Sequence[str]
+    ) -> Dict[str, Union[Prediction, str]]:
+        """Get the results of several prediction requests at once.
+
+        The statuses the pipeline runs recorded are read with a single storage query,
+        those of the runs that recorded none with a single ETL query, and the
+        predictions of the completed ones with a single storage query, plus one for
+        micro-batched submissions, however many runs are looked up, leaving out the
+        finished runs cached by run ID.
+        Unlike `get_prediction_result`, a failing query is raised rather than
+        reported as failed runs, so the caller can retry.
+
+        Args:
+            run_ids: Dagster run IDs of the requests to check
+
+        Returns:
+            Dict[str, Union[Prediction, str]]: The prediction, or the status string if
+                not completed, by run ID. Runs unknown to the pipeline are "not_found"
+        """
+        run_ids = list(dict.fromkeys(run_ids))
+
+        results: Dict[str, Union[Prediction, str]] = {}
+        if self.run_cache is not None:
+            for run_id in run_ids:
+                cached = self.run_cache.get(run_id)
+                if cached is not None:
+                    results[run_id] = cached
+            run_ids = [run_id for run_id in run_ids if run_id not in results]
+            if not run_ids:
+                return results
+
+        # Micro-batched submissions share the status of their batch run
+        pipeline_run_ids = {
+            run_id: split_handle(run_id)[0]
+            for run_id in run_ids
+            if not run_id.startswith(SYNC_RUN_PREFIX)
+        }
+        unique_run_ids = list(dict.fromkeys(pipeline_run_ids.values()))
+        pipeline_statuses = dict(await self._get_recorded_statuses(unique_run_ids))
+        unrecorded = [run_id for run_id in unique_run_ids if run_id not in pipeline_statuses]
+        if unrecorded:
+            pipeline_statuses.update(await self.etl.get_pipeline_statuses(unrecorded))
+
+        statuses: Dict[str, str] = {}
+        for run_id in run_ids:
+            # In-process predictions never went through the pipeline
+            if run_id.startswith(SYNC_RUN_PREFIX):
+                statuses[run_id] = "completed"
+            elif pipeline_run_ids[run_id] in pipeline_statuses:
+                statuses[run_id] = pipeline_statuses[pipeline_run_ids[run_id]]
+
+        completed = [run_id for run_id in run_ids if statuses.get(run_id) == "completed"]
+        batched = [run_id for run_id in completed if split_handle(run_id)[1] is not None]
+        single = [run_id for run_id in completed if split_handle(run_id)[1] is None]
+        stored_predictions: Dict[str, Prediction] = {}
+        if single:
+            stored_predictions = await asyncio.to_thread(
+                self.storage.get_predictions_by_run_ids, single
+            )
+        if batched:
+            stored_predictions.update(await self._get_batched_predictions(batched))
+
+        for run_id in run_ids:
+            status = statuses.get(run_id, "not_found")
+            if status != "completed":
+                results[run_id] = status
+                if status == "failed":
+                    self._cache_run_result(run_id, status)
+            elif run_id in stored_predictions:
+                results[run_id] = stored_predictions[run_id]
+                self._cache_prediction(stored_predictions[run_id])
+                self._cache_run_result(run_id, stored_predictions[run_id])
+            else:
+                logger.error(f"Prediction not found in storage for run_id: {run_id}")
+                results[run_id] = "failed"
+
+        return results
+
+    async def _get_recorded_statuses(self, run_ids: List[str]) -> Dict[str, str]:
+        """Read the statuses pipeline runs recorded in storage, in a single query.
+
+        A run that stopped without recording its end, such as one whose run worker
+        was lost, would otherwise stay pending or running forever, so statuses not
+        updated for `run_status_stale_after` seconds are read from the pipeline.
+
+        Returns:
+            Dict[str, str]: The status of each run, by run ID. Runs without a recorded
+                status, or with a stale one, are left out, as are all of them if
+                storage cannot be read
+        """
+        if not run_ids:
+            return {}
+
+        stale_before = None
+        if self.run_status_stale_after is not None:
+            stale_before = datetime.utcnow() - timedelta(seconds=self.run_status_stale_after)
+
+        try:
+            return await asyncio.to_thread(self.storage.get_run_statuses, run_ids, stale_before)
+        except Exception as e:
+            logger.warning(f"Error reading recorded run statuses: {str(e)}")
+            return {}
+
+    async def _get_batched_predictions(self, run_ids: List[str]) -> Dict[str, Prediction]:
+        """Read the predictions of micro-batched submissions in a single query.
+
+        Returns:
+            Dict[str, Prediction]: The predictions found, carrying the run ID handed
+                out for their submission, by that run ID
+        """
+        keys = {run_id: split_handle(run_id) for run_id in run_ids}
+        stored_predictions = await asyncio.to_thread(
+            self.storage.get_predictions_by_records, list(keys.values())
+        )
+        return {
+            run_id: stored_predictions[key].model_copy(update={"run_id": run_id})
+            for run_id, key in keys.items()
+            if key in stored_predictions
+        }
+
+    async def submit_batch_prediction_request(self, records: List[HousingRecord]) -> str:
+        """Submit a batch of prediction requests as a single ETL pipeline run.
+
+        The records are stored by the pipeline itself, with their IDs preserved, so
+        the per-item record IDs returned to the caller can be matched to the results.
+
+        Args:
+            records: Housing records to process
+
+        Returns:
+            str: Dagster run ID for tracking the whole batch
+
+        Raises:
+            PipelineOverloadedError: If the pipeline backlog is full
+        """
+        try:
+            reserved = await self._admit()
+            try:
+                run_id = await self.etl.start_batch_prediction_pipeline(records)
+            except Exception:
+                self._release(reserved)
+                raise
+
+            await self._record_pending_run(run_id)
+
+            logger.info(
+                f"Submitted batch prediction request of {len(records)} records "
+                f"with run_id: {run_id}"
+            )
+            return run_id
+
+        except Exception as e:
+            logger.error(f"Error submitting batch prediction request: {str(e)}")
+            raise
+
+    async def get_batch_prediction_result(self, run_id: str) -> Union[List[Prediction], str]:
+        """Get the results of a batch prediction request.
+
+        Args:
+            run_id: Dagster run ID of the batch to check
+
+        Returns:
+            Union[List[Prediction], str]: The batch predictions or status string if not completed
+        """
+        try:
+            status = (await self._get_recorded_statuses([run_id])).get(run_id)
+            if status is None:
+                status = await self.etl.get_pipeline_status(run_id)
+
+            if status == "failed":
+                logger.error("Batch pipeline failed")
+                return "failed"
+
+            if status == "completed":
+                stored_predictions = await asyncio.to_thread(self.storage.get_predictions, run_id)
+                if not stored_predictions:
+                    logger.error("Batch predictions not found in storage")
+                    return "failed"
+
+                return stored_predictions
+
+            return status
+
+        except Exception as e:
+            logger.error(f"Error getting batch prediction result: {str(e)}")
+            return "failed"
+
+    def list_predictions(
+        self, filters: PredictionFilter, limit: int, after: Optional[PredictionCursor] = None
+    ) -> Iterator[Prediction]:
+        """List stored predictions, newest first, fetching them lazily.
+
+        Args:
+            filters: Criteria the predictions must match
+            limit: Maximum number of predictions to list
+            after: Position of the last prediction of the previous page, if any
+
+        Returns:
+            Iterator[Prediction]: The matching predictions, newest first
+
+        Raises:
+            ValueError: If the limit is not positive or the value range is empty
+        """
+        if limit < 1:
+            raise ValueError("Limit must be at least 1")
+        if (
+            filters.min_value is not None
+            and filters.max_value is not None
+            and filters.min_value > filters.max_value
+        ):
+            raise ValueError("Minimum prediction value is greater than the maximum")
+
+        return self.storage.list_predictions(filters, limit, after)
@@ -0,0 +1,163 @@
+"""Shared status watcher for prediction runs."""
+import asyncio
+import logging
+from typing import AsyncIterator, Dict, Hashable, Optional, Set, Union
+
+from src.core.domain.entities.prediction import Prediction, PredictionStatus
+from src.core.port.service_port import PredictionServicePort
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+PredictionResult = Union[Prediction, str]
+
+
+def is_terminal(result: PredictionResult) -> bool:
+    """Check whether a prediction result will no longer change.
+
+    Args:
+        result: A prediction or a pipeline status string
+
+    Returns:
+        bool: True if the run has completed or failed
+    """
+    if isinstance(result, str):
+        return result in ("completed", "failed")
+    return result.status in (PredictionStatus.COMPLETED, PredictionStatus.FAILED)
+
+
+def _state_key(result: PredictionResult) -> Hashable:
+    """Key used to detect status transitions between two polls."""
+    if isinstance(result, str):
+        return result
+    return (result.status, result.value)
+
+
+class _RunWatch:
+    """Polling state shared by every subscriber of a single run."""
+
+    def __init__(self) -> None:
+        self.subscribers: Set["asyncio.Queue[PredictionResult]"] = set()
+        self.latest: Optional[PredictionResult] = None
+        self.task: Optional["asyncio.Task[None]"] = None
+
+
+class PredictionStatusWatcher:
+    """Follows prediction runs with one poll loop per run, shared by all waiters.
+
+    However many requests are waiting on the same run, the prediction service is
+    polled once per interval, and every waiter is notified of each transition.
+    """
+
+    def __init__(self, prediction_service: PredictionServicePort, poll_interval: float = 0.5):
+        """Initialize the watcher.
+
+        Args:
+            prediction_service: The service used to resolve run results
+            poll_interval: Seconds between two polls of the same run
+        """
+        self._prediction_service = prediction_service
+        self._poll_interval = poll_interval
+        self._watches: Dict[str, _RunWatch] = {}
+
+    async def watch(
+        self, run_id: str, timeout: Optional[float] = None
+    ) -> AsyncIterator[PredictionResult]:
+        """Yield every status transition of a run until it is terminal.
+
+        The current state is yielded first, then each change as it is observed.
+
+        Args:
+            run_id: The run to follow
+            timeout: Seconds after which to stop following, None to wait indefinitely
+
+        Yields:
+            PredictionResult: The prediction once completed, or the pipeline status
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        queue: "asyncio.Queue[PredictionResult]" = asyncio.Queue()
+        watch = self._subscribe(run_id, queue)
+
+        try:
+            while True:
+                remaining = None if deadline is None else deadline - loop.time()
+                if remaining is not None and remaining <= 0:
+                    return
+                try:
+                    result = await asyncio.wait_for(queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    return
+
+                yield result
+                if is_terminal(result):
+                    return
+        finally:
+            self._unsubscribe(run_id, watch, queue)
+
+    async def wait_for_result(self, run_id: str, timeout: float) -> PredictionResult:
+        """Wait until a run is terminal or the timeout expires.
+
+        Args:
+            run_id: The run to wait for
+            timeout: Maximum number of seconds to wait
+
+        Returns:
+            PredictionResult: The terminal result, or the latest status on timeout
+        """
+        latest: Optional[PredictionResult] = None
+        async for result in self.watch(run_id, timeout=timeout):
+            latest = result
+
+        if latest is None:
+            # Timed out before the first poll came back
+            return await self._prediction_service.get_prediction_result(run_id)
+        return latest
+
+    def _subscribe(self, run_id: str, queue: "asyncio.Queue[PredictionResult]") -> _RunWatch:
+        """Register a subscriber, starting the run's poll loop if needed."""
+        watch = self._watches.get(run_id)
+        if watch is None:
+            watch = _RunWatch()
+            self._watches[run_id] = watch
+            watch.task = asyncio.create_task(self._poll(run_id, watch))
+
+        watch.subscribers.add(queue)
+        if watch.latest is not None:
+            queue.put_nowait(watch.latest)
+        return watch
+
+    def _unsubscribe(
+        self, run_id: str, watch: _RunWatch, queue: "asyncio.Queue[PredictionResult]"
+    ) -> None:
+        """Remove a subscriber, stopping the run's poll loop once nobody listens."""
+        watch.subscribers.discard(queue)
+        if not watch.subscribers:
+            if watch.task is not None and not watch.task.done():
+                watch.task.cancel()
+            if self._watches.get(run_id) is watch:
+                del self._watches[run_id]
+
+    async def _poll(self, run_id: str, watch: _RunWatch) -> None:
+        """Poll a run until it is terminal, broadcasting each transition."""
+        try:
+            while True:
+                result = await self._prediction_service.get_prediction_result(run_id)
+
+                if watch.latest is None or _state_key(result) != _state_key(watch.latest):
+                    watch.latest = result
+                    for queue in list(watch.subscribers):
+                        queue.put_nowait(result)
+
+                if is_terminal(result):
+                    return
+                await asyncio.sleep(self._poll_interval)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error watching run {run_id}: {str(e)}")
+            for queue in list(watch.subscribers):
+                queue.put_nowait("failed")
+        finally:
+            if self._watches.get(run_id) is watch:
+                del self._watches[run_id]
@@ -0,0 +1,132 @@
+"""Warm-up of the API dependencies before it reports ready."""
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Optional
+
+from src.core.domain.entities.housing_record import HousingRecord
+from src.core.port.etl_port import ETLPort
+from src.core.port.model_port import ModelPort
+from src.core.port.storage_port import StoragePort
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+# Record scored to warm the model up, its prediction is discarded
+WARM_UP_RECORD = HousingRecord(
+    id="warm-up",
+    longitude=-122.64,
+    latitude=38.01,
+    housing_median_age=36.0,
+    total_rooms=1336.0,
+    total_bedrooms=258.0,
+    population=678.0,
+    households=249.0,
+    median_income=5.5789,
+    ocean_proximity="NEAR OCEAN",
+)
+
+
+class WarmUp:
+    """Loads the model and opens connections before the API accepts traffic.
+
+    The steps run concurrently, and those that fail are retried until they all
+    succeed. Resolving the pipeline location runs alongside, retried the same way
+    until it succeeds, but does not hold readiness back: without it, submissions
+    only cost an extra round trip, and a pipeline outage must not take down
+    in-process scoring.
+    """
+
+    def __init__(
+        self,
+        model: ModelPort,
+        storage: StoragePort,
+        etl: ETLPort,
+        retry_interval: float = 5.0,
+    ):
+        """Initialize the warm-up.
+
+        Args:
+            model: The model port to load and exercise
+            storage: The storage port whose connections are opened
+            etl: The ETL port whose pipeline location is resolved
+            retry_interval: Seconds between two attempts of the failed steps
+        """
+        self._model = model
+        self._storage = storage
+        self._etl = etl
+        self._retry_interval = retry_interval
+        # Required steps not completed yet
+        self._steps: Dict[str, Callable[[], Awaitable[None]]] = {
+            "model": self._warm_up_model,
+            "storage": self._warm_up_storage,
+        }
+        self._ready = False
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._etl_task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def ready(self) -> bool:
+        """Whether every required step has completed."""
+        return self._ready
+
+    def start(self) -> None:
+        """Start warming up in the background of the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            self._etl_task = asyncio.create_task(self._warm_up_etl())
+
+    async def stop(self) -> None:
+        """Stop warming up, if still in progress."""
+        for task in (self._task, self._etl_task):
+            if task is None:
+                continue
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._task = self._etl_task = None
+
+    async def _run(self) -> None:
+        """Run the steps, retrying the failed ones, until all have completed."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await self._run_steps()
+
+        while self._steps:
+            await asyncio.sleep(self._retry_interval)
+            await self._run_steps()
+
+        self._ready = True
+        logger.info(f"Warm-up completed in {loop.time() - start:.2f}s")
+
+    async def _run_steps(self) -> None:
+        """Run the pending steps concurrently, forgetting those that succeed."""
+        names = list(self._steps)
+        results = await asyncio.gather(
+            *(self._steps[name]() for name in names), return_exceptions=True
+        )
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Warm-up of {name} failed, retrying: {str(result)}")
+            else:
+                del self._steps[name]
+
+    async def _warm_up_model(self) -> None:
+        """Load the model and run a prediction through both scoring paths."""
+        await self._model.predict(WARM_UP_RECORD)
+        await self._model.predict_batch([WARM_UP_RECORD])
+
+    async def _warm_up_storage(self) -> None:
+        """Open the pooled connections, off the event loop."""
+        await asyncio.to_thread(self._storage.warm_up)
+
+    async def _warm_up_etl(self) -> None:
+        """Resolve the pipeline location, retrying until it succeeds."""
+        while True:
+            try:
+                await self._etl.warm_up()
+                return
+            except Exception as e:
+                logger.warning(f"Warm-up of the pipeline client failed, retrying: {str(e)}")
+            await asyncio.sleep(self._retry_interval)
@@ -0,0 +1,149 @@
+"""Delivery of the completion webhooks queued in the outbox."""
+import asyncio
+import logging
+import random
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from src.core.domain.entities.webhook import WebhookDelivery
+from src.core.port.storage_port import StoragePort
+from src.core.port.webhook_port import WebhookPort
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+
+class WebhookDispatcher:
+    """Sends the webhook deliveries of the outbox, retrying failed ones with backoff.
+
+    Due deliveries are claimed in batches, and those going to the same callback
+    URL are sent together, in requests of up to `max_events_per_request` events.
+    Delivery is at least once: a delivery is sent again if its outcome could not
+    be recorded, so receivers deduplicate events by their `id`.
+    """
+
+    def __init__(
+        self,
+        storage: StoragePort,
+        webhook: WebhookPort,
+        batch_size: int = 100,
+        max_events_per_request: int = 50,
+        max_attempts: int = 10,
+        poll_interval: float = 1.0,
+        lease: float = 60.0,
+        base_backoff: float = 2.0,
+        max_backoff: float = 3600.0,
+    ):
+        """Initialize the dispatcher.
+
+        Args:
+            storage: The storage port holding the outbox
+            webhook: The webhook port sending the deliveries
+            batch_size: Maximum number of deliveries claimed at once
+            max_events_per_request: Maximum number of events POSTed in one request
+            max_attempts: Number of failed attempts after which a delivery is given up
+            poll_interval: Seconds between two checks of an empty outbox
+            lease: Seconds claimed deliveries are reserved for, longer than a send
+            base_backoff: Seconds before the first retry, doubled on every failure
+            max_backoff: Maximum seconds between two attempts
+        """
+        self._storage = storage
+        self._webhook = webhook
+        self._batch_size = batch_size
+        self._max_events_per_request = max_events_per_request
+        self._max_attempts = max_attempts
+        self._poll_interval = poll_interval
+        self._lease = lease
+        self._base_backoff = base_backoff
+        self._max_backoff = max_backoff
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def start(self) -> None:
+        """Start dispatching in the background of the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop dispatching, abandoning the current batch to be claimed again."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        """Dispatch until cancelled, without waiting while the outbox has a backlog."""
+        while True:
+            try:
+                claimed = await self.dispatch()
+            except Exception as e:
+                logger.error(f"Error dispatching webhooks: {str(e)}")
+                claimed = 0
+
+            if claimed < self._batch_size:
+                await asyncio.sleep(self._poll_interval)
+
+    async def dispatch(self) -> int:
+        """Claim a batch of due deliveries, send it, and record the outcomes.
+
+        Returns:
+            int: Number of deliveries claimed
+
+        Raises:
+            StorageError: If the outbox cannot be read or updated
+        """
+        # The outbox is read and written off the event loop shared with the API
+        deliveries = await asyncio.to_thread(
+            self._storage.claim_webhook_deliveries, self._batch_size, self._lease
+        )
+        if not deliveries:
+            return 0
+
+        by_url: Dict[str, List[WebhookDelivery]] = defaultdict(list)
+        for delivery in deliveries:
+            by_url[delivery.callback_url].append(delivery)
+
+        requests = [
+            group[start : start + self._max_events_per_request]
+            for group in by_url.values()
+            for start in range(0, len(group), self._max_events_per_request)
+        ]
+        outcomes = await asyncio.gather(*(self._send(request) for request in requests))
+
+        delivered = [delivery.id for ok, request in outcomes if ok for delivery in request]
+        failed = [delivery for ok, request in outcomes if not ok for delivery in request]
+
+        await asyncio.to_thread(self._storage.complete_webhook_deliveries, delivered)
+        await asyncio.to_thread(self._storage.fail_webhook_deliveries, failed)
+        return len(deliveries)
+
+    async def _send(self, request: List[WebhookDelivery]) -> Tuple[bool, List[WebhookDelivery]]:
+        """Send deliveries to their callback URL, updating them if the request fails."""
+        callback_url = request[0].callback_url
+        try:
+            await self._webhook.send(callback_url, [delivery.to_event() for delivery in request])
+            return True, request
+        except Exception as e:
+            logger.warning(f"Error delivering {len(request)} webhooks: {str(e)}")
+            now = datetime.utcnow()
+            for delivery in request:
+                delivery.attempts += 1
+                delivery.last_error = str(e)
+                if delivery.attempts >= self._max_attempts:
+                    logger.error(f"Giving up webhook {delivery.id} for run_id {delivery.run_id}")
+                    delivery.next_attempt_at = None
+                else:
+                    delivery.next_attempt_at = now + timedelta(
+                        seconds=self._backoff(delivery.attempts)
+                    )
+            return False, request
+
+    def _backoff(self, attempts: int) -> float:
+        """Get the seconds to wait after a number of failed attempts, with jitter."""
+        delay = min(self._max_backoff, self._base_backoff * 2 ** (attempts - 1))
+        # Spread the retries of deliveries that failed together, e.g. on an outage
+        return delay / 2 + random.uniform(0, delay / 2)
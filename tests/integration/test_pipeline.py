@@ -48,7 +48,7 @@ async def test_complete_prediction_pipeline():
     run_id = await service.submit_prediction_request(record)
 
     # Verify ETL was called
-    mock_etl.start_prediction_pipeline.assert_called_once_with(record)
+    mock_etl.start_prediction_pipeline.assert_called_once_with(record, callback_url=None)
 
     # Verify run_id
     assert run_id == "test-run-id"
@@ -33,6 +33,7 @@ def mock_model_port():
     mock = create_mock_from_protocol(ModelPort)
     mock.predict = AsyncMock(return_value=0.0)
     mock.load_model = AsyncMock(return_value=None)
+    mock.get_version = MagicMock(return_value="model-v1")
     return mock
 
 
@@ -46,6 +47,11 @@ def mock_storage_port():
     mock.get_housing_record = MagicMock(return_value=None)
     mock.save_prediction = MagicMock(return_value="test-id")
     mock.get_prediction = MagicMock(return_value=None)
+    mock.get_idempotency_key = MagicMock(return_value=None)
+    mock.get_run_statuses = MagicMock(return_value={})
+    mock.save_idempotency_key = MagicMock(
+        side_effect=lambda submission, created_after, replaced_run_id=None: submission
+    )
     return mock
 
 
@@ -4,18 +4,41 @@ from typing import Any, Dict
 from unittest.mock import MagicMock
 
 # Third-party imports
+import pandas as pd
 import pytest
-from dagster import ConfigurableResource, materialize
+from dagster import (
+    ConfigurableResource,
+    DefaultSensorStatus,
+    build_run_status_sensor_context,
+    materialize,
+)
+from dagster._core.test_utils import instance_for_test
 
 # Local imports
 from src.adapter.driven.etl.assets import (
+    BACKFILL_SLICES,
+    backfill_cleaned_data,
+    backfill_prediction_result,
+    backfill_raw_data,
+    batch_prediction_result,
+    cleaned_batch_data,
     cleaned_data,
+    housing_prediction_job,
+    prediction_cancellation_webhook,
+    prediction_failure_webhook,
     prediction_result,
+    prepared_batch_data,
     prepared_data,
+    raw_batch_input,
     raw_input,
+    stored_backfill_predictions,
+    stored_batch_prediction_result,
+    stored_cleaned_batch_data,
     stored_cleaned_data,
     stored_prediction_result,
 )
+from src.adapter.driven.etl.dagster_adapter import CALLBACK_URL_TAG
+from src.adapter.driven.etl.housing_source import HousingFileResource
 from src.core.domain.entities.housing_record import HousingRecord
 from src.core.domain.exceptions import DataValidationError, PredictionError, StorageError
 from tests.test_base import BaseDagsterTest
@@ -97,7 +120,7 @@ class MockPostgresResource(ConfigurableResource):
     def get_housing_record(self, record_id):
         return None
 
-    def save_prediction(self, prediction):
+    def save_prediction(self, prediction, delivery=None):
         # For testing purposes, we'll return the record_id from the prediction
         return prediction.record_id
 
@@ -118,6 +141,9 @@ class MockModelResource(ConfigurableResource):
         """Teardown the resource after execution."""
         pass
 
+    def get_version(self):
+        return "model-v1"
+
     def predict(self, data):
         # Return different prediction values based on the input data
         # Use multiple fields to determine which sample we're dealing with
@@ -203,6 +229,15 @@ class TestAssets(BaseDagsterTest):
         with pytest.raises(DataValidationError):
             cleaned_data(context, input_data)
 
+    def test_cleaned_data_rejects_what_batch_cleaning_rejects(self, sample_input_1):
+        """Test a record out of range is rejected as it is by the batch pipeline."""
+        input_data = dict(sample_input_1, longitude=-250.0)
+        context = self.create_test_context()
+        with pytest.raises(DataValidationError, match="Longitude must be a number"):
+            cleaned_data(context, input_data)
+        with pytest.raises(DataValidationError, match="Longitude must be a number"):
+            cleaned_batch_data(context, [input_data])
+
     @pytest.mark.parametrize("sample_input", ["sample_input_1", "sample_input_2", "sample_input_3"])
     def test_stored_cleaned_data(self, request, sample_input, mock_storage_port):
         """Test successful storage of cleaned data."""
@@ -449,3 +484,278 @@ class TestAssets(BaseDagsterTest):
         )
         assert result.output_for_node("stored_prediction_result")["prediction"] == expected_value
         assert "run_id" in result.output_for_node("stored_prediction_result")
+
+    def test_cleaned_batch_data_reports_invalid_index(self, sample_input_1, sample_input_2):
+        """Test batch cleaning fails with the index of the invalid record."""
+        invalid_input = sample_input_2.copy()
+        invalid_input["ocean_proximity"] = "INVALID"
+        context = self.create_test_context()
+        with pytest.raises(DataValidationError, match="Record 1"):
+            cleaned_batch_data(context, [sample_input_1, invalid_input])
+
+    def test_cleaned_batch_data_cleans_whole_batch(self, sample_input_1, sample_input_2):
+        """Test batch cleaning converts numeric strings and fills missing total_bedrooms."""
+        context = self.create_test_context()
+        raw_batch = [
+            dict(sample_input_1, total_rooms="1336.0"),
+            dict(sample_input_2, total_bedrooms=None),
+        ]
+
+        result = cleaned_batch_data(context, raw_batch)
+
+        assert result["id"].tolist() == ["sample-1", "sample-2"]
+        assert result["total_rooms"].tolist()[0] == 1336.0
+        assert result["total_bedrooms"].tolist()[1] == 0.0
+
+    def test_housing_batch_prediction_job(
+        self,
+        sample_input_1,
+        sample_input_2,
+        sample_input_3,
+        expected_outputs,
+        mock_storage_port,
+        mock_model_port,
+    ):
+        """Test the complete batch prediction job scores every record in one run."""
+        batch = [sample_input_1, sample_input_2, sample_input_3]
+        record_ids = [item["record_id"] for item in batch]
+        expected_values = [expected_outputs[record_id] for record_id in record_ids]
+
+        # Configure mocks
+        mock_model_port.predict_batch = MagicMock(return_value=expected_values)
+        mock_storage_port.save_housing_records = MagicMock(return_value=record_ids)
+        mock_storage_port.save_predictions = MagicMock(return_value=record_ids)
+
+        resources = {
+            "model": mock_model_port,
+            "postgres": mock_storage_port,
+        }
+        run_config = {"ops": {"raw_batch_input": {"config": {"data": batch}}}}
+
+        result = materialize(
+            [
+                raw_batch_input,
+                cleaned_batch_data,
+                stored_cleaned_batch_data,
+                prepared_batch_data,
+                batch_prediction_result,
+                stored_batch_prediction_result,
+            ],
+            resources=resources,
+            run_config=run_config,
+        )
+
+        # Verify the results
+        assert result.success
+        output = result.output_for_node("stored_batch_prediction_result")
+        assert output["record_ids"] == record_ids
+        assert output["predictions"] == expected_values
+
+        # The model and the database are each called once for the whole batch
+        mock_model_port.predict_batch.assert_called_once()
+        features = mock_model_port.predict_batch.call_args[0][0]
+        assert features["ocean_proximity_NEAR OCEAN"].tolist() == [1, 0, 0]
+        mock_storage_port.save_housing_records.assert_called_once()
+        saved_records = mock_storage_port.save_housing_records.call_args[0][0]
+        assert [record.id for record in saved_records] == record_ids
+        mock_storage_port.save_predictions.assert_called_once()
+        saved_predictions = mock_storage_port.save_predictions.call_args[0][0]
+        assert [prediction.record_id for prediction in saved_predictions] == record_ids
+        assert [prediction.batch_index for prediction in saved_predictions] == [0, 1, 2]
+
+    def test_stored_prediction_result_queues_completion_notice(
+        self, sample_input_1, mock_storage_port, mock_model_port
+    ):
+        """Test a run submitted with a callback URL stores its notice with the prediction."""
+        mock_model_port.predict = MagicMock(return_value=[EXPECTED_OUTPUT_1])
+        mock_storage_port.save_prediction = MagicMock(return_value="sample-1")
+        run_config = {"ops": {"raw_input": {"config": {"data": sample_input_1}}}}
+
+        result = materialize(
+            [
+                raw_input,
+                cleaned_data,
+                prepared_data,
+                prediction_result,
+                stored_cleaned_data,
+                stored_prediction_result,
+            ],
+            resources={"model": mock_model_port, "postgres": mock_storage_port},
+            run_config=run_config,
+            tags={CALLBACK_URL_TAG: "https://client.example/hook"},
+        )
+
+        assert result.success
+        (prediction,) = mock_storage_port.save_prediction.call_args.args
+        delivery = mock_storage_port.save_prediction.call_args.kwargs["delivery"]
+        assert delivery.callback_url == "https://client.example/hook"
+        assert delivery.run_id == result.run_id == prediction.run_id
+        assert delivery.payload["status"] == "completed"
+        assert delivery.payload["prediction"] == EXPECTED_OUTPUT_1
+
+    def test_prediction_failure_webhook_queues_failure_notice(
+        self, sample_input_1, mock_storage_port, mock_model_port
+    ):
+        """Test a failed run submitted with a callback URL queues a failure notice."""
+        invalid_input = dict(sample_input_1, ocean_proximity="INVALID")
+        run_config = {"ops": {"raw_input": {"config": {"data": invalid_input}}}}
+
+        with instance_for_test() as instance:
+            result = housing_prediction_job.execute_in_process(
+                run_config=run_config,
+                instance=instance,
+                resources={"model": mock_model_port, "postgres": mock_storage_port},
+                tags={CALLBACK_URL_TAG: "https://client.example/hook"},
+                raise_on_error=False,
+            )
+            context = build_run_status_sensor_context(
+                sensor_name="prediction_failure_webhook",
+                dagster_instance=instance,
+                dagster_run=result.dagster_run,
+                dagster_event=result.get_run_failure_event(),
+                resources={"postgres": mock_storage_port},
+            ).for_run_failure()
+
+            prediction_failure_webhook(context)
+
+        assert not result.success
+        delivery = mock_storage_port.save_webhook_delivery.call_args.args[0]
+        assert delivery.run_id == result.run_id
+        assert delivery.callback_url == "https://client.example/hook"
+        assert delivery.payload["status"] == "failed"
+        mock_storage_port.save_prediction.assert_not_called()
+
+    def test_prediction_failure_webhook_runs_by_default(self):
+        """Test the failure sensor runs without being turned on in the UI."""
+        assert prediction_failure_webhook.default_status == DefaultSensorStatus.RUNNING
+
+    def test_prediction_cancellation_webhook_records_canceled_run(
+        self, sample_input_1, mock_storage_port, mock_model_port
+    ):
+        """Test a canceled run is recorded as failed and its callback URL notified."""
+        # A run stopped early stands in for the canceled one, the sensor only reads its tags
+        invalid_input = dict(sample_input_1, ocean_proximity="INVALID")
+        run_config = {"ops": {"raw_input": {"config": {"data": invalid_input}}}}
+
+        with instance_for_test() as instance:
+            result = housing_prediction_job.execute_in_process(
+                run_config=run_config,
+                instance=instance,
+                resources={"model": mock_model_port, "postgres": mock_storage_port},
+                tags={CALLBACK_URL_TAG: "https://client.example/hook"},
+                raise_on_error=False,
+            )
+            mock_storage_port.reset_mock()
+            context = build_run_status_sensor_context(
+                sensor_name="prediction_cancellation_webhook",
+                dagster_instance=instance,
+                dagster_run=result.dagster_run,
+                dagster_event=result.get_run_failure_event(),
+                resources={"postgres": mock_storage_port},
+            )
+
+            prediction_cancellation_webhook(context)
+
+        assert prediction_cancellation_webhook.default_status == DefaultSensorStatus.RUNNING
+        delivery = mock_storage_port.save_webhook_delivery.call_args.args[0]
+        assert delivery.run_id == result.run_id
+        assert delivery.payload["status"] == "failed"
+        mock_storage_port.save_run_status.assert_called_once_with(result.run_id, "failed")
+
+    def test_housing_prediction_job_records_run_status(
+        self, sample_input_1, mock_storage_port, mock_model_port
+    ):
+        """Test a run records its progress, then its failure as soon as a step fails."""
+        mock_model_port.predict = MagicMock(side_effect=PredictionError("Model error"))
+        run_config = {"ops": {"raw_input": {"config": {"data": sample_input_1}}}}
+
+        with instance_for_test() as instance:
+            result = housing_prediction_job.execute_in_process(
+                run_config=run_config,
+                instance=instance,
+                resources={"model": mock_model_port, "postgres": mock_storage_port},
+                raise_on_error=False,
+            )
+
+        assert not result.success
+        statuses = [call.args for call in mock_storage_port.save_run_status.call_args_list]
+        assert statuses == [(result.run_id, "running"), (result.run_id, "failed")]
+
+    @pytest.fixture
+    def backfill_resources(
+        self, tmp_path, sample_input_1, sample_input_2, sample_input_3, mock_storage_port
+    ):
+        """Write a housing file with an invalid row, and the resources backfilling it."""
+        invalid_input = dict(sample_input_1, record_id="invalid", ocean_proximity="INVALID")
+        rows = [sample_input_1, sample_input_2, sample_input_3, invalid_input]
+        path = tmp_path / "housing.csv"
+        pd.DataFrame(rows).to_csv(path, index=False)
+
+        model = MagicMock()
+        model.predict_batch = MagicMock(side_effect=lambda features: [1.0] * len(features))
+        model.get_version = MagicMock(return_value="model-v1")
+        mock_storage_port.save_backfilled_predictions = MagicMock(
+            side_effect=lambda records, predictions: [p.record_id for p in predictions]
+        )
+        return {
+            "model": model,
+            "postgres": mock_storage_port,
+            "housing_file": HousingFileResource(path=str(path)),
+        }
+
+    def test_housing_backfill_stores_every_record_once(self, backfill_resources):
+        """Test backfilling the partitions of a file stores each of its valid records once."""
+        backfill_assets = [
+            backfill_raw_data,
+            backfill_cleaned_data,
+            backfill_prediction_result,
+            stored_backfill_predictions,
+        ]
+        partitions = [str(index) for index in range(BACKFILL_SLICES)]
+
+        with instance_for_test() as instance:
+            for partition in partitions:
+                result = materialize(
+                    backfill_assets,
+                    resources=backfill_resources,
+                    partition_key=partition,
+                    instance=instance,
+                )
+                assert result.success
+
+        storage = backfill_resources["postgres"]
+        stored = [
+            prediction.record_id
+            for call in storage.save_backfilled_predictions.call_args_list
+            for prediction in call.args[1]
+        ]
+        assert sorted(stored) == ["sample-1", "sample-2", "sample-3"]
+
+    def test_housing_backfill_skips_materialized_partition(self, backfill_resources):
+        """Test a partition whose predictions are stored is skipped, unless asked otherwise."""
+        backfill_assets = [
+            backfill_raw_data,
+            backfill_cleaned_data,
+            backfill_prediction_result,
+            stored_backfill_predictions,
+        ]
+        storage = backfill_resources["postgres"]
+
+        with instance_for_test() as instance:
+            for _ in range(2):
+                materialize(
+                    backfill_assets,
+                    resources=backfill_resources,
+                    partition_key="0",
+                    instance=instance,
+                )
+            assert storage.save_backfilled_predictions.call_count == 1
+
+            materialize(
+                backfill_assets,
+                resources=backfill_resources,
+                partition_key="0",
+                instance=instance,
+                run_config={"ops": {"backfill_raw_data": {"config": {"skip_materialized": False}}}},
+            )
+            assert storage.save_backfilled_predictions.call_count == 2
@@ -0,0 +1,132 @@
+"""Unit tests for AdmissionController."""
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.core.domain.exceptions import PipelineOverloadedError
+from src.core.service.admission import AdmissionController
+from src.core.service.circuit_breaker import CircuitBreaker
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Create a manually advanced clock."""
+    return FakeClock()
+
+
+@pytest.mark.asyncio
+async def test_admits_while_backlog_under_limit(mock_etl_port, clock):
+    """Test runs are admitted while the backlog is under the limit."""
+    # Setup
+    mock_etl_port.get_active_run_count = AsyncMock(return_value=3)
+    controller = AdmissionController(mock_etl_port, max_backlog=10, clock=clock)
+
+    # Execute
+    await controller.admit()
+
+    # Assert
+    assert controller.stats.admitted == 1
+    assert controller.stats.backlog == 3
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_backlog_full(mock_etl_port, clock):
+    """Test a run is rejected with a retry delay once the backlog reaches the limit."""
+    # Setup
+    mock_etl_port.get_active_run_count = AsyncMock(return_value=10)
+    controller = AdmissionController(mock_etl_port, max_backlog=10, retry_after=7.0, clock=clock)
+
+    # Execute
+    with pytest.raises(PipelineOverloadedError) as exc_info:
+        await controller.admit()
+
+    # Assert
+    assert exc_info.value.retry_after == 7.0
+    assert controller.stats.rejected == 1
+    assert controller.stats.admitted == 0
+
+
+@pytest.mark.asyncio
+async def test_admitted_runs_count_until_next_refresh(mock_etl_port, clock):
+    """Test runs admitted since the last count fill the backlog before the next count."""
+    # Setup
+    mock_etl_port.get_active_run_count = AsyncMock(return_value=8)
+    controller = AdmissionController(
+        mock_etl_port, max_backlog=10, refresh_interval=1.0, clock=clock
+    )
+
+    # Execute
+    await controller.admit()
+    await controller.admit()
+    with pytest.raises(PipelineOverloadedError):
+        await controller.admit()
+
+    # Assert
+    mock_etl_port.get_active_run_count.assert_called_once()
+
+    # A fresh count replaces the local estimate
+    mock_etl_port.get_active_run_count.return_value = 4
+    clock.now = 1.0
+    await controller.admit()
+    assert controller.stats.backlog == 4
+    assert mock_etl_port.get_active_run_count.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_count_error_keeps_admitting(mock_etl_port, clock):
+    """Test submissions are not rejected because the backlog cannot be counted."""
+    # Setup
+    mock_etl_port.get_active_run_count = AsyncMock(side_effect=RuntimeError("Dagster down"))
+    controller = AdmissionController(mock_etl_port, max_backlog=10, clock=clock)
+
+    # Execute
+    await controller.admit()
+
+    # Assert
+    assert controller.stats.admitted == 1
+
+
+@pytest.mark.asyncio
+async def test_released_runs_leave_the_backlog(mock_etl_port, clock):
+    """Test runs that could not be started do not fill the backlog."""
+    # Setup
+    mock_etl_port.get_active_run_count = AsyncMock(return_value=8)
+    controller = AdmissionController(mock_etl_port, max_backlog=10, clock=clock)
+
+    # Execute
+    for _ in range(5):
+        await controller.admit()
+        controller.release()
+
+    # Assert
+    assert controller.stats.backlog == 8
+    assert controller.stats.rejected == 0
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_skips_admission(mock_etl_port, clock):
+    """Test nothing is counted nor reserved while no run can be started."""
+    # Setup
+    mock_etl_port.get_active_run_count = AsyncMock(return_value=10)
+    breaker = CircuitBreaker(min_calls=1, clock=clock)
+    with pytest.raises(RuntimeError):
+        await breaker.call(AsyncMock(side_effect=RuntimeError("Dagster down")))
+    controller = AdmissionController(mock_etl_port, max_backlog=10, breaker=breaker, clock=clock)
+
+    # Execute
+    reserved = await controller.admit()
+
+    # Assert
+    assert reserved is False
+    mock_etl_port.get_active_run_count.assert_not_called()
+    assert controller.stats.rejected == 0
@@ -0,0 +1,326 @@
+"""Unit tests for the FastAPI application."""
+from contextlib import ExitStack
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from dependency_injector import providers
+from fastapi.testclient import TestClient
+
+from src.adapter.driving.fastapi.app import app
+from src.adapter.driving.fastapi.models import (
+    PredictionCompletedResponse,
+    PredictionListItem,
+    PredictionPendingResponse,
+    PredictionRequest,
+    PredictionStatusItem,
+    PredictionStatusListResponse,
+)
+from src.config.container import container
+from src.core.domain.entities.prediction import PredictionFilter, PredictionStatus
+
+
+@pytest.fixture
+def mock_handler():
+    """Create a mock input port."""
+    handler = MagicMock()
+    handler.get_prediction_result = AsyncMock(
+        side_effect=lambda run_id, wait: PredictionPendingResponse(
+            run_id=run_id, status=PredictionStatus.PENDING
+        )
+    )
+    return handler
+
+
+@pytest.fixture
+def build_handler(mock_handler):
+    """Create a factory of the mock input port, counting its calls."""
+    return MagicMock(return_value=mock_handler)
+
+
+@pytest.fixture
+def scoring_batcher():
+    """Create a mock scoring batcher."""
+    return MagicMock(drain=AsyncMock())
+
+
+@pytest.fixture
+def prediction_service():
+    """Create a mock prediction service."""
+    return MagicMock(drain=AsyncMock())
+
+
+@pytest.fixture
+def storage_adapter():
+    """Create a mock storage adapter."""
+    return MagicMock()
+
+
+@pytest.fixture
+def webhook_dispatcher():
+    """Create a mock webhook dispatcher."""
+    return MagicMock(stop=AsyncMock())
+
+
+@pytest.fixture
+def webhook_adapter():
+    """Create a mock webhook adapter."""
+    return MagicMock(close=AsyncMock())
+
+
+@pytest.fixture
+def warm_up():
+    """Create a mock warm-up that has completed."""
+    return MagicMock(ready=True, stop=AsyncMock())
+
+
+@pytest.fixture
+def overridden_container(
+    build_handler,
+    scoring_batcher,
+    prediction_service,
+    storage_adapter,
+    webhook_dispatcher,
+    webhook_adapter,
+    warm_up,
+):
+    """Override the providers the application builds at startup."""
+    overrides = {
+        container.input_port: providers.Callable(build_handler),
+        container.warm_up: providers.Object(warm_up),
+        container.scoring_batcher: providers.Object(scoring_batcher),
+        container.prediction_service: providers.Object(prediction_service),
+        container.storage_adapter: providers.Object(storage_adapter),
+        container.webhook_dispatcher: providers.Object(webhook_dispatcher),
+        container.webhook_adapter: providers.Object(webhook_adapter),
+    }
+    with ExitStack() as stack:
+        for provider, override in overrides.items():
+            stack.enter_context(provider.override(override))
+        yield container
+
+
+@pytest.fixture
+def client(overridden_container):
+    """Create a test client running the application lifespan."""
+    with TestClient(app) as client:
+        yield client
+
+
+def test_handler_is_built_once_for_all_requests(
+    overridden_container,
+    build_handler,
+    mock_handler,
+    scoring_batcher,
+    prediction_service,
+    storage_adapter,
+):
+    """Test every request is served by the handler built at startup."""
+    # Execute
+    with TestClient(app) as client:
+        for run_id in ("run-1", "run-2", "run-3"):
+            assert client.get(f"/predictions/{run_id}").status_code == 200
+
+    # Assert
+    build_handler.assert_called_once()
+    assert mock_handler.get_prediction_result.await_count == 3
+    scoring_batcher.drain.assert_awaited_once()
+    prediction_service.drain.assert_awaited_once()
+    storage_adapter.close.assert_called_once()
+
+
+def test_ready_only_once_warmed_up(overridden_container, warm_up):
+    """Test the readiness check fails while warming up, unlike the health check."""
+    warm_up.ready = False
+    with TestClient(app) as client:
+        warm_up.start.assert_called_once()
+        assert client.get("/ready").status_code == 503
+        assert client.get("/health").status_code == 200
+
+        warm_up.ready = True
+        response = client.get("/ready")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ready"}
+    warm_up.stop.assert_awaited_once()
+
+
+def test_webhook_dispatcher_runs_with_the_app(
+    overridden_container, webhook_dispatcher, webhook_adapter
+):
+    """Test queued webhooks are sent while the application runs, and stop on shutdown."""
+    with TestClient(app):
+        webhook_dispatcher.start.assert_called_once()
+        webhook_dispatcher.stop.assert_not_awaited()
+
+    webhook_dispatcher.stop.assert_awaited_once()
+    webhook_adapter.close.assert_awaited_once()
+
+
+def test_submission_rejects_invalid_callback_url(client, mock_handler):
+    """Test a callback URL that is not an HTTP URL is rejected before submission."""
+    body = dict(PredictionRequest.model_config["json_schema_extra"]["example"])
+    body["callback_url"] = "ftp://client.example/hook"
+
+    response = client.post("/predictions", json=body)
+
+    assert response.status_code == 422
+    mock_handler.submit_prediction_request.assert_not_called()
+
+
+def test_batch_submission_rejects_callback_url(client, mock_handler):
+    """Test a batch record carrying a callback URL is rejected, as batches are not notified."""
+    body = dict(PredictionRequest.model_config["json_schema_extra"]["example"])
+    body["callback_url"] = "https://client.example/hook"
+
+    response = client.post("/predictions/batch", json=[body])
+
+    assert response.status_code == 422
+    assert "callback_url is only supported by single submissions" in response.text
+    mock_handler.submit_batch_prediction_request.assert_not_called()
+
+
+def test_completed_prediction_is_cacheable(client, mock_handler):
+    """Test a completed prediction carries an ETag and immutable caching headers."""
+    # Setup
+    mock_handler.get_prediction_result.side_effect = None
+    mock_handler.get_prediction_result.return_value = PredictionCompletedResponse(
+        run_id="run-1",
+        status=PredictionStatus.COMPLETED,
+        prediction=320201.58554044,
+        completed_at=datetime(2024, 4, 10, 12, 0, 5),
+    )
+
+    # Execute
+    response = client.get("/predictions/run-1")
+
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["etag"] == '"completed-run-1"'
+    assert response.headers["last-modified"] == "Wed, 10 Apr 2024 12:00:05 GMT"
+    assert "immutable" in response.headers["cache-control"]
+
+
+def test_pending_prediction_is_not_cacheable(client):
+    """Test a prediction in progress is neither tagged nor cached."""
+    response = client.get("/predictions/run-1")
+
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+    assert response.headers["cache-control"] == "no-store"
+
+
+def test_matching_if_none_match_skips_lookup(client, mock_handler):
+    """Test a client holding the completed prediction gets a 304 without a lookup."""
+    response = client.get("/predictions/run-1", headers={"If-None-Match": '"completed-run-1"'})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == '"completed-run-1"'
+    mock_handler.get_prediction_result.assert_not_called()
+
+
+def test_list_predictions_streams_page(client, mock_handler):
+    """Test the listing filters are passed on and the page is streamed as JSON."""
+    # Setup
+    record = PredictionRequest(
+        longitude=-122.64,
+        latitude=38.01,
+        housing_median_age=36.0,
+        total_rooms=1336.0,
+        total_bedrooms=258.0,
+        population=678.0,
+        households=249.0,
+        median_income=5.5789,
+        ocean_proximity="INLAND",
+    )
+    mock_handler.list_predictions = AsyncMock(
+        return_value=iter(
+            [
+                PredictionListItem(
+                    id="pred-1",
+                    run_id="run-1",
+                    prediction=150000.0,
+                    created_at=datetime(2024, 1, 1),
+                    record=record,
+                )
+            ]
+        )
+    )
+
+    # Execute
+    response = client.get(
+        "/predictions",
+        params={"ocean_proximity": "INLAND", "min_prediction": 100000, "limit": 20},
+    )
+
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert [item["id"] for item in response.json()["items"]] == ["pred-1"]
+    assert "next_cursor" not in response.json()
+    mock_handler.list_predictions.assert_awaited_once_with(
+        PredictionFilter(ocean_proximity="INLAND", min_value=100000.0), 20, cursor=None
+    )
+
+
+def test_bulk_status_lookup(client, mock_handler):
+    """Test many run IDs are looked up with a single call to the handler."""
+    # Setup
+    mock_handler.get_prediction_results = AsyncMock(
+        return_value=PredictionStatusListResponse(
+            items=[
+                PredictionStatusItem(run_id="run-1", status=PredictionStatus.RUNNING),
+                PredictionStatusItem(run_id="run-2", status=PredictionStatus.NOT_FOUND),
+            ]
+        )
+    )
+
+    # Execute
+    response = client.post("/predictions/status", json={"run_ids": ["run-1", "run-2"]})
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json() == {
+        "items": [
+            {"run_id": "run-1", "status": "running"},
+            {"run_id": "run-2", "status": "not_found"},
+        ]
+    }
+    assert response.headers["cache-control"] == "no-store"
+    mock_handler.get_prediction_results.assert_awaited_once_with(["run-1", "run-2"])
+
+
+def test_bulk_status_lookup_requires_run_ids(client):
+    """Test an empty lookup is rejected by validation."""
+    assert client.post("/predictions/status", json={"run_ids": []}).status_code == 422
+
+
+def test_prediction_events_stream_each_transition(client, mock_handler):
+    """Test the events route sends one SSE message per status transition."""
+
+    async def events(run_id):
+        yield PredictionPendingResponse(run_id=run_id, status=PredictionStatus.RUNNING)
+        yield PredictionCompletedResponse(
+            run_id=run_id,
+            status=PredictionStatus.COMPLETED,
+            prediction=320201.58,
+            completed_at=datetime(2024, 1, 1),
+        )
+
+    mock_handler.stream_prediction_events = events
+
+    # Execute
+    response = client.get("/predictions/run-1/events")
+
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.headers["cache-control"] == "no-cache"
+    messages = response.text.strip().split("\n\n")
+    assert [message.split("\n")[:2] for message in messages] == [
+        ["event: status", "id: 0"],
+        ["event: status", "id: 1"],
+    ]
+    assert '"status":"running"' in messages[0]
+    assert '"prediction":320201.58' in messages[1]
@@ -0,0 +1,96 @@
+"""Unit tests for TTLLRUCache."""
+from src.core.service.cache import TTLLRUCache
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_returns_cached_value():
+    """Test a cached value is returned and counted as a hit."""
+    cache: TTLLRUCache[str, str] = TTLLRUCache(maxsize=10)
+
+    cache.set("key", "value")
+
+    assert cache.get("key") == "value"
+    assert cache.get("missing") is None
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_hit_ratio():
+    """Test the hit ratio is the share of lookups answered."""
+    cache: TTLLRUCache[str, str] = TTLLRUCache(maxsize=10)
+    assert cache.stats.hit_ratio == 0.0
+
+    cache.set("key", "value")
+    for key in ("key", "key", "key", "missing"):
+        cache.get(key)
+
+    assert cache.stats.hit_ratio == 0.75
+
+
+def test_least_recently_used_entry_is_evicted():
+    """Test the entry used least recently is evicted once the cache is full."""
+    cache: TTLLRUCache[str, int] = TTLLRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    # Touch "a" so that "b" becomes the least recently used
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+    assert cache.stats.evictions == 1
+
+
+def test_entries_expire_after_ttl():
+    """Test an entry is dropped once its time to live has passed."""
+    clock = FakeClock()
+    cache: TTLLRUCache[str, str] = TTLLRUCache(maxsize=10, ttl=60.0, clock=clock)
+    cache.set("key", "value")
+
+    clock.now = 59.0
+    assert cache.get("key") == "value"
+
+    clock.now = 60.0
+    assert cache.get("key") is None
+    assert len(cache) == 0
+    assert cache.stats.expirations == 1
+
+
+def test_entry_ttl_only_shortens_the_cache_ttl():
+    """Test an entry set with its own time to live expires at the earliest of both."""
+    clock = FakeClock()
+    cache: TTLLRUCache[str, str] = TTLLRUCache(maxsize=10, ttl=60.0, clock=clock)
+    cache.set("short", "value", ttl=10.0)
+    cache.set("long", "value", ttl=120.0)
+
+    clock.now = 10.0
+    assert cache.get("short") is None
+    assert cache.get("long") == "value"
+
+    clock.now = 60.0
+    assert cache.get("long") is None
+
+
+def test_pop_and_clear():
+    """Test entries can be removed individually or all at once."""
+    cache: TTLLRUCache[str, int] = TTLLRUCache(maxsize=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    assert cache.pop("a") == 1
+    assert cache.pop("a") is None
+
+    cache.clear()
+    assert len(cache) == 0
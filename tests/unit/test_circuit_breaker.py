@@ -0,0 +1,221 @@
+"""Unit tests for CircuitBreaker."""
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.core.domain.exceptions import CircuitOpenError
+from src.core.service.circuit_breaker import BreakerState, CircuitBreaker
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Create a manually advanced clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock):
+    """Create a breaker opening when half of at least 4 calls in 10s are bad."""
+    return CircuitBreaker(
+        failure_rate=0.5,
+        slow_call_duration=1.0,
+        min_calls=4,
+        window=10.0,
+        open_duration=5.0,
+        clock=clock,
+    )
+
+
+async def _fail() -> None:
+    raise ConnectionError("Dagster is down")
+
+
+async def _succeed() -> str:
+    return "ok"
+
+
+async def _call_failing(breaker: CircuitBreaker, times: int) -> None:
+    for _ in range(times):
+        with pytest.raises(ConnectionError):
+            await breaker.call(_fail)
+
+
+@pytest.mark.asyncio
+async def test_opens_when_failure_rate_reached(breaker):
+    """Test the breaker opens once enough of the calls in the window failed."""
+    # Setup
+    await breaker.call(_succeed)
+    await breaker.call(_succeed)
+    await _call_failing(breaker, 1)
+    assert breaker.state == BreakerState.CLOSED
+
+    # Execute
+    await _call_failing(breaker, 1)
+
+    # Assert
+    assert breaker.state == BreakerState.OPEN
+    assert breaker.stats.trips == 1
+
+
+@pytest.mark.asyncio
+async def test_stays_closed_under_min_calls(breaker):
+    """Test a few failures do not open the breaker before enough calls were made."""
+    await _call_failing(breaker, 3)
+
+    assert breaker.state == BreakerState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_old_outcomes_leave_the_window(breaker, clock):
+    """Test failures older than the window no longer count."""
+    # Setup
+    await _call_failing(breaker, 3)
+    clock.now = 11.0
+
+    # Execute
+    await _call_failing(breaker, 1)
+    await breaker.call(_succeed)
+
+    # Assert
+    assert breaker.state == BreakerState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_slow_calls_open_the_breaker(breaker, clock):
+    """Test calls taking longer than the slow call duration count as failures."""
+
+    # Setup
+    async def slow() -> str:
+        clock.now += 2.0
+        return "late"
+
+    # Execute
+    results = [await breaker.call(slow) for _ in range(4)]
+
+    # Assert
+    assert results == ["late"] * 4
+    assert breaker.state == BreakerState.OPEN
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_rejects_without_calling(breaker):
+    """Test calls fail fast while the breaker is open."""
+    # Setup
+    await _call_failing(breaker, 4)
+    operation = AsyncMock()
+
+    # Execute
+    with pytest.raises(CircuitOpenError):
+        await breaker.call(operation)
+
+    # Assert
+    operation.assert_not_called()
+    assert breaker.stats.rejected == 1
+
+
+@pytest.mark.asyncio
+async def test_successful_probe_closes_the_breaker(breaker, clock):
+    """Test a successful call once the open duration has elapsed closes the breaker."""
+    # Setup
+    await _call_failing(breaker, 4)
+    clock.now += 5.0
+    assert breaker.state == BreakerState.HALF_OPEN
+
+    # Execute
+    result = await breaker.call(_succeed)
+
+    # Assert
+    assert result == "ok"
+    assert breaker.state == BreakerState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_failed_probe_opens_the_breaker_again(breaker, clock):
+    """Test a failed probe opens the breaker for another open duration."""
+    # Setup
+    await _call_failing(breaker, 4)
+    clock.now += 5.0
+
+    # Execute
+    await _call_failing(breaker, 1)
+
+    # Assert
+    assert breaker.state == BreakerState.OPEN
+    assert breaker.stats.trips == 2
+
+
+@pytest.mark.asyncio
+async def test_half_open_breaker_lets_a_single_probe_through(breaker, clock):
+    """Test other calls are rejected while the probe is in flight."""
+    # Setup
+    await _call_failing(breaker, 4)
+    clock.now += 5.0
+
+    async def probe() -> str:
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(_succeed)
+        return "ok"
+
+    # Execute
+    await breaker.call(probe)
+
+    # Assert
+    assert breaker.stats.rejected == 1
+    assert breaker.state == BreakerState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_cancelled_calls_are_not_recorded(breaker):
+    """Test calls cancelled by their caller do not count as failures."""
+
+    async def cancelled() -> None:
+        raise asyncio.CancelledError()
+
+    # Execute
+    for _ in range(4):
+        with pytest.raises(asyncio.CancelledError):
+            await breaker.call(cancelled)
+
+    # Assert
+    assert breaker.state == BreakerState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_lets_another_probe_through(breaker, clock):
+    """Test a probe cancelled by its caller leaves the breaker half open for the next call."""
+    # Setup
+    await _call_failing(breaker, 4)
+    clock.now += 5.0
+
+    async def cancelled() -> None:
+        raise asyncio.CancelledError()
+
+    # Execute
+    with pytest.raises(asyncio.CancelledError):
+        await breaker.call(cancelled)
+    assert breaker.state == BreakerState.HALF_OPEN
+    await breaker.call(_succeed)
+
+    # Assert
+    assert breaker.state == BreakerState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_errors_not_counted_as_failures_are_not_recorded(breaker):
+    """Test exceptions the predicate does not count as failures leave the breaker closed."""
+    for _ in range(4):
+        with pytest.raises(ConnectionError):
+            await breaker.call(_fail, is_failure=lambda error: False)
+
+    assert breaker.state == BreakerState.CLOSED
@@ -0,0 +1,101 @@
+"""Unit tests for the vectorized batch cleaning."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.adapter.driven.etl.cleaning import CLEANED_COLUMNS, MISSING_TOTAL_BEDROOMS, clean_batch
+
+
+@pytest.fixture
+def raw_record():
+    """Create a valid raw record."""
+    return {
+        "record_id": "sample-1",
+        "longitude": -122.64,
+        "latitude": 38.01,
+        "housing_median_age": 36.0,
+        "total_rooms": 1336.0,
+        "total_bedrooms": 258.0,
+        "population": 678.0,
+        "households": 249.0,
+        "median_income": 5.5789,
+        "ocean_proximity": "NEAR OCEAN",
+    }
+
+
+def test_clean_batch_keeps_valid_rows(raw_record):
+    """Test valid rows are cleaned into records, keeping their record ID."""
+    result = clean_batch([raw_record, dict(raw_record, record_id="sample-2")])
+
+    assert list(result.records.columns) == list(CLEANED_COLUMNS)
+    assert result.errors.empty
+    records = result.to_housing_records()
+    assert [record.id for record in records] == ["sample-1", "sample-2"]
+    assert records[0].median_income == 5.5789
+
+
+def test_clean_batch_converts_numeric_strings(raw_record):
+    """Test numeric fields given as strings are converted to floats."""
+    result = clean_batch([dict(raw_record, total_rooms="1336", median_income=" 5.5789 ")])
+
+    (record,) = result.to_housing_records()
+    assert record.total_rooms == 1336.0
+    assert record.median_income == 5.5789
+
+
+def test_clean_batch_fills_missing_total_bedrooms(raw_record):
+    """Test a missing total_bedrooms is filled instead of rejecting the row."""
+    without = dict(raw_record)
+    without.pop("total_bedrooms")
+
+    result = clean_batch([dict(raw_record, total_bedrooms=None), without])
+
+    assert result.errors.empty
+    assert result.records["total_bedrooms"].tolist() == [MISSING_TOTAL_BEDROOMS] * 2
+
+
+def test_clean_batch_reports_every_error_of_each_invalid_row(raw_record):
+    """Test invalid rows are left out and reported by position, with all their errors."""
+    invalid = dict(raw_record, longitude="abc", population=-1.0, ocean_proximity="INVALID")
+    missing = dict(raw_record, latitude=None, ocean_proximity=None)
+
+    result = clean_batch([raw_record, invalid, missing])
+
+    assert result.records.index.tolist() == [0]
+    assert result.errors.to_dict() == {
+        1: "longitude must be a valid number; Population must be a non-negative number; "
+        "Invalid ocean proximity: INVALID",
+        2: "Latitude must be a number between -90 and 90; Ocean proximity is required",
+    }
+
+
+def test_clean_batch_generates_missing_record_ids(raw_record):
+    """Test rows without a record ID get a unique one."""
+    without = dict(raw_record)
+    without.pop("record_id")
+
+    result = clean_batch([without, without])
+
+    first, second = result.records["id"]
+    assert first and second and first != second
+
+
+def test_clean_batch_accepts_columns(raw_record):
+    """Test a batch can be given as a DataFrame or as NumPy arrays by column."""
+    columns = {field: np.array([value] * 3) for field, value in raw_record.items()}
+
+    from_arrays = clean_batch(columns)
+    from_frame = clean_batch(pd.DataFrame(columns, index=[10, 11, 12]))
+
+    assert len(from_arrays.records) == 3
+    # Rows are indexed by position, whatever the index of the frame
+    assert from_frame.records.index.tolist() == [0, 1, 2]
+
+
+def test_clean_batch_without_rows():
+    """Test an empty batch has neither records nor errors."""
+    result = clean_batch([])
+
+    assert result.records.empty
+    assert result.errors.empty
+    assert result.to_housing_records() == []
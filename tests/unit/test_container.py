@@ -0,0 +1,65 @@
+"""Unit tests for the dependency injection container."""
+import subprocess
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+from dependency_injector import providers
+
+from src.config.container import Container, lazy
+
+
+@pytest.fixture
+def container():
+    """Create a container whose driven adapters are mocks."""
+    container = Container()
+    container.etl_adapter.override(providers.Object(MagicMock()))
+    container.storage_adapter.override(providers.Object(MagicMock()))
+    container.model.override(providers.Object(MagicMock()))
+    return container
+
+
+def test_lazy_imports_on_first_call():
+    """Test a lazy factory only imports the module of its class when called."""
+    module = MagicMock()
+    with patch("src.config.container.import_module", return_value=module) as mock_import:
+        factory = lazy("some.module.SomeAdapter")
+        mock_import.assert_not_called()
+
+        adapter = factory("arg", option=1)
+
+    mock_import.assert_called_once_with("some.module")
+    module.SomeAdapter.assert_called_once_with("arg", option=1)
+    assert adapter is module.SomeAdapter.return_value
+    assert factory.__name__ == "SomeAdapter"
+
+
+def test_app_import_skips_heavy_dependencies():
+    """Test importing the API does not import the dependencies of the driven adapters."""
+    heavy = ["dagster", "dagster_graphql", "sqlalchemy", "joblib", "sklearn"]
+    code = (
+        "import sys\n"
+        "import src.adapter.driving.fastapi.app\n"
+        f"print([name for name in {heavy!r} if name in sys.modules])\n"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_status_watcher_is_shared_by_the_process(container):
+    """Test every resolution of the handler watches runs through the same watcher."""
+    handler = container.input_port()
+
+    assert container.input_port() is handler
+    assert handler._status_watcher is container.status_watcher()
+
+
+def test_scoring_batcher_is_shared_by_the_process(container):
+    """Test WebSocket and sync scoring of every request feed the same micro-batcher."""
+    handler = container.input_port()
+
+    assert handler._scoring_batcher is container.scoring_batcher()
@@ -4,7 +4,7 @@ from typing import cast
 
 import pytest
 
-from src.core.domain.entities.housing_record import HousingRecord, OceanProximity
+from src.core.domain.entities.housing_record import FEATURE_NAMES, HousingRecord, OceanProximity
 from src.core.domain.entities.prediction import Prediction, PredictionStatus
 
 
@@ -122,3 +122,46 @@ def test_prediction_validation():
             run_id="test-run",
             created_at=datetime.now(),
         )
+
+
+def test_housing_record_fingerprint():
+    """Test that the fingerprint identifies a listing regardless of its ID."""
+    fields = {
+        "longitude": -122.64,
+        "latitude": 38.01,
+        "housing_median_age": 36,
+        "total_rooms": 1336.0,
+        "total_bedrooms": 258.0,
+        "population": 678.0,
+        "households": 249.0,
+        "median_income": 5.5789,
+        "ocean_proximity": cast(OceanProximity, "NEAR OCEAN"),
+    }
+    record = HousingRecord(id="first", **fields)
+    resubmitted = HousingRecord(id="second", **{**fields, "housing_median_age": 36.0})
+    other = HousingRecord(id="first", **{**fields, "median_income": 5.0})
+
+    assert record.fingerprint() == resubmitted.fingerprint()
+    assert record.fingerprint() != other.fingerprint()
+
+
+def test_housing_record_feature_vector():
+    """Test that the feature vector follows the model's feature order."""
+    record = HousingRecord(
+        longitude=-122.64,
+        latitude=38.01,
+        housing_median_age=36.0,
+        total_rooms=1336.0,
+        total_bedrooms=258.0,
+        population=678.0,
+        households=249.0,
+        median_income=5.5789,
+        ocean_proximity=cast(OceanProximity, "INLAND"),
+    )
+
+    features = record.to_feature_vector()
+
+    assert len(features) == len(FEATURE_NAMES) == 13
+    assert features[:8] == (-122.64, 38.01, 36.0, 1336.0, 258.0, 678.0, 249.0, 5.5789)
+    assert features[8:] == (0.0, 1.0, 0.0, 0.0, 0.0)
+    assert FEATURE_NAMES[9] == "ocean_proximity_INLAND"
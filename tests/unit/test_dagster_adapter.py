@@ -1,14 +1,27 @@
 """Unit tests for DagsterETLAdapter."""
+import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
+import requests
 from dagster import DagsterRunStatus
 from dagster_graphql import DagsterGraphQLClientError
 
-from src.adapter.driven.etl.dagster_adapter import DagsterETLAdapter, DagsterPipelineRun
+from src.adapter.driven.etl.dagster_adapter import (
+    CALLBACK_URL_TAG,
+    DagsterETLAdapter,
+    DagsterPipelineRun,
+)
 from src.core.domain.entities.housing_record import HousingRecord
-from src.core.domain.exceptions import PipelineError
+from src.core.domain.exceptions import (
+    CircuitOpenError,
+    PipelineError,
+    PipelineUnavailableError,
+)
+from src.core.service.circuit_breaker import BreakerState, CircuitBreaker
 
 
 @pytest.fixture
@@ -46,12 +59,15 @@ def mock_settings():
 
 
 @pytest.fixture
-def adapter(mock_dagster_client, mock_settings):
+def mock_graphql():
+    """Create a mock GraphQL endpoint, called with the body of each request."""
+    return MagicMock(return_value={"data": {}})
+
+
+@pytest.fixture
+def adapter(mock_dagster_client, mock_settings, mock_graphql):
     """Create a DagsterETLAdapter with mocked dependencies."""
-    with patch(
-        "src.adapter.driven.etl.dagster_adapter.DagsterGraphQLClient",
-        return_value=mock_dagster_client,
-    ), patch(
+    with patch("dagster_graphql.DagsterGraphQLClient", return_value=mock_dagster_client), patch(
         "src.adapter.driven.etl.dagster_adapter.get_settings", return_value=mock_settings
     ), patch("src.adapter.driven.etl.dagster_adapter.urlparse") as mock_urlparse:
         # Configure urlparse to return a mock result
@@ -66,7 +82,43 @@ def adapter(mock_dagster_client, mock_settings):
         assert adapter.client is mock_dagster_client
         assert adapter.settings is mock_settings
 
-        return adapter
+        # Queries the client does not cover are POSTed by the adapter itself
+        adapter._http = httpx.Client(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, json=mock_graphql(json.loads(request.content)))
+            )
+        )
+
+        # Queries run in executor threads, which create their own client
+        yield adapter
+
+
+def test_client_created_on_first_use(mock_dagster_client, mock_settings):
+    """Test the Dagster client is only created once the adapter first uses it."""
+    with patch(
+        "dagster_graphql.DagsterGraphQLClient", return_value=mock_dagster_client
+    ) as mock_client_class, patch(
+        "src.adapter.driven.etl.dagster_adapter.get_settings", return_value=mock_settings
+    ):
+        adapter = DagsterETLAdapter()
+        mock_client_class.assert_not_called()
+
+        assert adapter.client is mock_dagster_client
+        assert adapter.client is mock_dagster_client
+        mock_client_class.assert_called_once()
+
+
+def test_client_per_thread(mock_settings):
+    """Test threads sending queries at once each get a client of their own."""
+    with patch("dagster_graphql.DagsterGraphQLClient", side_effect=lambda **_: MagicMock()), patch(
+        "src.adapter.driven.etl.dagster_adapter.get_settings", return_value=mock_settings
+    ):
+        adapter = DagsterETLAdapter()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other_client = executor.submit(lambda: adapter.client).result()
+
+        assert adapter.client is adapter.client
+        assert adapter.client is not other_client
 
 
 def test_dagster_pipeline_run_creation():
@@ -135,6 +187,91 @@ async def test_start_prediction_pipeline_success(adapter, mock_housing_record, m
     assert run_config["resources"]["model"]["config"]["model_path"] == "/path/to/model.joblib"
 
 
+@pytest.mark.asyncio
+async def test_start_batch_prediction_pipeline_success(
+    adapter, mock_housing_record, mock_dagster_client
+):
+    """Test a batch is submitted as a single housing_batch_prediction_job run."""
+    second_record = mock_housing_record.model_copy(update={"id": "second-record"})
+
+    # Call the method
+    run_id = await adapter.start_batch_prediction_pipeline([mock_housing_record, second_record])
+
+    # Verify a single run was submitted for the whole batch
+    assert run_id == "test-run-id"
+    mock_dagster_client.submit_job_execution.assert_called_once()
+    call_args = mock_dagster_client.submit_job_execution.call_args[0]
+    run_config = mock_dagster_client.submit_job_execution.call_args[1]["run_config"]
+    assert call_args[0] == "housing_batch_prediction_job"
+
+    # Verify the records keep their IDs and order
+    data = run_config["ops"]["raw_batch_input"]["config"]["data"]
+    assert [item["record_id"] for item in data] == [mock_housing_record.id, "second-record"]
+    assert all("id" not in item for item in data)
+    assert "postgres" in run_config["resources"]
+    assert "model" in run_config["resources"]
+
+
+@pytest.mark.asyncio
+async def test_warm_up_resolves_job_locations(
+    adapter, mock_housing_record, mock_dagster_client, mock_graphql
+):
+    """Test submissions after warm-up name the job location instead of looking it up."""
+    mock_graphql.return_value = {
+        "data": {
+            "repositoriesOrError": {
+                "__typename": "RepositoryConnection",
+                "nodes": [
+                    {
+                        "name": "__repository__",
+                        "location": {"name": "housing-location"},
+                        "pipelines": [
+                            {"name": "housing_prediction_job"},
+                            {"name": "housing_batch_prediction_job"},
+                        ],
+                    },
+                    {
+                        "name": "__repository__",
+                        "location": {"name": "other-location"},
+                        "pipelines": [{"name": "other_job"}],
+                    },
+                ],
+            }
+        }
+    }
+
+    await adapter.warm_up()
+    await adapter.start_prediction_pipeline(mock_housing_record)
+
+    call_kwargs = mock_dagster_client.submit_job_execution.call_args.kwargs
+    assert call_kwargs["repository_location_name"] == "housing-location"
+    assert call_kwargs["repository_name"] == "__repository__"
+
+
+@pytest.mark.asyncio
+async def test_warm_up_missing_job(adapter, mock_graphql):
+    """Test warm-up fails when a prediction job is not deployed."""
+    mock_graphql.return_value = {
+        "data": {"repositoriesOrError": {"__typename": "RepositoryConnection", "nodes": []}}
+    }
+
+    with pytest.raises(PipelineError):
+        await adapter.warm_up()
+
+
+@pytest.mark.asyncio
+async def test_start_prediction_pipeline_tags_callback_url(
+    adapter, mock_housing_record, mock_dagster_client
+):
+    """Test the callback URL of a submission is passed to the run as a tag."""
+    await adapter.start_prediction_pipeline(
+        mock_housing_record, callback_url="https://client.example/hook"
+    )
+
+    tags = mock_dagster_client.submit_job_execution.call_args.kwargs["tags"]
+    assert tags == {CALLBACK_URL_TAG: "https://client.example/hook"}
+
+
 @pytest.mark.asyncio
 async def test_start_prediction_pipeline_dagster_error(
     adapter, mock_housing_record, mock_dagster_client
@@ -169,6 +306,62 @@ async def test_start_prediction_pipeline_unexpected_error(
     assert "Unexpected error" in str(excinfo.value)
 
 
+@pytest.mark.asyncio
+async def test_open_breaker_fails_fast(adapter, mock_housing_record, mock_dagster_client):
+    """Test queries are not sent to Dagster once the circuit breaker has opened."""
+    # Setup
+    adapter.breaker = CircuitBreaker(min_calls=2, failure_rate=0.5)
+    error = DagsterGraphQLClientError("Error when connecting")
+    error.__cause__ = requests.exceptions.ConnectionError("Connection refused")
+    mock_dagster_client.submit_job_execution.side_effect = error
+    for _ in range(2):
+        with pytest.raises(PipelineUnavailableError):
+            await adapter.start_prediction_pipeline(mock_housing_record)
+    mock_dagster_client.submit_job_execution.reset_mock()
+
+    # Execute
+    with pytest.raises(CircuitOpenError):
+        await adapter.start_prediction_pipeline(mock_housing_record)
+
+    # Assert
+    mock_dagster_client.submit_job_execution.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_unknown_runs_do_not_open_breaker(adapter, mock_dagster_client):
+    """Test Dagster answering that runs do not exist does not count against it."""
+    # Setup
+    adapter.breaker = CircuitBreaker(min_calls=2, failure_rate=0.5)
+    mock_dagster_client.get_run_status.side_effect = DagsterGraphQLClientError(
+        "RunNotFoundError", "Run Id unknown-run not found"
+    )
+
+    # Execute
+    for _ in range(4):
+        with pytest.raises(PipelineError) as excinfo:
+            await adapter.get_pipeline_status("unknown-run")
+        assert not isinstance(excinfo.value, PipelineUnavailableError)
+
+    # Assert
+    assert adapter.breaker.state == BreakerState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_server_errors_open_breaker(adapter):
+    """Test 5xx responses of the webserver count against Dagster."""
+    # Setup
+    adapter.breaker = CircuitBreaker(min_calls=2, failure_rate=0.5)
+    adapter._http = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(503)))
+
+    # Execute
+    for _ in range(2):
+        with pytest.raises(PipelineUnavailableError):
+            await adapter.get_active_run_count()
+
+    # Assert
+    assert adapter.breaker.state == BreakerState.OPEN
+
+
 @pytest.mark.asyncio
 async def test_get_pipeline_status_success(adapter, mock_dagster_client):
     """Test successful retrieval of pipeline status."""
@@ -225,3 +418,124 @@ async def test_get_pipeline_status_unexpected_error(adapter, mock_dagster_client
 
     # Verify the error message
     assert "Error checking pipeline status" in str(excinfo.value)
+
+
+@pytest.mark.asyncio
+async def test_get_active_run_count_success(adapter, mock_graphql):
+    """Test the active runs of both prediction jobs are counted in one query."""
+    # Setup
+    mock_graphql.return_value = {
+        "data": {
+            "single": {"__typename": "Runs", "count": 7},
+            "batch": {"__typename": "Runs", "count": 2},
+        }
+    }
+
+    # Execute
+    count = await adapter.get_active_run_count()
+
+    # Assert
+    assert count == 9
+    mock_graphql.assert_called_once()
+    variables = mock_graphql.call_args.args[0]["variables"]
+    assert variables["single"]["pipelineName"] == "housing_prediction_job"
+    assert variables["batch"]["pipelineName"] == "housing_batch_prediction_job"
+    assert "QUEUED" in variables["single"]["statuses"]
+
+
+@pytest.mark.asyncio
+async def test_get_active_run_count_python_error(adapter, mock_graphql):
+    """Test a Dagster error result is raised as a PipelineError."""
+    mock_graphql.return_value = {
+        "data": {
+            "single": {"__typename": "PythonError", "message": "Storage unavailable"},
+            "batch": {"__typename": "Runs", "count": 0},
+        }
+    }
+
+    with pytest.raises(PipelineError, match="Storage unavailable"):
+        await adapter.get_active_run_count()
+
+
+@pytest.mark.asyncio
+async def test_get_active_run_count_graphql_error(adapter, mock_graphql):
+    """Test errors reported by the webserver are raised as a PipelineError."""
+    mock_graphql.return_value = {"errors": [{"message": "Unknown argument"}]}
+
+    with pytest.raises(PipelineError, match="Unknown argument"):
+        await adapter.get_active_run_count()
+
+
+@pytest.mark.asyncio
+async def test_get_active_run_count_http_error(adapter):
+    """Test a failed request to the webserver is raised as a PipelineError."""
+    adapter._http = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(502)))
+
+    with pytest.raises(PipelineError):
+        await adapter.get_active_run_count()
+
+
+@pytest.mark.asyncio
+async def test_graphql_queries_go_to_the_webserver(adapter):
+    """Test the adapter POSTs its queries to the GraphQL endpoint of the webserver."""
+    requests = []
+
+    def respond(request):
+        requests.append(request)
+        return httpx.Response(
+            200, json={"data": {"runsOrError": {"__typename": "Runs", "results": []}}}
+        )
+
+    adapter.dagster_url = "http://dagster-webserver:3000/"
+    adapter._http = httpx.Client(transport=httpx.MockTransport(respond))
+
+    await adapter.get_pipeline_statuses(["run-1"])
+
+    assert str(requests[0].url) == "http://dagster-webserver:3000/graphql"
+    assert requests[0].method == "POST"
+
+
+@pytest.mark.asyncio
+async def test_get_pipeline_statuses_success(adapter, mock_graphql):
+    """Test the statuses of many runs are read in one query, unknown runs left out."""
+    # Setup
+    mock_graphql.return_value = {
+        "data": {
+            "runsOrError": {
+                "__typename": "Runs",
+                "results": [
+                    {"runId": "run-1", "status": "SUCCESS"},
+                    {"runId": "run-2", "status": "QUEUED"},
+                    {"runId": "run-3", "status": "CANCELED"},
+                ],
+            }
+        }
+    }
+
+    # Execute
+    statuses = await adapter.get_pipeline_statuses(["run-1", "run-2", "run-3", "run-4"])
+
+    # Assert
+    assert statuses == {"run-1": "completed", "run-2": "pending", "run-3": "failed"}
+    mock_graphql.assert_called_once()
+    variables = mock_graphql.call_args.args[0]["variables"]
+    assert variables == {"filter": {"runIds": ["run-1", "run-2", "run-3", "run-4"]}, "limit": 4}
+
+
+@pytest.mark.asyncio
+async def test_get_pipeline_statuses_python_error(adapter, mock_graphql):
+    """Test a Dagster error result is raised as a PipelineError."""
+    mock_graphql.return_value = {
+        "data": {"runsOrError": {"__typename": "PythonError", "message": "Storage unavailable"}}
+    }
+
+    with pytest.raises(PipelineError, match="Storage unavailable"):
+        await adapter.get_pipeline_statuses(["run-1"])
+
+
+@pytest.mark.asyncio
+async def test_get_pipeline_statuses_without_runs(adapter, mock_graphql):
+    """Test no query is sent when there is nothing to look up."""
+    assert await adapter.get_pipeline_statuses([]) == {}
+
+    mock_graphql.assert_not_called()
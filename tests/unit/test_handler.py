@@ -0,0 +1,303 @@
+"""Unit tests for FastAPIHandler."""
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+
+from src.adapter.driving.fastapi.handler import FastAPIHandler
+from src.adapter.driving.fastapi.models import PredictionRequest
+from src.adapter.driving.fastapi.sse import event_stream
+from src.core.domain.entities.prediction import Prediction, PredictionFilter, PredictionStatus
+from src.core.domain.exceptions import (
+    CallbackUrlNotAllowedError,
+    IdempotencyKeyReusedError,
+    PipelineOverloadedError,
+    StorageError,
+)
+from src.core.service.status_watcher import PredictionStatusWatcher
+
+REQUEST = PredictionRequest(
+    longitude=-122.64,
+    latitude=38.01,
+    housing_median_age=36.0,
+    total_rooms=1336.0,
+    total_bedrooms=258.0,
+    population=678.0,
+    households=249.0,
+    median_income=5.5789,
+    ocean_proximity="NEAR OCEAN",
+)
+
+
+@pytest.fixture
+def mock_service():
+    """Create a prediction service with nothing cached."""
+    service = MagicMock()
+    service.get_cached_prediction.return_value = None
+    return service
+
+
+@pytest.mark.asyncio
+async def test_overloaded_pipeline_returns_429(mock_service):
+    """Test a full pipeline backlog is reported as 429 with Retry-After."""
+    # Setup
+    mock_service.submit_prediction_request = AsyncMock(
+        side_effect=PipelineOverloadedError("Overloaded", retry_after=2.5)
+    )
+    handler = FastAPIHandler(mock_service)
+
+    # Execute
+    with pytest.raises(HTTPException) as exc_info:
+        await handler.submit_prediction_request(REQUEST)
+
+    # Assert
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.headers == {"Retry-After": "3"}
+
+
+@pytest.mark.asyncio
+async def test_reused_idempotency_key_returns_422(mock_service):
+    """Test an idempotency key sent with another request is rejected with 422."""
+    # Setup
+    mock_service.submit_prediction_request = AsyncMock(
+        side_effect=IdempotencyKeyReusedError("Idempotency key reused")
+    )
+    handler = FastAPIHandler(mock_service)
+
+    # Execute
+    with pytest.raises(HTTPException) as exc_info:
+        await handler.submit_prediction_request(REQUEST, idempotency_key="client-key")
+
+    # Assert
+    assert exc_info.value.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_submission_with_disallowed_callback_url(mock_service):
+    """Test a callback URL that may not receive webhooks is rejected with 422."""
+    mock_service.submit_prediction_request = AsyncMock(
+        side_effect=CallbackUrlNotAllowedError("Callback URLs must use https")
+    )
+    handler = FastAPIHandler(mock_service)
+    request = REQUEST.model_copy(update={"callback_url": "http://10.0.0.7/hook"})
+
+    with pytest.raises(HTTPException) as exc_info:
+        await handler.submit_prediction_request(request)
+
+    assert exc_info.value.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_submission_passes_callback_url(mock_service):
+    """Test the callback URL of a request is handed to the service as a string."""
+    # Setup
+    mock_service.submit_prediction_request = AsyncMock(return_value="run-1")
+    handler = FastAPIHandler(mock_service)
+    request = REQUEST.model_copy(update={"callback_url": "https://client.example/hook"})
+
+    # Execute
+    response = await handler.submit_prediction_request(request)
+
+    # Assert
+    assert response.run_id == "run-1"
+    assert mock_service.submit_prediction_request.call_args.kwargs["callback_url"] == (
+        "https://client.example/hook"
+    )
+
+
+@pytest.mark.asyncio
+async def test_overloaded_pipeline_rejects_batch_with_429(mock_service):
+    """Test a batch is rejected with 429 while the pipeline backlog is full."""
+    # Setup
+    mock_service.submit_batch_prediction_request = AsyncMock(
+        side_effect=PipelineOverloadedError("Overloaded", retry_after=5.0)
+    )
+    handler = FastAPIHandler(mock_service)
+
+    # Execute
+    with pytest.raises(HTTPException) as exc_info:
+        await handler.submit_batch_prediction_request([REQUEST])
+
+    # Assert
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.headers == {"Retry-After": "5"}
+
+
+@pytest.mark.asyncio
+async def test_batch_result_items_carry_their_index(mock_service):
+    """Test each item of a completed batch reports its position in the submission."""
+    # Setup
+    predictions = [
+        Prediction(
+            record_id=f"record-{index}",
+            value=100000.0 * (index + 1),
+            created_at=datetime(2024, 1, 1),
+            status=PredictionStatus.COMPLETED,
+            run_id="batch-run",
+            batch_index=index,
+        )
+        for index in range(3)
+    ]
+    mock_service.get_batch_prediction_result = AsyncMock(return_value=predictions)
+    handler = FastAPIHandler(mock_service)
+
+    # Execute
+    response = await handler.get_batch_prediction_result("batch-run")
+
+    # Assert
+    assert response.status == PredictionStatus.COMPLETED
+    assert [(item.index, item.record_id) for item in response.items] == [
+        (0, "record-0"),
+        (1, "record-1"),
+        (2, "record-2"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_list_predictions_fetches_one_extra_prediction(mock_service):
+    """Test a page asks for one more prediction than it holds, and maps them to items."""
+    # Setup
+    record = REQUEST.to_housing_record()
+    prediction = Prediction(
+        record_id=record.id,
+        value=320201.58,
+        created_at=datetime(2024, 1, 1),
+        status=PredictionStatus.COMPLETED,
+        record=record,
+        run_id="run-1",
+    )
+    mock_service.list_predictions.return_value = iter([prediction])
+    handler = FastAPIHandler(mock_service)
+    filters = PredictionFilter(ocean_proximity="NEAR OCEAN")
+
+    # Execute
+    items = list(await handler.list_predictions(filters, 10))
+
+    # Assert
+    mock_service.list_predictions.assert_called_once_with(filters, 11, None)
+    assert [(item.id, item.prediction) for item in items] == [(prediction.id, 320201.58)]
+    assert items[0].record.ocean_proximity == "NEAR OCEAN"
+
+
+@pytest.mark.asyncio
+async def test_list_predictions_rejects_oversized_page(mock_service):
+    """Test a page larger than the maximum is rejected before querying."""
+    handler = FastAPIHandler(mock_service, max_page_size=100)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await handler.list_predictions(PredictionFilter(), 101)
+
+    assert exc_info.value.status_code == 400
+    mock_service.list_predictions.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_list_predictions_rejects_malformed_cursor(mock_service):
+    """Test a cursor that was not issued by the server is a client error."""
+    handler = FastAPIHandler(mock_service)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await handler.list_predictions(PredictionFilter(), 10, cursor="not-a-cursor")
+
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_predictions_reports_storage_error_before_streaming(mock_service):
+    """Test a failing query is reported as 500 rather than in the middle of a stream."""
+
+    # Setup
+    def failing_listing():
+        raise StorageError("Database error")
+        yield
+
+    mock_service.list_predictions.return_value = failing_listing()
+    handler = FastAPIHandler(mock_service)
+
+    # Execute
+    with pytest.raises(HTTPException) as exc_info:
+        await handler.list_predictions(PredictionFilter(), 10)
+
+    # Assert
+    assert exc_info.value.status_code == 500
+
+
+@pytest.mark.asyncio
+async def test_get_prediction_results_keeps_request_order(mock_service):
+    """Test a bulk lookup answers every run ID, in request order."""
+    # Setup
+    mock_service.get_prediction_results = AsyncMock(
+        return_value={"run-1": "running", "run-2": "not_found"}
+    )
+    handler = FastAPIHandler(mock_service)
+
+    # Execute
+    response = await handler.get_prediction_results(["run-2", "run-1", "run-2"])
+
+    # Assert
+    assert [(item.run_id, item.status) for item in response.items] == [
+        ("run-2", PredictionStatus.NOT_FOUND),
+        ("run-1", PredictionStatus.RUNNING),
+        ("run-2", PredictionStatus.NOT_FOUND),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_prediction_results_rejects_oversized_lookup(mock_service):
+    """Test a lookup of more run IDs than the maximum is rejected before querying."""
+    mock_service.get_prediction_results = AsyncMock()
+    handler = FastAPIHandler(mock_service, max_status_lookup_size=2)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await handler.get_prediction_results(["run-1", "run-2", "run-3"])
+
+    assert exc_info.value.status_code == 400
+    mock_service.get_prediction_results.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_stream_prediction_events_follows_each_transition(mock_service):
+    """Test the event stream yields every status of a run, ending with its prediction."""
+    # Setup
+    completed = Prediction(
+        record_id="record-1",
+        value=320201.58,
+        created_at=datetime(2024, 1, 1),
+        status=PredictionStatus.COMPLETED,
+        run_id="run-1",
+    )
+    mock_service.get_prediction_result = AsyncMock(
+        side_effect=["pending", "pending", "running", completed]
+    )
+    watcher = PredictionStatusWatcher(mock_service, poll_interval=0.001)
+    handler = FastAPIHandler(mock_service, status_watcher=watcher)
+
+    # Execute
+    events = [event async for event in handler.stream_prediction_events("run-1")]
+
+    # Assert
+    assert [event.status for event in events] == [
+        PredictionStatus.PENDING,
+        PredictionStatus.RUNNING,
+        PredictionStatus.COMPLETED,
+    ]
+    assert events[-1].prediction == 320201.58
+
+
+@pytest.mark.asyncio
+async def test_stream_prediction_events_stops_watching_on_disconnect(mock_service):
+    """Test a client leaving the event stream stops the polling of its run."""
+    # Setup
+    mock_service.get_prediction_result = AsyncMock(return_value="running")
+    watcher = PredictionStatusWatcher(mock_service, poll_interval=0.001)
+    handler = FastAPIHandler(mock_service, status_watcher=watcher)
+    stream = event_stream(handler.stream_prediction_events("run-1"))
+
+    # Execute
+    first = await stream.__anext__()
+    await stream.aclose()
+
+    # Assert
+    assert '"status":"running"' in first
+    assert watcher._watches == {}
@@ -0,0 +1,84 @@
+"""Unit tests for the housing file resource."""
+import pandas as pd
+import pytest
+
+from src.adapter.driven.etl.housing_source import HousingFileResource
+
+
+@pytest.fixture
+def housing_file(tmp_path):
+    """Write a CSV housing file, half of its rows with a record ID."""
+    frame = pd.DataFrame(
+        {
+            "record_id": [f"record-{i}" if i % 2 else None for i in range(50)],
+            "longitude": -122.64,
+            "latitude": 38.01,
+            "housing_median_age": 36.0,
+            "total_rooms": 1336.0,
+            "total_bedrooms": 258.0,
+            "population": 678.0,
+            "households": 249.0,
+            "median_income": 5.5789,
+            "ocean_proximity": "NEAR OCEAN",
+            "median_house_value": 320201.58554044,
+        }
+    )
+    path = tmp_path / "housing.csv"
+    frame.to_csv(path, index=False)
+    return path
+
+
+def test_read_slice_splits_file_into_disjoint_slices(housing_file):
+    """Test every row is read in exactly one slice, without the unused columns."""
+    resource = HousingFileResource(path=str(housing_file))
+
+    slices = [resource.read_slice(index, 4) for index in range(4)]
+
+    record_ids = pd.concat(slices)["record_id"]
+    assert len(record_ids) == 50
+    assert record_ids.is_unique
+    assert set(record_ids) >= {f"record-{i}" for i in range(1, 50, 2)}
+    assert all(len(part) for part in slices)
+    assert all("median_house_value" not in part for part in slices)
+
+
+def test_read_slice_names_rows_by_line_offset(housing_file):
+    """Test a CSV row without a record ID is named after the offset of its line."""
+    resource = HousingFileResource(path=str(housing_file))
+    with open(housing_file, "rb") as file:
+        header = file.readline()
+
+    first = resource.read_slice(0, 4)
+
+    assert first["record_id"].iloc[0] == f"housing.csv:{len(header)}"
+
+
+def test_read_slice_is_stable(housing_file):
+    """Test reading a slice again gives the same records."""
+    resource = HousingFileResource(path=str(housing_file))
+
+    first = resource.read_slice(1, 4)
+
+    pd.testing.assert_frame_equal(resource.read_slice(1, 4), first)
+
+
+def test_read_slice_reads_parquet_row_groups(housing_file, tmp_path):
+    """Test a Parquet file is split by row groups, its rows named by row number."""
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "housing.parquet"
+    pd.read_csv(housing_file).to_parquet(path, row_group_size=10)
+    resource = HousingFileResource(path=str(path))
+
+    slices = [resource.read_slice(index, 5) for index in range(5)]
+
+    assert [len(part) for part in slices] == [10] * 5
+    assert slices[1]["record_id"].iloc[0] == "housing.parquet:10"
+    assert all("median_house_value" not in part for part in slices)
+
+
+def test_read_slice_rejects_unsupported_format(tmp_path):
+    """Test a file that is neither CSV nor Parquet is rejected."""
+    resource = HousingFileResource(path=str(tmp_path / "housing.json"))
+
+    with pytest.raises(ValueError, match="Unsupported housing file format"):
+        resource.read_slice(0, 4)
@@ -0,0 +1,141 @@
+"""Unit tests for the Prometheus metrics."""
+from unittest.mock import MagicMock
+
+from prometheus_client import REGISTRY, CollectorRegistry, generate_latest, values
+from prometheus_client.mmap_dict import MmapedDict, mmap_key
+
+from src.adapter.driving.fastapi import metrics
+from src.adapter.driving.fastapi.metrics import (
+    AdmissionCollector,
+    BreakerCollector,
+    CacheCollector,
+    WorkerMetricsPublisher,
+    build_registry,
+)
+from src.core.service.admission import AdmissionController
+from src.core.service.cache import TTLLRUCache
+from src.core.service.circuit_breaker import CircuitBreaker
+
+
+def test_cache_collector_exposes_cache_statistics():
+    """Test the statistics kept by a cache are exposed with its name as label."""
+    # Setup
+    cache: TTLLRUCache[str, int] = TTLLRUCache(maxsize=1)
+    collector = CacheCollector()
+    collector.register("test", cache)
+    registry = CollectorRegistry()
+    registry.register(collector)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("b")
+    cache.get("a")
+
+    # Execute
+    output = generate_latest(registry).decode()
+
+    # Assert
+    assert 'cache_hits_total{cache="test"} 1.0' in output
+    assert 'cache_misses_total{cache="test"} 1.0' in output
+    assert 'cache_evictions_total{cache="test"} 1.0' in output
+    assert 'cache_entries{cache="test"} 1.0' in output
+    assert 'cache_hit_ratio{cache="test"} 0.5' in output
+
+
+def test_admission_collector_exposes_backlog():
+    """Test the backlog and rejections seen by the controller are exposed."""
+    # Setup
+    controller = AdmissionController(MagicMock(), max_backlog=10)
+    controller.stats.backlog = 4
+    controller.stats.rejected = 2
+    collector = AdmissionCollector()
+    collector.register(controller)
+    registry = CollectorRegistry()
+    registry.register(collector)
+
+    # Execute
+    output = generate_latest(registry).decode()
+
+    # Assert
+    assert "prediction_pipeline_backlog 4.0" in output
+    assert "prediction_pipeline_backlog_limit 10.0" in output
+    assert "prediction_admission_rejected_total 2.0" in output
+
+
+def test_breaker_collector_exposes_state_and_fallbacks():
+    """Test the breaker state and decisions and the fallback count are exposed."""
+    # Setup
+    breaker = CircuitBreaker()
+    breaker.stats.trips = 2
+    breaker.stats.rejected = 5
+    service = MagicMock(fallbacks=3)
+    collector = BreakerCollector()
+    collector.register(breaker, service)
+    registry = CollectorRegistry()
+    registry.register(collector)
+
+    # Execute
+    output = generate_latest(registry).decode()
+
+    # Assert
+    assert 'pipeline_breaker_state{state="closed"} 1.0' in output
+    assert 'pipeline_breaker_state{state="open"} 0.0' in output
+    assert "pipeline_breaker_trips_total 2.0" in output
+    assert "pipeline_breaker_rejected_total 5.0" in output
+    assert "prediction_fallbacks_total 3.0" in output
+
+
+def test_build_registry_uses_default_registry_in_single_process(monkeypatch):
+    """Test a single process exposes its own in-memory metrics."""
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+
+    assert build_registry() is REGISTRY
+
+
+def test_build_registry_aggregates_workers_in_multiprocess_mode(monkeypatch, tmp_path):
+    """Test the samples written by every worker are summed on a scrape."""
+    # Setup
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    labels = {"method": "GET", "endpoint": "/health", "status": "200"}
+    key = mmap_key(
+        "http_requests_total", "http_requests_total", list(labels), list(labels.values()), ""
+    )
+    for pid, count in ((101, 2.0), (102, 3.0)):
+        samples = MmapedDict(str(tmp_path / f"counter_{pid}.db"))
+        samples.write_value(key, count, 0.0)
+        samples.close()
+    monkeypatch.setattr(metrics, "WORKER_METRICS", WorkerMetricsPublisher([]))
+
+    # Execute
+    output = generate_latest(build_registry()).decode()
+
+    # Assert
+    assert 'http_requests_total{endpoint="/health",method="GET",status="200"} 5.0' in output
+
+
+def test_worker_metrics_are_combined_in_multiprocess_mode(monkeypatch, tmp_path):
+    """Test the statistics published by each worker are combined on a scrape."""
+    # Setup
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    for pid, hits in ((101, 2), (102, 3)):
+        monkeypatch.setattr(values, "ValueClass", values.MultiProcessValue(lambda pid=pid: pid))
+        cache: TTLLRUCache[str, int] = TTLLRUCache(maxsize=10)
+        cache.set("a", 1)
+        for _ in range(hits):
+            cache.get("a")
+        collector = CacheCollector()
+        collector.register("test", cache)
+        publisher = WorkerMetricsPublisher([collector])
+        publisher.publish()
+        # Counters are published as their increase, so publishing again adds nothing
+        publisher.publish()
+
+    # Execute
+    monkeypatch.setattr(metrics, "WORKER_METRICS", WorkerMetricsPublisher([]))
+    output = generate_latest(build_registry()).decode()
+
+    # Assert
+    assert 'cache_hits_total{cache="test"} 5.0' in output
+    assert 'cache_entries{cache="test"} 2.0' in output
+    assert 'cache_hit_ratio{cache="test",pid="101"} 1.0' in output
+    assert 'cache_hit_ratio{cache="test",pid="102"} 1.0' in output
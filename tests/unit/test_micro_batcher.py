@@ -0,0 +1,68 @@
+"""Unit tests for MicroBatcher."""
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.core.service.micro_batcher import MicroBatcher
+
+
+@pytest.mark.asyncio
+async def test_concurrent_submissions_share_one_flush():
+    """Test items submitted within the wait window are flushed together."""
+    # Setup
+    flush = AsyncMock(side_effect=lambda items: [item * 2 for item in items])
+    batcher = MicroBatcher(flush, max_batch_size=100, max_wait=0.01)
+
+    # Execute
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(10)))
+
+    # Assert
+    assert results == [i * 2 for i in range(10)]
+    flush.assert_called_once_with(list(range(10)))
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_flushed_immediately():
+    """Test a batch reaching the maximum size does not wait for the window."""
+    # Setup
+    flush = AsyncMock(side_effect=lambda items: items)
+    batcher = MicroBatcher(flush, max_batch_size=4, max_wait=60.0)
+
+    # Execute
+    results = await asyncio.wait_for(
+        asyncio.gather(*(batcher.submit(i) for i in range(8))), timeout=1.0
+    )
+
+    # Assert
+    assert results == list(range(8))
+    assert flush.call_count == 2
+    assert [call.args[0] for call in flush.call_args_list] == [[0, 1, 2, 3], [4, 5, 6, 7]]
+
+
+@pytest.mark.asyncio
+async def test_flush_error_is_raised_to_every_caller():
+    """Test a failing flush propagates its error to all callers of the batch."""
+    # Setup
+    flush = AsyncMock(side_effect=RuntimeError("Model error"))
+    batcher = MicroBatcher(flush, max_batch_size=100, max_wait=0.01)
+
+    # Execute
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True)
+
+    # Assert
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_result_count_mismatch_fails_the_batch():
+    """Test a flush returning the wrong number of results fails every caller."""
+    # Setup
+    flush = AsyncMock(return_value=[1])
+    batcher = MicroBatcher(flush, max_batch_size=100, max_wait=0.01)
+
+    # Execute
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(2)), return_exceptions=True)
+
+    # Assert
+    assert all(isinstance(result, ValueError) for result in results)
@@ -0,0 +1,61 @@
+"""Unit tests for the Prometheus middleware."""
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from src.adapter.driving.fastapi.metrics import REQUEST_COUNT, REQUEST_LATENCY
+from src.adapter.driving.fastapi.middleware import UNMATCHED_ENDPOINT, PrometheusMiddleware
+
+
+@pytest.fixture
+def client():
+    """Create a test client for an app wrapped in the middleware."""
+    app = FastAPI()
+    app.add_middleware(PrometheusMiddleware)
+
+    @app.get("/test-middleware/{run_id}")
+    async def get_item(run_id: str) -> dict:
+        if run_id == "missing":
+            raise HTTPException(status_code=404, detail="Not found")
+        return {"run_id": run_id}
+
+    return TestClient(app)
+
+
+def _count(endpoint: str, status: int) -> float:
+    """Get the current request count for an endpoint and status."""
+    return REQUEST_COUNT.labels(method="GET", endpoint=endpoint, status=status)._value.get()
+
+
+def test_requests_are_labelled_with_route_template(client):
+    """Test distinct path parameters share the series of their route template."""
+    endpoint = "/test-middleware/{run_id}"
+    before = _count(endpoint, 200)
+
+    for run_id in ("run-1", "run-2", "run-3"):
+        assert client.get(f"/test-middleware/{run_id}").status_code == 200
+
+    assert _count(endpoint, 200) == before + 3
+    assert _count("/test-middleware/run-1", 200) == 0
+    latency = REQUEST_LATENCY.labels(method="GET", endpoint=endpoint)
+    assert latency._sum.get() > 0
+
+
+def test_error_status_is_recorded(client):
+    """Test the status code of an error response is recorded."""
+    endpoint = "/test-middleware/{run_id}"
+    before = _count(endpoint, 404)
+
+    assert client.get("/test-middleware/missing").status_code == 404
+
+    assert _count(endpoint, 404) == before + 1
+
+
+def test_unmatched_paths_share_one_label(client):
+    """Test requests matching no route do not create a series per path."""
+    before = _count(UNMATCHED_ENDPOINT, 404)
+
+    client.get("/unknown/a")
+    client.get("/unknown/b")
+
+    assert _count(UNMATCHED_ENDPOINT, 404) == before + 2
@@ -0,0 +1,90 @@
+"""Unit tests for the cursor pagination encoding."""
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.adapter.driving.fastapi.models import PredictionListItem, PredictionRequest
+from src.adapter.driving.fastapi.pagination import decode_cursor, encode_cursor, page_stream
+from src.core.domain.entities.prediction import PredictionCursor
+
+RECORD = PredictionRequest(
+    longitude=-122.64,
+    latitude=38.01,
+    housing_median_age=36.0,
+    total_rooms=1336.0,
+    total_bedrooms=258.0,
+    population=678.0,
+    households=249.0,
+    median_income=5.5789,
+    ocean_proximity="NEAR OCEAN",
+)
+
+
+def _items(count):
+    """Create listing entries, newest first."""
+    return [
+        PredictionListItem(
+            id=f"pred-{index}",
+            run_id=f"run-{index}",
+            prediction=1000.0 * index,
+            created_at=datetime(2024, 1, 1) - timedelta(minutes=index),
+            record=RECORD,
+        )
+        for index in range(count)
+    ]
+
+
+def test_cursor_round_trip():
+    """Test a decoded cursor points at the position it was encoded from."""
+    cursor = PredictionCursor(created_at=datetime(2024, 1, 1, 12, 30), id="pred-1")
+
+    assert decode_cursor(encode_cursor(cursor)) == cursor
+
+
+@pytest.mark.parametrize("token", ["not-a-cursor", "", "e30"])
+def test_malformed_cursor_is_rejected(token):
+    """Test a cursor that was not produced by the server raises ValueError."""
+    with pytest.raises(ValueError):
+        decode_cursor(token)
+
+
+def test_full_page_ends_with_cursor_of_last_item():
+    """Test the extra item is dropped and the cursor points at the last item sent."""
+    # Execute
+    page = json.loads(b"".join(page_stream(iter(_items(4)), limit=3)))
+
+    # Assert
+    assert [item["id"] for item in page["items"]] == ["pred-0", "pred-1", "pred-2"]
+    assert decode_cursor(page["next_cursor"]).id == "pred-2"
+
+
+def test_last_page_has_no_cursor():
+    """Test a page the listing ends in carries no cursor."""
+    page = json.loads(b"".join(page_stream(iter(_items(2)), limit=3)))
+
+    assert len(page["items"]) == 2
+    assert "next_cursor" not in page
+
+
+def test_closing_stream_closes_items():
+    """Test the items are closed along with a stream the client stopped reading."""
+    closed = []
+
+    def items():
+        try:
+            yield from _items(300)
+        finally:
+            closed.append(True)
+
+    stream = page_stream(items(), limit=300)
+    next(stream)
+    assert not closed
+
+    stream.close()
+    assert closed == [True]
+
+
+def test_empty_page():
+    """Test an empty listing is a valid document."""
+    assert json.loads(b"".join(page_stream(iter([]), limit=3))) == {"items": []}
@@ -3,10 +3,25 @@ from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import SQLAlchemyError
-
-from src.adapter.driven.storage.postgres_adapter import PostgresAdapter
-from src.core.domain.entities.prediction import Prediction, PredictionStatus
+from sqlalchemy.orm import sessionmaker
+
+from src.adapter.driven.storage.postgres_adapter import (
+    Base,
+    CleanedHousingRecord,
+    PostgresAdapter,
+    PredictionRecord,
+)
+from src.core.domain.entities.prediction import (
+    Prediction,
+    PredictionCursor,
+    PredictionFilter,
+    PredictionStatus,
+)
+from src.core.domain.entities.submission import SubmissionKey
+from src.core.domain.entities.webhook import WebhookDelivery, WebhookDeliveryStatus
 from src.core.domain.exceptions import StorageError
 
 
@@ -53,6 +68,8 @@ def mock_prediction_model():
     model.prediction_value = 320201.58554044
     model.created_at = datetime.now()
     model.run_id = "test-run-1"
+    model.batch_index = 0
+    model.model_version = "model-v1"
     return model
 
 
@@ -98,6 +115,22 @@ def test_save_housing_record_error(adapter, mock_housing_record, mock_session):
     mock_session.__exit__.assert_called_once()
 
 
+def test_save_housing_records_success(adapter, mock_housing_record, mock_session):
+    """Test saving several housing records in one transaction."""
+    second_record = mock_housing_record.model_copy(update={"id": "second-record"})
+
+    # Call the method
+    result = adapter.save_housing_records([mock_housing_record, second_record])
+
+    # Verify the result keeps the input order
+    assert result == [mock_housing_record.id, "second-record"]
+
+    # Verify a single commit was issued for the batch
+    mock_session.add_all.assert_called_once()
+    assert len(mock_session.add_all.call_args[0][0]) == 2
+    mock_session.commit.assert_called_once()
+
+
 def test_get_housing_record_success(adapter, mock_record_model, mock_session):
     """Test successful retrieval of a housing record."""
     # Configure the session query
@@ -241,3 +274,516 @@ def test_get_prediction_error(adapter, mock_session):
 
     # Verify the session was used correctly
     mock_session.__exit__.assert_called_once()
+
+
+def test_get_predictions_success(adapter, mock_prediction_model, mock_record_model, mock_session):
+    """Test retrieval of every prediction of a run."""
+    # Configure the session query
+    mock_query = MagicMock()
+    mock_query.options.return_value = mock_query
+    mock_query.filter_by.return_value = mock_query
+    mock_query.order_by.return_value = mock_query
+    mock_query.all.return_value = [mock_prediction_model]
+    mock_session.query.return_value = mock_query
+    mock_prediction_model.cleaned_record = mock_record_model
+
+    # Call the method
+    result = adapter.get_predictions("test-run-1")
+
+    # Verify the result
+    assert len(result) == 1
+    assert result[0].id == "test-pred-1"
+    assert result[0].record.id == "test-id-1"
+    assert result[0].batch_index == 0
+    mock_query.filter_by.assert_called_once_with(run_id="test-run-1")
+    order = [str(column) for column in mock_query.order_by.call_args.args]
+    assert order == [
+        "PredictionRecord.batch_index",
+        "PredictionRecord.created_at",
+        "PredictionRecord.id",
+    ]
+
+
+def test_get_predictions_reads_records_in_one_statement(adapter):
+    """Test the records of a multi-row run are loaded with its predictions, not one by one."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(
+        engine, tables=[CleanedHousingRecord.__table__, PredictionRecord.__table__]
+    )
+    adapter.Session = sessionmaker(bind=engine)
+    with adapter.Session() as session:
+        for index in range(3):
+            session.add(
+                CleanedHousingRecord(
+                    id=f"record-{index}",
+                    longitude=-122.64,
+                    latitude=38.01,
+                    housing_median_age=36.0,
+                    total_rooms=1336.0,
+                    total_bedrooms=258.0,
+                    population=678.0,
+                    households=249.0,
+                    median_income=5.5789,
+                    ocean_proximity="NEAR OCEAN",
+                )
+            )
+            session.add(
+                PredictionRecord(
+                    id=f"prediction-{index}",
+                    cleaned_record_id=f"record-{index}",
+                    prediction_value=320201.58554044,
+                    run_id="test-run-1",
+                    batch_index=index,
+                )
+            )
+        session.commit()
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    result = adapter.get_predictions("test-run-1")
+
+    assert [prediction.record.id for prediction in result] == [
+        "record-0",
+        "record-1",
+        "record-2",
+    ]
+    assert len(statements) == 1
+
+
+def test_setup_adds_missing_columns(adapter, mock_engine):
+    """Test setup adds the columns introduced after a table was first created."""
+    # The adapter runs setup when it is created
+    connection = mock_engine.begin.return_value.__enter__.return_value
+
+    # Assert
+    statements = [str(call.args[0]) for call in connection.execute.call_args_list]
+    assert statements == [
+        "ALTER TABLE predictions ADD COLUMN IF NOT EXISTS batch_index INTEGER",
+        "ALTER TABLE predictions ADD COLUMN IF NOT EXISTS model_version VARCHAR",
+        "ALTER TABLE idempotency_keys ADD COLUMN IF NOT EXISTS fingerprint VARCHAR",
+        "DROP INDEX IF EXISTS ix_predictions_prediction_value_created_at",
+        "DROP INDEX IF EXISTS ix_cleaned_housing_records_ocean_proximity_id",
+    ]
+
+
+def test_close_disposes_engine(adapter, mock_engine):
+    """Test closing the adapter releases its connection pool."""
+    adapter.close()
+
+    mock_engine.dispose.assert_called_once()
+
+
+def test_get_idempotency_key_success(adapter, mock_session):
+    """Test retrieval of the submission recorded for a live idempotency key."""
+    # Configure the session query
+    mock_query = MagicMock()
+    mock_query.filter.return_value = mock_query
+    mock_query.one_or_none.return_value = MagicMock(
+        key="key:client-key",
+        run_id="test-run-1",
+        fingerprint="request-hash",
+        created_at=datetime(2024, 1, 2),
+    )
+    mock_session.query.return_value = mock_query
+
+    # Call the method
+    result = adapter.get_idempotency_key("key:client-key", datetime(2024, 1, 1))
+
+    # Verify the result
+    assert result == SubmissionKey(
+        key="key:client-key",
+        run_id="test-run-1",
+        fingerprint="request-hash",
+        created_at=datetime(2024, 1, 2),
+    )
+
+
+def test_get_idempotency_key_expired(adapter, mock_session):
+    """Test an expired or unknown idempotency key is not returned."""
+    mock_query = MagicMock()
+    mock_query.filter.return_value = mock_query
+    mock_query.one_or_none.return_value = None
+    mock_session.query.return_value = mock_query
+
+    assert adapter.get_idempotency_key("key:client-key", datetime(2024, 1, 1)) is None
+
+
+def test_save_idempotency_key_inserted(adapter, mock_session):
+    """Test a new idempotency key keeps the run it was saved with."""
+    # Configure the upsert to return the inserted run
+    mock_session.execute.return_value.scalar.return_value = "test-run-1"
+    submission = SubmissionKey(key="key:client-key", run_id="test-run-1")
+
+    # Call the method
+    result = adapter.save_idempotency_key(submission, datetime(2024, 1, 1))
+
+    # Verify the result
+    assert result is submission
+    mock_session.commit.assert_called_once()
+    mock_session.query.assert_not_called()
+
+
+def test_save_idempotency_key_conflict(adapter, mock_session):
+    """Test a live idempotency key keeps the run it was first saved with."""
+    # Configure the upsert to skip the update and the query to find the live row
+    mock_session.execute.return_value.scalar.return_value = None
+    mock_query = MagicMock()
+    mock_query.filter_by.return_value = mock_query
+    mock_query.one.return_value = MagicMock(
+        key="key:client-key",
+        run_id="test-run-0",
+        fingerprint=None,
+        created_at=datetime(2024, 1, 2),
+    )
+    mock_session.query.return_value = mock_query
+
+    # Call the method
+    result = adapter.save_idempotency_key(
+        SubmissionKey(key="key:client-key", run_id="test-run-1"), datetime(2024, 1, 1)
+    )
+
+    # Verify the result
+    assert result.run_id == "test-run-0"
+    mock_query.filter_by.assert_called_once_with(key="key:client-key")
+
+
+def test_save_idempotency_key_replaces_failed_run(adapter, mock_session):
+    """Test a live key is replaced when it points to the run being replaced."""
+    mock_session.execute.return_value.scalar.return_value = "test-run-1"
+
+    adapter.save_idempotency_key(
+        SubmissionKey(key="key:client-key", run_id="test-run-1"),
+        datetime(2024, 1, 1),
+        replaced_run_id="test-run-0",
+    )
+
+    statement = mock_session.execute.call_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "idempotency_keys.created_at <= %(created_at_1)s" in sql
+    assert "OR idempotency_keys.run_id = %(run_id_1)s" in sql
+
+
+def test_save_idempotency_key_error(adapter, mock_session):
+    """Test error handling when saving an idempotency key."""
+    mock_session.execute.side_effect = SQLAlchemyError("Database error")
+
+    with pytest.raises(StorageError):
+        adapter.save_idempotency_key(
+            SubmissionKey(key="key:client-key", run_id="test-run-1"), datetime(2024, 1, 1)
+        )
+
+
+def test_list_predictions_uses_keyset_pagination(
+    adapter, mock_prediction_model, mock_record_model, mock_session
+):
+    """Test a listing page starts after the cursor instead of skipping rows."""
+    # Configure the streamed rows
+    mock_session.execute.return_value.scalars.return_value = iter([mock_prediction_model])
+    mock_prediction_model.cleaned_record = mock_record_model
+    after = PredictionCursor(created_at=datetime(2024, 1, 1), id="test-pred-0")
+
+    # Call the method
+    result = list(
+        adapter.list_predictions(PredictionFilter(ocean_proximity="NEAR OCEAN"), 10, after)
+    )
+
+    # Verify the result and the query
+    assert [prediction.id for prediction in result] == ["test-pred-1"]
+    statement = mock_session.execute.call_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "(predictions.created_at, predictions.id) <" in sql
+    assert "ORDER BY predictions.created_at DESC, predictions.id DESC" in sql
+    assert "OFFSET" not in sql
+
+
+def test_closing_listing_closes_its_session(
+    adapter, mock_prediction_model, mock_record_model, mock_session
+):
+    """Test a listing left unfinished closes its session as soon as it is closed."""
+    mock_session.execute.return_value.scalars.return_value = iter([mock_prediction_model] * 2)
+    mock_prediction_model.cleaned_record = mock_record_model
+
+    listing = adapter.list_predictions(PredictionFilter(), 10)
+    next(listing)
+    mock_session.close.assert_not_called()
+
+    listing.close()
+    mock_session.close.assert_called_once()
+
+
+def test_list_predictions_error(adapter, mock_session):
+    """Test error handling when listing predictions."""
+    mock_session.execute.side_effect = SQLAlchemyError("Database error")
+
+    with pytest.raises(StorageError):
+        list(adapter.list_predictions(PredictionFilter(), 10))
+
+
+def test_get_predictions_by_run_ids_success(
+    adapter, mock_prediction_model, mock_record_model, mock_session
+):
+    """Test the predictions of many runs are read with a single array parameter."""
+    # Configure the session query
+    mock_query = MagicMock()
+    mock_query.options.return_value = mock_query
+    mock_query.filter.return_value = mock_query
+    mock_query.order_by.return_value = mock_query
+    mock_query.all.return_value = [mock_prediction_model]
+    mock_session.query.return_value = mock_query
+    mock_prediction_model.cleaned_record = mock_record_model
+
+    # Call the method
+    result = adapter.get_predictions_by_run_ids(["test-run-1", "test-run-2"])
+
+    # Verify the result and the query
+    assert list(result) == ["test-run-1"]
+    assert result["test-run-1"].id == "test-pred-1"
+    condition = mock_query.filter.call_args.args[0]
+    sql = str(condition.compile(dialect=postgresql.dialect()))
+    assert sql == "predictions.run_id = ANY (%(run_ids)s::VARCHAR[])"
+    mock_session.query.assert_called_once()
+
+
+def test_get_predictions_by_run_ids_error(adapter, mock_session):
+    """Test error handling when getting the predictions of many runs."""
+    mock_session.query.side_effect = SQLAlchemyError("Database error")
+
+    with pytest.raises(StorageError):
+        adapter.get_predictions_by_run_ids(["test-run-1"])
+
+
+def test_get_predictions_by_records_success(
+    adapter, mock_prediction_model, mock_record_model, mock_session
+):
+    """Test predictions of batch run records are read in one query, unasked pairs dropped."""
+    # Configure the session query
+    other = MagicMock(
+        run_id="test-run-2", cleaned_record_id=mock_prediction_model.cleaned_record_id
+    )
+    mock_query = MagicMock()
+    mock_query.options.return_value = mock_query
+    mock_query.filter.return_value = mock_query
+    mock_query.all.return_value = [mock_prediction_model, other]
+    mock_session.query.return_value = mock_query
+    mock_prediction_model.cleaned_record = mock_record_model
+    key = (mock_prediction_model.run_id, mock_prediction_model.cleaned_record_id)
+
+    # Call the method
+    result = adapter.get_predictions_by_records([key, ("test-run-2", "other-record")])
+
+    # Verify the result and the query
+    assert list(result) == [key]
+    assert result[key].id == "test-pred-1"
+    run_condition, record_condition = mock_query.filter.call_args.args
+    assert str(run_condition.compile(dialect=postgresql.dialect())) == (
+        "predictions.run_id = ANY (%(run_ids)s::VARCHAR[])"
+    )
+    assert str(record_condition.compile(dialect=postgresql.dialect())) == (
+        "predictions.cleaned_record_id = ANY (%(record_ids)s::VARCHAR[])"
+    )
+
+
+def test_get_predictions_by_records_without_keys(adapter, mock_session):
+    """Test no query is sent when there is nothing to look up."""
+    assert adapter.get_predictions_by_records([]) == {}
+    mock_session.query.assert_not_called()
+
+
+def test_save_prediction_queues_delivery_in_same_transaction(adapter, mock_session):
+    """Test a completion notice is committed together with its prediction."""
+    prediction = Prediction(
+        record_id="test-id-1",
+        value=320201.58554044,
+        created_at=datetime(2024, 1, 1),
+        run_id="test-run-1",
+    )
+    delivery = WebhookDelivery.for_prediction(prediction, "https://client.example/hook")
+
+    adapter.save_prediction(prediction, delivery)
+
+    added = [call.args[0] for call in mock_session.add.call_args_list]
+    assert [type(row).__name__ for row in added] == ["PredictionRecord", "WebhookDeliveryRecord"]
+    assert added[1].payload["prediction"] == 320201.58554044
+    mock_session.commit.assert_called_once()
+
+
+def test_save_prediction_completes_run_in_same_transaction(adapter, mock_session):
+    """Test the run of a prediction is recorded as completed when the prediction is saved."""
+    prediction = Prediction(
+        record_id="test-id-1",
+        value=320201.58554044,
+        created_at=datetime(2024, 1, 1),
+        run_id="test-run-1",
+    )
+
+    adapter.save_prediction(prediction)
+
+    statement = mock_session.execute.call_args.args[0]
+    compiled = statement.compile(dialect=postgresql.dialect())
+    assert "INSERT INTO prediction_runs" in str(compiled)
+    assert compiled.params["run_id"] == "test-run-1"
+    assert compiled.params["status"] == "completed"
+    mock_session.commit.assert_called_once()
+
+
+def test_save_backfilled_predictions_skips_stored_ones(adapter, mock_housing_record, mock_session):
+    """Test stored records are kept, and records already scored get no new prediction."""
+    second_record = mock_housing_record.model_copy(update={"id": "second-record"})
+    predictions = [
+        Prediction(record_id=record.id, value=1.0, created_at=datetime(2024, 1, 1))
+        for record in (mock_housing_record, second_record)
+    ]
+    mock_session.execute.return_value.scalars.return_value = [mock_housing_record.id]
+
+    result = adapter.save_backfilled_predictions([mock_housing_record, second_record], predictions)
+
+    assert result == ["second-record"]
+    records_insert, rows = mock_session.execute.call_args_list[0].args
+    sql = str(records_insert.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (id) DO NOTHING" in sql
+    assert [row["id"] for row in rows] == [mock_housing_record.id, "second-record"]
+    (added,) = mock_session.add_all.call_args.args
+    assert [row.cleaned_record_id for row in added] == ["second-record"]
+    mock_session.commit.assert_called_once()
+
+
+def test_save_backfilled_predictions_error(adapter, mock_housing_record, mock_session):
+    """Test error handling when saving backfilled predictions."""
+    mock_session.execute.side_effect = SQLAlchemyError("Database error")
+    prediction = Prediction(
+        record_id=mock_housing_record.id, value=1.0, created_at=datetime(2024, 1, 1)
+    )
+
+    with pytest.raises(StorageError, match="Error saving backfilled predictions"):
+        adapter.save_backfilled_predictions([mock_housing_record], [prediction])
+
+
+def test_save_run_status_never_moves_backwards(adapter, mock_session):
+    """Test a status only replaces the statuses that come before it."""
+    adapter.save_run_status("test-run-1", "running")
+
+    statement = mock_session.execute.call_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (run_id) DO UPDATE" in sql
+    assert "WHERE prediction_runs.status IN (__[POSTCOMPILE_status_1])" in sql
+    assert statement.compile(dialect=postgresql.dialect()).params["status_1"] == ["pending"]
+    mock_session.commit.assert_called_once()
+
+
+def test_save_run_status_error(adapter, mock_session):
+    """Test error handling when saving the status of a run."""
+    mock_session.execute.side_effect = SQLAlchemyError("Database error")
+
+    with pytest.raises(StorageError):
+        adapter.save_run_status("test-run-1", "failed")
+
+
+def test_get_run_statuses_success(adapter, mock_session):
+    """Test the statuses of many runs are read with a single array parameter."""
+    mock_session.execute.return_value.all.return_value = [("test-run-1", "running")]
+
+    result = adapter.get_run_statuses(["test-run-1", "test-run-2"])
+
+    assert result == {"test-run-1": "running"}
+    statement = mock_session.execute.call_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "WHERE prediction_runs.run_id = ANY (%(run_ids)s::VARCHAR[])" in sql
+
+
+def test_get_run_statuses_leaves_out_stale_statuses(adapter, mock_session):
+    """Test unfinished statuses not updated since the given time are filtered out."""
+    mock_session.execute.return_value.all.return_value = []
+
+    adapter.get_run_statuses(["test-run-1"], stale_before=datetime(2024, 1, 1))
+
+    statement = mock_session.execute.call_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "prediction_runs.status IN (__[POSTCOMPILE_status_1])" in sql
+    assert "prediction_runs.updated_at >= %(updated_at_1)s" in sql
+    assert statement.compile().params["status_1"] == ["completed", "failed"]
+
+
+def test_get_run_statuses_without_runs(adapter, mock_session):
+    """Test no query is sent when there is nothing to look up."""
+    assert adapter.get_run_statuses([]) == {}
+    mock_session.execute.assert_not_called()
+
+
+def test_claim_webhook_deliveries_skips_locked_rows(adapter, mock_session):
+    """Test due deliveries are claimed without waiting on other dispatchers, and leased."""
+    # Configure the claimed row
+    row = MagicMock(
+        id="delivery-1",
+        run_id="test-run-1",
+        callback_url="https://client.example/hook",
+        payload={"run_id": "test-run-1", "status": "completed"},
+        status="pending",
+        attempts=0,
+        next_attempt_at=datetime(2024, 1, 1),
+        last_error=None,
+        created_at=datetime(2024, 1, 1),
+    )
+    mock_session.execute.return_value.scalars.return_value.all.return_value = [row]
+
+    # Call the method
+    result = adapter.claim_webhook_deliveries(10, lease=60.0)
+
+    # Verify the result, the query and the lease
+    assert [delivery.id for delivery in result] == ["delivery-1"]
+    assert result[0].status == WebhookDeliveryStatus.PENDING
+    statement = mock_session.execute.call_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert row.next_attempt_at > datetime.utcnow()
+    mock_session.commit.assert_called_once()
+
+
+def test_fail_webhook_deliveries_gives_up_without_next_attempt(adapter, mock_session):
+    """Test a delivery without a next attempt time is marked as failed."""
+    delivery = WebhookDelivery(
+        id="delivery-1",
+        run_id="test-run-1",
+        callback_url="https://client.example/hook",
+        payload={},
+        attempts=10,
+        next_attempt_at=None,
+        last_error="Connection refused",
+    )
+
+    adapter.fail_webhook_deliveries([delivery])
+
+    rows = mock_session.execute.call_args.args[1]
+    assert rows[0]["status"] == WebhookDeliveryStatus.FAILED.value
+    assert rows[0]["attempts"] == 10
+    mock_session.commit.assert_called_once()
+
+
+def test_claim_webhook_deliveries_error(adapter, mock_session):
+    """Test error handling when claiming webhook deliveries."""
+    mock_session.execute.side_effect = SQLAlchemyError("Database error")
+
+    with pytest.raises(StorageError):
+        adapter.claim_webhook_deliveries(10, lease=60.0)
+
+
+def test_warm_up_opens_every_pooled_connection(adapter, mock_engine):
+    """Test warm-up checks out the whole pool at once and gives it back."""
+    connections = [MagicMock() for _ in range(adapter.pool_size)]
+    mock_engine.connect.side_effect = connections
+
+    adapter.warm_up()
+
+    assert mock_engine.connect.call_count == adapter.pool_size
+    for connection in connections:
+        connection.execute.assert_called_once()
+        connection.close.assert_called_once()
+
+
+def test_warm_up_error(adapter, mock_engine):
+    """Test error handling when the database cannot be reached during warm-up."""
+    connection = MagicMock()
+    mock_engine.connect.side_effect = [connection, SQLAlchemyError("Connection refused")]
+
+    with pytest.raises(StorageError):
+        adapter.warm_up()
+    connection.close.assert_called_once()
@@ -1,8 +1,29 @@
-from unittest.mock import AsyncMock
+import asyncio
+import time
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from src.core.service.prediction_service import PredictionService
+from src.core.domain.entities.prediction import Prediction, PredictionFilter, PredictionStatus
+from src.core.domain.entities.submission import SubmissionKey
+from src.core.domain.exceptions import (
+    CallbackUrlNotAllowedError,
+    CircuitOpenError,
+    IdempotencyKeyReusedError,
+    PipelineError,
+    PipelineOverloadedError,
+    PipelineUnavailableError,
+    PredictionError,
+    StorageError,
+)
+from src.core.service.admission import AdmissionController
+from src.core.service.cache import TTLLRUCache
+from src.core.service.prediction_service import (
+    BATCH_HANDLE_SEPARATOR,
+    SYNC_RUN_PREFIX,
+    PredictionService,
+)
 
 
 @pytest.fixture
@@ -103,3 +124,1038 @@ async def test_get_prediction_result_exception_handling(
     assert result == "failed"
     mock_etl_port.get_pipeline_status.assert_called_once_with(run_id)
     mock_storage_port.get_prediction.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_submit_batch_prediction_request(
+    mock_etl_port, mock_storage_port, prediction_service, mock_housing_record
+):
+    """Test a batch is submitted as a single pipeline run."""
+    # Setup
+    mock_etl_port.start_batch_prediction_pipeline = AsyncMock(return_value="batch-run-id")
+    records = [mock_housing_record, mock_housing_record.model_copy(update={"id": "second"})]
+
+    # Execute
+    run_id = await prediction_service.submit_batch_prediction_request(records)
+
+    # Assert
+    assert run_id == "batch-run-id"
+    mock_etl_port.start_batch_prediction_pipeline.assert_called_once_with(records)
+    mock_storage_port.save_housing_record.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_batch_prediction_result_completed(
+    mock_etl_port, mock_storage_port, prediction_service
+):
+    """Test get_batch_prediction_result returns every stored prediction of the run."""
+    # Setup
+    run_id = "batch-run-id"
+    predictions = [
+        Prediction(record_id=f"record-{i}", value=1000.0 * i, created_at=datetime.now())
+        for i in range(3)
+    ]
+    mock_etl_port.get_pipeline_status.return_value = "completed"
+    mock_storage_port.get_predictions.return_value = predictions
+
+    # Execute
+    result = await prediction_service.get_batch_prediction_result(run_id)
+
+    # Assert
+    assert result == predictions
+    mock_storage_port.get_predictions.assert_called_once_with(run_id)
+
+
+@pytest.mark.asyncio
+async def test_get_batch_prediction_result_running(
+    mock_etl_port, mock_storage_port, prediction_service
+):
+    """Test get_batch_prediction_result while the batch is still running."""
+    # Setup
+    mock_etl_port.get_pipeline_status.return_value = "running"
+
+    # Execute
+    result = await prediction_service.get_batch_prediction_result("batch-run-id")
+
+    # Assert
+    assert result == "running"
+    mock_storage_port.get_predictions.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_predict_scores_in_process_and_persists(
+    mock_etl_port, mock_storage_port, mock_model_port, mock_housing_record
+):
+    """Test predict scores with the in-process model and skips the pipeline."""
+    # Setup
+    mock_etl_port.start_prediction_pipeline = AsyncMock()
+    mock_model_port.predict.return_value = 320201.58554044
+    service = PredictionService(etl=mock_etl_port, storage=mock_storage_port, model=mock_model_port)
+
+    # Execute
+    prediction = await service.predict(mock_housing_record)
+
+    # Assert
+    assert prediction.value == 320201.58554044
+    assert prediction.status == PredictionStatus.COMPLETED
+    assert prediction.record_id == mock_housing_record.id
+    assert prediction.run_id.startswith(SYNC_RUN_PREFIX)
+    mock_model_port.predict.assert_called_once_with(mock_housing_record)
+    mock_storage_port.save_housing_record.assert_called_once_with(mock_housing_record)
+    mock_storage_port.save_prediction.assert_called_once_with(prediction)
+    mock_etl_port.start_prediction_pipeline.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_predict_without_model(prediction_service, mock_housing_record):
+    """Test predict fails when no in-process model is configured."""
+    with pytest.raises(PredictionError):
+        await prediction_service.predict(mock_housing_record)
+
+
+@pytest.mark.asyncio
+async def test_get_prediction_result_sync_run_reads_storage(
+    mock_etl_port, mock_storage_port, prediction_service
+):
+    """Test results of in-process predictions are read from storage without Dagster."""
+    # Setup
+    run_id = f"{SYNC_RUN_PREFIX}test"
+    prediction = Prediction(
+        record_id="test-record",
+        value=320201.58554044,
+        created_at=datetime.now(),
+        status=PredictionStatus.COMPLETED,
+        run_id=run_id,
+    )
+    mock_storage_port.get_prediction.return_value = prediction
+
+    # Execute
+    result = await prediction_service.get_prediction_result(run_id)
+
+    # Assert
+    assert result == prediction
+    mock_etl_port.get_pipeline_status.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_predict_batch_scores_and_persists_in_bulk(
+    mock_etl_port, mock_storage_port, mock_model_port, mock_housing_record
+):
+    """Test predict_batch makes one model call and one bulk write per table."""
+    # Setup
+    records = [mock_housing_record, mock_housing_record.model_copy(update={"id": "second"})]
+    mock_model_port.predict_batch = AsyncMock(return_value=[1000.0, 2000.0])
+    service = PredictionService(etl=mock_etl_port, storage=mock_storage_port, model=mock_model_port)
+
+    # Execute
+    predictions = await service.predict_batch(records)
+
+    # Assert
+    assert [prediction.value for prediction in predictions] == [1000.0, 2000.0]
+    assert [prediction.record_id for prediction in predictions] == [records[0].id, "second"]
+    assert len({prediction.run_id for prediction in predictions}) == 2
+    mock_model_port.predict_batch.assert_called_once_with(records)
+    mock_storage_port.save_housing_records.assert_called_once_with(records)
+    mock_storage_port.save_predictions.assert_called_once_with(predictions)
+
+
+@pytest.fixture
+def deduplicating_service(mock_etl_port, mock_storage_port):
+    """Create a PredictionService deduplicating submissions."""
+    mock_etl_port.start_prediction_pipeline = AsyncMock(return_value="new-run-id")
+    return PredictionService(
+        etl=mock_etl_port,
+        storage=mock_storage_port,
+        idempotency_ttl=3600.0,
+        submission_cache=TTLLRUCache(maxsize=100, ttl=3600.0),
+    )
+
+
+@pytest.mark.asyncio
+async def test_submit_prediction_request_records_idempotency_key(
+    mock_etl_port, mock_storage_port, deduplicating_service, mock_housing_record
+):
+    """Test a first submission starts a run and records its key."""
+    # Execute
+    run_id = await deduplicating_service.submit_prediction_request(
+        mock_housing_record, idempotency_key="client-key"
+    )
+
+    # Assert
+    assert run_id == "new-run-id"
+    mock_etl_port.start_prediction_pipeline.assert_called_once_with(
+        mock_housing_record, callback_url=None
+    )
+    submission, _, replaced_run_id = mock_storage_port.save_idempotency_key.call_args.args
+    assert submission.key == "key:client-key"
+    assert submission.run_id == "new-run-id"
+    assert submission.fingerprint is not None
+    assert replaced_run_id is None
+
+
+@pytest.mark.asyncio
+async def test_submissions_with_other_callback_urls_start_their_own_runs(
+    mock_etl_port, mock_storage_port, deduplicating_service, mock_housing_record
+):
+    """Test identical records are not deduplicated onto a run notifying another URL."""
+    # Setup
+    mock_storage_port.get_idempotency_key.return_value = None
+
+    # Execute
+    await deduplicating_service.submit_prediction_request(
+        mock_housing_record, callback_url="https://a.example/hook"
+    )
+    await deduplicating_service.submit_prediction_request(
+        mock_housing_record, callback_url="https://b.example/hook"
+    )
+
+    # Assert
+    assert mock_etl_port.start_prediction_pipeline.call_count == 2
+    assert mock_etl_port.start_prediction_pipeline.call_args.kwargs == {
+        "callback_url": "https://b.example/hook"
+    }
+
+
+@pytest.mark.asyncio
+async def test_submission_with_disallowed_callback_url_is_rejected(
+    mock_etl_port, mock_storage_port, mock_housing_record
+):
+    """Test a callback URL refused by the webhook port is rejected before any run."""
+    # Setup
+    webhook = MagicMock()
+    webhook.check_callback_url = AsyncMock(
+        side_effect=CallbackUrlNotAllowedError("Callback URLs must use https")
+    )
+    service = PredictionService(etl=mock_etl_port, storage=mock_storage_port, webhook=webhook)
+
+    # Execute
+    with pytest.raises(CallbackUrlNotAllowedError):
+        await service.submit_prediction_request(
+            mock_housing_record, callback_url="http://10.0.0.7/hook"
+        )
+
+    # Assert
+    webhook.check_callback_url.assert_awaited_once_with("http://10.0.0.7/hook")
+    mock_etl_port.start_prediction_pipeline.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_resubmitted_record_reuses_run(
+    mock_etl_port, mock_storage_port, deduplicating_service, mock_housing_record
+):
+    """Test an identical record resubmitted with a new ID gets the first run ID."""
+    # Execute
+    first = await deduplicating_service.submit_prediction_request(mock_housing_record)
+    second = await deduplicating_service.submit_prediction_request(
+        mock_housing_record.model_copy(update={"id": "resubmitted"})
+    )
+
+    # Assert
+    assert first == second == "new-run-id"
+    mock_etl_port.start_prediction_pipeline.assert_called_once()
+    mock_storage_port.save_housing_record.assert_called_once()
+    # The second lookup is answered by the in-process cache
+    mock_storage_port.get_idempotency_key.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_known_key_in_storage_reuses_run(
+    mock_etl_port, mock_storage_port, deduplicating_service, mock_housing_record
+):
+    """Test a key recorded by another process is honoured without starting a run."""
+    # Setup
+    mock_storage_port.get_idempotency_key.return_value = SubmissionKey(
+        key="key:client-key", run_id="existing-run-id"
+    )
+
+    # Execute
+    run_id = await deduplicating_service.submit_prediction_request(
+        mock_housing_record, idempotency_key="client-key"
+    )
+
+    # Assert
+    assert run_id == "existing-run-id"
+    mock_etl_port.start_prediction_pipeline.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_known_key_is_cached_for_its_remaining_lifetime(
+    mock_storage_port, deduplicating_service, mock_housing_record
+):
+    """Test a key read from storage expires from the cache when it expires in storage."""
+    # Setup, the key was recorded 3000 of its 3600 seconds ago
+    mock_storage_port.get_idempotency_key.return_value = SubmissionKey(
+        key="key:client-key",
+        run_id="existing-run-id",
+        created_at=datetime.utcnow() - timedelta(seconds=3000),
+    )
+
+    # Execute
+    await deduplicating_service.submit_prediction_request(
+        mock_housing_record, idempotency_key="client-key"
+    )
+
+    # Assert
+    _, expires_at = deduplicating_service.submission_cache._entries["key:client-key"]
+    assert 590 < expires_at - time.monotonic() <= 600
+
+
+@pytest.mark.asyncio
+async def test_key_of_failed_run_starts_a_new_run(
+    mock_etl_port, mock_storage_port, deduplicating_service, mock_housing_record
+):
+    """Test a submission whose earlier run failed is retried instead of deduplicated."""
+    # Setup
+    mock_storage_port.get_idempotency_key.return_value = SubmissionKey(
+        key=f"record:{mock_housing_record.fingerprint()}", run_id="failed-run-id"
+    )
+    mock_storage_port.get_run_statuses.return_value = {"failed-run-id": "failed"}
+
+    # Execute
+    run_id = await deduplicating_service.submit_prediction_request(mock_housing_record)
+
+    # Assert
+    assert run_id == "new-run-id"
+    mock_etl_port.start_prediction_pipeline.assert_called_once()
+    submission, _, replaced_run_id = mock_storage_port.save_idempotency_key.call_args.args
+    assert submission.run_id == "new-run-id"
+    assert replaced_run_id == "failed-run-id"
+
+
+@pytest.mark.asyncio
+async def test_key_reused_for_another_request_is_rejected(
+    mock_etl_port, deduplicating_service, mock_housing_record
+):
+    """Test an idempotency key sent again with another body does not return its run."""
+    # Setup
+    await deduplicating_service.submit_prediction_request(
+        mock_housing_record, idempotency_key="client-key"
+    )
+    other_record = mock_housing_record.model_copy(update={"median_income": 1.0})
+
+    # Execute
+    with pytest.raises(IdempotencyKeyReusedError):
+        await deduplicating_service.submit_prediction_request(
+            other_record, idempotency_key="client-key"
+        )
+
+    # Assert
+    mock_etl_port.start_prediction_pipeline.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_submissions_start_one_run(
+    mock_etl_port, deduplicating_service, mock_housing_record
+):
+    """Test identical submissions arriving together share a single run."""
+    # Execute
+    run_ids = await asyncio.gather(
+        *(deduplicating_service.submit_prediction_request(mock_housing_record) for _ in range(5))
+    )
+
+    # Assert
+    assert set(run_ids) == {"new-run-id"}
+    mock_etl_port.start_prediction_pipeline.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_lost_race_returns_winning_run(
+    mock_storage_port, deduplicating_service, mock_housing_record
+):
+    """Test the run recorded first wins when another process saved the key meanwhile."""
+    # Setup
+    mock_storage_port.save_idempotency_key.side_effect = None
+    mock_storage_port.save_idempotency_key.return_value = SubmissionKey(
+        key=f"record:{mock_housing_record.fingerprint()}", run_id="winning-run-id"
+    )
+
+    # Execute
+    run_id = await deduplicating_service.submit_prediction_request(mock_housing_record)
+
+    # Assert
+    assert run_id == "winning-run-id"
+
+
+@pytest.fixture
+def caching_service(mock_etl_port, mock_storage_port, mock_model_port):
+    """Create a PredictionService caching completed predictions."""
+    mock_etl_port.get_pipeline_status = AsyncMock(return_value="completed")
+    mock_model_port.get_version.return_value = "model-v1"
+    return PredictionService(
+        etl=mock_etl_port,
+        storage=mock_storage_port,
+        model=mock_model_port,
+        result_cache=TTLLRUCache(maxsize=100, ttl=3600.0),
+    )
+
+
+@pytest.mark.asyncio
+async def test_completed_prediction_is_served_from_cache(
+    mock_storage_port, caching_service, mock_housing_record
+):
+    """Test a completed prediction is cached for records with the same features."""
+    # Setup
+    prediction = Prediction(
+        record_id=mock_housing_record.id,
+        value=320201.58554044,
+        created_at=datetime.now(),
+        status=PredictionStatus.COMPLETED,
+        record=mock_housing_record,
+        run_id="test-run-id",
+        model_version="model-v1",
+    )
+    mock_storage_port.get_prediction.return_value = prediction
+    repeat = mock_housing_record.model_copy(update={"id": "repeat"})
+
+    # Execute
+    before = caching_service.get_cached_prediction(repeat)
+    await caching_service.get_prediction_result("test-run-id")
+    after = caching_service.get_cached_prediction(repeat)
+
+    # Assert
+    assert before is None
+    assert after == prediction
+
+
+@pytest.mark.asyncio
+async def test_cache_is_invalidated_when_model_changes(
+    mock_model_port, caching_service, mock_housing_record
+):
+    """Test predictions of a previous model version are never served."""
+    # Setup
+    mock_model_port.predict.return_value = 320201.58554044
+    await caching_service.predict(mock_housing_record)
+    assert caching_service.get_cached_prediction(mock_housing_record) is not None
+
+    # Execute
+    mock_model_port.get_version.return_value = "model-v2"
+
+    # Assert
+    assert caching_service.get_cached_prediction(mock_housing_record) is None
+    assert len(caching_service.result_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_prediction_of_another_model_is_not_cached(
+    mock_storage_port, caching_service, mock_housing_record
+):
+    """Test a pipeline result made by an earlier or unknown model is not cached."""
+    # Setup
+    predictions = {
+        run_id: Prediction(
+            record_id=mock_housing_record.id,
+            value=320201.58554044,
+            created_at=datetime.now(),
+            status=PredictionStatus.COMPLETED,
+            record=mock_housing_record,
+            run_id=run_id,
+            model_version=model_version,
+        )
+        for run_id, model_version in (("old-run-id", "model-v0"), ("unknown-run-id", None))
+    }
+    mock_storage_port.get_prediction.side_effect = predictions.get
+
+    # Execute
+    for run_id in predictions:
+        assert await caching_service.get_prediction_result(run_id) == predictions[run_id]
+
+    # Assert
+    assert caching_service.get_cached_prediction(mock_housing_record) is None
+
+
+@pytest.mark.asyncio
+async def test_in_process_prediction_records_model_version(
+    mock_model_port, mock_storage_port, caching_service, mock_housing_record
+):
+    """Test a prediction scored in-process is stored with the version that made it."""
+    mock_model_port.predict.return_value = 320201.58554044
+
+    prediction = await caching_service.predict(mock_housing_record)
+
+    assert prediction.model_version == "model-v1"
+    assert mock_storage_port.save_prediction.call_args.args[0].model_version == "model-v1"
+
+
+def test_cache_is_bypassed_without_model_version(
+    mock_model_port, caching_service, mock_housing_record
+):
+    """Test the cache is skipped when the model version cannot be read."""
+    mock_model_port.get_version.side_effect = FileNotFoundError("Model file not found")
+
+    assert caching_service.get_cached_prediction(mock_housing_record) is None
+
+
+@pytest.mark.asyncio
+async def test_submission_rejected_when_pipeline_overloaded(
+    mock_etl_port, mock_storage_port, mock_housing_record
+):
+    """Test no run is started and nothing is stored when admission is refused."""
+    # Setup
+    mock_etl_port.start_prediction_pipeline = AsyncMock(return_value="new-run-id")
+    admission = AsyncMock()
+    admission.admit.side_effect = PipelineOverloadedError("Overloaded", retry_after=5.0)
+    service = PredictionService(etl=mock_etl_port, storage=mock_storage_port, admission=admission)
+
+    # Execute
+    with pytest.raises(PipelineOverloadedError):
+        await service.submit_prediction_request(mock_housing_record)
+
+    # Assert
+    mock_etl_port.start_prediction_pipeline.assert_not_called()
+    mock_storage_port.save_housing_record.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_submission_stores_record_while_run_starts(
+    mock_etl_port, mock_storage_port, mock_housing_record
+):
+    """Test the record is stored while the run is submitted, not after."""
+    # Setup: the run only starts once the record is being stored
+    loop = asyncio.get_running_loop()
+    storing = asyncio.Event()
+    mock_storage_port.save_housing_record.side_effect = lambda _: loop.call_soon_threadsafe(
+        storing.set
+    )
+
+    async def start_prediction_pipeline(record, callback_url=None):
+        await storing.wait()
+        return "new-run-id"
+
+    mock_etl_port.start_prediction_pipeline = start_prediction_pipeline
+    service = PredictionService(etl=mock_etl_port, storage=mock_storage_port)
+
+    # Execute
+    run_id = await asyncio.wait_for(service.submit_prediction_request(mock_housing_record), 1.0)
+
+    # Assert
+    assert run_id == "new-run-id"
+    mock_storage_port.save_housing_record.assert_called_once_with(mock_housing_record)
+
+
+@pytest.mark.asyncio
+async def test_slow_storage_does_not_block_event_loop(
+    mock_etl_port, mock_storage_port, mock_housing_record
+):
+    """Test other tasks keep running while a storage call blocks."""
+    # Setup
+    mock_etl_port.start_prediction_pipeline = AsyncMock(return_value="new-run-id")
+    mock_storage_port.save_housing_record.side_effect = lambda _: time.sleep(0.2)
+    service = PredictionService(etl=mock_etl_port, storage=mock_storage_port)
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    # Execute
+    ticker = asyncio.create_task(tick())
+    await service.submit_prediction_request(mock_housing_record)
+    ticker.cancel()
+
+    # Assert
+    assert ticks >= 5
+
+
+def test_list_predictions_reads_storage(prediction_service, mock_storage_port):
+    """Test listings are read lazily from storage."""
+    # Setup
+    mock_storage_port.list_predictions.return_value = iter([])
+    filters = PredictionFilter(min_value=100000.0, max_value=200000.0)
+
+    # Execute
+    result = prediction_service.list_predictions(filters, 50)
+
+    # Assert
+    assert list(result) == []
+    mock_storage_port.list_predictions.assert_called_once_with(filters, 50, None)
+
+
+def test_list_predictions_rejects_inverted_value_range(prediction_service, mock_storage_port):
+    """Test a value range that cannot match anything is rejected."""
+    with pytest.raises(ValueError):
+        prediction_service.list_predictions(
+            PredictionFilter(min_value=200000.0, max_value=100000.0), 50
+        )
+
+    mock_storage_port.list_predictions.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_prediction_results_batches_lookups(
+    prediction_service, mock_etl_port, mock_storage_port, mock_housing_record
+):
+    """Test many runs are resolved with one ETL query and one storage query."""
+    # Setup
+    completed = Prediction(
+        record_id=mock_housing_record.id,
+        value=320201.58,
+        created_at=datetime.now(),
+        status=PredictionStatus.COMPLETED,
+        run_id="run-done",
+    )
+    in_process = completed.model_copy(update={"run_id": f"{SYNC_RUN_PREFIX}1"})
+    mock_etl_port.get_pipeline_statuses = AsyncMock(
+        return_value={"run-done": "completed", "run-lost": "completed", "run-queued": "pending"}
+    )
+    mock_storage_port.get_predictions_by_run_ids.return_value = {
+        "run-done": completed,
+        f"{SYNC_RUN_PREFIX}1": in_process,
+    }
+
+    # Execute
+    results = await prediction_service.get_prediction_results(
+        ["run-done", "run-lost", "run-queued", "run-unknown", f"{SYNC_RUN_PREFIX}1", "run-done"]
+    )
+
+    # Assert
+    assert results == {
+        "run-done": completed,
+        "run-lost": "failed",
+        "run-queued": "pending",
+        "run-unknown": "not_found",
+        f"{SYNC_RUN_PREFIX}1": in_process,
+    }
+    mock_etl_port.get_pipeline_statuses.assert_awaited_once_with(
+        ["run-done", "run-lost", "run-queued", "run-unknown"]
+    )
+    mock_storage_port.get_predictions_by_run_ids.assert_called_once_with(
+        ["run-done", "run-lost", f"{SYNC_RUN_PREFIX}1"]
+    )
+
+
+@pytest.fixture
+def run_caching_service(mock_etl_port, mock_storage_port):
+    """Create a PredictionService caching the results of finished runs."""
+    mock_etl_port.get_pipeline_status = AsyncMock()
+    return PredictionService(
+        etl=mock_etl_port,
+        storage=mock_storage_port,
+        run_cache=TTLLRUCache(maxsize=100, ttl=3600.0),
+    )
+
+
+@pytest.mark.asyncio
+async def test_finished_run_is_read_once(
+    mock_etl_port, mock_storage_port, run_caching_service, mock_housing_record
+):
+    """Test repeated reads of a completed or failed run query neither Dagster nor storage."""
+    # Setup
+    prediction = Prediction(
+        record_id=mock_housing_record.id,
+        value=320201.58,
+        created_at=datetime.now(),
+        status=PredictionStatus.COMPLETED,
+        run_id="run-done",
+    )
+    mock_storage_port.get_prediction.return_value = prediction
+    mock_etl_port.get_pipeline_status.side_effect = lambda run_id: (
+        "completed" if run_id == "run-done" else "failed"
+    )
+
+    # Execute
+    for _ in range(3):
+        assert await run_caching_service.get_prediction_result("run-done") == prediction
+        assert await run_caching_service.get_prediction_result("run-failed") == "failed"
+
+    # Assert
+    assert mock_etl_port.get_pipeline_status.call_count == 2
+    mock_storage_port.get_prediction.assert_called_once_with("run-done")
+    assert run_caching_service.run_cache.stats.hits == 4
+
+
+@pytest.mark.asyncio
+async def test_unfinished_and_unreadable_runs_are_not_cached(
+    mock_etl_port, mock_storage_port, run_caching_service
+):
+    """Test runs in progress, or failed only because their result is missing, are read again."""
+    # Setup
+    mock_etl_port.get_pipeline_status.side_effect = ["running", "completed", "completed"]
+    mock_storage_port.get_prediction.return_value = None
+
+    # Execute
+    assert await run_caching_service.get_prediction_result("run-id") == "running"
+    assert await run_caching_service.get_prediction_result("run-id") == "failed"
+    assert await run_caching_service.get_prediction_result("run-id") == "failed"
+
+    # Assert
+    assert mock_etl_port.get_pipeline_status.call_count == 3
+    assert len(run_caching_service.run_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_prediction_results_only_looks_up_uncached_runs(
+    mock_etl_port, mock_storage_port, run_caching_service, mock_housing_record
+):
+    """Test finished runs cached by an earlier lookup are left out of the queries."""
+    # Setup
+    prediction = Prediction(
+        record_id=mock_housing_record.id,
+        value=320201.58,
+        created_at=datetime.now(),
+        status=PredictionStatus.COMPLETED,
+        run_id="run-done",
+    )
+    mock_etl_port.get_pipeline_statuses = AsyncMock(
+        return_value={"run-done": "completed", "run-failed": "failed", "run-queued": "pending"}
+    )
+    mock_storage_port.get_predictions_by_run_ids.return_value = {"run-done": prediction}
+    run_ids = ["run-done", "run-failed", "run-queued"]
+    first = await run_caching_service.get_prediction_results(run_ids)
+
+    # Execute
+    second = await run_caching_service.get_prediction_results(run_ids)
+
+    # Assert
+    assert second == first
+    mock_etl_port.get_pipeline_statuses.assert_awaited_with(["run-queued"])
+    mock_storage_port.get_predictions_by_run_ids.assert_called_once_with(["run-done"])
+
+
+@pytest.fixture
+def batching_service(mock_etl_port, mock_storage_port):
+    """Create a PredictionService micro-batching submissions."""
+    mock_etl_port.start_prediction_pipeline = AsyncMock(return_value="single-run-id")
+    mock_etl_port.start_batch_prediction_pipeline = AsyncMock(return_value="batch-run-id")
+    mock_etl_port.get_pipeline_status = AsyncMock(return_value="completed")
+    return PredictionService(
+        etl=mock_etl_port,
+        storage=mock_storage_port,
+        submission_batch_max_size=10,
+        submission_batch_max_wait=0.01,
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_submissions_start_one_batch_run(
+    mock_etl_port, mock_storage_port, batching_service, mock_housing_record
+):
+    """Test submissions arriving together share a batch run, each with its own run ID."""
+    # Setup
+    records = [mock_housing_record.model_copy(update={"id": f"record-{i}"}) for i in range(3)]
+
+    # Execute
+    run_ids = await asyncio.gather(
+        *(batching_service.submit_prediction_request(record) for record in records)
+    )
+
+    # Assert
+    assert run_ids == [f"batch-run-id{BATCH_HANDLE_SEPARATOR}record-{i}" for i in range(3)]
+    mock_etl_port.start_batch_prediction_pipeline.assert_awaited_once_with(records)
+    mock_etl_port.start_prediction_pipeline.assert_not_called()
+    # The batch run stores the records itself
+    mock_storage_port.save_housing_record.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_micro_batch_is_admitted_as_one_run(
+    mock_etl_port, mock_storage_port, mock_housing_record
+):
+    """Test a micro-batch reserves room for the one run it starts, not one per record."""
+    # Setup
+    mock_etl_port.start_batch_prediction_pipeline = AsyncMock(return_value="batch-run-id")
+    admission = AsyncMock()
+    service = PredictionService(
+        etl=mock_etl_port,
+        storage=mock_storage_port,
+        admission=admission,
+        submission_batch_max_size=10,
+        submission_batch_max_wait=0.01,
+    )
+    records = [mock_housing_record.model_copy(update={"id": f"record-{i}"}) for i in range(3)]
+
+    # Execute
+    await asyncio.gather(*(service.submit_prediction_request(record) for record in records))
+
+    # Assert
+    admission.admit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_micro_batch_rejected_when_pipeline_overloaded(
+    mock_etl_port, mock_storage_port, mock_model_port, mock_housing_record
+):
+    """Test the submissions of a refused micro-batch are rejected, not scored in-process."""
+    # Setup
+    mock_etl_port.start_batch_prediction_pipeline = AsyncMock(return_value="batch-run-id")
+    admission = AsyncMock()
+    admission.admit.side_effect = PipelineOverloadedError("Overloaded", retry_after=5.0)
+    service = PredictionService(
+        etl=mock_etl_port,
+        storage=mock_storage_port,
+        model=mock_model_port,
+        admission=admission,
+        submission_batch_max_size=10,
+        submission_batch_max_wait=0.01,
+    )
+
+    # Execute
+    with pytest.raises(PipelineOverloadedError):
+        await service.submit_prediction_request(mock_housing_record)
+
+    # Assert
+    mock_etl_port.start_batch_prediction_pipeline.assert_not_called()
+    assert service.fallbacks == 0
+
+
+@pytest.mark.asyncio
+async def test_submission_with_callback_url_is_not_batched(
+    mock_etl_port, batching_service, mock_housing_record
+):
+    """Test submissions to be notified get a single run, as batch runs do not notify."""
+    run_id = await batching_service.submit_prediction_request(
+        mock_housing_record, callback_url="https://client.example/hook"
+    )
+
+    assert run_id == "single-run-id"
+    mock_etl_port.start_batch_prediction_pipeline.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_batched_submission_resolves_to_its_prediction(
+    mock_etl_port, mock_storage_port, batching_service, mock_housing_record
+):
+    """Test the run ID of a batched submission reads the prediction of its record."""
+    # Setup
+    prediction = Prediction(
+        record_id="record-1",
+        value=320201.58,
+        created_at=datetime.now(),
+        status=PredictionStatus.COMPLETED,
+        run_id="batch-run-id",
+    )
+    mock_storage_port.get_predictions_by_records.return_value = {
+        ("batch-run-id", "record-1"): prediction
+    }
+    handle = f"batch-run-id{BATCH_HANDLE_SEPARATOR}record-1"
+
+    # Execute
+    result = await batching_service.get_prediction_result(handle)
+
+    # Assert
+    assert result.value == prediction.value
+    assert result.run_id == handle
+    mock_etl_port.get_pipeline_status.assert_awaited_once_with("batch-run-id")
+    mock_storage_port.get_predictions_by_records.assert_called_once_with(
+        [("batch-run-id", "record-1")]
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_prediction_results_shares_batch_run_status(
+    mock_etl_port, mock_storage_port, batching_service
+):
+    """Test batched submissions of the same run are looked up with their batch run."""
+    # Setup
+    handles = [f"batch-run-id{BATCH_HANDLE_SEPARATOR}record-{i}" for i in range(2)]
+    mock_etl_port.get_pipeline_statuses = AsyncMock(return_value={"batch-run-id": "running"})
+
+    # Execute
+    results = await batching_service.get_prediction_results(handles + ["other-run"])
+
+    # Assert
+    assert results == {handles[0]: "running", handles[1]: "running", "other-run": "not_found"}
+    mock_etl_port.get_pipeline_statuses.assert_awaited_once_with(["batch-run-id", "other-run"])
+    mock_storage_port.get_predictions_by_records.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_submission_falls_back_to_in_process_scoring(
+    mock_etl_port, mock_storage_port, mock_model_port, mock_housing_record
+):
+    """Test a submission is scored in-process when its pipeline run cannot be started."""
+    # Setup
+    mock_etl_port.start_prediction_pipeline = AsyncMock(side_effect=CircuitOpenError("open"))
+    mock_model_port.predict.return_value = 320201.58
+    service = PredictionService(etl=mock_etl_port, storage=mock_storage_port, model=mock_model_port)
+
+    # Execute
+    run_id = await service.submit_prediction_request(
+        mock_housing_record, callback_url="https://client.example/hook"
+    )
+
+    # Assert
+    assert run_id.startswith(SYNC_RUN_PREFIX)
+    assert service.fallbacks == 1
+    # The record was stored along with the attempt to start the run
+    mock_storage_port.save_housing_record.assert_called_once_with(mock_housing_record)
+    prediction = mock_storage_port.save_prediction.call_args.args[0]
+    delivery = mock_storage_port.save_prediction.call_args.kwargs["delivery"]
+    assert prediction.run_id == run_id
+    assert prediction.value == 320201.58
+    assert delivery.callback_url == "https://client.example/hook"
+
+
+@pytest.mark.asyncio
+async def test_batched_submission_falls_back_to_in_process_scoring(
+    mock_etl_port, mock_storage_port, mock_model_port, mock_housing_record
+):
+    """Test records of a batch run that cannot be started are scored and stored in-process."""
+    # Setup
+    mock_etl_port.start_batch_prediction_pipeline = AsyncMock(side_effect=CircuitOpenError("open"))
+    mock_model_port.predict.return_value = 320201.58
+    service = PredictionService(
+        etl=mock_etl_port,
+        storage=mock_storage_port,
+        model=mock_model_port,
+        submission_batch_max_size=10,
+        submission_batch_max_wait=0.01,
+    )
+
+    # Execute
+    run_id = await service.submit_prediction_request(mock_housing_record)
+
+    # Assert
+    assert run_id.startswith(SYNC_RUN_PREFIX)
+    assert service.fallbacks == 1
+    mock_storage_port.save_housing_record.assert_called_once_with(mock_housing_record)
+    mock_storage_port.save_prediction.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_fallbacks_give_back_their_admission(
+    mock_etl_port, mock_storage_port, mock_model_port, mock_housing_record
+):
+    """Test runs that could not be started do not keep their room in the backlog."""
+    # Setup
+    mock_etl_port.start_prediction_pipeline = AsyncMock(
+        side_effect=PipelineUnavailableError("down")
+    )
+    mock_etl_port.get_active_run_count = AsyncMock(return_value=0)
+    mock_model_port.predict.return_value = 320201.58
+    admission = AdmissionController(mock_etl_port, max_backlog=2, refresh_interval=3600.0)
+    service = PredictionService(
+        etl=mock_etl_port, storage=mock_storage_port, model=mock_model_port, admission=admission
+    )
+
+    # Execute
+    for _ in range(5):
+        await service.submit_prediction_request(mock_housing_record)
+
+    # Assert
+    assert service.fallbacks == 5
+    assert admission.stats.rejected == 0
+
+
+@pytest.mark.asyncio
+async def test_submission_does_not_fall_back_on_pipeline_misconfiguration(
+    mock_etl_port, mock_storage_port, mock_model_port, mock_housing_record
+):
+    """Test errors other than the pipeline being unavailable are raised, not hidden."""
+    # Setup
+    error = PipelineError("Dagster GraphQL error: Unknown job housing_prediction_jb")
+    mock_etl_port.start_prediction_pipeline = AsyncMock(side_effect=error)
+    mock_etl_port.start_batch_prediction_pipeline = AsyncMock(side_effect=error)
+    service = PredictionService(
+        etl=mock_etl_port,
+        storage=mock_storage_port,
+        model=mock_model_port,
+        submission_batch_max_size=10,
+        submission_batch_max_wait=0.01,
+    )
+
+    # Execute
+    with pytest.raises(PipelineError, match="Unknown job"):
+        await service.submit_prediction_request(mock_housing_record)
+    with pytest.raises(PipelineError, match="Unknown job"):
+        await service.submit_prediction_request(
+            mock_housing_record, callback_url="https://client.example/hook"
+        )
+
+    # Assert
+    assert service.fallbacks == 0
+    mock_model_port.predict.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_submission_without_model_does_not_fall_back(
+    mock_etl_port, prediction_service, mock_housing_record
+):
+    """Test the pipeline error is raised when no in-process model is configured."""
+    mock_etl_port.start_prediction_pipeline = AsyncMock(side_effect=CircuitOpenError("open"))
+
+    with pytest.raises(CircuitOpenError):
+        await prediction_service.submit_prediction_request(mock_housing_record)
+
+    assert prediction_service.fallbacks == 0
+
+
+@pytest.mark.asyncio
+async def test_get_prediction_result_reads_recorded_status(
+    mock_etl_port, mock_storage_port, prediction_service
+):
+    """Test the status recorded by a run in storage is read without querying Dagster."""
+    mock_storage_port.get_run_statuses.return_value = {"test-run-id": "running"}
+
+    result = await prediction_service.get_prediction_result("test-run-id")
+
+    assert result == "running"
+    mock_storage_port.get_run_statuses.assert_called_once_with(["test-run-id"], None)
+    mock_etl_port.get_pipeline_status.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_prediction_result_stale_status_reads_pipeline(
+    mock_etl_port, mock_storage_port, mock_housing_record
+):
+    """Test a run whose recorded status went stale is read from Dagster instead."""
+    # Setup: the stale "running" row is left out by storage
+    mock_storage_port.get_run_statuses.return_value = {}
+    mock_etl_port.get_pipeline_status = AsyncMock(return_value="failed")
+    service = PredictionService(
+        etl=mock_etl_port, storage=mock_storage_port, run_status_stale_after=300.0
+    )
+
+    # Execute
+    result = await service.get_prediction_result("test-run-id")
+
+    # Assert
+    assert result == "failed"
+    run_ids, stale_before = mock_storage_port.get_run_statuses.call_args.args
+    assert run_ids == ["test-run-id"]
+    age = (datetime.utcnow() - stale_before).total_seconds()
+    assert 300.0 <= age < 310.0
+    mock_etl_port.get_pipeline_status.assert_awaited_once_with("test-run-id")
+
+
+@pytest.mark.asyncio
+async def test_get_prediction_result_unrecorded_run_reads_pipeline(
+    mock_etl_port, mock_storage_port, prediction_service
+):
+    """Test runs that recorded no status, or whose status cannot be read, ask Dagster."""
+    mock_storage_port.get_run_statuses.side_effect = StorageError("Database error")
+    mock_etl_port.get_pipeline_status.return_value = "pending"
+
+    result = await prediction_service.get_prediction_result("test-run-id")
+
+    assert result == "pending"
+    mock_etl_port.get_pipeline_status.assert_awaited_once_with("test-run-id")
+
+
+@pytest.mark.asyncio
+async def test_get_prediction_results_only_asks_pipeline_for_unrecorded_runs(
+    mock_etl_port, mock_storage_port, prediction_service
+):
+    """Test Dagster is only queried for the runs without a recorded status."""
+    mock_storage_port.get_run_statuses.return_value = {"run-recorded": "running"}
+    mock_etl_port.get_pipeline_statuses = AsyncMock(return_value={"run-old": "pending"})
+
+    results = await prediction_service.get_prediction_results(["run-recorded", "run-old"])
+
+    assert results == {"run-recorded": "running", "run-old": "pending"}
+    mock_etl_port.get_pipeline_statuses.assert_awaited_once_with(["run-old"])
+
+
+@pytest.mark.asyncio
+async def test_submission_records_pending_run(
+    mock_etl_port, mock_storage_port, prediction_service, mock_housing_record
+):
+    """Test a started run is recorded as pending, and a failure to do so is not raised."""
+    mock_etl_port.start_prediction_pipeline = AsyncMock(return_value="test-run-id")
+    mock_storage_port.save_run_status.side_effect = StorageError("Database error")
+
+    run_id = await prediction_service.submit_prediction_request(mock_housing_record)
+
+    assert run_id == "test-run-id"
+    mock_storage_port.save_run_status.assert_called_once_with("test-run-id", "pending")
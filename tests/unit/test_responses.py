@@ -0,0 +1,103 @@
+"""Unit tests for the FastAPI response classes."""
+import json
+from datetime import datetime
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from starlette.requests import ClientDisconnect
+
+from src.adapter.driving.fastapi.models import (
+    BatchPredictionItem,
+    BatchPredictionResultResponse,
+    PredictionSubmissionResponse,
+)
+from src.adapter.driving.fastapi.responses import (
+    ClosingStreamingResponse,
+    ModelJSONResponse,
+    completed_etag,
+    completed_headers,
+    etag_matches,
+)
+from src.core.domain.entities.prediction import PredictionStatus
+
+
+def test_model_is_rendered_like_jsonable_encoder():
+    """Test a response model renders the same JSON as the two-pass encoding."""
+    model = BatchPredictionResultResponse(
+        run_id="run-1",
+        status=PredictionStatus.COMPLETED,
+        items=[
+            BatchPredictionItem(record_id=f"record-{i}", prediction=float(i) * 1000.5)
+            for i in range(3)
+        ],
+        completed_at=datetime(2024, 1, 1, 12, 30),
+    )
+
+    response = ModelJSONResponse(model)
+
+    assert json.loads(response.body) == jsonable_encoder(model, exclude_none=True)
+    assert response.media_type == "application/json"
+
+
+def test_none_fields_are_excluded():
+    """Test unset optional fields are left out of the body."""
+    model = PredictionSubmissionResponse(run_id="run-1", status=PredictionStatus.PENDING)
+
+    body = json.loads(ModelJSONResponse(model).body)
+
+    assert body == {"run_id": "run-1", "status": "pending"}
+
+
+def test_plain_content_is_rendered():
+    """Test content that is not a model is still rendered as JSON."""
+    response = ModelJSONResponse({"status": "healthy"})
+
+    assert json.loads(response.body) == {"status": "healthy"}
+
+
+@pytest.mark.asyncio
+async def test_streamed_content_is_closed_when_client_disconnects():
+    """Test the content is closed as soon as the client is gone, not once collected."""
+    closed = []
+
+    def content():
+        try:
+            while True:
+                yield b"chunk"
+        finally:
+            closed.append(True)
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            raise OSError("Client disconnected")
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    response = ClosingStreamingResponse(content())
+    scope = {"type": "http", "asgi": {"spec_version": "2.4"}}
+    with pytest.raises(ClientDisconnect):
+        await response(scope, receive, send)
+
+    assert closed == [True]
+
+
+def test_completed_headers():
+    """Test a completed prediction is tagged and cacheable for good."""
+    headers = completed_headers("run-1", datetime(2024, 4, 10, 12, 0, 5))
+
+    assert headers == {
+        "ETag": '"completed-run-1"',
+        "Last-Modified": "Wed, 10 Apr 2024 12:00:05 GMT",
+        "Cache-Control": "public, max-age=31536000, immutable",
+    }
+
+
+def test_etag_matches():
+    """Test If-None-Match lists and weak tags are matched."""
+    etag = completed_etag("run-1")
+
+    assert etag_matches('"completed-run-1"', etag)
+    assert etag_matches('"other", W/"completed-run-1"', etag)
+    assert not etag_matches('"completed-run-2"', etag)
+    assert not etag_matches("*", etag)
@@ -1,7 +1,12 @@
 """Unit tests for SklearnModelAdapter."""
+import asyncio
+import os
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import joblib
 import numpy as np
 import pytest
 
@@ -187,6 +192,69 @@ async def test_predict_error(adapter, mock_sklearn_model_wrapper, mock_housing_r
     assert "Error making prediction" in str(excinfo.value)
 
 
+@pytest.mark.asyncio
+async def test_predict_batch_single_model_call(
+    adapter, mock_sklearn_model_wrapper, mock_housing_record
+):
+    """Test batch prediction scores every record with one model call."""
+    # Set the model in the adapter
+    adapter._model = mock_sklearn_model_wrapper
+    mock_sklearn_model_wrapper.model.predict = MagicMock(return_value=np.array([1.0, 2.0, 3.0]))
+
+    # Call the method
+    result = await adapter.predict_batch([mock_housing_record] * 3)
+
+    # Verify the result
+    assert result == [1.0, 2.0, 3.0]
+
+    # Verify the model received a single 3x13 feature matrix
+    mock_sklearn_model_wrapper.model.predict.assert_called_once()
+    assert mock_sklearn_model_wrapper.model.predict.call_args[0][0].shape == (3, 13)
+
+
+@pytest.mark.asyncio
+async def test_model_runs_off_the_event_loop(
+    adapter, mock_joblib, mock_sklearn_model, mock_housing_record
+):
+    """Test loading the model and predicting leave the event loop thread free."""
+    threads = []
+
+    def load(path):
+        threads.append(threading.get_ident())
+        return mock_sklearn_model
+
+    def predict(x):
+        threads.append(threading.get_ident())
+        return np.array([1.0] * len(x))
+
+    mock_joblib.load.side_effect = load
+    mock_sklearn_model.predict.side_effect = predict
+
+    await adapter.predict(mock_housing_record)
+    await adapter.predict_batch([mock_housing_record] * 2)
+
+    assert len(threads) == 3
+    assert threading.get_ident() not in threads
+
+
+@pytest.mark.asyncio
+async def test_concurrent_predictions_load_model_once(
+    adapter, mock_joblib, mock_sklearn_model, mock_housing_record
+):
+    """Test predictions waiting for the model share a single load of it."""
+
+    def load(path):
+        time.sleep(0.05)
+        return mock_sklearn_model
+
+    mock_joblib.load.side_effect = load
+
+    results = await asyncio.gather(*(adapter.predict(mock_housing_record) for _ in range(5)))
+
+    assert results == [320201.58554044] * 5
+    mock_joblib.load.assert_called_once()
+
+
 def test_record_to_features(mock_housing_record):
     """Test conversion of housing record to feature array."""
     # Call the method
@@ -203,3 +271,72 @@ def test_record_to_features(mock_housing_record):
     assert features[1] == 38.01  # latitude
     assert features[8] == 0  # first ocean proximity bit
     assert features[12] == 1  # last ocean proximity bit (NEAR OCEAN)
+
+
+def test_get_version_changes_with_model_file(tmp_path):
+    """Test the model version changes when the model file is replaced."""
+    # Setup
+    model_file = tmp_path / "model.joblib"
+    model_file.write_bytes(b"first model")
+    adapter = SklearnModelAdapter(str(model_file))
+
+    # Execute
+    first_version = adapter.get_version()
+    model_file.write_bytes(b"second, retrained model")
+    second_version = adapter.get_version()
+
+    # Assert
+    assert first_version != second_version
+    assert second_version == adapter.get_version()
+
+
+def test_get_version_file_not_found(tmp_path):
+    """Test the model version requires the model file."""
+    adapter = SklearnModelAdapter(str(tmp_path / "missing.joblib"))
+
+    with pytest.raises(FileNotFoundError):
+        adapter.get_version()
+
+
+class ConstantModel:
+    """Model predicting the same value for every row."""
+
+    def __init__(self, value: float):
+        self.value = value
+
+    def predict(self, x: np.ndarray) -> np.ndarray:
+        return np.full(len(x), self.value)
+
+
+@pytest.mark.asyncio
+async def test_model_is_reloaded_when_its_file_changes(tmp_path, mock_housing_record):
+    """Test predictions are made by the new model as soon as the file is replaced."""
+    # Setup
+    model_file = tmp_path / "model.joblib"
+    joblib.dump(ConstantModel(1.0), model_file)
+    adapter = SklearnModelAdapter(str(model_file))
+    assert await adapter.predict(mock_housing_record) == 1.0
+
+    # Execute
+    joblib.dump(ConstantModel(2.0), model_file)
+    os.utime(model_file, ns=(0, 0))
+
+    # Assert
+    assert await adapter.predict(mock_housing_record) == 2.0
+    assert await adapter.predict_batch([mock_housing_record]) == [2.0]
+
+
+@pytest.mark.asyncio
+async def test_model_is_kept_while_its_file_is_missing(tmp_path, mock_housing_record):
+    """Test the loaded model keeps serving while its file is being replaced."""
+    # Setup
+    model_file = tmp_path / "model.joblib"
+    joblib.dump(ConstantModel(1.0), model_file)
+    adapter = SklearnModelAdapter(str(model_file))
+    await adapter.predict(mock_housing_record)
+
+    # Execute
+    model_file.unlink()
+
+    # Assert
+    assert await adapter.predict(mock_housing_record) == 1.0
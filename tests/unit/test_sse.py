@@ -0,0 +1,60 @@
+"""Unit tests for the Server-Sent Events encoding."""
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+
+from src.adapter.driving.fastapi.models import (
+    PredictionCompletedResponse,
+    PredictionPendingResponse,
+)
+from src.adapter.driving.fastapi.sse import event_stream, format_event
+from src.core.domain.entities.prediction import PredictionStatus
+
+
+def test_format_event():
+    """Test a response model is encoded as a single SSE message."""
+    model = PredictionPendingResponse(run_id="test-run-id", status=PredictionStatus.RUNNING)
+
+    message = format_event(model, "status", 3)
+
+    assert message.endswith("\n\n")
+    lines = message.strip().split("\n")
+    assert lines[0] == "event: status"
+    assert lines[1] == "id: 3"
+    assert json.loads(lines[2][len("data: ") :]) == {"run_id": "test-run-id", "status": "running"}
+
+
+@pytest.mark.asyncio
+async def test_event_stream_encodes_each_transition():
+    """Test every model of the stream becomes one numbered event."""
+
+    async def events():
+        yield PredictionPendingResponse(run_id="test-run-id", status=PredictionStatus.PENDING)
+        yield PredictionCompletedResponse(
+            run_id="test-run-id",
+            status=PredictionStatus.COMPLETED,
+            prediction=320201.58554044,
+            completed_at=datetime.now(),
+        )
+
+    messages = [message async for message in event_stream(events())]
+
+    assert len(messages) == 2
+    assert "id: 0" in messages[0] and '"status":"pending"' in messages[0]
+    assert "id: 1" in messages[1] and '"prediction":320201.58554044' in messages[1]
+
+
+@pytest.mark.asyncio
+async def test_event_stream_sends_heartbeats_while_idle():
+    """Test a keep-alive comment is sent when no event arrives in time."""
+
+    async def events():
+        await asyncio.sleep(0.05)
+        yield PredictionPendingResponse(run_id="test-run-id", status=PredictionStatus.RUNNING)
+
+    messages = [message async for message in event_stream(events(), heartbeat_interval=0.01)]
+
+    assert messages[0] == ": keep-alive\n\n"
+    assert messages[-1].startswith("event: status")
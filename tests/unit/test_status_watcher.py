@@ -0,0 +1,103 @@
+"""Unit tests for PredictionStatusWatcher."""
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.domain.entities.prediction import Prediction, PredictionStatus
+from src.core.service.status_watcher import PredictionStatusWatcher, is_terminal
+
+
+@pytest.fixture
+def completed_prediction():
+    """Create a completed prediction."""
+    return Prediction(
+        record_id="test-record",
+        value=320201.58554044,
+        created_at=datetime.now(),
+        status=PredictionStatus.COMPLETED,
+        run_id="test-run-id",
+    )
+
+
+@pytest.fixture
+def mock_service():
+    """Create a mock prediction service."""
+    service = MagicMock()
+    service.get_prediction_result = AsyncMock()
+    return service
+
+
+def test_is_terminal(completed_prediction):
+    """Test terminal state detection."""
+    assert is_terminal(completed_prediction)
+    assert is_terminal("failed")
+    assert not is_terminal("pending")
+    assert not is_terminal("running")
+
+
+@pytest.mark.asyncio
+async def test_wait_for_result_returns_terminal_result(mock_service, completed_prediction):
+    """Test waiting returns as soon as the run completes."""
+    # Setup
+    mock_service.get_prediction_result.side_effect = ["pending", "running", completed_prediction]
+    watcher = PredictionStatusWatcher(mock_service, poll_interval=0.01)
+
+    # Execute
+    result = await watcher.wait_for_result("test-run-id", timeout=1.0)
+
+    # Assert
+    assert result == completed_prediction
+    assert mock_service.get_prediction_result.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_wait_for_result_times_out_with_latest_status(mock_service):
+    """Test waiting returns the latest status when the timeout expires."""
+    # Setup
+    mock_service.get_prediction_result.return_value = "running"
+    watcher = PredictionStatusWatcher(mock_service, poll_interval=0.01)
+
+    # Execute
+    result = await watcher.wait_for_result("test-run-id", timeout=0.05)
+
+    # Assert
+    assert result == "running"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_waiters_share_one_poll_loop(mock_service, completed_prediction):
+    """Test many waiters on the same run trigger a single poll per interval."""
+    # Setup
+    polls = ["pending", "running", completed_prediction]
+    mock_service.get_prediction_result.side_effect = polls
+    watcher = PredictionStatusWatcher(mock_service, poll_interval=0.01)
+
+    # Execute
+    results = await asyncio.gather(
+        *(watcher.wait_for_result("test-run-id", timeout=1.0) for _ in range(50))
+    )
+
+    # Assert
+    assert all(result == completed_prediction for result in results)
+    assert mock_service.get_prediction_result.call_count == len(polls)
+
+
+@pytest.mark.asyncio
+async def test_watch_yields_each_transition_once(mock_service, completed_prediction):
+    """Test watch yields distinct transitions and stops at the terminal state."""
+    # Setup
+    mock_service.get_prediction_result.side_effect = [
+        "pending",
+        "pending",
+        "running",
+        completed_prediction,
+    ]
+    watcher = PredictionStatusWatcher(mock_service, poll_interval=0.01)
+
+    # Execute
+    transitions = [result async for result in watcher.watch("test-run-id", timeout=1.0)]
+
+    # Assert
+    assert transitions == ["pending", "running", completed_prediction]
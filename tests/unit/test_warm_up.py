@@ -0,0 +1,120 @@
+"""Unit tests for WarmUp."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.domain.exceptions import PipelineError, StorageError
+from src.core.service.warm_up import WARM_UP_RECORD, WarmUp
+
+
+@pytest.fixture
+def model():
+    """Create a model port scoring every record."""
+    return MagicMock(predict=AsyncMock(return_value=1.0), predict_batch=AsyncMock())
+
+
+@pytest.fixture
+def etl():
+    """Create an ETL port resolving its location."""
+    return MagicMock(warm_up=AsyncMock())
+
+
+async def wait_until_ready(warm_up: WarmUp, timeout: float = 1.0) -> None:
+    """Wait for a started warm-up to complete."""
+
+    async def poll() -> None:
+        while not warm_up.ready:
+            await asyncio.sleep(0.005)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+@pytest.mark.asyncio
+async def test_ready_once_every_step_completed(model, etl):
+    """Test the model is exercised on both scoring paths and connections opened."""
+    # Setup
+    storage = MagicMock()
+    warm_up = WarmUp(model, storage, etl)
+
+    # Execute
+    assert not warm_up.ready
+    warm_up.start()
+    await wait_until_ready(warm_up)
+
+    # Assert
+    model.predict.assert_awaited_once_with(WARM_UP_RECORD)
+    model.predict_batch.assert_awaited_once_with([WARM_UP_RECORD])
+    storage.warm_up.assert_called_once()
+    etl.warm_up.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_step_is_retried_alone(model, etl):
+    """Test readiness waits for a failed step, without redoing the others."""
+    # Setup
+    storage = MagicMock()
+    storage.warm_up.side_effect = [StorageError("Connection refused"), None]
+    warm_up = WarmUp(model, storage, etl, retry_interval=0.01)
+
+    # Execute
+    warm_up.start()
+    await wait_until_ready(warm_up)
+
+    # Assert
+    assert storage.warm_up.call_count == 2
+    model.predict.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_pipeline_outage_does_not_hold_readiness_back(model):
+    """Test the API gets ready for in-process scoring while the pipeline is unreachable."""
+    etl = MagicMock(warm_up=AsyncMock(side_effect=PipelineError("Connection refused")))
+    warm_up = WarmUp(model, MagicMock(), etl, retry_interval=60.0)
+
+    warm_up.start()
+    await wait_until_ready(warm_up)
+
+    etl.warm_up.assert_awaited_once()
+    await warm_up.stop()
+
+
+@pytest.mark.asyncio
+async def test_pipeline_warm_up_is_retried_until_it_succeeds(model):
+    """Test the pipeline location is resolved once the pipeline is back."""
+    # Setup
+    etl = MagicMock(
+        warm_up=AsyncMock(
+            side_effect=[PipelineError("Connection refused"), PipelineError("Timeout"), None]
+        )
+    )
+    warm_up = WarmUp(model, MagicMock(), etl, retry_interval=0.01)
+
+    # Execute
+    warm_up.start()
+    await wait_until_ready(warm_up)
+
+    async def resolved() -> None:
+        while etl.warm_up.await_count < 3:
+            await asyncio.sleep(0.005)
+
+    await asyncio.wait_for(resolved(), 1.0)
+    await asyncio.sleep(0.03)
+
+    # Assert
+    assert etl.warm_up.await_count == 3
+    await warm_up.stop()
+
+
+@pytest.mark.asyncio
+async def test_stop_abandons_warm_up(model, etl):
+    """Test a warm-up stuck retrying is stopped on shutdown."""
+    storage = MagicMock()
+    storage.warm_up.side_effect = StorageError("Connection refused")
+    warm_up = WarmUp(model, storage, etl, retry_interval=0.01)
+
+    warm_up.start()
+    await asyncio.sleep(0.03)
+    await warm_up.stop()
+
+    assert not warm_up.ready
@@ -0,0 +1,138 @@
+"""Unit tests for HttpxWebhookAdapter."""
+import hashlib
+import hmac
+import json
+
+import httpx
+import pytest
+
+from src.adapter.driven.webhook.httpx_adapter import (
+    SIGNATURE_HEADER,
+    TIMESTAMP_HEADER,
+    HttpxWebhookAdapter,
+)
+from src.core.domain.exceptions import CallbackUrlNotAllowedError, WebhookDeliveryError
+
+EVENTS = [{"id": "delivery-1", "run_id": "run-1", "status": "completed", "prediction": 1.0}]
+
+
+def make_adapter(
+    receiver, secret="test-secret", allowed_hosts=("client.example",)
+) -> HttpxWebhookAdapter:
+    """Create an adapter sending to an in-process receiver."""
+    adapter = HttpxWebhookAdapter(secret=secret, allowed_hosts=allowed_hosts)
+    adapter._client = httpx.AsyncClient(transport=httpx.MockTransport(receiver))
+    return adapter
+
+
+@pytest.mark.asyncio
+async def test_send_signs_body_and_timestamp():
+    """Test a receiver holding the secret can verify the request."""
+    # Setup
+    received = []
+
+    def receiver(request: httpx.Request) -> httpx.Response:
+        received.append(request)
+        return httpx.Response(204)
+
+    adapter = make_adapter(receiver)
+
+    # Execute
+    await adapter.send("https://client.example/hook", EVENTS)
+
+    # Assert
+    (request,) = received
+    timestamp = request.headers[TIMESTAMP_HEADER]
+    expected = hmac.new(
+        b"test-secret", timestamp.encode() + b"." + request.content, hashlib.sha256
+    ).hexdigest()
+    assert request.headers[SIGNATURE_HEADER] == f"sha256={expected}"
+    assert json.loads(request.content) == {"events": EVENTS}
+    await adapter.close()
+
+
+@pytest.mark.asyncio
+async def test_send_without_secret_is_unsigned():
+    """Test requests are sent without signature headers when no secret is set."""
+    received = []
+    adapter = make_adapter(lambda request: received.append(request) or httpx.Response(200), None)
+
+    await adapter.send("https://client.example/hook", EVENTS)
+
+    assert SIGNATURE_HEADER not in received[0].headers
+    await adapter.close()
+
+
+@pytest.mark.asyncio
+async def test_send_rejected_by_receiver():
+    """Test a non-2xx response is reported as a failed delivery."""
+    adapter = make_adapter(lambda request: httpx.Response(503))
+
+    with pytest.raises(WebhookDeliveryError, match="503"):
+        await adapter.send("https://client.example/hook", EVENTS)
+    await adapter.close()
+
+
+@pytest.mark.asyncio
+async def test_send_unreachable_receiver():
+    """Test a transport error is reported as a failed delivery."""
+
+    def receiver(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("Connection refused", request=request)
+
+    adapter = make_adapter(receiver)
+
+    with pytest.raises(WebhookDeliveryError, match="Connection refused"):
+        await adapter.send("https://client.example/hook", EVENTS)
+    await adapter.close()
+
+
+@pytest.mark.asyncio
+async def test_allowed_hosts_are_the_only_callback_hosts():
+    """Test only the allowed hosts are accepted when some are set."""
+    adapter = HttpxWebhookAdapter(allowed_hosts=["hooks.internal"])
+
+    await adapter.check_callback_url("http://hooks.internal:8080/hook")
+    with pytest.raises(CallbackUrlNotAllowedError, match="not allowed"):
+        await adapter.check_callback_url("https://client.example/hook")
+
+
+@pytest.mark.parametrize(
+    "callback_url",
+    [
+        "http://93.184.215.14/hook",
+        "https://127.0.0.1/hook",
+        "https://10.0.0.7/hook",
+        "https://169.254.169.254/latest/meta-data",
+        "https://[::1]/hook",
+        "https://[::ffff:192.168.0.1]/hook",
+    ],
+)
+@pytest.mark.asyncio
+async def test_callback_url_must_be_https_to_a_public_address(callback_url):
+    """Test plain http and hosts resolving to non-public addresses are rejected."""
+    adapter = HttpxWebhookAdapter()
+
+    with pytest.raises(CallbackUrlNotAllowedError):
+        await adapter.check_callback_url(callback_url)
+
+
+@pytest.mark.asyncio
+async def test_public_https_callback_url_is_allowed():
+    """Test an https URL of a public address is accepted without allowed hosts."""
+    await HttpxWebhookAdapter().check_callback_url("https://93.184.215.14/hook")
+
+
+@pytest.mark.asyncio
+async def test_send_checks_the_callback_url_again():
+    """Test nothing is sent to a URL that is not allowed anymore."""
+    received = []
+    adapter = make_adapter(
+        lambda request: received.append(request) or httpx.Response(200), allowed_hosts=()
+    )
+
+    with pytest.raises(CallbackUrlNotAllowedError):
+        await adapter.send("https://127.0.0.1/hook", EVENTS)
+
+    assert received == []
+    await adapter.close()
@@ -0,0 +1,133 @@
+"""Unit tests for WebhookDispatcher."""
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.domain.entities.webhook import WebhookDelivery
+from src.core.domain.exceptions import WebhookDeliveryError
+from src.core.service.webhook_dispatcher import WebhookDispatcher
+
+
+def make_delivery(delivery_id: str, callback_url: str, attempts: int = 0) -> WebhookDelivery:
+    """Create a pending delivery."""
+    return WebhookDelivery(
+        id=delivery_id,
+        run_id=f"run-{delivery_id}",
+        callback_url=callback_url,
+        payload={"run_id": f"run-{delivery_id}", "status": "completed"},
+        attempts=attempts,
+    )
+
+
+@pytest.fixture
+def storage():
+    """Create a storage port with an empty outbox."""
+    storage = MagicMock()
+    storage.claim_webhook_deliveries.return_value = []
+    return storage
+
+
+@pytest.mark.asyncio
+async def test_deliveries_to_one_url_share_requests(storage):
+    """Test deliveries are grouped by callback URL and split into bounded requests."""
+    # Setup
+    storage.claim_webhook_deliveries.return_value = [
+        make_delivery("1", "https://a.example/hook"),
+        make_delivery("2", "https://b.example/hook"),
+        make_delivery("3", "https://a.example/hook"),
+        make_delivery("4", "https://a.example/hook"),
+    ]
+    webhook = MagicMock(send=AsyncMock())
+    dispatcher = WebhookDispatcher(storage, webhook, max_events_per_request=2)
+
+    # Execute
+    claimed = await dispatcher.dispatch()
+
+    # Assert
+    assert claimed == 4
+    requests = sorted(
+        (call.args[0], [event["id"] for event in call.args[1]])
+        for call in webhook.send.call_args_list
+    )
+    assert requests == [
+        ("https://a.example/hook", ["1", "3"]),
+        ("https://a.example/hook", ["4"]),
+        ("https://b.example/hook", ["2"]),
+    ]
+    assert sorted(storage.complete_webhook_deliveries.call_args.args[0]) == ["1", "2", "3", "4"]
+    storage.fail_webhook_deliveries.assert_called_once_with([])
+
+
+@pytest.mark.asyncio
+async def test_failed_request_is_retried_with_backoff(storage):
+    """Test the deliveries of a failed request are rescheduled, later on every attempt."""
+    # Setup
+    storage.claim_webhook_deliveries.return_value = [
+        make_delivery("1", "https://a.example/hook", attempts=0),
+        make_delivery("2", "https://a.example/hook", attempts=3),
+    ]
+    webhook = MagicMock(send=AsyncMock(side_effect=WebhookDeliveryError("Status 503")))
+    dispatcher = WebhookDispatcher(storage, webhook, base_backoff=10.0)
+    before = datetime.utcnow()
+
+    # Execute
+    await dispatcher.dispatch()
+
+    # Assert
+    storage.complete_webhook_deliveries.assert_called_once_with([])
+    first, fourth = storage.fail_webhook_deliveries.call_args.args[0]
+    assert (first.attempts, fourth.attempts) == (1, 4)
+    assert first.last_error == "Status 503"
+    assert 5 <= (first.next_attempt_at - before).total_seconds() <= 11
+    assert 40 <= (fourth.next_attempt_at - before).total_seconds() <= 81
+
+
+@pytest.mark.asyncio
+async def test_delivery_is_given_up_after_max_attempts(storage):
+    """Test a delivery failing its last attempt is not rescheduled."""
+    # Setup
+    storage.claim_webhook_deliveries.return_value = [
+        make_delivery("1", "https://a.example/hook", attempts=2)
+    ]
+    webhook = MagicMock(send=AsyncMock(side_effect=WebhookDeliveryError("Status 500")))
+    dispatcher = WebhookDispatcher(storage, webhook, max_attempts=3)
+
+    # Execute
+    await dispatcher.dispatch()
+
+    # Assert
+    (delivery,) = storage.fail_webhook_deliveries.call_args.args[0]
+    assert delivery.attempts == 3
+    assert delivery.next_attempt_at is None
+
+
+@pytest.mark.asyncio
+async def test_empty_outbox_sends_nothing(storage):
+    """Test nothing is sent or updated while no delivery is due."""
+    webhook = MagicMock(send=AsyncMock())
+    dispatcher = WebhookDispatcher(storage, webhook)
+
+    assert await dispatcher.dispatch() == 0
+    webhook.send.assert_not_called()
+    storage.complete_webhook_deliveries.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_polls_until_stopped(storage):
+    """Test the background loop keeps claiming deliveries until it is stopped."""
+    # Setup
+    webhook = MagicMock(send=AsyncMock())
+    dispatcher = WebhookDispatcher(storage, webhook, poll_interval=0.01)
+
+    # Execute
+    dispatcher.start()
+    await asyncio.sleep(0.05)
+    await dispatcher.stop()
+    calls = storage.claim_webhook_deliveries.call_count
+    await asyncio.sleep(0.03)
+
+    # Assert
+    assert calls >= 2
+    assert storage.claim_webhook_deliveries.call_count == calls
@@ -0,0 +1,144 @@
+"""Unit tests for the WebSocket scoring channel."""
+import asyncio
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi.testclient import TestClient
+
+from src.adapter.driving.fastapi.handler import FastAPIHandler
+from src.adapter.driving.fastapi.websocket import serve_prediction_stream
+from src.core.domain.entities.prediction import Prediction, PredictionStatus
+from src.core.service.micro_batcher import MicroBatcher
+
+RECORD = {
+    "longitude": -122.64,
+    "latitude": 38.01,
+    "housing_median_age": 36.0,
+    "total_rooms": 1336.0,
+    "total_bedrooms": 258.0,
+    "population": 678.0,
+    "households": 249.0,
+    "median_income": 5.5789,
+    "ocean_proximity": "NEAR OCEAN",
+}
+
+
+@pytest.fixture
+def mock_service():
+    """Create a prediction service scoring each record as its median income."""
+
+    async def predict_batch(records):
+        return [
+            Prediction(
+                record_id=record.id,
+                value=record.median_income,
+                created_at=datetime.now(),
+                status=PredictionStatus.COMPLETED,
+                run_id=f"sync-{record.id}",
+            )
+            for record in records
+        ]
+
+    service = MagicMock()
+    service.predict_batch = AsyncMock(side_effect=predict_batch)
+    return service
+
+
+@pytest.fixture
+def client(mock_service):
+    """Create a test client for an app exposing the WebSocket channel."""
+    batcher = MicroBatcher(mock_service.predict_batch, max_batch_size=64, max_wait=0.1)
+    handler = FastAPIHandler(mock_service, scoring_batcher=batcher)
+    app = FastAPI()
+
+    @app.websocket("/predictions/ws")
+    async def prediction_stream(websocket: WebSocket) -> None:
+        await serve_prediction_stream(websocket, handler)
+
+    return TestClient(app)
+
+
+def test_results_are_tagged_with_correlation_ids(client, mock_service):
+    """Test every message gets a result carrying its correlation ID."""
+    with client.websocket_connect("/predictions/ws") as websocket:
+        for i in range(5):
+            record = {**RECORD, "median_income": float(i)}
+            websocket.send_text(json.dumps({"correlation_id": f"req-{i}", "record": record}))
+
+        results = [json.loads(websocket.receive_text()) for _ in range(5)]
+
+    by_id = {result["correlation_id"]: result for result in results}
+    assert set(by_id) == {f"req-{i}" for i in range(5)}
+    for i in range(5):
+        assert by_id[f"req-{i}"]["status"] == "completed"
+        assert by_id[f"req-{i}"]["prediction"] == float(i)
+
+    # Messages sent back to back are scored in fewer model calls than messages
+    assert mock_service.predict_batch.call_count < 5
+
+
+def test_invalid_message_returns_failed_result(client, mock_service):
+    """Test an invalid message is answered with an error instead of closing the stream."""
+    with client.websocket_connect("/predictions/ws") as websocket:
+        websocket.send_text(json.dumps({"correlation_id": "bad", "record": {"longitude": 1}}))
+        result = json.loads(websocket.receive_text())
+
+    assert result["correlation_id"] == "bad"
+    assert result["status"] == "failed"
+    assert "Invalid message" in result["error"]
+    mock_service.predict_batch.assert_not_called()
+
+
+def test_message_with_callback_url_returns_failed_result(client, mock_service):
+    """Test a message carrying a callback URL is rejected, as results are not notified."""
+    record = {**RECORD, "callback_url": "https://client.example/hook"}
+    with client.websocket_connect("/predictions/ws") as websocket:
+        websocket.send_text(json.dumps({"correlation_id": "hook", "record": record}))
+        result = json.loads(websocket.receive_text())
+
+    assert result["status"] == "failed"
+    assert "callback_url is only supported by single submissions" in result["error"]
+    mock_service.predict_batch.assert_not_called()
+
+
+def test_binary_frame_closes_the_stream_with_1003(client, mock_service):
+    """Test a binary frame closes the connection as unsupported data."""
+    with client.websocket_connect("/predictions/ws") as websocket:
+        websocket.send_bytes(b"\x00\x01")
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            websocket.receive_text()
+
+    assert exc_info.value.code == 1003
+    mock_service.predict_batch.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_client_that_never_reads_stops_the_stream_being_read(mock_service):
+    """Test results a client does not read keep their messages in flight."""
+    # Setup
+    batcher = MicroBatcher(mock_service.predict_batch, max_batch_size=64, max_wait=0.01)
+    handler = FastAPIHandler(mock_service, scoring_batcher=batcher)
+    message = json.dumps({"correlation_id": "req", "record": RECORD})
+
+    async def never_sent(text):
+        await asyncio.Event().wait()
+
+    websocket = MagicMock()
+    websocket.accept = AsyncMock()
+    websocket.receive = AsyncMock(return_value={"type": "websocket.receive", "text": message})
+    websocket.send_text = AsyncMock(side_effect=never_sent)
+
+    # Execute
+    stream = asyncio.create_task(serve_prediction_stream(websocket, handler, max_in_flight=4))
+    await asyncio.sleep(0.2)
+    stream.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await stream
+
+    # Assert
+    # 4 messages are in flight, and the fifth waits for one of them to be sent
+    assert websocket.receive.await_count == 5
+    assert websocket.send_text.await_count == 1